@@ -1,26 +1,39 @@
 import json
-import boto3
 import os
 import uuid
 import base64
 from datetime import datetime
-from decimal import Decimal
+
+from botocore.exceptions import ClientError
+
+from wms_common.clients import lazy_client, lazy_resource
+from wms_common.etag import is_not_modified, make_etag, not_modified_response, read_validator, requested_etags, with_etag
+from wms_common.http import api_handler
+from wms_common.idempotency import run_idempotent
+from wms_common.pagination import encode_token, page_args, page_body, read_page_params
+from wms_common.projection import build_projection, parse_fields
+from wms_common.serialization import dumps
+from wms_common.uploads import UploadSessionError, build_document_metadata, build_s3_key, complete_upload, create_upload_session, read_upload_session
 
 # AWS 서비스 클라이언트
-dynamodb = boto3.resource('dynamodb')
-s3 = boto3.client('s3')
-events = boto3.client('events')
+dynamodb = lazy_resource('dynamodb')
+s3 = lazy_client('s3')
+events = lazy_client('events')
 
 # 환경 변수
 DOCUMENT_METADATA_TABLE = os.environ.get('DOCUMENT_METADATA_TABLE')
 DOCUMENT_BUCKET = os.environ.get('DOCUMENT_BUCKET')
+IDEMPOTENCY_TABLE = os.environ.get('IDEMPOTENCY_TABLE')
+
+# 다운로드 URL 유효 시간 / ETag 갱신 주기 (캐시된 URL이 항상 절반 이상 유효하도록)
+DOWNLOAD_URL_EXPIRES = 3600
+DOWNLOAD_URL_WINDOW = DOWNLOAD_URL_EXPIRES // 2
 
-# JSON 인코더 클래스 정의
-class DecimalEncoder(json.JSONEncoder):
-    def default(self, obj):
-        if isinstance(obj, Decimal):
-            return float(obj)
-        return super(DecimalEncoder, self).default(obj)
+# 목록 조회 fields= 허용 필드 (document_id는 항상 포함)
+DOCUMENT_LIST_FIELDS = [
+    'document_id', 'order_id', 'document_type', 's3_key', 'file_name', 'content_type',
+    'upload_date', 'uploader', 'verification_status', 'verification_notes', 'version', 'updated_at'
+]
 
 # 공통 헤더
 COMMON_HEADERS = {
@@ -28,13 +41,12 @@ COMMON_HEADERS = {
     'Access-Control-Allow-Origin': 'http://localhost:3000',  # 와일드카드(*) 금지
     'Access-Control-Allow-Credentials': 'true',    
     'Access-Control-Allow-Methods': 'GET,POST,PUT,DELETE,OPTIONS',
-    'Access-Control-Allow-Headers': 'Content-Type,X-Amz-Date,Authorization,X-Api-Key,X-Amz-Security-Token'
+    'Access-Control-Allow-Headers': 'Content-Type,X-Amz-Date,Authorization,X-Api-Key,X-Amz-Security-Token,Idempotency-Key'
 }
 
+@api_handler
 def lambda_handler(event, context):
     try:
-        print(f"Received event: {json.dumps(event)}")
-
         if 'httpMethod' in event:
             http_method = event.get('httpMethod')
             path = event.get('path', '')
@@ -43,22 +55,27 @@ def lambda_handler(event, context):
             if http_method == 'GET' and path == '/documents':
                 return get_documents(event)
             elif http_method == 'GET' and path.startswith('/documents/') and path_params.get('document_id'):
-                return get_document(path_params['document_id'])
+                return get_document(event, path_params['document_id'])
+            elif http_method == 'POST' and path == '/documents/upload-sessions':
+                return create_document_upload_session(event)
+            elif http_method == 'POST' and path == '/documents/upload-sessions/finalize':
+                return finalize_document_upload(event)
             elif http_method == 'POST' and path == '/documents':
-                return upload_document(event)
+                idempotency_table = dynamodb.Table(IDEMPOTENCY_TABLE) if IDEMPOTENCY_TABLE else None
+                return run_idempotent(event, idempotency_table, 'POST /documents', upload_document, COMMON_HEADERS)
             elif http_method == 'DELETE' and path.startswith('/documents/') and path_params.get('document_id'):
                 return delete_document(path_params['document_id'])
 
             return {
                 'statusCode': 404,
                 'headers': COMMON_HEADERS,
-                'body': json.dumps({'message': 'Endpoint not found', 'path': path, 'method': http_method}, cls=DecimalEncoder)
+                'body': dumps({'message': 'Endpoint not found', 'path': path, 'method': http_method})
             }
 
         return {
             'statusCode': 200,
             'headers': COMMON_HEADERS,
-            'body': json.dumps({'message': 'Document service executed directly', 'event': event}, cls=DecimalEncoder)
+            'body': dumps({'message': 'Document service executed directly', 'event': event})
         }
 
     except Exception as e:
@@ -66,7 +83,7 @@ def lambda_handler(event, context):
         return {
             'statusCode': 500,
             'headers': COMMON_HEADERS,
-            'body': json.dumps({'message': f"Error: {str(e)}"}, cls=DecimalEncoder)
+            'body': dumps({'message': f"Error: {str(e)}"})
         }
 
 def get_documents(event):
@@ -75,55 +92,79 @@ def get_documents(event):
         order_id = query_params.get('order_id')
         table = dynamodb.Table(DOCUMENT_METADATA_TABLE)
 
+        index_name = 'order_id-index' if order_id else None
+        scope = f'documents:{order_id}' if order_id else 'documents'
+        try:
+            fields = parse_fields(query_params, DOCUMENT_LIST_FIELDS, required=('document_id',))
+            limit, cursor = read_page_params(query_params, scope, index_name)
+        except ValueError as e:
+            return {
+                'statusCode': 400,
+                'headers': COMMON_HEADERS,
+                'body': dumps({'message': str(e)})
+            }
+        request_args = dict(build_projection(fields, DOCUMENT_LIST_FIELDS), **page_args(limit, cursor))
+
         if order_id:
             response = table.query(
-                IndexName='order_id-index',
+                IndexName=index_name,
                 KeyConditionExpression='order_id = :order_id',
-                ExpressionAttributeValues={':order_id': order_id}
+                ExpressionAttributeValues={':order_id': order_id},
+                **request_args
             )
         else:
-            response = table.scan()
+            response = table.scan(**request_args)
 
         documents = response.get('Items', [])
+        next_token = encode_token(response.get('LastEvaluatedKey'), scope, index_name)
 
         return {
             'statusCode': 200,
             'headers': COMMON_HEADERS,
-            'body': json.dumps({'documents': documents, 'count': len(documents)}, cls=DecimalEncoder)
+            'body': dumps(page_body('documents', documents, next_token))
         }
     except Exception as e:
         print(f"Error getting documents: {str(e)}")
         return {
             'statusCode': 500,
             'headers': COMMON_HEADERS,
-            'body': json.dumps({'message': f"Error getting documents: {str(e)}"}, cls=DecimalEncoder)
+            'body': dumps({'message': f"Error getting documents: {str(e)}"})
         }
 
-def get_document(document_id):
+def get_document(event, document_id):
     try:
         table = dynamodb.Table(DOCUMENT_METADATA_TABLE)
+        
+        # 조건부 요청이면 version / updated_at만 먼저 읽어 304 판단 (presigned URL 생성도 생략)
+        url_window = int(datetime.now().timestamp()) // DOWNLOAD_URL_WINDOW
+        if requested_etags(event):
+            etag = read_validator(table, {'document_id': document_id}, suffix=url_window)
+            if etag is not None and is_not_modified(event, etag):
+                return not_modified_response(COMMON_HEADERS, etag)
+        
         response = table.get_item(Key={'document_id': document_id})
 
         if 'Item' not in response:
             return {
                 'statusCode': 404,
                 'headers': COMMON_HEADERS,
-                'body': json.dumps({'message': 'Document not found'}, cls=DecimalEncoder)
+                'body': dumps({'message': 'Document not found'})
             }
 
         document = response['Item']
         presigned_url = s3.generate_presigned_url(
             'get_object',
             Params={'Bucket': DOCUMENT_BUCKET, 'Key': document['s3_key']},
-            ExpiresIn=3600
+            ExpiresIn=DOWNLOAD_URL_EXPIRES
         )
 
         document['download_url'] = presigned_url
+        etag = make_etag(document, suffix=url_window)
 
         return {
             'statusCode': 200,
-            'headers': COMMON_HEADERS,
-            'body': json.dumps(document, cls=DecimalEncoder)
+            'headers': with_etag(COMMON_HEADERS, etag),
+            'body': dumps(document)
         }
 
     except Exception as e:
@@ -131,7 +172,7 @@ def get_document(document_id):
         return {
             'statusCode': 500,
             'headers': COMMON_HEADERS,
-            'body': json.dumps({'message': f"Error getting document: {str(e)}"}, cls=DecimalEncoder)
+            'body': dumps({'message': f"Error getting document: {str(e)}"})
         }
 
 def upload_document(event):
@@ -144,7 +185,7 @@ def upload_document(event):
             return {
                 'statusCode': 400,
                 'headers': COMMON_HEADERS,
-                'body': json.dumps({'message': f'Missing required fields: {", ".join(missing_fields)}'}, cls=DecimalEncoder)
+                'body': dumps({'message': f'Missing required fields: {", ".join(missing_fields)}'})
             }
 
         valid_types = ['INVOICE', 'BILL_OF_ENTRY', 'AIRWAY_BILL']
@@ -154,7 +195,7 @@ def upload_document(event):
             return {
                 'statusCode': 400,
                 'headers': COMMON_HEADERS,
-                'body': json.dumps({'message': f'Invalid document type. Must be one of: {", ".join(valid_types)}'}, cls=DecimalEncoder)
+                'body': dumps({'message': f'Invalid document type. Must be one of: {", ".join(valid_types)}'})
             }
 
         try:
@@ -163,14 +204,13 @@ def upload_document(event):
             return {
                 'statusCode': 400,
                 'headers': COMMON_HEADERS,
-                'body': json.dumps({'message': 'Invalid file content. Must be base64 encoded.'}, cls=DecimalEncoder)
+                'body': dumps({'message': 'Invalid file content. Must be base64 encoded.'})
             }
 
         document_id = str(uuid.uuid4())
         timestamp = int(datetime.now().timestamp())
         file_name = body.get('file_name')
-        file_extension = file_name.split('.')[-1] if '.' in file_name else ''
-        s3_key = f"{body.get('order_id')}/{document_type.lower()}/{document_id}.{file_extension}"
+        s3_key = build_s3_key(body.get('order_id'), document_type, document_id, file_name)
 
         s3.put_object(Bucket=DOCUMENT_BUCKET, Key=s3_key, Body=decoded_content, ContentType=body.get('content_type'))
 
@@ -201,14 +241,108 @@ def upload_document(event):
         return {
             'statusCode': 201,
             'headers': COMMON_HEADERS,
-            'body': json.dumps({'document': document_metadata, 'message': 'Document uploaded successfully'}, cls=DecimalEncoder)
+            'body': dumps({'document': document_metadata, 'message': 'Document uploaded successfully'})
         }
     except Exception as e:
         print(f"Error uploading document: {str(e)}")
         return {
             'statusCode': 500,
             'headers': COMMON_HEADERS,
-            'body': json.dumps({'message': f"Error uploading document: {str(e)}"}, cls=DecimalEncoder)
+            'body': dumps({'message': f"Error uploading document: {str(e)}"})
+        }
+
+def create_document_upload_session(event):
+    """S3 직접 업로드 세션 생성 (presigned PUT 또는 멀티파트 파트 URL 발급)"""
+    try:
+        body = json.loads(event.get('body') or '{}')
+        required_fields = ['order_id', 'document_type', 'file_name', 'content_type', 'size_bytes']
+        missing_fields = [field for field in required_fields if field not in body]
+
+        if missing_fields:
+            return {
+                'statusCode': 400,
+                'headers': COMMON_HEADERS,
+                'body': dumps({'message': f'Missing required fields: {", ".join(missing_fields)}'})
+            }
+
+        try:
+            session = create_upload_session(
+                s3, DOCUMENT_BUCKET,
+                body.get('order_id'), body.get('document_type'), body.get('file_name'),
+                body.get('content_type'), body.get('size_bytes'), body.get('user_id', 'system')
+            )
+        except UploadSessionError as e:
+            return {
+                'statusCode': 400,
+                'headers': COMMON_HEADERS,
+                'body': dumps({'message': str(e)})
+            }
+
+        return {
+            'statusCode': 201,
+            'headers': COMMON_HEADERS,
+            'body': dumps(session)
+        }
+    except Exception as e:
+        print(f"Error creating upload session: {str(e)}")
+        return {
+            'statusCode': 500,
+            'headers': COMMON_HEADERS,
+            'body': dumps({'message': f"Error creating upload session: {str(e)}"})
+        }
+
+def finalize_document_upload(event):
+    """직접 업로드 완료 처리 - 객체 확인 후 메타데이터 저장 및 DocumentUploaded 발행"""
+    try:
+        body = json.loads(event.get('body') or '{}')
+
+        try:
+            session = read_upload_session(body.get('session_token'))
+            if not session.get('order_id'):
+                raise UploadSessionError('This upload session belongs to an order that has not been created yet')
+            size_bytes = complete_upload(s3, DOCUMENT_BUCKET, session, body.get('parts'))
+        except UploadSessionError as e:
+            return {
+                'statusCode': 400,
+                'headers': COMMON_HEADERS,
+                'body': dumps({'message': str(e)})
+            }
+
+        timestamp = int(datetime.now().timestamp())
+        document_metadata = build_document_metadata(session, session['order_id'], size_bytes, timestamp)
+
+        # finalize 재시도 시 중복 저장 / 중복 이벤트 방지
+        table = dynamodb.Table(DOCUMENT_METADATA_TABLE)
+        try:
+            table.put_item(Item=document_metadata, ConditionExpression='attribute_not_exists(document_id)')
+        except ClientError as e:
+            if e.response.get('Error', {}).get('Code') != 'ConditionalCheckFailedException':
+                raise
+            existing = table.get_item(Key={'document_id': session['document_id']}).get('Item', document_metadata)
+            return {
+                'statusCode': 200,
+                'headers': COMMON_HEADERS,
+                'body': dumps({'document': existing, 'message': 'Document already finalized'})
+            }
+
+        publish_event({
+            'document_id': document_metadata['document_id'],
+            'order_id': document_metadata['order_id'],
+            'document_type': document_metadata['document_type'],
+            'timestamp': timestamp
+        }, 'DocumentUploaded')
+
+        return {
+            'statusCode': 201,
+            'headers': COMMON_HEADERS,
+            'body': dumps({'document': document_metadata, 'message': 'Document uploaded successfully'})
+        }
+    except Exception as e:
+        print(f"Error finalizing document upload: {str(e)}")
+        return {
+            'statusCode': 500,
+            'headers': COMMON_HEADERS,
+            'body': dumps({'message': f"Error finalizing document upload: {str(e)}"})
         }
 
 def delete_document(document_id):
@@ -220,7 +354,7 @@ def delete_document(document_id):
             return {
                 'statusCode': 404,
                 'headers': COMMON_HEADERS,
-                'body': json.dumps({'message': 'Document not found'}, cls=DecimalEncoder)
+                'body': dumps({'message': 'Document not found'})
             }
 
         document = response['Item']
@@ -230,14 +364,14 @@ def delete_document(document_id):
         return {
             'statusCode': 200,
             'headers': COMMON_HEADERS,
-            'body': json.dumps({'message': 'Document deleted successfully'}, cls=DecimalEncoder)
+            'body': dumps({'message': 'Document deleted successfully'})
         }
     except Exception as e:
         print(f"Error deleting document: {str(e)}")
         return {
             'statusCode': 500,
             'headers': COMMON_HEADERS,
-            'body': json.dumps({'message': f"Error deleting document: {str(e)}"}, cls=DecimalEncoder)
+            'body': dumps({'message': f"Error deleting document: {str(e)}"})
         }
 
 def publish_event(event_detail, detail_type, source='wms.document-service'):
@@ -246,7 +380,7 @@ def publish_event(event_detail, detail_type, source='wms.document-service'):
             Entries=[{
                 'Source': source,
                 'DetailType': detail_type,
-                'Detail': json.dumps(event_detail, cls=DecimalEncoder)
+                'Detail': dumps(event_detail)
             }]
         )
         print(f"Event published: {response}")
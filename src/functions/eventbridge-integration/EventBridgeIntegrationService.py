@@ -1,47 +1,57 @@
-import json
-import boto3
 import os
+from datetime import datetime
 from decimal import Decimal
 
+from wms_common.clients import is_warmup_event, lazy_client, lazy_resource, warmup_response
+from wms_common.log import log_request
+from wms_common.rollup import order_rollup_deltas, record_rollup_event
+from wms_common.scorecard import record_scorecard_event
+from wms_common.serialization import dumps
+
 # AWS 서비스 클라이언트
-dynamodb = boto3.resource('dynamodb')
-lambda_client = boto3.client('lambda')
-events = boto3.client('events')
+dynamodb = lazy_resource('dynamodb')
+lambda_client = lazy_client('lambda')
+events = lazy_client('events')
 
 # 환경 변수
 RECEIVING_ORDER_TABLE = os.environ.get('RECEIVING_ORDER_TABLE')
 RECEIVING_HISTORY_TABLE = os.environ.get('RECEIVING_HISTORY_TABLE')
+RECEIVING_ITEM_TABLE = os.environ.get('RECEIVING_ITEM_TABLE')
+SUPPLIER_SCORECARD_TABLE = os.environ.get('SUPPLIER_SCORECARD_TABLE')
+RECEIVING_ROLLUP_TABLE = os.environ.get('RECEIVING_ROLLUP_TABLE')
 TECHNICAL_QUERY_FUNCTION = os.environ.get('TECHNICAL_QUERY_FUNCTION')
 BINNING_FUNCTION = os.environ.get('BINNING_FUNCTION')
 
-# JSON 인코더 클래스 정의
-class DecimalEncoder(json.JSONEncoder):
-    def default(self, obj):
-        if isinstance(obj, Decimal):
-            return float(obj)
-        return super(DecimalEncoder, self).default(obj)
+# 예정일 당일 안에 완료되면 정시 입고로 집계
+ON_TIME_GRACE_SECONDS = int(os.environ.get('ON_TIME_GRACE_SECONDS', '86400'))
 
+@log_request
 def lambda_handler(event, context):
     """이벤트 처리 Lambda 핸들러"""
+    if is_warmup_event(event):
+        return warmup_response()
     try:
-        print(f"Received event: {json.dumps(event)}")
-        
         # EventBridge 이벤트 처리
         if 'source' in event and 'detail-type' in event:
             source = event['source']
             detail_type = event['detail-type']
             detail = event.get('detail', {})
+            event_id = event.get('id')
             
             # 이벤트 유형에 따른 처리
             if source == 'wms.receiving-service':
                 if detail_type == 'ReceivingCompleted':
-                    return handle_receiving_completed(detail)
+                    return handle_receiving_completed(detail, event_id)
+                elif detail_type == 'ReceivingRejected':
+                    return handle_receiving_rejected(detail, event_id)
             
             elif source == 'wms.verification-service':
                 if detail_type == 'InspectionPassed':
                     return handle_inspection_passed(detail)
                 elif detail_type == 'DocumentVerificationCompleted':
-                    return handle_document_verification(detail)
+                    return handle_document_verification(detail, event_id)
+                elif detail_type == 'ReceivingRejected':
+                    return handle_receiving_rejected(detail, event_id)
             
             # 기타 이벤트 처리
             return {
@@ -52,18 +62,17 @@ def lambda_handler(event, context):
                     'Access-Control-Allow-Methods': 'GET,POST,PUT,DELETE,OPTIONS',
                     'Access-Control-Allow-Headers': 'Content-Type,X-Amz-Date,Authorization,X-Api-Key,X-Amz-Security-Token'
                 },
-                'body': json.dumps({
+                'body': dumps({
                     'message': f'Processed {source} {detail_type} event',
                     'detail': detail
-                }, cls=DecimalEncoder)
+                })
             }
         
-        # DynamoDB 스트림 이벤트 처리
+        # DynamoDB 스트림 이벤트 처리 (배치의 모든 레코드 처리)
         if 'Records' in event and event['Records']:
-            for record in event['Records']:
-                # DynamoDB 스트림 레코드
-                if record.get('eventSource') == 'aws:dynamodb':
-                    return handle_dynamodb_stream(record)
+            stream_records = [record for record in event['Records'] if record.get('eventSource') == 'aws:dynamodb']
+            if stream_records:
+                return handle_dynamodb_stream_batch(stream_records)
                 
         # 직접 호출
         return {
@@ -74,14 +83,17 @@ def lambda_handler(event, context):
                     'Access-Control-Allow-Methods': 'GET,POST,PUT,DELETE,OPTIONS',
                     'Access-Control-Allow-Headers': 'Content-Type,X-Amz-Date,Authorization,X-Api-Key,X-Amz-Security-Token'
                 },
-            'body': json.dumps({
+            'body': dumps({
                 'message': 'EventBridge integration service executed directly',
                 'event': event
-            }, cls=DecimalEncoder)
+            })
         }
             
     except Exception as e:
         print(f"Error: {str(e)}")
+        # EventBridge 이벤트는 실패로 끝나야 재시도됨 (스코어카드는 이벤트 ID로 중복 집계 방지)
+        if 'source' in event and 'detail-type' in event:
+            raise
         return {
             'statusCode': 500,
             'headers': {
@@ -90,10 +102,10 @@ def lambda_handler(event, context):
                     'Access-Control-Allow-Methods': 'GET,POST,PUT,DELETE,OPTIONS',
                     'Access-Control-Allow-Headers': 'Content-Type,X-Amz-Date,Authorization,X-Api-Key,X-Amz-Security-Token'
                 },
-            'body': json.dumps({'message': f"Error: {str(e)}"}, cls=DecimalEncoder)
+            'body': dumps({'message': f"Error: {str(e)}"})
         }
 
-def handle_receiving_completed(detail):
+def handle_receiving_completed(detail, event_id=None):
     """입고 완료 이벤트 처리"""
     try:
         order_id = detail.get('order_id')
@@ -101,7 +113,7 @@ def handle_receiving_completed(detail):
         if not order_id:
             return {
                 'statusCode': 400,
-                'body': json.dumps({'message': 'Missing order_id in event detail'}, cls=DecimalEncoder)
+                'body': dumps({'message': 'Missing order_id in event detail'})
             }
             
         # 기술 검사 서비스 호출 (Lambda 함수)
@@ -110,28 +122,28 @@ def handle_receiving_completed(detail):
                 response = lambda_client.invoke(
                     FunctionName=TECHNICAL_QUERY_FUNCTION,
                     InvocationType='Event',  # 비동기 호출
-                    Payload=json.dumps({
+                    Payload=dumps({
                         'action': 'start_inspection',
                         'order_id': order_id
-                    }, cls=DecimalEncoder)
+                    })
                 )
                 print(f"Invoked technical query function: {response}")
             except Exception as lambda_error:
                 print(f"Error invoking technical query function: {str(lambda_error)}")
         
+        # 공급업체 스코어카드 반영
+        update_scorecard_for_completion(detail, scorecard_event_id(detail, event_id))
+        
         return {
             'statusCode': 200,
-            'body': json.dumps({
+            'body': dumps({
                 'message': 'Receiving completed event processed',
                 'order_id': order_id
-            }, cls=DecimalEncoder)
+            })
         }
     except Exception as e:
         print(f"Error handling receiving completed: {str(e)}")
-        return {
-            'statusCode': 500,
-            'body': json.dumps({'message': f"Error handling receiving completed: {str(e)}"}, cls=DecimalEncoder)
-        }
+        raise
 
 def handle_inspection_passed(detail):
     """검수 통과 이벤트 처리"""
@@ -141,7 +153,7 @@ def handle_inspection_passed(detail):
         if not order_id:
             return {
                 'statusCode': 400,
-                'body': json.dumps({'message': 'Missing order_id in event detail'}, cls=DecimalEncoder)
+                'body': dumps({'message': 'Missing order_id in event detail'})
             }
             
         # GRN 발행 이벤트 생성
@@ -158,10 +170,10 @@ def handle_inspection_passed(detail):
                 response = lambda_client.invoke(
                     FunctionName=BINNING_FUNCTION,
                     InvocationType='Event',  # 비동기 호출
-                    Payload=json.dumps({
+                    Payload=dumps({
                         'action': 'start_binning',
                         'order_id': order_id
-                    }, cls=DecimalEncoder)
+                    })
                 )
                 print(f"Invoked binning function: {response}")
             except Exception as lambda_error:
@@ -169,19 +181,19 @@ def handle_inspection_passed(detail):
         
         return {
             'statusCode': 200,
-            'body': json.dumps({
+            'body': dumps({
                 'message': 'Inspection passed event processed',
                 'order_id': order_id
-            }, cls=DecimalEncoder)
+            })
         }
     except Exception as e:
         print(f"Error handling inspection passed: {str(e)}")
         return {
             'statusCode': 500,
-            'body': json.dumps({'message': f"Error handling inspection passed: {str(e)}"}, cls=DecimalEncoder)
+            'body': dumps({'message': f"Error handling inspection passed: {str(e)}"})
         }
 
-def handle_document_verification(detail):
+def handle_document_verification(detail, event_id=None):
     """문서 검증 완료 이벤트 처리"""
     try:
         order_id = detail.get('order_id')
@@ -190,7 +202,7 @@ def handle_document_verification(detail):
         if not order_id:
             return {
                 'statusCode': 400,
-                'body': json.dumps({'message': 'Missing order_id in event detail'}, cls=DecimalEncoder)
+                'body': dumps({'message': 'Missing order_id in event detail'})
             }
             
         # 문서 검증 결과에 따른 처리
@@ -200,58 +212,176 @@ def handle_document_verification(detail):
             pass
         elif verification_status == 'DECLINED':
             # 검증 거부 시 처리 로직
-            # 입고 주문 상태 업데이트
+            # 입고 주문 상태 업데이트 - ReceivingRejected는 주문 테이블 스트림이 상태 변경 시 한 번만 발행
+            # (여기서 따로 발행하면 스트림 이벤트와 ID가 달라 거부가 두 번 집계됨)
             order_table = dynamodb.Table(RECEIVING_ORDER_TABLE)
             order_table.update_item(
                 Key={'order_id': order_id},
-                UpdateExpression="set #status = :status",
+                UpdateExpression="set #status = :status, rejection_reason = :reason, updated_at = :time",
                 ExpressionAttributeValues={
-                    ':status': 'REJECTED'
+                    ':status': 'REJECTED',
+                    ':reason': 'Document verification declined',
+                    ':time': int(datetime.now().timestamp())
                 },
                 ExpressionAttributeNames={'#status': 'status'}
             )
-            
-            # 거부 이벤트 발행
-            rejection_event = {
-                'order_id': order_id,
-                'reason': 'Document verification declined',
-                'timestamp': detail.get('timestamp')
-            }
-            
-            publish_event(rejection_event, 'ReceivingRejected', 'wms.verification-service')
+        
+        # 공급업체 스코어카드 반영 (문서 반려율)
+        update_scorecard_for_verification(detail, scorecard_event_id(detail, event_id))
         
         return {
             'statusCode': 200,
-            'body': json.dumps({
+            'body': dumps({
                 'message': 'Document verification event processed',
                 'order_id': order_id,
                 'status': verification_status
-            }, cls=DecimalEncoder)
+            })
         }
     except Exception as e:
         print(f"Error handling document verification: {str(e)}")
+        raise
+
+def handle_receiving_rejected(detail, event_id=None):
+    """입고 거부 이벤트 처리"""
+    try:
+        order_id = detail.get('order_id')
+        
+        if not order_id:
+            return {
+                'statusCode': 400,
+                'body': dumps({'message': 'Missing order_id in event detail'})
+            }
+        
+        # 공급업체 스코어카드 반영
+        supplier_id = detail.get('supplier_id') or get_order_fields(order_id).get('supplier_id')
+        apply_scorecard_counters(supplier_id, scorecard_event_id(detail, event_id), {'rejected_orders': 1})
+        
         return {
-            'statusCode': 500,
-            'body': json.dumps({'message': f"Error handling document verification: {str(e)}"}, cls=DecimalEncoder)
+            'statusCode': 200,
+            'body': dumps({
+                'message': 'Receiving rejected event processed',
+                'order_id': order_id
+            })
+        }
+    except Exception as e:
+        print(f"Error handling receiving rejected: {str(e)}")
+        raise
+
+def get_order_fields(order_id):
+    """이벤트에 없는 주문 정보 보완용 조회 (스코어카드 계산 필드만)"""
+    order_table = dynamodb.Table(RECEIVING_ORDER_TABLE)
+    response = order_table.get_item(
+        Key={'order_id': order_id},
+        ProjectionExpression='supplier_id, scheduled_date, arrived_at, received_at, updated_at'
+    )
+    return response.get('Item', {})
+
+def scorecard_event_id(detail, event_id):
+    """스코어카드 중복 집계 방지 키 - 발행자가 넣은 결정적 ID(detail.event_id) 우선, 없으면 EventBridge 이벤트 ID"""
+    return detail.get('event_id') or event_id
+
+def apply_scorecard_counters(supplier_id, event_id, counters):
+    """스코어카드 카운터 원자적 증가 (같은 이벤트 중복 집계 방지)"""
+    if not SUPPLIER_SCORECARD_TABLE or not supplier_id:
+        return
+    record_scorecard_event(dynamodb.meta.client, SUPPLIER_SCORECARD_TABLE, supplier_id, event_id, counters)
+
+def update_scorecard_for_completion(detail, event_id):
+    """입고 완료: 정시율, 입고 소요 시간(dock-to-stock), 수량 정확도 집계"""
+    order_id = detail.get('order_id')
+    order = dict(detail)
+    if not order.get('supplier_id') or order.get('scheduled_date') is None:
+        order.update({key: value for key, value in get_order_fields(order_id).items() if order.get(key) is None})
+    
+    completed_at = int(order.get('received_at') or order.get('timestamp') or datetime.now().timestamp())
+    counters = {'completed_orders': 1}
+    
+    scheduled_date = order.get('scheduled_date')
+    if scheduled_date is not None:
+        if completed_at <= int(scheduled_date) + ON_TIME_GRACE_SECONDS:
+            counters['on_time_orders'] = 1
+        
+        # 도착(arrived_at) 기록이 없으면 입고 예정일을 도착 시각으로 간주
+        arrived_at = int(order.get('arrived_at') or scheduled_date)
+        if completed_at >= arrived_at:
+            counters['dock_to_stock_orders'] = 1
+            counters['dock_to_stock_seconds_total'] = completed_at - arrived_at
+    
+    # 주문 품목의 예정/입고 수량 (order_id-index 한 번 조회)
+    if RECEIVING_ITEM_TABLE:
+        item_table = dynamodb.Table(RECEIVING_ITEM_TABLE)
+        query_args = {
+            'IndexName': 'order_id-index',
+            'KeyConditionExpression': 'order_id = :oid',
+            'ProjectionExpression': 'expected_qty, received_qty',
+            'ExpressionAttributeValues': {':oid': order_id}
         }
+        while True:
+            response = item_table.query(**query_args)
+            for item in response.get('Items', []):
+                expected_qty = int(item.get('expected_qty', 0) or 0)
+                received_qty = int(item.get('received_qty', 0) or 0)
+                counters['lines_total'] = counters.get('lines_total', 0) + 1
+                counters['expected_qty_total'] = counters.get('expected_qty_total', 0) + expected_qty
+                counters['received_qty_total'] = counters.get('received_qty_total', 0) + received_qty
+                if expected_qty == received_qty:
+                    counters['accurate_lines'] = counters.get('accurate_lines', 0) + 1
+            if 'LastEvaluatedKey' not in response:
+                break
+            query_args['ExclusiveStartKey'] = response['LastEvaluatedKey']
+    
+    apply_scorecard_counters(order.get('supplier_id'), event_id, counters)
+
+def update_scorecard_for_verification(detail, event_id):
+    """문서 검증 완료: 검증 문서 수 / 반려 문서 수 집계"""
+    supplier_id = detail.get('supplier_id') or get_order_fields(detail.get('order_id')).get('supplier_id')
+    declined = 1 if detail.get('verification_status') == 'DECLINED' else 0
+    counters = {
+        'documents_verified': int(detail.get('document_count', 1)),
+        'documents_declined': int(detail.get('declined_count', declined))
+    }
+    apply_scorecard_counters(supplier_id, event_id, counters)
+
+def handle_dynamodb_stream_batch(records):
+    """스트림 배치 처리 - 실패한 레코드는 batchItemFailures로 보고 (ReportBatchItemFailures 설정 시 재전달)"""
+    failures = []
+    for record in records:
+        result = handle_dynamodb_stream(record)
+        if result['statusCode'] >= 500:
+            failures.append({'itemIdentifier': record.get('dynamodb', {}).get('SequenceNumber')})
+    
+    return {
+        'statusCode': 200,
+        'body': dumps({
+            'message': f'Processed {len(records)} DynamoDB stream records',
+            'failed': len(failures)
+        }),
+        'batchItemFailures': failures
+    }
+
+def update_order_rollups(record, old_data, new_data):
+    """일자/상태별 주문 수 집계 반영 (같은 스트림 레코드 중복 집계 방지)"""
+    if not RECEIVING_ROLLUP_TABLE:
+        return
+    deltas = order_rollup_deltas(old_data, new_data)
+    record_rollup_event(dynamodb.meta.client, RECEIVING_ROLLUP_TABLE, record.get('eventID'), deltas)
 
 def handle_dynamodb_stream(record):
     """DynamoDB 스트림 이벤트 처리"""
     try:
         event_name = record.get('eventName')
+        table_name = record.get('eventSourceARN', '').split('/')[1]
+        
+        # DynamoDB 데이터를 Python 형식으로 변환
+        new_data = convert_dynamodb_to_python(record.get('dynamodb', {}).get('NewImage', {}))
+        old_data = convert_dynamodb_to_python(record.get('dynamodb', {}).get('OldImage', {}))
+        
+        # 입고 주문 생성 / 상태 변경 / 삭제 시 일별 집계 갱신
+        if table_name == RECEIVING_ORDER_TABLE and event_name in ('INSERT', 'MODIFY', 'REMOVE'):
+            update_order_rollups(record, old_data, new_data)
         
         # 변경 유형에 따른 처리
         if event_name == 'MODIFY':
-            # 수정 이벤트 처리
-            new_image = record.get('dynamodb', {}).get('NewImage', {})
-            old_image = record.get('dynamodb', {}).get('OldImage', {})
-            
-            # DynamoDB 데이터를 Python 형식으로 변환
-            new_data = convert_dynamodb_to_python(new_image)
-            old_data = convert_dynamodb_to_python(old_image)
-            
-            table_name = record.get('eventSourceARN', '').split('/')[1]
-            
             # 입고 주문 테이블 이벤트 처리
             if table_name == RECEIVING_ORDER_TABLE:
                 # 상태 변경 감지
@@ -260,24 +390,28 @@ def handle_dynamodb_stream(record):
                     old_status = old_data['status']
                     
                     if new_status != old_status:
-                        # 상태 변경에 따른 이벤트 발행
-                        handle_order_status_change(new_data, old_status, new_status)
+                        # 상태 변경에 따른 이벤트 발행 (스트림 재전달 시 같은 eventID로 중복 집계 방지)
+                        handle_order_status_change(new_data, old_status, new_status, record.get('eventID'))
         
         return {
             'statusCode': 200,
-            'body': json.dumps({
+            'body': dumps({
                 'message': f'DynamoDB stream event {event_name} processed'
-            }, cls=DecimalEncoder)
+            })
         }
     except Exception as e:
         print(f"Error handling DynamoDB stream: {str(e)}")
         return {
             'statusCode': 500,
-            'body': json.dumps({'message': f"Error handling DynamoDB stream: {str(e)}"}, cls=DecimalEncoder)
+            'body': dumps({'message': f"Error handling DynamoDB stream: {str(e)}"})
         }
 
-def handle_order_status_change(order_data, old_status, new_status):
-    """입고 주문 상태 변경 처리"""
+def handle_order_status_change(order_data, old_status, new_status, stream_event_id=None):
+    """입고 주문 상태 변경 처리
+
+    발행 이벤트의 event_id는 스트림 레코드 eventID라 재전달돼도 같으므로, 공급업체 스코어카드
+    (detail.event_id 기준 마커)가 같은 입고 완료 / 거절을 한 번만 집계합니다.
+    """
     order_id = order_data.get('order_id')
     
     # 특정 상태 변경에 따른 이벤트 발행
@@ -286,7 +420,11 @@ def handle_order_status_change(order_data, old_status, new_status):
         event_detail = {
             'order_id': order_id,
             'supplier_id': order_data.get('supplier_id'),
-            'timestamp': order_data.get('updated_at')
+            'scheduled_date': order_data.get('scheduled_date'),
+            'arrived_at': order_data.get('arrived_at'),
+            'received_at': order_data.get('received_at'),
+            'timestamp': order_data.get('updated_at'),
+            'event_id': stream_event_id
         }
         
         publish_event(event_detail, 'ReceivingCompleted', 'wms.receiving-service')
@@ -295,8 +433,10 @@ def handle_order_status_change(order_data, old_status, new_status):
         # 입고 거부 이벤트 발행
         event_detail = {
             'order_id': order_id,
-            'reason': 'Order status changed to REJECTED',
-            'timestamp': order_data.get('updated_at')
+            'supplier_id': order_data.get('supplier_id'),
+            'reason': order_data.get('rejection_reason') or 'Order status changed to REJECTED',
+            'timestamp': order_data.get('updated_at'),
+            'event_id': stream_event_id
         }
         
         publish_event(event_detail, 'ReceivingRejected', 'wms.receiving-service')
@@ -326,19 +466,22 @@ def convert_dynamodb_to_python(dynamodb_data):
     return result
 
 def publish_event(event_detail, detail_type, source='wms.event-service'):
-    """EventBridge에 이벤트 발행"""
+    """EventBridge에 이벤트 발행 (실패 시 예외 - 스트림 레코드 / 이벤트가 재시도되도록)"""
     try:
         response = events.put_events(
             Entries=[
                 {
                     'Source': source,
                     'DetailType': detail_type,
-                    'Detail': json.dumps(event_detail, cls=DecimalEncoder)
+                    'Detail': dumps(event_detail)
                 }
             ]
         )
-        print(f"Event published: {response}")
-        return response
     except Exception as e:
         print(f"Error publishing event: {str(e)}")
-        return None
\ No newline at end of file
+        raise
+    if response.get('FailedEntryCount'):
+        entry = response['Entries'][0]
+        raise RuntimeError(f"Failed to publish {detail_type}: {entry.get('ErrorCode')} {entry.get('ErrorMessage')}")
+    print(f"Event published: {response}")
+    return response
\ No newline at end of file
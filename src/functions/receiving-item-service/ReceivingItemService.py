@@ -1,23 +1,39 @@
 import json
-import boto3
 import os
 import uuid
 from datetime import datetime
-from decimal import Decimal
+
+from wms_common.clients import lazy_resource
+from wms_common.etag import is_not_modified, make_etag, not_modified_response, read_validator, requested_etags, with_etag
+from wms_common.http import api_handler
+from wms_common.pagination import encode_token, page_args, page_body, read_page_params
+from wms_common.patch import build_patch, get_expected_version, patched_item, VERSION_ATTRIBUTE
+from wms_common.projection import build_projection, parse_fields
+from wms_common.serialization import dumps
+from wms_common.transactions import condition_check_action, transact_write, TransactionConflictError, update_action
 
 # AWS 서비스 클라이언트
-dynamodb = boto3.resource('dynamodb')
+dynamodb = lazy_resource('dynamodb')
 
 # 환경 변수
 RECEIVING_ITEM_TABLE = os.environ.get('RECEIVING_ITEM_TABLE')
 RECEIVING_ORDER_TABLE = os.environ.get('RECEIVING_ORDER_TABLE')
 
-# JSON 인코더 클래스 정의
-class DecimalEncoder(json.JSONEncoder):
-    def default(self, obj):
-        if isinstance(obj, Decimal):
-            return float(obj)
-        return super(DecimalEncoder, self).default(obj)
+# 수정 가능한 품목 필드
+ITEM_UPDATE_FIELDS = [
+    'product_name', 'sku_number', 'expected_qty', 'received_qty', 'serial_or_barcode',
+    'length', 'width', 'height', 'depth', 'volume', 'weight', 'notes'
+]
+
+# 품목 수정이 허용되는 주문 상태 조건 (완료 / 취소 / 삭제된 주문의 품목은 수정 불가)
+ORDER_EDITABLE_CONDITION = 'attribute_exists(order_id) AND #st <> :completed AND #st <> :cancelled AND #st <> :deleted'
+ORDER_EDITABLE_VALUES = {':completed': 'COMPLETED', ':cancelled': 'CANCELLED', ':deleted': 'DELETED'}
+
+# 동시 수정 충돌 시 품목 수정 재시도 횟수 (If-Match 없는 요청)
+ITEM_UPDATE_ATTEMPTS = 3
+
+# 목록 조회 fields= 허용 필드 (item_id는 항상 포함)
+ITEM_LIST_FIELDS = ['item_id', 'order_id'] + ITEM_UPDATE_FIELDS + ['version', 'created_at', 'updated_at']
 
 # 공통 CORS 헤더 정의
 def get_cors_headers():
@@ -29,11 +45,10 @@ def get_cors_headers():
         'Access-Control-Allow-Headers': 'Content-Type,X-Amz-Date,Authorization,X-Api-Key,X-Amz-Security-Token'
     }
 
+@api_handler
 def lambda_handler(event, context):
     """입고 품목 관리 Lambda 핸들러"""
     try:
-        print(f"Received event: {json.dumps(event)}")
-        
         # API Gateway 프록시 통합
         if 'httpMethod' in event:
             http_method = event.get('httpMethod')
@@ -43,11 +58,11 @@ def lambda_handler(event, context):
             
             # 주문별 품목 목록 조회
             if http_method == 'GET' and path == '/receiving-items' and 'order_id' in query_params:
-                return get_items_by_order(query_params['order_id'])
+                return get_items_by_order(query_params['order_id'], query_params)
             
             # 특정 품목 조회
             elif http_method == 'GET' and path.startswith('/receiving-items/') and path_params.get('item_id'):
-                return get_item(path_params['item_id'])
+                return get_item(event, path_params['item_id'])
             
             # 품목 업데이트
             elif http_method == 'PUT' and path.startswith('/receiving-items/') and path_params.get('item_id'):
@@ -61,21 +76,21 @@ def lambda_handler(event, context):
             return {
                 'statusCode': 404,
                 'headers': get_cors_headers(),
-                'body': json.dumps({
+                'body': dumps({
                     'message': 'Endpoint not found',
                     'path': path,
                     'method': http_method
-                }, cls=DecimalEncoder)
+                })
             }
         
         # 직접 호출
         return {
             'statusCode': 200,
             'headers': get_cors_headers(),
-            'body': json.dumps({
+            'body': dumps({
                 'message': 'Receiving item service executed directly',
                 'event': event
-            }, cls=DecimalEncoder)
+            })
         }
             
     except Exception as e:
@@ -83,12 +98,23 @@ def lambda_handler(event, context):
         return {
             'statusCode': 500,
             'headers': get_cors_headers(),
-            'body': json.dumps({'message': f"Error: {str(e)}"}, cls=DecimalEncoder)
+            'body': dumps({'message': f"Error: {str(e)}"})
         }
 
-def get_items_by_order(order_id):
+def get_items_by_order(order_id, query_params=None):
     """주문별 품목 목록 조회"""
     try:
+        scope = f'receiving-items:{order_id}'
+        try:
+            fields = parse_fields(query_params, ITEM_LIST_FIELDS, required=('item_id',))
+            limit, cursor = read_page_params(query_params, scope, 'order_id-index')
+        except ValueError as e:
+            return {
+                'statusCode': 400,
+                'headers': get_cors_headers(),
+                'body': dumps({'message': str(e)})
+            }
+        
         # 주문 존재 확인
         order_table = dynamodb.Table(RECEIVING_ORDER_TABLE)
         order_response = order_table.get_item(Key={'order_id': order_id})
@@ -97,7 +123,7 @@ def get_items_by_order(order_id):
             return {
                 'statusCode': 404,
                 'headers': get_cors_headers(),
-                'body': json.dumps({'message': 'Receiving order not found'}, cls=DecimalEncoder)
+                'body': dumps({'message': 'Receiving order not found'})
             }
         
         # 품목 조회
@@ -109,32 +135,38 @@ def get_items_by_order(order_id):
             KeyConditionExpression='order_id = :oid',
             ExpressionAttributeValues={
                 ':oid': order_id
-            }
+            },
+            **page_args(limit, cursor),
+            **build_projection(fields, ITEM_LIST_FIELDS)
         )
         
         items = response.get('Items', [])
+        next_token = encode_token(response.get('LastEvaluatedKey'), scope, 'order_id-index')
         
         return {
             'statusCode': 200,
             'headers': get_cors_headers(),
-            'body': json.dumps({
-                'items': items,
-                'count': len(items)
-            }, cls=DecimalEncoder)
+            'body': dumps(page_body('items', items, next_token))
         }
     except Exception as e:
         print(f"Error getting items by order: {str(e)}")
         return {
             'statusCode': 500,
             'headers': get_cors_headers(),
-            'body': json.dumps({'message': f"Error getting items by order: {str(e)}"}, cls=DecimalEncoder)
+            'body': dumps({'message': f"Error getting items by order: {str(e)}"})
         }
 
-def get_item(item_id):
-    """특정 품목 조회"""
+def get_item(event, item_id):
+    """특정 품목 조회 (ETag / If-None-Match 지원)"""
     try:
         table = dynamodb.Table(RECEIVING_ITEM_TABLE)
         
+        # 조건부 요청이면 version / updated_at만 먼저 읽어 304 판단
+        if requested_etags(event):
+            etag = read_validator(table, {'item_id': item_id})
+            if etag is not None and is_not_modified(event, etag):
+                return not_modified_response(get_cors_headers(), etag)
+        
         response = table.get_item(
             Key={
                 'item_id': item_id
@@ -145,117 +177,130 @@ def get_item(item_id):
             return {
                 'statusCode': 404,
                 'headers': get_cors_headers(),
-                'body': json.dumps({'message': 'Item not found'}, cls=DecimalEncoder)
+                'body': dumps({'message': 'Item not found'})
             }
             
         item = response['Item']
+        etag = make_etag(item)
         
         return {
             'statusCode': 200,
-            'headers': get_cors_headers(),
-            'body': json.dumps(item, cls=DecimalEncoder)
+            'headers': with_etag(get_cors_headers(), etag),
+            'body': dumps(item)
         }
     except Exception as e:
         print(f"Error getting item: {str(e)}")
         return {
             'statusCode': 500,
             'headers': get_cors_headers(),
-            'body': json.dumps({'message': f"Error getting item: {str(e)}"}, cls=DecimalEncoder)
+            'body': dumps({'message': f"Error getting item: {str(e)}"})
         }
 
+def item_conflict_response(current_version):
+    """동시 수정으로 인한 409 응답"""
+    return {
+        'statusCode': 409,
+        'headers': get_cors_headers(),
+        'body': dumps({
+            'message': 'Item was modified by another request',
+            'current_version': current_version
+        })
+    }
+
 def update_item(event, item_id):
     """품목 업데이트"""
     try:
         body = json.loads(event.get('body', '{}'))
         
-        # 기존 품목 조회
-        table = dynamodb.Table(RECEIVING_ITEM_TABLE)
-        response = table.get_item(Key={'item_id': item_id})
-        
-        if 'Item' not in response:
+        # 변경 항목 준비
+        try:
+            expected_version = get_expected_version(event, body)
+        except ValueError as e:
             return {
-                'statusCode': 404,
+                'statusCode': 400,
                 'headers': get_cors_headers(),
-                'body': json.dumps({'message': 'Item not found'}, cls=DecimalEncoder)
+                'body': dumps({'message': str(e)})
             }
-            
-        existing_item = response['Item']
         
-        # 주문 확인
-        order_id = existing_item.get('order_id')
-        order_table = dynamodb.Table(RECEIVING_ORDER_TABLE)
-        order_response = order_table.get_item(Key={'order_id': order_id})
+        changes = {field: body[field] for field in ITEM_UPDATE_FIELDS if field in body}
         
-        if 'Item' not in order_response:
+        # 주문 상태 ConditionCheck에 order_id가 필요하므로 품목은 한 번 읽음 (order_id는 수정 불가 필드)
+        existing_item = dynamodb.Table(RECEIVING_ITEM_TABLE).get_item(Key={'item_id': item_id}).get('Item')
+        if existing_item is None:
             return {
                 'statusCode': 404,
                 'headers': get_cors_headers(),
-                'body': json.dumps({'message': 'Associated order not found'}, cls=DecimalEncoder)
+                'body': dumps({'message': 'Item not found'})
             }
-            
-        existing_order = order_response['Item']
         
-        # 주문 상태 확인 (완료된 주문의 품목은 수정 불가)
-        if existing_order.get('status') in ['COMPLETED', 'CANCELLED', 'DELETED']:
-            return {
-                'statusCode': 400,
-                'headers': get_cors_headers(),
-                'body': json.dumps({'message': f'Cannot update item for order in {existing_order.get("status")} status'}, cls=DecimalEncoder)
-            }
+        # 주문 상태 검사와 품목 수정을 하나의 트랜잭션으로 커밋 (검사 후 수정 사이의 경쟁 상태 제거)
+        for _ in range(ITEM_UPDATE_ATTEMPTS):
+            current_version = int(existing_item.get(VERSION_ATTRIBUTE, 0))
+            if expected_version is not None and expected_version != current_version:
+                return item_conflict_response(current_version)
             
-        # 변경 항목 준비
-        update_expression = "set updated_at = :time"
-        expression_values = {
-            ':time': int(datetime.now().timestamp())
-        }
-        
-        # 업데이트 가능한 필드
-        update_fields = {
-            'product_name': 'pname',
-            'sku_number': 'sku',
-            'expected_qty': 'eqty',
-            'received_qty': 'rqty',
-            'serial_or_barcode': 'serial',
-            'length': 'len',
-            'width': 'wid',
-            'height': 'hei',
-            'depth': 'dep',
-            'volume': 'vol',
-            'weight': 'wei',
-            'notes': 'notes'
-        }
-        
-        for field, short in update_fields.items():
-            if field in body:
-                update_expression += f", {field} = :{short}"
-                expression_values[f':{short}'] = body[field]
-        
-        # DynamoDB 업데이트
-        table.update_item(
-            Key={'item_id': item_id},
-            UpdateExpression=update_expression,
-            ExpressionAttributeValues=expression_values,
-            ReturnValues="ALL_NEW"
-        )
-
-        # 업데이트된 품목 조회
-        response = table.get_item(Key={'item_id': item_id})
-        updated_item = response['Item']
+            # 읽은 version을 조건으로 수정 -> 성공하면 그 사이 변경이 없으므로 읽은 레코드로 수정 후 레코드 구성
+            timestamp = int(datetime.now().timestamp())
+            update_expression, condition, names, values = build_patch('item_id', changes, current_version, timestamp)
+            try:
+                transact_write(dynamodb.meta.client, [
+                    condition_check_action(
+                        RECEIVING_ORDER_TABLE, {'order_id': existing_item.get('order_id')},
+                        ORDER_EDITABLE_CONDITION, {'#st': 'status'}, ORDER_EDITABLE_VALUES,
+                        return_old_on_failure=True
+                    ),
+                    update_action(
+                        RECEIVING_ITEM_TABLE, {'item_id': item_id}, update_expression,
+                        condition, names, values, return_old_on_failure=True
+                    )
+                ])
+            except TransactionConflictError as e:
+                order_reason, item_reason = e.reasons
+                if order_reason == 'ConditionalCheckFailed':
+                    existing_order = e.items[0]
+                    if existing_order is None:
+                        return {
+                            'statusCode': 404,
+                            'headers': get_cors_headers(),
+                            'body': dumps({'message': 'Associated order not found'})
+                        }
+                    return {
+                        'statusCode': 400,
+                        'headers': get_cors_headers(),
+                        'body': dumps({'message': f'Cannot update item for order in {existing_order.get("status")} status'})
+                    }
+                current_item = e.items[1]
+                if current_item is None:
+                    return {
+                        'statusCode': 404,
+                        'headers': get_cors_headers(),
+                        'body': dumps({'message': 'Item not found'})
+                    }
+                if expected_version is not None:
+                    return item_conflict_response(int(current_item.get(VERSION_ATTRIBUTE, 0)))
+                # If-Match 없는 요청은 실패 응답(ALL_OLD)의 현재 품목으로 다시 읽지 않고 재시도
+                existing_item = current_item
+                continue
+            
+            updated_item = patched_item(existing_item, changes, timestamp)
+            break
+        else:
+            return item_conflict_response(int(existing_item.get(VERSION_ATTRIBUTE, 0)))
         
         return {
             'statusCode': 200,
             'headers': get_cors_headers(),
-            'body': json.dumps({
+            'body': dumps({
                 'item': updated_item,
                 'message': 'Item updated successfully'
-            }, cls=DecimalEncoder)
+            })
         }
     except Exception as e:
         print(f"Error updating item: {str(e)}")
         return {
             'statusCode': 500,
             'headers': get_cors_headers(),
-            'body': json.dumps({'message': f"Error updating item: {str(e)}"}, cls=DecimalEncoder)
+            'body': dumps({'message': f"Error updating item: {str(e)}"})
         }
 
 def batch_add_items(event):
@@ -271,7 +316,7 @@ def batch_add_items(event):
             return {
                 'statusCode': 400,
                 'headers': get_cors_headers(),
-                'body': json.dumps({'message': f'Missing required fields: {", ".join(missing_fields)}'}, cls=DecimalEncoder)
+                'body': dumps({'message': f'Missing required fields: {", ".join(missing_fields)}'})
             }
             
         order_id = body.get('order_id')
@@ -281,7 +326,7 @@ def batch_add_items(event):
             return {
                 'statusCode': 400,
                 'headers': get_cors_headers(),
-                'body': json.dumps({'message': 'Items must be a non-empty array'}, cls=DecimalEncoder)
+                'body': dumps({'message': 'Items must be a non-empty array'})
             }
             
         # 주문 확인
@@ -292,7 +337,7 @@ def batch_add_items(event):
             return {
                 'statusCode': 404,
                 'headers': get_cors_headers(),
-                'body': json.dumps({'message': 'Receiving order not found'}, cls=DecimalEncoder)
+                'body': dumps({'message': 'Receiving order not found'})
             }
             
         existing_order = order_response['Item']
@@ -302,7 +347,7 @@ def batch_add_items(event):
             return {
                 'statusCode': 400,
                 'headers': get_cors_headers(),
-                'body': json.dumps({'message': f'Cannot add items to order in {existing_order.get("status")} status'}, cls=DecimalEncoder)
+                'body': dumps({'message': f'Cannot add items to order in {existing_order.get("status")} status'})
             }
             
         # 품목 추가
@@ -318,7 +363,7 @@ def batch_add_items(event):
                 return {
                     'statusCode': 400,
                     'headers': get_cors_headers(),
-                    'body': json.dumps({'message': 'Each item must have product_name and expected_qty'}, cls=DecimalEncoder)
+                    'body': dumps({'message': 'Each item must have product_name and expected_qty'})
                 }
                 
             # 품목 데이터
@@ -347,16 +392,16 @@ def batch_add_items(event):
         return {
             'statusCode': 201,
             'headers': get_cors_headers(),
-            'body': json.dumps({
+            'body': dumps({
                 'items': added_items,
                 'count': len(added_items),
                 'message': 'Items added successfully'
-            }, cls=DecimalEncoder)
+            })
         }
     except Exception as e:
         print(f"Error adding items: {str(e)}")
         return {
             'statusCode': 500,
             'headers': get_cors_headers(),
-            'body': json.dumps({'message': f"Error adding items: {str(e)}"}, cls=DecimalEncoder)
+            'body': dumps({'message': f"Error adding items: {str(e)}"})
         }
\ No newline at end of file
@@ -1,19 +1,37 @@
 import json
-import boto3
 import os
 import uuid
 import base64
-from datetime import datetime
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
 from decimal import Decimal
 from boto3.dynamodb.conditions import Attr, And
 from boto3.dynamodb.conditions import Attr
 from decimal import Decimal
 
+from wms_common.batch import batch_write_items, deserialize_item, serialize_item
+from wms_common.clients import lazy_client, lazy_resource
+from wms_common.export import EXPORT_FORMATS, JobDeadlineError, S3MultipartWriter, encode_rows, export_plan_to_s3
+from wms_common.history import event_time_key, parse_time_bound
+from wms_common.http import api_handler, get_header, read_body
+from wms_common.idempotency import run_idempotent
+from wms_common.log import log
+from wms_common.manifest import batched, detect_manifest_format, iter_manifest_rows
+from wms_common.projection import build_projection, parse_fields, select_fields
+from wms_common.pagination import encode_token, page_body, query_scope, read_page_params
+from wms_common.query_plan import describe_plan, execute_plan_page, query_all
+from wms_common.rollup import MAX_ROLLUP_DAYS, build_rollup_summary, query_rollups
+from wms_common.serialization import dumps
+from wms_common.transactions import MAX_TRANSACT_ITEMS, TransactionConflictError, put_action, transact_write, update_action
+from wms_common.uploads import build_document_metadata, build_s3_key, complete_upload, read_upload_session
+
 # AWS 서비스 클라이언트
 region_name = 'us-east-2'
-dynamodb = boto3.resource('dynamodb', region_name=region_name)
-s3 = boto3.client('s3', region_name=region_name)
-events = boto3.client('events', region_name=region_name)
+dynamodb = lazy_resource('dynamodb', region_name=region_name)
+s3 = lazy_client('s3', region_name=region_name)
+events = lazy_client('events', region_name=region_name)
+lambda_client = lazy_client('lambda', region_name=region_name)
 
 # 환경 변수 - 테이블 풀네임 사용
 RECEIVING_ORDER_TABLE = 'wms-receiving-orders-dev-wms-storage-stack'
@@ -21,21 +39,97 @@ RECEIVING_ITEM_TABLE = 'wms-receiving-items-dev-wms-storage-stack'
 RECEIVING_HISTORY_TABLE = 'wms-receiving-history-dev-wms-storage-stack'
 DOCUMENT_METADATA_TABLE = 'wms-document-metadata-dev-wms-storage-stack'
 DOCUMENT_BUCKET = os.environ.get('DOCUMENT_BUCKET', 'wms-documents-dev-242201288894-wms-storage-stack')
+IDEMPOTENCY_TABLE = os.environ.get('IDEMPOTENCY_TABLE', 'wms-idempotency-keys-dev-wms-storage-stack')
+RECEIVING_ROLLUP_TABLE = os.environ.get('RECEIVING_ROLLUP_TABLE', 'wms-receiving-rollups-dev-wms-storage-stack')
+VERIFICATION_RESULT_TABLE = os.environ.get('VERIFICATION_RESULT_TABLE')
+
+# 문서 S3 동시 업로드 수
+DOCUMENT_UPLOAD_WORKERS = int(os.environ.get('DOCUMENT_UPLOAD_WORKERS', '4'))
+
+# 주문 상세(/full) 문서 다운로드 URL 유효 시간(초)
+DOWNLOAD_URL_EXPIRES = 3600
+
+# 주문 내보내기 (병렬 scan 세그먼트 수, 결과 / 상태 파일 위치)
+EXPORT_BUCKET = os.environ.get('EXPORT_BUCKET', DOCUMENT_BUCKET)
+EXPORT_SCAN_SEGMENTS = int(os.environ.get('EXPORT_SCAN_SEGMENTS', '8'))
+EXPORT_PREFIX = 'exports/receiving-orders'
+EXPORT_URL_EXPIRES = 3600
+
+# 백그라운드 작업 (내보내기 / 일괄 등록) 전용 함수 - 미설정 시 현재 함수를 비동기 호출
+JOB_FUNCTION_NAME = os.environ.get('JOB_FUNCTION_NAME')
+# 남은 실행 시간이 이보다 적으면 작업을 중단하고 FAILED 기록
+JOB_DEADLINE_MARGIN_MS = int(os.environ.get('JOB_DEADLINE_MARGIN_MS', '30000'))
+
+# 매니페스트 일괄 등록 (이 크기를 넘는 매니페스트는 백그라운드 작업으로 처리)
+BULK_PREFIX = 'imports/receiving-orders'
+BULK_SYNC_MAX_BYTES = int(os.environ.get('BULK_SYNC_MAX_BYTES', str(256 * 1024)))
+BULK_BATCH_ROWS = 100
+BULK_PROGRESS_BATCHES = 10      # 백그라운드 작업 진행 상황 기록 주기 (배치 수)
+BULK_WRITE_WORKERS = 8
+BULK_REPORT_FIELDS = ['row', 'status', 'order_id', 'item_id', 'po_number', 'errors']
+
+# 주문 테이블 GSI (wms-storage-stack.yaml)
+ORDER_SUPPLIER_INDEX = 'supplier-index'          # supplier_id / created_at
+ORDER_STATUS_DATE_INDEX = 'status-date-index'    # status / scheduled_date
+ORDER_DATE_STATUS_INDEX = 'date-status-index'    # scheduled_date / status
+
+# 페이지 토큰 범위를 결정하는 필터 파라미터
+ORDER_FILTER_PARAMS = ('supplier_id', 'status', 'from_date', 'to_date')
+
+# 조회 계획 표현식에서 쓰는 속성 이름 별칭
+ORDER_ATTRIBUTE_NAMES = {'#st': 'status', '#sd': 'scheduled_date'}
+
+# 주문 상태 전이표 - 목표 상태: 허용되는 현재 상태 (일반적인 흐름을 앞에 두어 먼저 시도)
+# SCHEDULED -> IN_PROGRESS -> COMPLETED / REJECTED
+ORDER_TRANSITIONS = {
+    'IN_PROGRESS': ('SCHEDULED',),
+    'COMPLETED': ('IN_PROGRESS',),
+    'REJECTED': ('IN_PROGRESS', 'SCHEDULED')
+}
+
+# 날짜 조건만 있을 때 status-date-index를 팬아웃할 주문 상태 목록 - 주문에 기록되는 모든 상태
+# (생성 시 SCHEDULED, 상태 전이표의 상태, 이전 버전이 기록한 상태와 format_order 기본값 IN_PROCESS)
+DEFAULT_ORDER_STATUS = 'IN_PROCESS'
+LEGACY_ORDER_STATUSES = ('CONFIRMED', 'CANCELLED', 'DELETED', DEFAULT_ORDER_STATUS)
+ORDER_STATUSES = tuple(dict.fromkeys(
+    ('SCHEDULED',)
+    + tuple(status for sources in ORDER_TRANSITIONS.values() for status in sources)
+    + tuple(ORDER_TRANSITIONS)
+    + LEGACY_ORDER_STATUSES
+))
+
+# 상태 전이별 이력 이벤트 유형
+ORDER_TRANSITION_EVENTS = {
+    'IN_PROGRESS': 'RECEIVING_STARTED',
+    'COMPLETED': 'RECEIVING_COMPLETED',
+    'REJECTED': 'RECEIVING_REJECTED'
+}
+
+# 적용 가능한 인덱스가 없을 때 병렬 scan 세그먼트 수
+ORDER_SCAN_SEGMENTS = int(os.environ.get('ORDER_SCAN_SEGMENTS', '4'))
 
 # 표준 응답 헤더
 COMMON_HEADERS = {
     'Content-Type': 'application/json',
     'Access-Control-Allow-Origin': '*',
-    'Access-Control-Allow-Headers': 'Content-Type,X-Amz-Date,Authorization,X-Api-Key,X-Amz-Security-Token',
+    'Access-Control-Allow-Headers': 'Content-Type,X-Amz-Date,Authorization,X-Api-Key,X-Amz-Security-Token,Idempotency-Key',
     'Access-Control-Allow-Methods': 'GET,POST,PUT,DELETE,OPTIONS'
 }
 
-# JSON 인코더 클래스 정의
-class DecimalEncoder(json.JSONEncoder):
-    def default(self, obj):
-        if isinstance(obj, Decimal):
-            return float(obj)
-        return super(DecimalEncoder, self).default(obj)
+# 목록 조회 fields= 허용 필드 (응답 필드 → 원본 속성, order_id는 항상 포함)
+ORDER_LIST_FIELDS = {
+    'order_id': ('order_id',),
+    'supplier_name': ('supplier_name',),
+    'supplier_id': ('supplier_id',),
+    'sku_name': ('sku_name',),
+    'sku_id': ('sku_number',),
+    'serial_barcode': ('barcode',),
+    'status': ('status',),
+    'created_at': ('created_at',),
+    'grn_number': ('grn_number',),
+    'received_date': ('scheduled_date',),
+    'created_at_iso': ('created_at',)
+}
 
 def safe_decimal(value, default=0):
     """None도 안전하게 Decimal로 변환"""
@@ -46,11 +140,11 @@ def safe_decimal(value, default=0):
     except Exception:
         return Decimal(str(default))
 
+@api_handler
 def lambda_handler(event, context):
     """입고 주문 처리 Lambda 핸들러"""
     try:
-        print(f"Received event: {json.dumps(event)}")
-        print(f"Using tables: Order={RECEIVING_ORDER_TABLE}, Item={RECEIVING_ITEM_TABLE}, History={RECEIVING_HISTORY_TABLE}, Doc={DOCUMENT_METADATA_TABLE}")
+        log('DEBUG', 'tables', order=RECEIVING_ORDER_TABLE, item=RECEIVING_ITEM_TABLE, history=RECEIVING_HISTORY_TABLE, document=DOCUMENT_METADATA_TABLE)
         
         
         # API Gateway 프록시 통합
@@ -63,9 +157,44 @@ def lambda_handler(event, context):
             if http_method == 'GET' and path == '/receiving-orders':
                 return get_receiving_orders(event)
             
-            # 입고 주문 생성
+            # 입고 주문 생성 (Idempotency-Key 재시도는 저장된 응답 재생)
             elif http_method == 'POST' and path == '/receiving-orders':
-                return create_receiving_order(event)
+                return run_idempotent(
+                    event, dynamodb.Table(IDEMPOTENCY_TABLE), 'POST /receiving-orders',
+                    create_receiving_order, COMMON_HEADERS
+                )
+            
+            # 주문 상세 (주문 + 품목 + 문서 + 검증 결과 + 이력을 한 번에)
+            elif http_method == 'GET' and path.startswith('/receiving-orders/') and path_params.get('order_id') and path.endswith('/full'):
+                return get_receiving_order_full(path_params['order_id'])
+            
+            # 입고 확정 / 상태 변경 (상태 전이표에 따른 조건부 트랜잭션)
+            elif http_method == 'POST' and path.startswith('/receiving-orders/') and path_params.get('order_id') and path.endswith('/receive'):
+                return process_receiving(event, path_params['order_id'])
+            
+            elif http_method == 'PUT' and path.startswith('/receiving-orders/') and path_params.get('order_id') and path.endswith('/status'):
+                return update_order_status(event, path_params['order_id'])
+            
+            # 매니페스트 일괄 등록 / 작업 상태 조회
+            elif http_method == 'POST' and path == '/receiving-orders/bulk':
+                return run_idempotent(
+                    event, dynamodb.Table(IDEMPOTENCY_TABLE), 'POST /receiving-orders/bulk',
+                    lambda request: create_receiving_orders_bulk(request, context), COMMON_HEADERS
+                )
+            
+            elif http_method == 'GET' and path.startswith('/receiving-orders/bulk/') and path_params.get('job_id'):
+                return get_bulk_job(path_params['job_id'])
+            
+            # 일자/상태별 주문 수 집계 (대시보드)
+            elif http_method == 'GET' and path == '/receiving-orders/rollups':
+                return get_order_rollups(event)
+            
+            # 주문 내보내기 작업 시작 / 상태 조회
+            elif http_method == 'POST' and path == '/receiving-orders/export':
+                return start_order_export(event, context)
+            
+            elif http_method == 'GET' and path.startswith('/receiving-orders/export/') and path_params.get('export_id'):
+                return get_order_export(path_params['export_id'])
             
             # OPTIONS 메서드 처리 (CORS)
             elif http_method == 'OPTIONS':
@@ -79,20 +208,30 @@ def lambda_handler(event, context):
             return {
                 'statusCode': 404,
                 'headers': COMMON_HEADERS,
-                'body': json.dumps({
+                'body': dumps({
                     'message': 'Endpoint not found',
                     'path': path,
                     'method': http_method
-                }, cls=DecimalEncoder)
+                })
             }
         
+        # 직접 호출 - 비동기 내보내기 작업 실행
+        if event.get('action') == 'export_receiving_orders':
+            return run_order_export(event, context)
+        if event.get('action') == 'import_receiving_orders':
+            return run_bulk_job(event, context)
+        
+        # 비동기 호출 실패 대상 (작업 함수가 시간 초과 / 메모리 부족으로 중단된 경우)
+        if 'requestPayload' in event and 'responseContext' in event:
+            return record_job_failure(event)
+        
         # 직접 호출
         return {
             'statusCode': 200,
-            'body': json.dumps({
+            'body': dumps({
                 'message': 'Receiving order service executed directly',
                 'event': event
-            }, cls=DecimalEncoder)
+            })
         }
             
     except Exception as e:
@@ -100,7 +239,7 @@ def lambda_handler(event, context):
         return {
             'statusCode': 500,
             'headers': COMMON_HEADERS,
-            'body': json.dumps({'message': f"Error: {str(e)}"}, cls=DecimalEncoder)
+            'body': dumps({'message': f"Error: {str(e)}"})
         }
 
 #def publish_event(event_detail, detail_type, source='wms.receiving-service'):
@@ -127,43 +266,40 @@ def publish_event(event_detail, detail_type, source='wms.receiving-service'):
     print(f"EventBridge 이벤트 발행 비활성화됨: {detail_type}")
     return None  # 이벤트 발행 스킵
 
-def upload_document(order_id, document_info, user_id):
-    """문서 업로드 처리"""
-    try:
-        document_type = document_info.get('document_type')
-        file_name = document_info.get('file_name')
-        content_type = document_info.get('content_type')
-        file_content = document_info.get('file_content')
-        
-        if not all([document_type, file_name, content_type, file_content]):
-            print(f"Missing required document fields for {document_type}")
-            return None
-            
-        # 문서 ID 및 기타 메타데이터 생성
-        document_id = str(uuid.uuid4())
-        timestamp = int(datetime.now().timestamp())
-        file_extension = file_name.split('.')[-1] if '.' in file_name else ''
-        
-        # S3 키 생성
-        s3_key = f"{order_id}/{document_type.lower()}/{document_id}.{file_extension}"
-        
-        # 파일 내용 디코딩
-        try:
-            decoded_content = base64.b64decode(file_content)
-        except Exception as e:
-            print(f"Error decoding file content for {document_type}: {str(e)}")
-            return None
-            
-        # S3에 업로드
-        s3.put_object(
-            Bucket=DOCUMENT_BUCKET,
-            Key=s3_key,
-            Body=decoded_content,
-            ContentType=content_type
-        )
-        
-        # 메타데이터 저장
-        document_metadata = {
+class DocumentContentError(ValueError):
+    """문서 내용 디코딩 실패 (400)"""
+
+def prepare_document(order_id, document_info, user_id, timestamp):
+    """문서 필수 항목 확인 및 메타데이터 생성 (디코딩은 업로드 작업에서 병렬 처리)
+    
+    upload_session이 있으면 클라이언트가 presigned URL로 S3에 직접 올린 문서로 처리합니다.
+    """
+    if document_info.get('upload_session'):
+        session = read_upload_session(document_info['upload_session'])
+        if session.get('order_id') not in (None, order_id):
+            raise DocumentContentError('업로드 세션이 다른 주문에 속해 있습니다')
+        if document_info.get('document_type', session['document_type']) != session['document_type']:
+            raise DocumentContentError(f"문서 유형이 업로드 세션과 일치하지 않습니다: {document_info.get('document_type')}")
+        return {
+            'metadata': build_document_metadata(session, order_id, session['size_bytes'], timestamp),
+            'session': session,
+            'parts': document_info.get('parts')
+        }
+    
+    document_type = document_info.get('document_type')
+    file_name = document_info.get('file_name')
+    content_type = document_info.get('content_type')
+    file_content = document_info.get('file_content')
+    
+    if not all([document_type, file_name, content_type, file_content]):
+        raise DocumentContentError(f'문서 필수 항목이 누락되었습니다: {document_type or file_name}')
+    
+    # 문서 ID 및 S3 키 생성
+    document_id = str(uuid.uuid4())
+    s3_key = build_s3_key(order_id, document_type, document_id, file_name)
+    
+    return {
+        'metadata': {
             'document_id': document_id,
             'order_id': order_id,
             'document_type': document_type,
@@ -174,30 +310,93 @@ def upload_document(order_id, document_info, user_id):
             'uploader': user_id,
             'verification_status': 'PENDING',
             'verification_notes': ''
-        }
-        
-        table = dynamodb.Table(DOCUMENT_METADATA_TABLE)
-        table.put_item(Item=document_metadata)
-        
-        # 문서 업로드 이벤트 발행
-        event_detail = {
-            'document_id': document_id,
-            'order_id': order_id,
-            'document_type': document_type,
-            'timestamp': timestamp
-        }
-        
-        publish_event(event_detail, 'DocumentUploaded', 'wms.document-service')
-        
+        },
+        'file_content': file_content
+    }
+
+def elapsed_ms(started):
+    """perf_counter 기준 경과 시간(ms)"""
+    return round((time.perf_counter() - started) * 1000, 1)
+
+def upload_document(document):
+    """문서 하나 디코딩 후 S3 업로드, 단계별 소요 시간 반환 (직접 업로드 문서는 완료 확인만)"""
+    metadata = document['metadata']
+    started = time.perf_counter()
+    
+    if 'session' in document:
+        size_bytes = complete_upload(s3, DOCUMENT_BUCKET, document['session'], document.get('parts'))
+        metadata['size_bytes'] = size_bytes
         return {
-            'document_id': document_id,
-            'document_type': document_type,
-            'file_name': file_name,
-            'upload_status': 'COMPLETE'
+            's3_key': metadata['s3_key'],
+            'client_uploaded': True,
+            'size_bytes': size_bytes,
+            'decode_ms': 0,
+            'upload_ms': elapsed_ms(started),
+            'total_ms': elapsed_ms(started)
         }
+    
+    # 파일 내용 디코딩
+    try:
+        decoded_content = base64.b64decode(document['file_content'])
+    except Exception:
+        raise DocumentContentError(f"문서 내용이 올바른 base64 형식이 아닙니다: {metadata['document_type']}")
+    decode_ms = elapsed_ms(started)
+    
+    upload_started = time.perf_counter()
+    s3.put_object(
+        Bucket=DOCUMENT_BUCKET,
+        Key=metadata['s3_key'],
+        Body=decoded_content,
+        ContentType=metadata['content_type']
+    )
+    
+    return {
+        's3_key': metadata['s3_key'],
+        'client_uploaded': False,
+        'size_bytes': len(decoded_content),
+        'decode_ms': decode_ms,
+        'upload_ms': elapsed_ms(upload_started),
+        'total_ms': elapsed_ms(started)
+    }
+
+def delete_uploaded_documents(s3_keys):
+    """보상 처리 - 업로드한 S3 객체 삭제 (실패는 로그만 남김)"""
+    if not s3_keys:
+        return
+    try:
+        s3.delete_objects(
+            Bucket=DOCUMENT_BUCKET,
+            Delete={'Objects': [{'Key': key} for key in s3_keys], 'Quiet': True}
+        )
     except Exception as e:
-        print(f"Error uploading document {document_type}: {str(e)}")
-        return None
+        print(f"Error deleting uploaded documents {s3_keys}: {str(e)}")
+
+def upload_documents(documents):
+    """문서 디코딩 + S3 업로드를 제한된 스레드 풀에서 동시 실행, 문서별 결과(소요 시간 포함) 반환
+    
+    하나라도 실패하면 업로드된 객체를 삭제하고 예외 발생 (내용 / 업로드 세션 오류는 ValueError)
+    """
+    if not documents:
+        return []
+    
+    results = []
+    errors = []
+    with ThreadPoolExecutor(max_workers=min(DOCUMENT_UPLOAD_WORKERS, len(documents))) as executor:
+        futures = [executor.submit(upload_document, document) for document in documents]
+        for future in futures:
+            try:
+                results.append(future.result())
+            except Exception as e:
+                errors.append(e)
+    
+    if errors:
+        # 클라이언트가 직접 올린 객체는 재시도에 다시 쓰이므로 남겨 둠
+        delete_uploaded_documents([result['s3_key'] for result in results if not result['client_uploaded']])
+        content_errors = [error for error in errors if isinstance(error, ValueError)]
+        if content_errors:
+            raise content_errors[0]
+        raise RuntimeError(f"문서 업로드 실패: {'; '.join(str(error) for error in errors)}")
+    return results
 
 def create_receiving_order(event):
     """입고 주문 생성"""
@@ -223,7 +422,7 @@ def create_receiving_order(event):
                 return {
                     'statusCode': 400,
                     'headers': COMMON_HEADERS,
-                    'body': json.dumps({'message': error_msg}, cls=DecimalEncoder)
+                    'body': dumps({'message': error_msg})
                 }
 
         # 필수 문서 체크
@@ -234,7 +433,15 @@ def create_receiving_order(event):
             return {
                 'statusCode': 400,
                 'headers': COMMON_HEADERS,
-                'body': json.dumps({'message': f'필수 문서가 누락되었습니다: {", ".join(missing_docs)}'}, cls=DecimalEncoder)
+                'body': dumps({'message': f'필수 문서가 누락되었습니다: {", ".join(missing_docs)}'})
+            }
+
+        # 주문 + 품목 + 이력 + 문서 메타데이터가 한 트랜잭션에 들어가야 함
+        if len(documents) > MAX_TRANSACT_ITEMS - 3:
+            return {
+                'statusCode': 400,
+                'headers': COMMON_HEADERS,
+                'body': dumps({'message': f'문서는 최대 {MAX_TRANSACT_ITEMS - 3}개까지 등록할 수 있습니다.'})
             }
 
         order_id = str(uuid.uuid4())
@@ -251,7 +458,7 @@ def create_receiving_order(event):
             return {
                 'statusCode': 400,
                 'headers': COMMON_HEADERS,
-                'body': json.dumps({'message': '잘못된 날짜 형식입니다. YYYY-MM-DD 또는 ISO 형식을 사용하세요.'}, cls=DecimalEncoder)
+                'body': dumps({'message': '잘못된 날짜 형식입니다. YYYY-MM-DD 또는 ISO 형식을 사용하세요.'})
             }
 
         order_data = {
@@ -291,34 +498,88 @@ def create_receiving_order(event):
             'updated_at': Decimal(str(timestamp))
         }
 
-        dynamodb.Table(RECEIVING_ORDER_TABLE).put_item(Item=order_data)
-        dynamodb.Table(RECEIVING_ITEM_TABLE).put_item(Item=item_data)
-
-        # 문서 업로드
-        uploaded_documents = []
-        for doc in documents:
-            result = upload_document(order_id, doc, user_id)
-            if result:
-                uploaded_documents.append(result)
+        # 문서 필수 항목 확인 (업로드 전에 모두 확인)
+        try:
+            prepared_documents = [prepare_document(order_id, doc, user_id, timestamp) for doc in documents]
+        except ValueError as e:
+            return {
+                'statusCode': 400,
+                'headers': COMMON_HEADERS,
+                'body': dumps({'message': str(e)})
+            }
 
         # 이력 기록
         history_data = {
             'history_id': str(uuid.uuid4()),
             'order_id': order_id,
+            'supplier_id': order_data['supplier_id'],
             'timestamp': Decimal(str(timestamp)),
             'event_type': 'ORDER_CREATED',
+            'event_time': event_time_key('ORDER_CREATED', timestamp),
             'previous_status': None,
             'new_status': 'IN_PROCESS',
             'user_id': user_id,
             'notes': '입고 주문 생성 완료'
         }
-        dynamodb.Table(RECEIVING_HISTORY_TABLE).put_item(Item=history_data)
+
+        # 디코딩 + S3 업로드는 트랜잭션 전에 동시 실행
+        upload_started = time.perf_counter()
+        try:
+            upload_results = upload_documents(prepared_documents)
+        except ValueError as e:
+            return {
+                'statusCode': 400,
+                'headers': COMMON_HEADERS,
+                'body': dumps({'message': str(e)})
+            }
+        upload_wall_ms = elapsed_ms(upload_started)
+        uploaded_keys = [result['s3_key'] for result in upload_results if not result['client_uploaded']]
+
+        # 주문 / 품목 / 문서 메타데이터 / 이력을 한 번의 TransactWriteItems로 커밋
+        actions = [
+            put_action(RECEIVING_ORDER_TABLE, order_data, 'attribute_not_exists(order_id)'),
+            put_action(RECEIVING_ITEM_TABLE, item_data, 'attribute_not_exists(item_id)'),
+            put_action(RECEIVING_HISTORY_TABLE, history_data, 'attribute_not_exists(history_id)')
+        ]
+        actions.extend(
+            put_action(DOCUMENT_METADATA_TABLE, document['metadata'], 'attribute_not_exists(document_id)')
+            for document in prepared_documents
+        )
+        try:
+            transact_write(dynamodb.meta.client, actions)
+        except Exception:
+            # 보상 처리 - 커밋되지 않은 주문의 문서 삭제
+            delete_uploaded_documents(uploaded_keys)
+            raise
+
+        # 문서 업로드 이벤트 발행 (커밋 이후)
+        uploaded_documents = []
+        for document, upload_result in zip(prepared_documents, upload_results):
+            metadata = document['metadata']
+            publish_event({
+                'document_id': metadata['document_id'],
+                'order_id': order_id,
+                'document_type': metadata['document_type'],
+                'timestamp': timestamp
+            }, 'DocumentUploaded', 'wms.document-service')
+            uploaded_documents.append({
+                'document_id': metadata['document_id'],
+                'document_type': metadata['document_type'],
+                'file_name': metadata['file_name'],
+                'upload_status': 'COMPLETE',
+                'size_bytes': upload_result['size_bytes'],
+                'timing': {
+                    'decode_ms': upload_result['decode_ms'],
+                    'upload_ms': upload_result['upload_ms'],
+                    'total_ms': upload_result['total_ms']
+                }
+            })
 
         # 응답
         return {
             'statusCode': 201,
             'headers': COMMON_HEADERS,
-            'body': json.dumps({
+            'body': dumps({
                 'order': {
                     **order_data,
                     'scheduled_date_iso': scheduled_date,
@@ -334,8 +595,9 @@ def create_receiving_order(event):
                     }
                 },
                 'documents': uploaded_documents,
+                'documents_upload_ms': upload_wall_ms,
                 'message': '입고 주문 및 문서가 성공적으로 생성되었습니다.'
-            }, cls=DecimalEncoder)
+            })
         }
 
     except Exception as e:
@@ -343,43 +605,200 @@ def create_receiving_order(event):
         return {
             'statusCode': 500,
             'headers': COMMON_HEADERS,
-            'body': json.dumps({'message': f"입고 주문 생성 중 오류가 발생했습니다: {str(e)}"}, cls=DecimalEncoder)
+            'body': dumps({'message': f"입고 주문 생성 중 오류가 발생했습니다: {str(e)}"})
         }
 
+def build_date_condition(from_ts, to_ts):
+    """scheduled_date 범위 조건 (#sd 이름 사용), 범위가 없으면 None"""
+    if from_ts is not None and to_ts is not None:
+        return '#sd BETWEEN :from AND :to', {':from': from_ts, ':to': to_ts}
+    if from_ts is not None:
+        return '#sd >= :from', {':from': from_ts}
+    if to_ts is not None:
+        return '#sd <= :to', {':to': to_ts}
+    return None
+
+def build_order_request(index_name, key_condition, filter_conditions, values, names):
+    """query / scan 인자 생성 (빈 이름 / 값 맵은 DynamoDB가 거부하므로 제외)"""
+    request = {}
+    if index_name:
+        request['IndexName'] = index_name
+    if key_condition:
+        request['KeyConditionExpression'] = key_condition
+        # 최신 입고 예정일 / 생성일 순
+        request['ScanIndexForward'] = False
+    if filter_conditions:
+        request['FilterExpression'] = ' AND '.join(filter_conditions)
+    if values:
+        request['ExpressionAttributeValues'] = values
+    if names:
+        request['ExpressionAttributeNames'] = names
+    return request
+
+def plan_order_query(query_params, projection=None):
+    """필터(supplier_id, status, from_date, to_date)에 맞는 인덱스와 키 조건 선택
+    
+    우선순위: supplier-index > status-date-index > date-status-index(단일 시각)
+    > 상태별 status-date-index 팬아웃(날짜만) > 병렬 scan. 잘못된 날짜는 ValueError.
+    """
+    supplier_id = query_params.get('supplier_id')
+    status = query_params.get('status')
+    from_ts = parse_time_bound(query_params.get('from_date'))
+    to_ts = parse_time_bound(query_params.get('to_date'), end_of_day=True)
+    if from_ts is not None and to_ts is not None and from_ts > to_ts:
+        raise ValueError('from_date must not be after to_date')
+    
+    projection = projection or {}
+    names = dict(projection.get('ExpressionAttributeNames', {}))
+    date_condition = build_date_condition(from_ts, to_ts)
+    
+    def make_request(index_name, key_condition, filter_conditions, values, used_names=()):
+        # 표현식에서 실제로 쓰는 이름만 전달 (사용하지 않는 이름이 있으면 DynamoDB가 거부)
+        request_names = dict(names)
+        for alias in used_names:
+            request_names[alias] = ORDER_ATTRIBUTE_NAMES[alias]
+        request = build_order_request(index_name, key_condition, filter_conditions, values, request_names)
+        if 'ProjectionExpression' in projection:
+            request['ProjectionExpression'] = projection['ProjectionExpression']
+        return request
+    
+    # 1) 공급업체: supplier-index (정렬 키가 created_at이므로 상태/날짜는 필터)
+    if supplier_id:
+        values = {':sid': supplier_id}
+        filters = []
+        used_names = []
+        if status:
+            filters.append('#st = :st')
+            values[':st'] = status
+            used_names.append('#st')
+        if date_condition:
+            filters.append(date_condition[0])
+            values.update(date_condition[1])
+            used_names.append('#sd')
+        return {
+            'operation': 'query',
+            'index': ORDER_SUPPLIER_INDEX,
+            'key_condition': 'supplier_id',
+            'filters': [ORDER_ATTRIBUTE_NAMES[alias] for alias in used_names],
+            'requests': [make_request(ORDER_SUPPLIER_INDEX, 'supplier_id = :sid', filters, values, used_names)]
+        }
+    
+    # 2) 상태 (+ 날짜 범위): status-date-index
+    if status:
+        key_condition = '#st = :st'
+        values = {':st': status}
+        used_names = ['#st']
+        if date_condition:
+            key_condition += f' AND {date_condition[0]}'
+            values.update(date_condition[1])
+            used_names.append('#sd')
+        return {
+            'operation': 'query',
+            'index': ORDER_STATUS_DATE_INDEX,
+            'key_condition': ', '.join(ORDER_ATTRIBUTE_NAMES[alias] for alias in used_names),
+            'filters': [],
+            'requests': [make_request(ORDER_STATUS_DATE_INDEX, key_condition, [], values, used_names)]
+        }
+    
+    # 3) 날짜 범위가 단일 시각: date-status-index 해시 키 일치
+    if from_ts is not None and from_ts == to_ts:
+        return {
+            'operation': 'query',
+            'index': ORDER_DATE_STATUS_INDEX,
+            'key_condition': 'scheduled_date',
+            'filters': [],
+            'requests': [make_request(ORDER_DATE_STATUS_INDEX, '#sd = :from', [], {':from': from_ts}, ['#sd'])]
+        }
+    
+    # 4) 날짜 범위만: 상태별 status-date-index 범위 query 팬아웃
+    if date_condition:
+        requests = []
+        for order_status in ORDER_STATUSES:
+            values = {':st': order_status}
+            values.update(date_condition[1])
+            requests.append(make_request(
+                ORDER_STATUS_DATE_INDEX, f'#st = :st AND {date_condition[0]}', [], values, ['#st', '#sd']
+            ))
+        return {
+            'operation': 'query',
+            'index': ORDER_STATUS_DATE_INDEX,
+            'key_condition': 'status (fan-out), scheduled_date',
+            'filters': [],
+            'requests': requests
+        }
+    
+    # 5) 적용 가능한 인덱스 없음: 병렬 scan
+    return {
+        'operation': 'scan',
+        'index': None,
+        'key_condition': None,
+        'filters': [],
+        'segments': ORDER_SCAN_SEGMENTS,
+        'requests': [make_request(None, None, [], {})]
+    }
+
+def format_order(item):
+    """주문 레코드를 목록 / 내보내기 응답 형식으로 변환"""
+    formatted_item = {
+        'order_id': item.get('order_id'),
+        'supplier_name': item.get('supplier_name'),
+        'supplier_id': item.get('supplier_id'),
+        'sku_name': item.get('sku_name'),
+        'sku_id': item.get('sku_number'),
+        'serial_barcode': item.get('barcode', ''),
+        'status': item.get('status', DEFAULT_ORDER_STATUS),
+        'created_at': item.get('created_at'),
+        'grn_number': item.get('grn_number', '')
+    }
+
+    if 'scheduled_date' in item:
+        formatted_item['received_date'] = datetime.fromtimestamp(int(item['scheduled_date'])).strftime('%Y-%m-%d')
+    if 'created_at' in item:
+        formatted_item['created_at_iso'] = datetime.fromtimestamp(int(item['created_at'])).isoformat()
+
+    return formatted_item
+
 def get_receiving_orders(event):
-    """입고 주문 목록 전체 조회 (필터 없이)"""
+    """입고 주문 목록 조회 (필터에 맞는 인덱스 query, 없으면 scan 세그먼트 동시 조회, 페이지네이션)"""
     try:
-        table = dynamodb.Table(RECEIVING_ORDER_TABLE)
-        response = table.scan()  # ✅ 조건 없이 전체 조회
-        items = response.get('Items', [])
-
-        # 결과 포맷팅
-        formatted_items = []
-        for item in items:
-            formatted_item = {
-                'order_id': item.get('order_id'),
-                'supplier_name': item.get('supplier_name'),
-                'supplier_id': item.get('supplier_id'),
-                'sku_name': item.get('sku_name'),
-                'sku_id': item.get('sku_number'),
-                'serial_barcode': item.get('barcode', ''),
-                'status': item.get('status', 'IN_PROCESS'),
-                'created_at': item.get('created_at'),
-                'grn_number': item.get('grn_number', '')
+        query_params = event.get('queryStringParameters', {}) or {}
+        try:
+            fields = parse_fields(query_params, ORDER_LIST_FIELDS, required=('order_id',))
+            # 정렬 / date_range 계산용 scheduled_date는 항상 조회
+            projection = build_projection(fields, ORDER_LIST_FIELDS, extra_attributes=('scheduled_date',))
+            plan = plan_order_query(query_params, projection)
+            # 필터나 scan 세그먼트 수가 바뀌면 이전 토큰은 거부
+            scope_params = {name: query_params.get(name) for name in ORDER_FILTER_PARAMS}
+            scope_params['segments'] = plan.get('segments')
+            scope = query_scope('receiving-orders', scope_params)
+            limit, cursor = read_page_params(query_params, scope, plan['index'])
+        except ValueError as e:
+            return {
+                'statusCode': 400,
+                'headers': COMMON_HEADERS,
+                'body': dumps({'message': str(e)})
             }
+        
+        plan_summary = describe_plan(plan)
+        items, next_cursor = execute_plan_page(
+            dynamodb.meta.client, RECEIVING_ORDER_TABLE, plan, limit,
+            stream=cursor['stream'] if cursor else 0,
+            start_key=cursor['raw_key'] if cursor and cursor['raw_key'] else None,
+            segment_keys=cursor['segments'] if cursor else None
+        )
+        next_token = None
+        if next_cursor:
+            next_token = encode_token(next_cursor['key'], scope, plan['index'], next_cursor['stream'],
+                                      next_cursor.get('segments'))
 
-            if 'scheduled_date' in item:
-                formatted_item['received_date'] = datetime.fromtimestamp(item['scheduled_date']).strftime('%Y-%m-%d')
-            if 'created_at' in item:
-                formatted_item['created_at_iso'] = datetime.fromtimestamp(item['created_at']).isoformat()
-
-            formatted_items.append(formatted_item)
+        # 결과 포맷팅
+        formatted_items = [format_order(item) for item in items]
 
-        # 정렬
+        # 페이지 내 정렬
         formatted_items.sort(key=lambda x: x.get('received_date', ''), reverse=True)
 
         # 메타데이터 구성
-        meta = {}
+        meta = {'plan': plan_summary}
         if formatted_items:
             dates = [item.get('received_date') for item in formatted_items if 'received_date' in item]
             if dates:
@@ -388,19 +807,832 @@ def get_receiving_orders(event):
                     'to': max(dates)
                 }
 
+        formatted_items = [select_fields(item, fields) for item in formatted_items]
+
         return {
             'statusCode': 200,
             'headers': COMMON_HEADERS,
-            'body': json.dumps({
-                'orders': formatted_items,
-                'count': len(formatted_items),
-                'meta': meta
-            }, cls=DecimalEncoder)
+            'body': dumps(page_body('orders', formatted_items, next_token, meta=meta))
         }
     except Exception as e:
         print(f"Error getting receiving orders: {str(e)}")
         return {
             'statusCode': 500,
             'headers': COMMON_HEADERS,
-            'body': json.dumps({'message': f"Error getting receiving orders: {str(e)}"}, cls=DecimalEncoder)
+            'body': dumps({'message': f"Error getting receiving orders: {str(e)}"})
+        }
+
+def write_job_status(key, status):
+    """백그라운드 작업(내보내기 / 일괄 등록) 상태를 S3 JSON으로 기록"""
+    s3.put_object(
+        Bucket=EXPORT_BUCKET,
+        Key=key,
+        Body=dumps(status).encode('utf-8'),
+        ContentType='application/json'
+    )
+
+def read_job_status(key):
+    """백그라운드 작업 상태 조회 (없으면 None)"""
+    try:
+        response = s3.get_object(Bucket=EXPORT_BUCKET, Key=key)
+    except s3.exceptions.NoSuchKey:
+        return None
+    return json.loads(response['Body'].read())
+
+def invoke_job_async(context, payload):
+    """백그라운드 작업 함수를 비동기(Event) 호출 (JOB_FUNCTION_NAME 미설정 시 같은 함수)"""
+    function_name = JOB_FUNCTION_NAME or (context.function_name if context else os.environ.get('AWS_LAMBDA_FUNCTION_NAME'))
+    lambda_client.invoke(
+        FunctionName=function_name,
+        InvocationType='Event',
+        Payload=dumps(payload).encode('utf-8')
+    )
+
+def job_deadline(context):
+    """남은 실행 시간이 JOB_DEADLINE_MARGIN_MS 미만이 되면 True를 반환하는 함수 (context 없으면 항상 False)"""
+    if context is None:
+        return lambda: False
+    return lambda: context.get_remaining_time_in_millis() < JOB_DEADLINE_MARGIN_MS
+
+def job_status_key(payload):
+    """비동기 작업 호출 payload에 해당하는 상태 파일 키 (알 수 없는 작업이면 None)"""
+    if payload.get('action') == 'export_receiving_orders' and is_job_id(payload.get('export_id')):
+        return export_manifest_key(payload['export_id'])
+    if payload.get('action') == 'import_receiving_orders' and is_job_id(payload.get('job_id')):
+        return bulk_job_key(payload['job_id'], 'status.json')
+    return None
+
+def record_job_failure(event):
+    """비동기 호출 실패 레코드를 받아 아직 RUNNING인 작업 상태를 FAILED로 기록"""
+    payload = event.get('requestPayload') or {}
+    key = job_status_key(payload)
+    if key is None:
+        print(f"Unknown failed job payload: {dumps(payload)}")
+        return None
+    
+    status = read_job_status(key) or {}
+    if status.get('status') not in (None, 'RUNNING'):
+        return status
+    response = event.get('responsePayload') or {}
+    condition = (event.get('requestContext') or {}).get('condition')
+    status.update({
+        'status': 'FAILED',
+        'error': response.get('errorMessage') or condition or 'Job function failed',
+        'failed_at': int(datetime.now().timestamp())
+    })
+    write_job_status(key, status)
+    return status
+
+def is_job_id(value):
+    try:
+        uuid.UUID(value)
+        return True
+    except (TypeError, ValueError):
+        return False
+
+def export_manifest_key(export_id):
+    return f"{EXPORT_PREFIX}/{export_id}.json"
+
+def start_order_export(event, context):
+    """주문 내보내기 작업 시작 - 필터 검증 후 같은 함수를 비동기 호출하고 202 반환"""
+    try:
+        body = json.loads(event.get('body') or '{}')
+        export_format = (body.get('format') or 'ndjson').lower()
+        filters = {name: body.get(name) for name in ORDER_FILTER_PARAMS if body.get(name)}
+        
+        if export_format not in EXPORT_FORMATS:
+            return {
+                'statusCode': 400,
+                'headers': COMMON_HEADERS,
+                'body': dumps({'message': f"format must be one of: {', '.join(EXPORT_FORMATS)}"})
+            }
+        try:
+            plan = plan_order_query(filters)
+        except ValueError as e:
+            return {
+                'statusCode': 400,
+                'headers': COMMON_HEADERS,
+                'body': dumps({'message': str(e)})
+            }
+        
+        export_id = str(uuid.uuid4())
+        manifest = {
+            'export_id': export_id,
+            'status': 'RUNNING',
+            'format': export_format,
+            'filters': filters,
+            'plan': describe_plan(plan),
+            'requested_by': body.get('user_id', 'system'),
+            'created_at': int(datetime.now().timestamp())
+        }
+        write_job_status(export_manifest_key(export_id), manifest)
+        invoke_job_async(context, {
+            'action': 'export_receiving_orders',
+            'export_id': export_id,
+            'format': export_format,
+            'filters': filters
+        })
+        
+        return {
+            'statusCode': 202,
+            'headers': COMMON_HEADERS,
+            'body': dumps({
+                **manifest,
+                'status_url': f"/receiving-orders/export/{export_id}"
+            })
+        }
+    except Exception as e:
+        print(f"Error starting receiving order export: {str(e)}")
+        return {
+            'statusCode': 500,
+            'headers': COMMON_HEADERS,
+            'body': dumps({'message': f"Error starting receiving order export: {str(e)}"})
+        }
+
+def run_order_export(event, context=None):
+    """비동기 내보내기 작업 - 병렬 scan / 인덱스 query 결과를 NDJSON / CSV 멀티파트 객체로 저장"""
+    export_id = event['export_id']
+    export_format = event.get('format', 'ndjson')
+    filters = event.get('filters') or {}
+    key = f"{EXPORT_PREFIX}/{export_id}.{export_format}"
+    
+    plan = plan_order_query(filters)
+    if plan['operation'] == 'scan':
+        plan['segments'] = EXPORT_SCAN_SEGMENTS
+    
+    # start_order_export가 저장한 매니페스트(requested_by, created_at 등)를 유지하며 갱신
+    manifest = read_job_status(export_manifest_key(export_id)) or {
+        'export_id': export_id,
+        'format': export_format,
+        'filters': filters
+    }
+    manifest.update({
+        'plan': describe_plan(plan),
+        'started_at': int(datetime.now().timestamp())
+    })
+    try:
+        result = export_plan_to_s3(
+            dynamodb.meta.client, RECEIVING_ORDER_TABLE, plan,
+            s3, EXPORT_BUCKET, key, export_format, list(ORDER_LIST_FIELDS), format_order,
+            deadline=job_deadline(context)
+        )
+        manifest.update({
+            'status': 'COMPLETED',
+            's3_key': key,
+            'rows': result['rows'],
+            'bytes': result['bytes'],
+            'completed_at': int(datetime.now().timestamp())
+        })
+    except Exception as e:
+        print(f"Error exporting receiving orders {export_id}: {str(e)}")
+        manifest.update({'status': 'FAILED', 'error': str(e)})
+    
+    write_job_status(export_manifest_key(export_id), manifest)
+    return manifest
+
+def get_order_export(export_id):
+    """내보내기 작업 상태 조회 (완료 시 presigned 다운로드 URL 포함)"""
+    try:
+        manifest = read_job_status(export_manifest_key(export_id)) if is_job_id(export_id) else None
+        if manifest is None:
+            return {
+                'statusCode': 404,
+                'headers': COMMON_HEADERS,
+                'body': dumps({'message': 'Export not found'})
+            }
+        
+        if manifest.get('status') == 'COMPLETED':
+            manifest['download_url'] = s3.generate_presigned_url(
+                'get_object',
+                Params={'Bucket': EXPORT_BUCKET, 'Key': manifest['s3_key']},
+                ExpiresIn=EXPORT_URL_EXPIRES
+            )
+        
+        return {
+            'statusCode': 200,
+            'headers': COMMON_HEADERS,
+            'body': dumps(manifest)
+        }
+    except Exception as e:
+        print(f"Error getting receiving order export: {str(e)}")
+        return {
+            'statusCode': 500,
+            'headers': COMMON_HEADERS,
+            'body': dumps({'message': f"Error getting receiving order export: {str(e)}"})
+        }
+
+def get_order_rollups(event):
+    """일자/상태별 주문 수 조회 - 집계 테이블 query 한 번 (기본: 최근 30일)"""
+    try:
+        query_params = event.get('queryStringParameters', {}) or {}
+        today = datetime.now().date()
+        try:
+            to_date = datetime.fromisoformat(query_params.get('to_date') or today.isoformat()).date()
+            from_date = datetime.fromisoformat(query_params.get('from_date') or (to_date - timedelta(days=29)).isoformat()).date()
+        except ValueError:
+            return {
+                'statusCode': 400,
+                'headers': COMMON_HEADERS,
+                'body': dumps({'message': 'from_date and to_date must be YYYY-MM-DD'})
+            }
+        if from_date > to_date or (to_date - from_date).days >= MAX_ROLLUP_DAYS:
+            return {
+                'statusCode': 400,
+                'headers': COMMON_HEADERS,
+                'body': dumps({'message': f'Date range must be between 1 and {MAX_ROLLUP_DAYS} days'})
+            }
+        
+        statuses = [status for status in (query_params.get('status') or '').split(',') if status]
+        items = query_rollups(dynamodb.Table(RECEIVING_ROLLUP_TABLE), from_date.isoformat(), to_date.isoformat())
+        summary = build_rollup_summary(items, statuses)
+        
+        return {
+            'statusCode': 200,
+            'headers': COMMON_HEADERS,
+            'body': dumps({
+                'from_date': from_date.isoformat(),
+                'to_date': to_date.isoformat(),
+                **summary
+            })
+        }
+    except Exception as e:
+        print(f"Error getting receiving order rollups: {str(e)}")
+        return {
+            'statusCode': 500,
+            'headers': COMMON_HEADERS,
+            'body': dumps({'message': f"Error getting receiving order rollups: {str(e)}"})
+        }
+
+def bulk_job_key(job_id, name):
+    return f"{BULK_PREFIX}/{job_id}/{name}"
+
+def validate_manifest_row(row):
+    """매니페스트 행 검증 후 정규화된 dict 반환 (오류 목록이 있으면 ValueError)"""
+    errors = []
+    required_fields = [
+        ('scheduled_date', '입고 예정일이 필요합니다.'),
+        ('supplier_name', '공급업체 이름이 필요합니다.'),
+        ('supplier_number', '공급업체 번호가 필요합니다.'),
+        ('sku_name', 'SKU 이름이 필요합니다.'),
+        ('sku_number', 'SKU 번호가 필요합니다.'),
+        ('shipment_number', '배송 번호가 필요합니다.')
+    ]
+    for field_name, error_msg in required_fields:
+        if row.get(field_name) in (None, ''):
+            errors.append(error_msg)
+    
+    scheduled_date = None
+    if row.get('scheduled_date') not in (None, ''):
+        try:
+            scheduled_date = parse_time_bound(row['scheduled_date'])
+        except ValueError:
+            errors.append('잘못된 날짜 형식입니다. YYYY-MM-DD 또는 ISO 형식을 사용하세요.')
+    
+    expected_qty = row.get('expected_qty')
+    try:
+        expected_qty = Decimal(str(expected_qty)) if expected_qty not in (None, '') else Decimal('1')
+        if expected_qty <= 0 or expected_qty != expected_qty.to_integral_value():
+            raise ValueError
+    except Exception:
+        errors.append('expected_qty는 1 이상의 정수여야 합니다.')
+    
+    if errors:
+        raise ValueError(errors)
+    
+    return {
+        'po_number': str(row.get('po_number') or ''),
+        'supplier_number': str(row['supplier_number']),
+        'supplier_name': str(row['supplier_name']),
+        'sku_name': str(row['sku_name']),
+        'sku_number': str(row['sku_number']),
+        'barcode': str(row.get('barcode') or ''),
+        'scheduled_date': scheduled_date,
+        'shipment_number': str(row['shipment_number']),
+        'truck_number': str(row.get('truck_number') or ''),
+        'driver_contact': str(row.get('driver_contact') or ''),
+        'notes': str(row.get('notes') or ''),
+        'expected_qty': expected_qty,
+        'dimensions': {name: row.get(name) for name in ('length', 'width', 'height', 'depth', 'volume', 'weight')}
+    }
+
+def process_manifest_batch(rows, orders_by_po, user_id, timestamp):
+    """매니페스트 행 배치 검증 후 주문 / 품목 / 이력 BatchWriteItem, 행별 결과 목록 반환
+
+    같은 공급업체 + po_number 행은 한 주문의 품목으로 묶습니다(orders_by_po는 배치 간 공유).
+    po_number가 없는 행은 각각 별도 주문이 됩니다.
+    """
+    results = []
+    orders, items, histories = [], [], []
+    
+    for row_number, row, error in rows:
+        result = {'row': row_number, 'status': 'FAILED', 'order_id': None, 'item_id': None,
+                  'po_number': (row or {}).get('po_number') or None, 'errors': []}
+        results.append(result)
+        if error:
+            result['errors'] = [error]
+            continue
+        try:
+            line = validate_manifest_row(row)
+        except ValueError as e:
+            result['errors'] = e.args[0]
+            continue
+        
+        po_key = (line['supplier_number'], line['po_number']) if line['po_number'] else None
+        order_id = orders_by_po.get(po_key) if po_key else None
+        if order_id is None:
+            order_id = str(uuid.uuid4())
+            if po_key:
+                orders_by_po[po_key] = order_id
+            orders.append({
+                'order_id': order_id,
+                'po_number': line['po_number'] or f'PO-{timestamp}',
+                'supplier_id': line['supplier_number'],
+                'supplier_name': line['supplier_name'],
+                'sku_name': line['sku_name'],
+                'sku_number': line['sku_number'],
+                'barcode': line['barcode'],
+                'scheduled_date': Decimal(str(line['scheduled_date'])),
+                'status': 'SCHEDULED',
+                'notes': line['notes'],
+                'shipment_number': line['shipment_number'],
+                'truck_number': line['truck_number'],
+                'driver_contact': line['driver_contact'],
+                'verification_status': 'PENDING',
+                'created_at': Decimal(str(timestamp)),
+                'updated_at': Decimal(str(timestamp))
+            })
+            histories.append({
+                'history_id': str(uuid.uuid4()),
+                'order_id': order_id,
+                'supplier_id': line['supplier_number'],
+                'timestamp': Decimal(str(timestamp)),
+                'event_type': 'ORDER_CREATED',
+                'event_time': event_time_key('ORDER_CREATED', timestamp),
+                'previous_status': None,
+                'new_status': 'IN_PROCESS',
+                'user_id': user_id,
+                'notes': '매니페스트 일괄 등록'
+            })
+        
+        item_id = str(uuid.uuid4())
+        items.append({
+            'item_id': item_id,
+            'order_id': order_id,
+            'product_name': line['sku_name'],
+            'sku_number': line['sku_number'],
+            'expected_qty': line['expected_qty'],
+            'serial_or_barcode': line['barcode'],
+            **{name: safe_decimal(value) for name, value in line['dimensions'].items()},
+            'created_at': Decimal(str(timestamp)),
+            'updated_at': Decimal(str(timestamp))
+        })
+        result.update({'status': 'CREATED', 'order_id': order_id, 'item_id': item_id})
+    
+    # 세 테이블을 동시에 쓰고, 각 테이블은 25개 청크를 작업 풀에서 병렬 처리
+    client = dynamodb.meta.client
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        futures = [
+            executor.submit(batch_write_items, client, table_name, table_items, BULK_WRITE_WORKERS)
+            for table_name, table_items in (
+                (RECEIVING_ORDER_TABLE, orders),
+                (RECEIVING_ITEM_TABLE, items),
+                (RECEIVING_HISTORY_TABLE, histories)
+            )
+        ]
+        failed_orders, failed_items, failed_histories = [future.result() for future in futures]
+    
+    # 쓰기 실패 행 표시 (주문 쓰기 실패 시 해당 주문의 모든 행 실패 처리, 이후 행은 새 주문으로 등록)
+    failed_order_ids = {item['order_id']: reason for item, reason in failed_orders}
+    failed_item_ids = {item['item_id']: reason for item, reason in failed_items}
+    for item, reason in failed_histories:
+        print(f"Error writing bulk order history for {item['order_id']}: {reason}")
+    for po_key, order_id in list(orders_by_po.items()):
+        if order_id in failed_order_ids:
+            del orders_by_po[po_key]
+    for result in results:
+        reason = failed_order_ids.get(result['order_id']) or failed_item_ids.get(result['item_id'])
+        if result['status'] == 'CREATED' and reason:
+            result.update({'status': 'FAILED', 'errors': [f'Write failed: {reason}']})
+    
+    return results
+
+def import_manifest(source, manifest_format, user_id, on_batch):
+    """매니페스트를 BULK_BATCH_ROWS 행씩 읽어 처리하고 on_batch(결과 목록, 요약) 호출, 요약 반환"""
+    timestamp = int(datetime.now().timestamp())
+    orders_by_po = {}
+    summary = {'rows': 0, 'created': 0, 'failed': 0, 'orders': set()}
+    for rows in batched(iter_manifest_rows(source, manifest_format), BULK_BATCH_ROWS):
+        results = process_manifest_batch(rows, orders_by_po, user_id, timestamp)
+        for result in results:
+            summary['rows'] += 1
+            if result['status'] == 'CREATED':
+                summary['created'] += 1
+                summary['orders'].add(result['order_id'])
+            else:
+                summary['failed'] += 1
+        on_batch(results, summary)
+    summary['orders'] = len(summary['orders'])
+    return summary
+
+def create_receiving_orders_bulk(event, context):
+    """NDJSON / CSV 매니페스트 일괄 등록 (작은 매니페스트는 즉시 처리, 큰 매니페스트는 백그라운드 작업)"""
+    try:
+        query_params = event.get('queryStringParameters', {}) or {}
+        try:
+            manifest_format = detect_manifest_format(query_params.get('format'), get_header(event, 'Content-Type'))
+        except ValueError as e:
+            return {
+                'statusCode': 400,
+                'headers': COMMON_HEADERS,
+                'body': dumps({'message': str(e)})
+            }
+        user_id = query_params.get('user_id', 'system')
+        manifest = read_body(event)
+        if not manifest.strip():
+            return {
+                'statusCode': 400,
+                'headers': COMMON_HEADERS,
+                'body': dumps({'message': 'Manifest body is empty'})
+            }
+        
+        # 작은 매니페스트 - 즉시 처리 후 행별 결과 반환
+        if len(manifest.encode('utf-8')) <= BULK_SYNC_MAX_BYTES:
+            report = []
+            summary = import_manifest(manifest, manifest_format, user_id, lambda results, _: report.extend(results))
+            return {
+                'statusCode': 200 if summary['failed'] == 0 else 207,
+                'headers': COMMON_HEADERS,
+                'body': dumps({**summary, 'results': report})
+            }
+        
+        # 큰 매니페스트 - S3에 저장 후 백그라운드 작업으로 처리
+        job_id = str(uuid.uuid4())
+        manifest_key = bulk_job_key(job_id, f'manifest.{manifest_format}')
+        s3.put_object(Bucket=EXPORT_BUCKET, Key=manifest_key, Body=manifest.encode('utf-8'))
+        status = {
+            'job_id': job_id,
+            'status': 'RUNNING',
+            'format': manifest_format,
+            'manifest_bytes': len(manifest.encode('utf-8')),
+            'requested_by': user_id,
+            'rows': 0,
+            'created_at': int(datetime.now().timestamp())
+        }
+        write_job_status(bulk_job_key(job_id, 'status.json'), status)
+        invoke_job_async(context, {
+            'action': 'import_receiving_orders',
+            'job_id': job_id,
+            'format': manifest_format,
+            'user_id': user_id
+        })
+        
+        return {
+            'statusCode': 202,
+            'headers': COMMON_HEADERS,
+            'body': dumps({**status, 'status_url': f"/receiving-orders/bulk/{job_id}"})
+        }
+    except Exception as e:
+        print(f"Error creating receiving orders in bulk: {str(e)}")
+        return {
+            'statusCode': 500,
+            'headers': COMMON_HEADERS,
+            'body': dumps({'message': f"Error creating receiving orders in bulk: {str(e)}"})
+        }
+
+def run_bulk_job(event, context=None):
+    """백그라운드 일괄 등록 - S3 매니페스트를 스트리밍으로 읽고 행별 결과를 NDJSON 리포트로 저장
+
+    실행 시간이 부족하면 처리한 배치까지만 리포트를 남기고 FAILED 기록 (재실행 시 중복 등록 방지용)
+    """
+    job_id = event['job_id']
+    manifest_format = event.get('format', 'ndjson')
+    status_key = bulk_job_key(job_id, 'status.json')
+    report_key = bulk_job_key(job_id, 'report.ndjson')
+    
+    status = read_job_status(status_key) or {'job_id': job_id, 'format': manifest_format}
+    status['started_at'] = int(datetime.now().timestamp())
+    writer = S3MultipartWriter(s3, EXPORT_BUCKET, report_key, 'application/x-ndjson')
+    deadline = job_deadline(context)
+    batches = [0]
+    progress = {'rows': 0, 'created': 0, 'failed': 0}
+    
+    def on_batch(results, summary):
+        writer.write(encode_rows(results, 'ndjson', BULK_REPORT_FIELDS))
+        batches[0] += 1
+        progress.update({key: summary[key] for key in progress})
+        if batches[0] % BULK_PROGRESS_BATCHES == 0:
+            write_job_status(status_key, {**status, **progress})
+        if deadline():
+            raise JobDeadlineError('Bulk import did not finish before the Lambda timeout')
+    
+    try:
+        body = s3.get_object(Bucket=EXPORT_BUCKET, Key=bulk_job_key(job_id, f'manifest.{manifest_format}'))['Body']
+        summary = import_manifest(body, manifest_format, event.get('user_id', 'system'), on_batch)
+        writer.close()
+        status.update(summary)
+        status.update({
+            'status': 'COMPLETED',
+            'report_key': report_key,
+            'completed_at': int(datetime.now().timestamp())
+        })
+    except Exception as e:
+        print(f"Error importing receiving order manifest {job_id}: {str(e)}")
+        status.update(progress)
+        status.update({'status': 'FAILED', 'error': str(e), 'failed_at': int(datetime.now().timestamp())})
+        # 이미 등록된 행을 확인할 수 있도록 처리한 배치까지의 리포트 보존
+        try:
+            writer.close()
+            status['report_key'] = report_key
+        except Exception as close_error:
+            print(f"Error saving partial bulk report {job_id}: {str(close_error)}")
+            writer.abort()
+    
+    write_job_status(status_key, status)
+    return status
+
+def get_bulk_job(job_id):
+    """일괄 등록 작업 상태 조회 (행별 결과 리포트가 있으면 presigned URL 포함 - 실패한 작업은 부분 리포트)"""
+    try:
+        status = read_job_status(bulk_job_key(job_id, 'status.json')) if is_job_id(job_id) else None
+        if status is None:
+            return {
+                'statusCode': 404,
+                'headers': COMMON_HEADERS,
+                'body': dumps({'message': 'Bulk job not found'})
+            }
+        
+        if status.get('report_key'):
+            status['report_url'] = s3.generate_presigned_url(
+                'get_object',
+                Params={'Bucket': EXPORT_BUCKET, 'Key': status['report_key']},
+                ExpiresIn=EXPORT_URL_EXPIRES
+            )
+        
+        return {
+            'statusCode': 200,
+            'headers': COMMON_HEADERS,
+            'body': dumps(status)
+        }
+    except Exception as e:
+        print(f"Error getting bulk job: {str(e)}")
+        return {
+            'statusCode': 500,
+            'headers': COMMON_HEADERS,
+            'body': dumps({'message': f"Error getting bulk job: {str(e)}"})
+        }
+
+class OrderTransitionError(Exception):
+    """주문이 없거나(404) 현재 상태에서 허용되지 않는 전이(409)"""
+
+    def __init__(self, status_code, message, current_status=None):
+        super().__init__(message)
+        self.status_code = status_code
+        self.current_status = current_status
+
+def transition_order_status(order_id, new_status, user_id, notes=None, updates=None, timestamp=None, supplier_id=None):
+    """주문 상태 전이 - 현재 상태 조건부 update_item과 이력 Put을 한 트랜잭션으로 커밋, 이전 상태 반환
+
+    현재 상태를 미리 읽지 않고 전이표의 첫 번째 허용 상태와 supplier_id(요청에서 받은 값, 없으면 미지정)를
+    조건으로 가정해 커밋합니다. 이력 항목의 supplier_id는 supplier-event-index(공급업체 입고 이력)의
+    키이므로 조건으로 주문의 실제 값과 일치함을 보장합니다. 조건 실패 시 돌려받은 현재 항목의
+    상태가 허용 상태이면 그 상태 / supplier_id로 다시 시도합니다.
+    """
+    if timestamp is None:
+        timestamp = int(datetime.now().timestamp())
+    allowed = ORDER_TRANSITIONS[new_status]
+    event_type = ORDER_TRANSITION_EVENTS[new_status]
+    
+    names = {'#st': 'status'}
+    values = {':to': new_status, ':ts': timestamp}
+    assignments = ['#st = :to', 'updated_at = :ts']
+    for index, (name, value) in enumerate(sorted((updates or {}).items())):
+        names[f'#u{index}'] = name
+        values[f':u{index}'] = value
+        assignments.append(f'#u{index} = :u{index}')
+    
+    previous_status = allowed[0]
+    for attempt in range(3):
+        history_data = {
+            'history_id': str(uuid.uuid4()),
+            'order_id': order_id,
+            'timestamp': Decimal(str(timestamp)),
+            'event_type': event_type,
+            'event_time': event_time_key(event_type, timestamp),
+            'previous_status': previous_status,
+            'new_status': new_status,
+            'user_id': user_id,
+            'notes': notes or f'Status changed from {previous_status} to {new_status}'
+        }
+        condition_values = {**values, ':from': previous_status}
+        if supplier_id:
+            history_data['supplier_id'] = supplier_id
+            condition_values[':sid'] = supplier_id
+            condition = '#st = :from AND supplier_id = :sid'
+        else:
+            condition = '#st = :from AND attribute_not_exists(supplier_id)'
+        try:
+            transact_write(dynamodb.meta.client, [
+                update_action(
+                    RECEIVING_ORDER_TABLE, {'order_id': order_id}, f"SET {', '.join(assignments)}",
+                    condition=condition, names=names, values=condition_values,
+                    return_old_on_failure=True
+                ),
+                put_action(RECEIVING_HISTORY_TABLE, history_data, 'attribute_not_exists(history_id)')
+            ])
+            return previous_status
+        except TransactionConflictError as e:
+            current = e.items[0]
+            if current is None:
+                raise OrderTransitionError(404, 'Receiving order not found')
+            current_status = current.get('status')
+            if current_status not in allowed:
+                raise OrderTransitionError(409, f'Cannot change status from {current_status} to {new_status}', current_status)
+            if (current_status, current.get('supplier_id')) == (previous_status, supplier_id):
+                # 같은 가정으로 실패 - 이력 Put 충돌 등 주문 외 조건
+                break
+            previous_status, supplier_id = current_status, current.get('supplier_id')
+    raise OrderTransitionError(409, 'Order status changed concurrently, please retry')
+
+def transition_error_response(error):
+    body = {'message': str(error)}
+    if error.current_status:
+        body['current_status'] = error.current_status
+    return {
+        'statusCode': error.status_code,
+        'headers': COMMON_HEADERS,
+        'body': dumps(body)
+    }
+
+def process_receiving(event, order_id):
+    """입고 처리 (실제 입고 확정) - IN_PROGRESS -> COMPLETED, GRN 번호 발급"""
+    try:
+        body = json.loads(event.get('body') or '{}')
+        timestamp = int(datetime.now().timestamp())
+        grn_number = f"GRN-{timestamp}-{order_id[:8]}"
+        
+        try:
+            previous_status = transition_order_status(
+                order_id, 'COMPLETED', body.get('user_id', 'system'),
+                notes=f'Receiving completed with GRN: {grn_number}',
+                updates={'received_at': timestamp, 'verification_status': 'COMPLETED', 'grn_number': grn_number},
+                timestamp=timestamp, supplier_id=body.get('supplier_id')
+            )
+        except OrderTransitionError as e:
+            return transition_error_response(e)
+        
+        # ReceivingCompleted 이벤트는 주문 테이블 스트림(상태 변경)에서 발행
+        return {
+            'statusCode': 200,
+            'headers': COMMON_HEADERS,
+            'body': dumps({
+                'order_id': order_id,
+                'previous_status': previous_status,
+                'status': 'COMPLETED',
+                'grn_number': grn_number,
+                'message': 'Receiving completed successfully'
+            })
+        }
+    except Exception as e:
+        print(f"Error processing receiving: {str(e)}")
+        return {
+            'statusCode': 500,
+            'headers': COMMON_HEADERS,
+            'body': dumps({'message': f"Error processing receiving: {str(e)}"})
+        }
+
+def update_order_status(event, order_id):
+    """주문 상태 변경 (상태 전이표에 정의된 전이만 허용)"""
+    try:
+        body = json.loads(event.get('body') or '{}')
+        new_status = body.get('status')
+        
+        if new_status not in ORDER_TRANSITIONS:
+            return {
+                'statusCode': 400,
+                'headers': COMMON_HEADERS,
+                'body': dumps({'message': f'Invalid status. Must be one of: {", ".join(ORDER_TRANSITIONS)}'})
+            }
+        
+        timestamp = int(datetime.now().timestamp())
+        updates = {}
+        if new_status == 'IN_PROGRESS':
+            updates['arrived_at'] = timestamp
+        elif new_status == 'COMPLETED':
+            updates.update({'received_at': timestamp, 'verification_status': 'COMPLETED'})
+        elif new_status == 'REJECTED':
+            updates.update({'rejected_at': timestamp, 'rejection_reason': body.get('reason', body.get('notes', ''))})
+        
+        try:
+            previous_status = transition_order_status(
+                order_id, new_status, body.get('user_id', 'system'),
+                notes=body.get('notes'), updates=updates, timestamp=timestamp, supplier_id=body.get('supplier_id')
+            )
+        except OrderTransitionError as e:
+            return transition_error_response(e)
+        
+        return {
+            'statusCode': 200,
+            'headers': COMMON_HEADERS,
+            'body': dumps({
+                'order_id': order_id,
+                'previous_status': previous_status,
+                'status': new_status,
+                'message': 'Status updated successfully'
+            })
+        }
+    except Exception as e:
+        print(f"Error updating order status: {str(e)}")
+        return {
+            'statusCode': 500,
+            'headers': COMMON_HEADERS,
+            'body': dumps({'message': f"Error updating order status: {str(e)}"})
+        }
+
+def read_order_record(client, order_id):
+    response = client.get_item(TableName=RECEIVING_ORDER_TABLE, Key=serialize_item({'order_id': order_id}))
+    return deserialize_item(response['Item']) if 'Item' in response else None
+
+def query_by_order(client, table_name, index_name, order_id):
+    """order_id GSI 전체 조회 (저수준 클라이언트 - 스레드 간 공유 가능)"""
+    return query_all(client, table_name, {
+        'IndexName': index_name,
+        'KeyConditionExpression': 'order_id = :oid',
+        'ExpressionAttributeValues': {':oid': order_id}
+    })
+
+def timed_read(read, *args):
+    """(결과, 소요 ms) 반환"""
+    started = time.perf_counter()
+    return read(*args), elapsed_ms(started)
+
+def get_receiving_order_full(order_id):
+    """주문 상세 - 주문 / 품목 / 문서 / 검증 결과 / 이력을 동시에 조회해 하나의 문서로 반환"""
+    try:
+        client = dynamodb.meta.client
+        reads = {
+            'order': (read_order_record, client, order_id),
+            'items': (query_by_order, client, RECEIVING_ITEM_TABLE, 'order_id-index', order_id),
+            'documents': (query_by_order, client, DOCUMENT_METADATA_TABLE, 'order_id-index', order_id),
+            'history': (query_by_order, client, RECEIVING_HISTORY_TABLE, 'order-time-index', order_id)
+        }
+        if VERIFICATION_RESULT_TABLE:
+            reads['verification_results'] = (query_by_order, client, VERIFICATION_RESULT_TABLE, 'order_id-index', order_id)
+        
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=len(reads)) as executor:
+            futures = {name: executor.submit(timed_read, *read) for name, read in reads.items()}
+        
+        # 주문 조회 실패는 오류, 나머지 구성 요소 실패는 errors에 담아 부분 응답
+        order, order_ms = futures.pop('order').result()
+        if order is None:
+            return {
+                'statusCode': 404,
+                'headers': COMMON_HEADERS,
+                'body': dumps({'message': 'Receiving order not found'})
+            }
+        
+        sections = {'verification_results': []}
+        timing = {'order_ms': order_ms}
+        errors = {}
+        for name, future in futures.items():
+            try:
+                sections[name], timing[f'{name}_ms'] = future.result()
+            except Exception as e:
+                print(f"Error reading {name} for order {order_id}: {str(e)}")
+                sections[name] = []
+                errors[name] = str(e)
+        
+        # 문서 다운로드 URL 일괄 서명 (로컬 서명이라 추가 왕복 없음)
+        for document in sections['documents']:
+            if document.get('s3_key'):
+                document['download_url'] = s3.generate_presigned_url(
+                    'get_object',
+                    Params={'Bucket': DOCUMENT_BUCKET, 'Key': document['s3_key']},
+                    ExpiresIn=DOWNLOAD_URL_EXPIRES
+                )
+        sections['history'].sort(key=lambda entry: entry.get('timestamp', 0))
+        timing['total_ms'] = elapsed_ms(started)
+        
+        body = {
+            'order': {**order, **format_order(order)},
+            'items': sections['items'],
+            'documents': sections['documents'],
+            'verification_results': sections['verification_results'],
+            'history': sections['history'],
+            'meta': {'timing': timing}
+        }
+        if errors:
+            body['meta']['errors'] = errors
+        
+        return {
+            'statusCode': 200,
+            'headers': COMMON_HEADERS,
+            'body': dumps(body)
+        }
+    except Exception as e:
+        print(f"Error getting receiving order detail: {str(e)}")
+        return {
+            'statusCode': 500,
+            'headers': COMMON_HEADERS,
+            'body': dumps({'message': f"Error getting receiving order detail: {str(e)}"})
         }
@@ -1,16 +1,98 @@
 import json
-import boto3
 import os
 import uuid
+import re
+import unicodedata
+import gzip
+import time
+import csv
+import io
 from datetime import datetime
 from decimal import Decimal
+from itertools import islice
+
+from wms_common.batch import batch_get_items, batch_write_items
+from wms_common.clients import lazy_client, lazy_resource
+from wms_common.etag import is_not_modified, make_etag, not_modified_response, read_validator, requested_etags, with_etag
+from wms_common.history import SUPPLIER_EVENT_INDEX, build_history_key_condition, parse_time_bound
+from wms_common.http import api_handler, get_header, read_body
+from wms_common.log import log
+from wms_common.pagination import PaginationError, encode_token, page_args, page_body, query_scope, read_page_params
+from wms_common.patch import apply_patch, get_expected_version, PatchError, ItemNotFoundError
+from wms_common.projection import FieldSelectionError, build_projection, parse_fields, select_fields
+from wms_common.query_plan import execute_plan_page
+from wms_common.scorecard import SCORECARD_RECORD_KEY, build_scorecard
+from wms_common.serialization import dumps
 
 # AWS 서비스 클라이언트
-dynamodb = boto3.resource('dynamodb')
+dynamodb = lazy_resource('dynamodb')
+s3 = lazy_client('s3')
 
 # 환경 변수
 SUPPLIER_TABLE = os.environ.get('SUPPLIER_TABLE')
 RECEIVING_HISTORY_TABLE = os.environ.get('RECEIVING_HISTORY_TABLE')
+SUPPLIER_STATUS_INDEX = os.environ.get('SUPPLIER_STATUS_INDEX', 'status-name-index')
+SUPPLIER_SEARCH_TABLE = os.environ.get('SUPPLIER_SEARCH_TABLE')
+SUPPLIER_SCORECARD_TABLE = os.environ.get('SUPPLIER_SCORECARD_TABLE')
+SUPPLIER_SNAPSHOT_BUCKET = os.environ.get('SUPPLIER_SNAPSHOT_BUCKET', os.environ.get('DOCUMENT_BUCKET'))
+SUPPLIER_SNAPSHOT_KEY = os.environ.get('SUPPLIER_SNAPSHOT_KEY', 'snapshots/suppliers.json.gz')
+SUPPLIER_SNAPSHOT_MAX_AGE = int(os.environ.get('SUPPLIER_SNAPSHOT_MAX_AGE', '30'))  # 초 단위 최대 지연
+# 변경 이력(메타 항목의 changes 목록) 최대 길이 - 항목 크기 400KB 한도 보호
+SUPPLIER_SNAPSHOT_MAX_CHANGES = int(os.environ.get('SUPPLIER_SNAPSHOT_MAX_CHANGES', '2000'))
+
+# 목록 조회 상태 (status 파라미터 없으면 ACTIVE만, status=ALL이면 아래 상태 전체)
+SUPPLIER_STATUSES = ('ACTIVE', 'INACTIVE', 'DELETED')
+DEFAULT_LIST_STATUS = 'ACTIVE'
+
+# 이름 검색 인덱스 설정
+SEARCH_MAX_PREFIX = 10          # 단어별로 저장하는 최대 접두어 길이
+DEFAULT_SEARCH_LIMIT = 20
+SEARCH_PAGE_SIZE = 100          # 검색 인덱스 조회 1회당 최대 행 수
+# 단어 접두어 일치 단계에서 읽는 최대 행 수 ('a' 같은 짧은 검색어가 토큰 파티션 전체를 읽지 않도록)
+SEARCH_WORD_MATCH_MAX_ROWS = int(os.environ.get('SEARCH_WORD_MATCH_MAX_ROWS', '500'))
+SEARCH_INDEXED_FIELDS = ('supplier_name', 'status')   # 바뀌면 검색 인덱스 행을 다시 만드는 필드
+
+# 공급업체 필수 필드
+SUPPLIER_REQUIRED_FIELDS = ['supplier_name', 'contact_email', 'contact_phone']
+
+# 일괄 등록 설정
+SUPPLIER_IMPORT_FIELDS = [
+    'supplier_name', 'contact_email', 'contact_phone', 'contact_name', 'responsible_person', 'address'
+]
+MAX_IMPORT_ROWS = 50000
+IMPORT_WRITE_WORKERS = int(os.environ.get('IMPORT_WRITE_WORKERS', '8'))
+
+# 일괄 조회 설정
+MAX_BATCH_GET_IDS = 5000
+
+# 수정 가능한 공급업체 필드
+# 목록 조회 fields= 허용 필드 (supplier_id는 항상 포함)
+SUPPLIER_LIST_FIELDS = [
+    'supplier_id', 'supplier_name', 'contact_name', 'contact_email', 'contact_phone',
+    'responsible_person', 'address', 'status', 'version', 'created_at', 'updated_at'
+]
+
+SUPPLIER_UPDATE_FIELDS = [
+    'supplier_name', 'contact_name', 'contact_phone', 'contact_email',
+    'responsible_person', 'address', 'status'
+]
+
+# 공급업체 스냅샷 설정
+# 버전 정보는 검색 인덱스 테이블의 예약 행에 저장 ('#'은 검색 토큰에 나타나지 않음)
+SNAPSHOT_META_KEY = {'token': '#snapshot', 'sort_key': '#meta'}
+SNAPSHOT_REBUILD_MARKER = '#rebuild'   # 재생성 시 변경 이력에 남기는 표시 (공급업체 ID가 아님)
+SNAPSHOT_FIELDS = [
+    'supplier_id', 'supplier_name', 'contact_name', 'contact_email', 'contact_phone',
+    'responsible_person', 'address', 'status', 'version', 'created_at', 'updated_at'
+]
+
+# 웜 컨테이너에서 재사용되는 스냅샷 캐시
+# 컨테이너의 첫 조회 시 로드 (모듈 로드 시점의 AWS 호출은 콜드 스타트 예산 위반 - wms_common.clients)
+_supplier_snapshot = {
+    'version': None,     # 로드된 스냅샷 버전 (None이면 미사용)
+    'suppliers': {},     # supplier_id -> 공급업체 레코드
+    'checked_at': 0      # 마지막 버전 확인 시각
+}
 
 # 표준 응답 헤더
 COMMON_HEADERS = {
@@ -21,18 +103,10 @@ COMMON_HEADERS = {
     'Access-Control-Allow-Credentials': 'true'
 }
 
-# JSON 인코더 클래스 정의
-class DecimalEncoder(json.JSONEncoder):
-    def default(self, obj):
-        if isinstance(obj, Decimal):
-            return float(obj)
-        return super(DecimalEncoder, self).default(obj)
-
+@api_handler
 def lambda_handler(event, context):
     """공급업체 관리 Lambda 핸들러"""
     try:
-        print(f"Received event: {json.dumps(event)}")
-        
         # API Gateway 프록시 통합
         if 'httpMethod' in event:
             http_method = event.get('httpMethod')
@@ -43,49 +117,69 @@ def lambda_handler(event, context):
             if http_method == 'GET' and path == '/suppliers':
                 return get_suppliers(event)
             
+            # 공급업체 입고 이력 조회
+            elif http_method == 'GET' and path.startswith('/suppliers/') and path_params.get('supplier_id') and path.endswith('/inbound-history'):
+                return get_supplier_inbound_history(event, path_params['supplier_id'])
+                
+            # 공급업체 출고 이력 조회
+            elif http_method == 'GET' and path.startswith('/suppliers/') and path_params.get('supplier_id') and path.endswith('/outbound-history'):
+                return get_supplier_outbound_history(event, path_params['supplier_id'])
+            
+            # 공급업체 스코어카드 조회
+            elif http_method == 'GET' and path.startswith('/suppliers/') and path_params.get('supplier_id') and path.endswith('/scorecard'):
+                return get_supplier_scorecard(path_params['supplier_id'])
+            
             # 특정 공급업체 조회
             elif http_method == 'GET' and path.startswith('/suppliers/') and path_params.get('supplier_id'):
-                return get_supplier(path_params['supplier_id'])
+                return get_supplier(event, path_params['supplier_id'])
             
             # 공급업체 생성
             elif http_method == 'POST' and path == '/suppliers':
                 return create_supplier(event)
             
+            # 공급업체 일괄 등록
+            elif http_method == 'POST' and path == '/suppliers/batch':
+                return import_suppliers(event)
+            
+            # 공급업체 일괄 조회
+            elif http_method == 'POST' and path == '/suppliers/batch-get':
+                return batch_get_supplier_details(event)
+            
             # 공급업체 업데이트
             elif http_method == 'PUT' and path.startswith('/suppliers/') and path_params.get('supplier_id'):
                 return update_supplier(event, path_params['supplier_id'])
                 
             # 공급업체 삭제
             elif http_method == 'DELETE' and path.startswith('/suppliers/') and path_params.get('supplier_id'):
-                return delete_supplier(path_params['supplier_id'])
-                
-            # 공급업체 입고 이력 조회
-            elif http_method == 'GET' and path.startswith('/suppliers/') and path_params.get('supplier_id') and path.endswith('/inbound-history'):
-                return get_supplier_inbound_history(path_params['supplier_id'])
-                
-            # 공급업체 출고 이력 조회
-            elif http_method == 'GET' and path.startswith('/suppliers/') and path_params.get('supplier_id') and path.endswith('/outbound-history'):
-                return get_supplier_outbound_history(path_params['supplier_id'])
+                return delete_supplier(event, path_params['supplier_id'])
             
             # 기본 응답
             return {
                 'statusCode': 404,
                 'headers': COMMON_HEADERS,
-                'body': json.dumps({
+                'body': dumps({
                     'message': 'Endpoint not found',
                     'path': path,
                     'method': http_method
-                }, cls=DecimalEncoder)
+                })
             }
         
+        # 직접 호출 - 공급업체 스냅샷 재생성
+        if event.get('action') == 'rebuild_supplier_snapshot':
+            return rebuild_supplier_snapshot()
+        
+        # 직접 호출 - 검색 인덱스 재구축
+        if event.get('action') == 'rebuild_supplier_search_index':
+            return rebuild_supplier_search_index()
+        
         # 직접 호출
         return {
             'statusCode': 200,
             'headers': COMMON_HEADERS,
-            'body': json.dumps({
+            'body': dumps({
                 'message': 'Supplier service executed directly',
                 'event': event
-            }, cls=DecimalEncoder)
+            })
         }
             
     except Exception as e:
@@ -93,94 +187,661 @@ def lambda_handler(event, context):
         return {
             'statusCode': 500,
             'headers': COMMON_HEADERS,
-            'body': json.dumps({'message': f"Error: {str(e)}"}, cls=DecimalEncoder)
+            'body': dumps({'message': f"Error: {str(e)}"})
         }
 
 def get_suppliers(event):
-    """공급업체 목록 조회"""
+    """공급업체 목록 조회
+
+    - supplier_name: 이름 검색 (순위순, limit / next_token)
+    - status: 상태 인덱스 query (기본 ACTIVE, ALL이면 SUPPLIER_STATUSES 전체를 차례로 조회)
+    """
     try:
         query_params = event.get('queryStringParameters', {}) or {}
         supplier_name = query_params.get('supplier_name')
         
-        table = dynamodb.Table(SUPPLIER_TABLE)
+        try:
+            fields = parse_fields(query_params, SUPPLIER_LIST_FIELDS, required=('supplier_id',))
+        except FieldSelectionError as e:
+            return {
+                'statusCode': 400,
+                'headers': COMMON_HEADERS,
+                'body': dumps({'message': str(e)})
+            }
         
         if supplier_name:
-            # 공급업체 이름으로 필터링 (GSI 필요)
-            response = table.scan(
-                FilterExpression='contains(supplier_name, :name)',
-                ExpressionAttributeValues={
-                    ':name': supplier_name
+            # 이름 검색 인덱스 조회 (scan 대신 토큰 query), next_token은 순위 위치
+            scope = query_scope('supplier-search', [' '.join(normalize_name_words(supplier_name))])
+            try:
+                limit, cursor = read_page_params(query_params, scope, default_limit=DEFAULT_SEARCH_LIMIT)
+            except PaginationError as e:
+                return {
+                    'statusCode': 400,
+                    'headers': COMMON_HEADERS,
+                    'body': dumps({'message': str(e)})
                 }
-            )
-        else:
-            # 모든 공급업체 조회
-            response = table.scan()
             
-        suppliers = response.get('Items', [])
+            offset = int(cursor['key'].get('offset', 0)) if cursor else 0
+            suppliers, has_more = search_suppliers_by_name(supplier_name, limit, offset)
+            suppliers = [select_fields(supplier, fields) for supplier in suppliers]
+            next_token = encode_token({'offset': offset + limit}, scope) if has_more else None
+            
+            return {
+                'statusCode': 200,
+                'headers': COMMON_HEADERS,
+                'body': dumps(page_body('suppliers', suppliers, next_token))
+            }
+        
+        # 상태 인덱스 기반 페이지 조회 (scan 대신 query, status=ALL이면 상태별 query를 차례로 이어 읽음)
+        status = query_params.get('status', DEFAULT_LIST_STATUS).upper()
+        if status != 'ALL' and status not in SUPPLIER_STATUSES:
+            return {
+                'statusCode': 400,
+                'headers': COMMON_HEADERS,
+                'body': dumps({'message': f"status must be one of: ALL, {', '.join(SUPPLIER_STATUSES)}"})
+            }
+        statuses = SUPPLIER_STATUSES if status == 'ALL' else (status,)
+        scope = f'suppliers:{status}'
+        try:
+            limit, cursor = read_page_params(query_params, scope, SUPPLIER_STATUS_INDEX)
+        except PaginationError as e:
+            return {
+                'statusCode': 400,
+                'headers': COMMON_HEADERS,
+                'body': dumps({'message': str(e)})
+            }
+        
+        projection = build_projection(fields, SUPPLIER_LIST_FIELDS, names={'#status': 'status'})
+        plan = {
+            'operation': 'query',
+            'index': SUPPLIER_STATUS_INDEX,
+            'requests': [
+                {
+                    'IndexName': SUPPLIER_STATUS_INDEX,
+                    'KeyConditionExpression': '#status = :status',
+                    'ExpressionAttributeValues': {':status': value},
+                    **projection
+                }
+                for value in statuses
+            ]
+        }
+        suppliers, next_cursor = execute_plan_page(
+            dynamodb.meta.client, SUPPLIER_TABLE, plan, limit,
+            stream=cursor['stream'] if cursor else 0,
+            start_key=cursor['raw_key'] if cursor and cursor['raw_key'] else None
+        )
+        next_token = None
+        if next_cursor:
+            next_token = encode_token(next_cursor['key'], scope, SUPPLIER_STATUS_INDEX, next_cursor['stream'])
         
         return {
             'statusCode': 200,
             'headers': COMMON_HEADERS,
-            'body': json.dumps({
-                'suppliers': suppliers,
-                'count': len(suppliers)
-            }, cls=DecimalEncoder)
+            'body': dumps(page_body('suppliers', suppliers, next_token))
         }
     except Exception as e:
         print(f"Error getting suppliers: {str(e)}")
         return {
             'statusCode': 500,
             'headers': COMMON_HEADERS,
-            'body': json.dumps({'message': f"Error getting suppliers: {str(e)}"}, cls=DecimalEncoder)
+            'body': dumps({'message': f"Error getting suppliers: {str(e)}"})
+        }
+
+def normalize_name_words(name):
+    """검색용 이름 정규화 (NFKC, 대소문자 무시) 후 단어 목록 반환"""
+    normalized = unicodedata.normalize('NFKC', name or '').casefold()
+    return re.findall(r'\w+', normalized)
+
+def build_search_tokens(name):
+    """이름의 각 단어에 대한 접두어 토큰 집합 생성"""
+    tokens = set()
+    for word in normalize_name_words(name):
+        for length in range(1, min(len(word), SEARCH_MAX_PREFIX) + 1):
+            tokens.add(word[:length])
+    return tokens
+
+def build_search_rows(supplier):
+    """검색 인덱스 테이블에 저장할 행 목록 생성 (삭제된 공급업체는 제외)"""
+    if not supplier or supplier.get('status') == 'DELETED':
+        return []
+    
+    supplier_id = supplier['supplier_id']
+    supplier_name = supplier.get('supplier_name') or ''
+    # 정렬 키: 정규화된 이름순 정렬 + supplier_id로 유일성 보장
+    sort_key = f"{' '.join(normalize_name_words(supplier_name))}#{supplier_id}"
+    
+    return [
+        {
+            'token': token,
+            'sort_key': sort_key,
+            'supplier_id': supplier_id,
+            'supplier_name': supplier_name
         }
+        for token in build_search_tokens(supplier_name)
+    ]
+
+def sync_supplier_search_index(old_supplier, new_supplier):
+    """공급업체 생성/수정/삭제 시 이름 검색 인덱스 갱신"""
+    try:
+        old_rows = {(row['token'], row['sort_key']): row for row in build_search_rows(old_supplier)}
+        new_rows = {(row['token'], row['sort_key']): row for row in build_search_rows(new_supplier)}
+        
+        if old_rows.keys() == new_rows.keys():
+            return
+        
+        search_table = dynamodb.Table(SUPPLIER_SEARCH_TABLE)
+        with search_table.batch_writer() as batch:
+            for token, sort_key in old_rows.keys() - new_rows.keys():
+                batch.delete_item(Key={'token': token, 'sort_key': sort_key})
+            for key in new_rows.keys() - old_rows.keys():
+                batch.put_item(Item=new_rows[key])
+    except Exception as e:
+        # 공급업체 쓰기는 이미 커밋됨 - 응답은 바꾸지 않고 경보용 ERROR 로그 (rebuild_supplier_search_index로 복구)
+        supplier_id = (new_supplier or old_supplier or {}).get('supplier_id')
+        log('ERROR', 'supplier search index sync failed', supplier_id=supplier_id, error=str(e))
 
-def get_supplier(supplier_id):
-    """특정 공급업체 조회"""
+def rank_search_candidate(query_words, candidate_name):
+    """검색 결과 순위 (정확히 일치 > 이름 접두어 일치 > 단어 접두어 일치), 불일치 시 None"""
+    name_words = normalize_name_words(candidate_name)
+    
+    # 모든 검색어 단어가 이름의 어떤 단어의 접두어여야 함
+    for query_word in query_words:
+        if not any(name_word.startswith(query_word) for name_word in name_words):
+            return None
+    
+    query_text = ' '.join(query_words)
+    name_text = ' '.join(name_words)
+    if name_text == query_text:
+        return 0
+    if name_text.startswith(query_text):
+        return 1
+    return 2
+
+def iter_search_rows(token, sort_prefix=None, page_size=None):
+    """검색 인덱스 토큰 파티션을 sort_key(정규화된 이름) 순서로 순회 (sort_prefix: 이름 접두어 조건)"""
+    search_table = dynamodb.Table(SUPPLIER_SEARCH_TABLE)
+    query_args = {
+        'KeyConditionExpression': '#token = :token',
+        'ExpressionAttributeNames': {'#token': 'token'},
+        'ExpressionAttributeValues': {':token': token}
+    }
+    if sort_prefix:
+        query_args['KeyConditionExpression'] += ' AND begins_with(sort_key, :prefix)'
+        query_args['ExpressionAttributeValues'][':prefix'] = sort_prefix
+    if page_size:
+        query_args['Limit'] = page_size
+    while True:
+        response = search_table.query(**query_args)
+        yield from response.get('Items', [])
+        if 'LastEvaluatedKey' not in response:
+            return
+        query_args['ExclusiveStartKey'] = response['LastEvaluatedKey']
+
+def rank_supplier_ids(supplier_name, limit):
+    """이름 검색 인덱스로 순위순 supplier_id를 최대 limit개 반환
+
+    1. 정확히 일치 / 이름 접두어 일치: 첫 단어 토큰 파티션에서 정규화된 검색어 전체를 sort_key
+       begins_with 조건으로 조회 (sort_key 순서 = 순위 순서이므로 limit개까지만 읽음)
+    2. 결과가 limit개 미만이면 단어 접두어 일치: 가장 긴 단어 토큰 파티션을 이름순으로
+       최대 SEARCH_WORD_MATCH_MAX_ROWS행까지 읽어 모든 검색어 단어가 접두어로 포함된 이름만 선택
+       (짧은 검색어의 큰 파티션은 상한 안에서만 순위를 매김)
+    """
+    query_words = normalize_name_words(supplier_name)
+    if not query_words:
+        return []
+    query_text = ' '.join(query_words)
+    first_token = query_words[0][:SEARCH_MAX_PREFIX]
+    
+    # 정확히 일치 (sort_key = '<정규화된 이름>#<supplier_id>')
+    exact_prefix = f'{query_text}#'
+    supplier_ids = [row['supplier_id'] for row in islice(iter_search_rows(first_token, exact_prefix, limit), limit)]
+    
+    # 이름 접두어 일치
+    if len(supplier_ids) < limit:
+        for row in iter_search_rows(first_token, query_text, limit):
+            if row['sort_key'].startswith(exact_prefix):
+                continue
+            supplier_ids.append(row['supplier_id'])
+            if len(supplier_ids) >= limit:
+                break
+    
+    # 단어 접두어 일치 (이름 중간 단어)
+    if len(supplier_ids) < limit:
+        probe = max(query_words, key=len)[:SEARCH_MAX_PREFIX]
+        found_ids = set(supplier_ids)
+        word_matches = sorted(
+            (row['sort_key'], row['supplier_id'])
+            for row in islice(iter_search_rows(probe, page_size=SEARCH_PAGE_SIZE), SEARCH_WORD_MATCH_MAX_ROWS)
+            if row['supplier_id'] not in found_ids
+            and rank_search_candidate(query_words, row.get('supplier_name')) == 2
+        )
+        supplier_ids.extend(supplier_id for _, supplier_id in word_matches[:limit - len(supplier_ids)])
+    
+    return supplier_ids
+
+def search_suppliers_by_name(supplier_name, limit, offset=0):
+    """이름 검색 결과 중 offset부터 limit개 공급업체를 순위순으로 반환 -> (suppliers, 다음 페이지 존재 여부)
+
+    순위가 여러 단계를 합친 결과라 키셋 커서 대신 순위 위치(offset)로 이어 읽습니다.
+    """
+    # 다음 페이지 존재 여부 확인용으로 1개 더 조회
+    supplier_ids = rank_supplier_ids(supplier_name, offset + limit + 1)[offset:]
+    has_more = len(supplier_ids) > limit
+    supplier_ids = supplier_ids[:limit]
+    if not supplier_ids:
+        return [], False
+    
+    # 현재 페이지 결과만 공급업체 테이블에서 일괄 조회
+    found = batch_get_suppliers(supplier_ids)
+    
+    suppliers = [
+        found[supplier_id] for supplier_id in supplier_ids
+        if supplier_id in found and found[supplier_id].get('status') != 'DELETED'
+    ]
+    return suppliers, has_more
+
+def rebuild_supplier_search_index():
+    """기존 공급업체 전체에 대한 이름 검색 인덱스 재구축 (직접 호출용)"""
     try:
         table = dynamodb.Table(SUPPLIER_TABLE)
+        search_table = dynamodb.Table(SUPPLIER_SEARCH_TABLE)
         
-        response = table.get_item(
-            Key={
-                'supplier_id': supplier_id
+        indexed = 0
+        scan_args = {}
+        with search_table.batch_writer(overwrite_by_pkeys=['token', 'sort_key']) as batch:
+            while True:
+                response = table.scan(**scan_args)
+                for supplier in response.get('Items', []):
+                    for row in build_search_rows(supplier):
+                        batch.put_item(Item=row)
+                    indexed += 1
+                if 'LastEvaluatedKey' not in response:
+                    break
+                scan_args['ExclusiveStartKey'] = response['LastEvaluatedKey']
+        
+        return {
+            'statusCode': 200,
+            'headers': COMMON_HEADERS,
+            'body': dumps({'message': 'Supplier search index rebuilt', 'count': indexed})
+        }
+    except Exception as e:
+        print(f"Error rebuilding supplier search index: {str(e)}")
+        return {
+            'statusCode': 500,
+            'headers': COMMON_HEADERS,
+            'body': dumps({'message': f"Error rebuilding supplier search index: {str(e)}"})
+        }
+
+def batch_get_suppliers(supplier_ids):
+    """supplier_id 목록을 100개 단위 BatchGetItem 병렬 조회 (supplier_id -> 레코드)"""
+    keys = [{'supplier_id': supplier_id} for supplier_id in supplier_ids]
+    suppliers, unprocessed = batch_get_items(dynamodb.meta.client, SUPPLIER_TABLE, keys)
+    if unprocessed:
+        raise RuntimeError(f'{len(unprocessed)} suppliers could not be read')
+    return {supplier['supplier_id']: supplier for supplier in suppliers}
+
+def to_snapshot_value(value):
+    """스냅샷 저장용 값 변환 (정수 Decimal은 int로)"""
+    if isinstance(value, Decimal):
+        return int(value) if value == value.to_integral_value() else float(value)
+    return value
+
+def to_snapshot_record(supplier):
+    """공급업체 레코드에서 스냅샷 필드만 추출"""
+    return {field: to_snapshot_value(supplier.get(field)) for field in SNAPSHOT_FIELDS if field in supplier}
+
+def bump_supplier_snapshot_version(supplier_id):
+    """공급업체 변경 시 스냅샷 버전 증가 및 변경 ID 기록
+
+    실패는 호출자에게 전달합니다 (버전이 오르지 않으면 캐시된 스냅샷이 변경을 놓침).
+    변경 이력이 SUPPLIER_SNAPSHOT_MAX_CHANGES에 도달하면 (재생성이 밀린 경우) 이력을 비우고
+    base_version을 올립니다 - 다음 재생성 전까지 스냅샷 대신 DynamoDB를 조회합니다.
+    """
+    table = dynamodb.Table(SUPPLIER_SEARCH_TABLE)
+    try:
+        table.update_item(
+            Key=SNAPSHOT_META_KEY,
+            UpdateExpression=(
+                "set changes = list_append(if_not_exists(changes, :empty), :ids), "
+                "base_version = if_not_exists(base_version, :zero) add version :one"
+            ),
+            ConditionExpression="attribute_not_exists(changes) OR size(changes) < :max",
+            ExpressionAttributeValues={
+                ':empty': [],
+                ':ids': [supplier_id],
+                ':zero': 0,
+                ':one': 1,
+                ':max': SUPPLIER_SNAPSHOT_MAX_CHANGES
             }
         )
+    except dynamodb.meta.client.exceptions.ConditionalCheckFailedException:
+        print("Supplier snapshot change log is full, resetting it until the next rebuild")
+        reset_snapshot_changes(table)
+
+def record_snapshot_change(supplier_id):
+    """커밋된 공급업체 변경을 스냅샷 변경 이력에 기록 (실패해도 응답은 바꾸지 않음)
+
+    쓰기는 이미 저장되었으므로 500으로 응답하면 재시도가 중복 공급업체를 만듭니다.
+    실패는 ERROR 로그로 남기고, 놓친 변경은 예약된 스냅샷 재생성에서 반영됩니다.
+    """
+    try:
+        bump_supplier_snapshot_version(supplier_id)
+    except Exception as e:
+        log('ERROR', 'supplier snapshot change not recorded', supplier_id=supplier_id, error=str(e))
+
+def reset_snapshot_changes(table):
+    """가득 찬 변경 이력을 비우고 version / base_version을 다음 버전으로 (동시 변경 시 다시 읽어 재시도)"""
+    for _ in range(5):
+        meta = table.get_item(Key=SNAPSHOT_META_KEY, ConsistentRead=True).get('Item', {})
+        version = int(meta.get('version', 0))
+        try:
+            table.update_item(
+                Key=SNAPSHOT_META_KEY,
+                UpdateExpression="set changes = :empty, version = :next, base_version = :next",
+                ConditionExpression="version = :version",
+                ExpressionAttributeValues={':empty': [], ':next': version + 1, ':version': version}
+            )
+            return
+        except dynamodb.meta.client.exceptions.ConditionalCheckFailedException:
+            continue
+    raise RuntimeError('Could not reset the supplier snapshot change log')
+
+def load_supplier_snapshot():
+    """S3에서 스냅샷 파일 로드 (열 기반 gzip JSON)"""
+    response = s3.get_object(Bucket=SUPPLIER_SNAPSHOT_BUCKET, Key=SUPPLIER_SNAPSHOT_KEY)
+    snapshot = json.loads(gzip.decompress(response['Body'].read()))
+    
+    columns = snapshot['columns']
+    suppliers = {}
+    for row in snapshot['rows']:
+        record = {column: value for column, value in zip(columns, row) if value is not None}
+        suppliers[record['supplier_id']] = record
+    
+    _supplier_snapshot['suppliers'] = suppliers
+    _supplier_snapshot['version'] = int(snapshot['version'])
+
+def refresh_supplier_snapshot():
+    """버전 확인 후 변경된 공급업체만 증분 반영 (SUPPLIER_SNAPSHOT_MAX_AGE 주기)"""
+    now = time.time()
+    if now - _supplier_snapshot['checked_at'] < SUPPLIER_SNAPSHOT_MAX_AGE:
+        return
+    _supplier_snapshot['checked_at'] = now
+    
+    try:
+        meta = dynamodb.Table(SUPPLIER_SEARCH_TABLE).get_item(Key=SNAPSHOT_META_KEY).get('Item', {})
+        version = int(meta.get('version', 0))
+        base_version = int(meta.get('base_version', 0))
+        
+        # 최초 로드 또는 변경 이력이 정리되어 증분 반영이 불가능한 경우 전체 로드
+        local_version = _supplier_snapshot['version']
+        if local_version is None or local_version < base_version:
+            load_supplier_snapshot()
+            local_version = _supplier_snapshot['version']
+            if local_version < base_version:
+                raise RuntimeError(f"snapshot version {local_version} is older than change log base {base_version}")
+        
+        if local_version >= version:
+            return
+        
+        changed_ids = [
+            supplier_id for supplier_id in meta.get('changes', [])[local_version - base_version:]
+            if supplier_id != SNAPSHOT_REBUILD_MARKER
+        ]
+        changed = batch_get_suppliers(changed_ids)
+        suppliers = _supplier_snapshot['suppliers']
+        for supplier_id in set(changed_ids):
+            supplier = changed.get(supplier_id)
+            if supplier and supplier.get('status') == 'ACTIVE':
+                suppliers[supplier_id] = to_snapshot_record(supplier)
+            else:
+                suppliers.pop(supplier_id, None)
+        _supplier_snapshot['version'] = version
+    except Exception as e:
+        # 스냅샷이 없거나 로드 실패 시 DynamoDB 직접 조회로 대체
+        print(f"Error refreshing supplier snapshot: {str(e)}")
+        _supplier_snapshot['version'] = None
+        _supplier_snapshot['suppliers'] = {}
+
+def get_snapshot_supplier(supplier_id):
+    """스냅샷에서 활성 공급업체 조회 (없으면 None)"""
+    if not SUPPLIER_SNAPSHOT_BUCKET:
+        return None
+    refresh_supplier_snapshot()
+    return _supplier_snapshot['suppliers'].get(supplier_id)
+
+def lookup_supplier(supplier_id):
+    """스냅샷에서 활성 공급업체 조회 후 없으면 DynamoDB 조회"""
+    supplier = get_snapshot_supplier(supplier_id)
+    if supplier is not None:
+        return supplier
+    
+    response = dynamodb.Table(SUPPLIER_TABLE).get_item(Key={'supplier_id': supplier_id})
+    return response.get('Item')
+
+def compact_snapshot_changes(search_table, snapshot_version):
+    """스냅샷에 반영된 변경 이력을 잘라내고 이후 변경만 유지 (재생성 중 변경이 있으면 다시 읽어 재시도)"""
+    for _ in range(3):
+        meta = search_table.get_item(Key=SNAPSHOT_META_KEY, ConsistentRead=True).get('Item', {})
+        version = int(meta.get('version', 0))
+        base_version = int(meta.get('base_version', 0))
+        if base_version >= snapshot_version:
+            return
+        try:
+            search_table.update_item(
+                Key=SNAPSHOT_META_KEY,
+                UpdateExpression="set base_version = :base, changes = :tail",
+                ConditionExpression="version = :version",
+                ExpressionAttributeValues={
+                    ':base': snapshot_version,
+                    ':tail': meta.get('changes', [])[snapshot_version - base_version:],
+                    ':version': version
+                }
+            )
+            return
+        except dynamodb.meta.client.exceptions.ConditionalCheckFailedException:
+            continue
+    print("Supplier snapshot change log kept changing, compacting on the next rebuild")
+
+def rebuild_supplier_snapshot():
+    """활성 공급업체 전체 스냅샷을 S3에 재생성하고 변경 이력 정리 (EventBridge 예약 / 직접 호출)"""
+    try:
+        search_table = dynamodb.Table(SUPPLIER_SEARCH_TABLE)
+        # 재생성 자체도 버전을 올림 - 정리 후 base_version이 모든 웜 컨테이너의 버전보다 커져 전체 다시 로드
+        # (변경 이력 기록에 실패해 놓친 변경도 이 재생성으로 반영됨)
+        bump_supplier_snapshot_version(SNAPSHOT_REBUILD_MARKER)
+        meta = search_table.get_item(Key=SNAPSHOT_META_KEY, ConsistentRead=True).get('Item', {})
+        version = int(meta.get('version', 0))
+        
+        # 상태 인덱스로 활성 공급업체만 조회
+        table = dynamodb.Table(SUPPLIER_TABLE)
+        rows = []
+        query_args = {
+            'IndexName': SUPPLIER_STATUS_INDEX,
+            'KeyConditionExpression': '#status = :status',
+            'ExpressionAttributeNames': {'#status': 'status'},
+            'ExpressionAttributeValues': {':status': 'ACTIVE'}
+        }
+        while True:
+            response = table.query(**query_args)
+            for supplier in response.get('Items', []):
+                record = to_snapshot_record(supplier)
+                rows.append([record.get(field) for field in SNAPSHOT_FIELDS])
+            if 'LastEvaluatedKey' not in response:
+                break
+            query_args['ExclusiveStartKey'] = response['LastEvaluatedKey']
         
-        if 'Item' not in response:
+        snapshot = {'version': version, 'columns': SNAPSHOT_FIELDS, 'rows': rows}
+        s3.put_object(
+            Bucket=SUPPLIER_SNAPSHOT_BUCKET,
+            Key=SUPPLIER_SNAPSHOT_KEY,
+            Body=gzip.compress(json.dumps(snapshot, separators=(',', ':')).encode('utf-8')),
+            ContentType='application/json',
+            ContentEncoding='gzip'
+        )
+        
+        compact_snapshot_changes(search_table, version)
+        
+        return {
+            'statusCode': 200,
+            'headers': COMMON_HEADERS,
+            'body': dumps({'message': 'Supplier snapshot rebuilt', 'version': version, 'count': len(rows)})
+        }
+    except Exception as e:
+        print(f"Error rebuilding supplier snapshot: {str(e)}")
+        return {
+            'statusCode': 500,
+            'headers': COMMON_HEADERS,
+            'body': dumps({'message': f"Error rebuilding supplier snapshot: {str(e)}"})
+        }
+
+def format_supplier(supplier):
+    """공급업체 레코드를 응답 형식으로 변환"""
+    return {
+        'supplier_id': supplier.get('supplier_id'),
+        'supplier_name': supplier.get('supplier_name'),
+        'contact_info': {
+            'name': supplier.get('contact_name', ''),
+            'email': supplier.get('contact_email', ''),
+            'phone': supplier.get('contact_phone', ''),
+            'responsible_person': supplier.get('responsible_person', '')
+        },
+        'address': supplier.get('address', ''),
+        'status': supplier.get('status', 'ACTIVE'),
+        'version': supplier.get('version', 0),
+        'created_at': supplier.get('created_at'),
+        'updated_at': supplier.get('updated_at')
+    }
+
+def patch_error_response(error):
+    """PATCH 엔진 예외를 404 / 409 응답으로 변환"""
+    if isinstance(error, ItemNotFoundError):
+        body = {'message': 'Supplier not found'}
+    else:
+        body = {
+            'message': 'Supplier was modified by another request',
+            'current_version': error.current_version
+        }
+    return {
+        'statusCode': error.status_code,
+        'headers': COMMON_HEADERS,
+        'body': dumps(body)
+    }
+
+def get_supplier(event, supplier_id):
+    """특정 공급업체 조회 (ETag / If-None-Match 지원)"""
+    try:
+        supplier = get_snapshot_supplier(supplier_id)
+        
+        # 스냅샷에 없고 조건부 요청이면 version / updated_at만 먼저 읽어 304 판단
+        if supplier is None and requested_etags(event):
+            etag = read_validator(dynamodb.Table(SUPPLIER_TABLE), {'supplier_id': supplier_id})
+            if etag is not None and is_not_modified(event, etag):
+                return not_modified_response(COMMON_HEADERS, etag)
+        
+        if supplier is None:
+            supplier = lookup_supplier(supplier_id)
+        
+        if supplier is None:
             return {
                 'statusCode': 404,
                 'headers': COMMON_HEADERS,
-                'body': json.dumps({'message': 'Supplier not found'}, cls=DecimalEncoder)
+                'body': dumps({'message': 'Supplier not found'})
             }
-            
-        supplier = response['Item']
+        
+        etag = make_etag(supplier)
+        if is_not_modified(event, etag):
+            return not_modified_response(COMMON_HEADERS, etag)
         
         # 새로운 응답 형식으로 변환
-        formatted_supplier = {
-            'supplier_id': supplier.get('supplier_id'),
-            'supplier_name': supplier.get('supplier_name'),
-            'contact_info': {
-                'name': supplier.get('contact_name', ''),
-                'email': supplier.get('contact_email', ''),
-                'phone': supplier.get('contact_phone', ''),
-                'responsible_person': supplier.get('responsible_person', '')
-            },
-            'address': supplier.get('address', ''),
-            'status': supplier.get('status', 'ACTIVE'),
-            'created_at': supplier.get('created_at'),
-            'updated_at': supplier.get('updated_at')
+        formatted_supplier = format_supplier(supplier)
+        
+        return {
+            'statusCode': 200,
+            'headers': with_etag(COMMON_HEADERS, etag),
+            'body': dumps(formatted_supplier)
         }
+    except Exception as e:
+        print(f"Error getting supplier: {str(e)}")
+        return {
+            'statusCode': 500,
+            'headers': COMMON_HEADERS,
+            'body': dumps({'message': f"Error getting supplier: {str(e)}"})
+        }
+
+def build_supplier_record(body, timestamp):
+    """요청 데이터로 신규 공급업체 레코드 생성"""
+    return {
+        'supplier_id': str(uuid.uuid4()),
+        'supplier_name': body.get('supplier_name'),
+        'contact_email': body.get('contact_email', ''),
+        'contact_phone': body.get('contact_phone'),
+        'contact_name': body.get('contact_name', ''),
+        'responsible_person': body.get('responsible_person', ''),
+        'address': body.get('address', ''),
+        'status': 'ACTIVE',
+        'version': 1,
+        'created_at': timestamp,
+        'updated_at': timestamp
+    }
+
+def batch_get_supplier_details(event):
+    """여러 공급업체 일괄 조회 (스냅샷 우선, 나머지는 100개 단위 BatchGetItem 병렬 조회)"""
+    try:
+        body = json.loads(event.get('body') or '{}')
+        supplier_ids = body.get('supplier_ids')
+        
+        if not isinstance(supplier_ids, list) or not all(isinstance(i, str) and i for i in supplier_ids):
+            return {
+                'statusCode': 400,
+                'headers': COMMON_HEADERS,
+                'body': dumps({'message': 'supplier_ids must be an array of strings'})
+            }
+        
+        supplier_ids = list(dict.fromkeys(supplier_ids))
+        if len(supplier_ids) > MAX_BATCH_GET_IDS:
+            return {
+                'statusCode': 413,
+                'headers': COMMON_HEADERS,
+                'body': dumps({'message': f'Too many supplier_ids: maximum {MAX_BATCH_GET_IDS}'})
+            }
+        
+        # 스냅샷에 있는 활성 공급업체는 메모리에서 바로 응답
+        found = {}
+        if SUPPLIER_SNAPSHOT_BUCKET:
+            refresh_supplier_snapshot()
+            snapshot = _supplier_snapshot['suppliers']
+            found = {supplier_id: snapshot[supplier_id] for supplier_id in supplier_ids if supplier_id in snapshot}
+        
+        remaining = [{'supplier_id': supplier_id} for supplier_id in supplier_ids if supplier_id not in found]
+        unprocessed = []
+        if remaining:
+            suppliers, unprocessed_keys = batch_get_items(dynamodb.meta.client, SUPPLIER_TABLE, remaining)
+            found.update((supplier['supplier_id'], supplier) for supplier in suppliers)
+            unprocessed = [key['supplier_id'] for key in unprocessed_keys]
+        
+        # 요청 순서대로 응답
+        formatted_suppliers = [format_supplier(found[supplier_id]) for supplier_id in supplier_ids if supplier_id in found]
+        not_found = [
+            supplier_id for supplier_id in supplier_ids
+            if supplier_id not in found and supplier_id not in unprocessed
+        ]
         
         return {
             'statusCode': 200,
             'headers': COMMON_HEADERS,
-            'body': json.dumps(formatted_supplier, cls=DecimalEncoder)
+            'body': dumps({
+                'suppliers': formatted_suppliers,
+                'count': len(formatted_suppliers),
+                'not_found': not_found,
+                'unprocessed': unprocessed
+            })
         }
     except Exception as e:
-        print(f"Error getting supplier: {str(e)}")
+        print(f"Error batch getting suppliers: {str(e)}")
         return {
             'statusCode': 500,
             'headers': COMMON_HEADERS,
-            'body': json.dumps({'message': f"Error getting supplier: {str(e)}"}, cls=DecimalEncoder)
+            'body': dumps({'message': f"Error batch getting suppliers: {str(e)}"})
         }
 
 def create_supplier(event):
@@ -189,149 +850,206 @@ def create_supplier(event):
         body = json.loads(event.get('body', '{}'))
         
         # 필수 필드 검증
-        required_fields = ['supplier_name', 'contact_email', 'contact_phone']
-        missing_fields = [field for field in required_fields if field not in body]
+        missing_fields = [field for field in SUPPLIER_REQUIRED_FIELDS if field not in body]
         
         if missing_fields:
             return {
                 'statusCode': 400,
                 'headers': COMMON_HEADERS,
-                'body': json.dumps({'message': f'Missing required fields: {", ".join(missing_fields)}'}, cls=DecimalEncoder)
+                'body': dumps({'message': f'Missing required fields: {", ".join(missing_fields)}'})
             }
             
-        # 공급업체 ID 생성 및 타임스탬프
-        supplier_id = str(uuid.uuid4())
-        timestamp = int(datetime.now().timestamp())
-        
         # 공급업체 데이터 생성
-        supplier_data = {
-            'supplier_id': supplier_id,
-            'supplier_name': body.get('supplier_name'),
-            'contact_email': body.get('contact_email', ''),
-            'contact_phone': body.get('contact_phone'),
-            'contact_name': body.get('contact_name', ''),
-            'responsible_person': body.get('responsible_person', ''),
-            'address': body.get('address', ''),
-            'status': 'ACTIVE',
-            'created_at': timestamp,
-            'updated_at': timestamp
-        }
+        supplier_data = build_supplier_record(body, int(datetime.now().timestamp()))
+        supplier_id = supplier_data['supplier_id']
         
         # DynamoDB에 저장
         table = dynamodb.Table(SUPPLIER_TABLE)
         table.put_item(Item=supplier_data)
+        sync_supplier_search_index(None, supplier_data)
+        record_snapshot_change(supplier_id)
         
         # 응답 형식으로 변환
-        formatted_supplier = {
-            'supplier_id': supplier_data.get('supplier_id'),
-            'supplier_name': supplier_data.get('supplier_name'),
-            'contact_info': {
-                'name': supplier_data.get('contact_name', ''),
-                'email': supplier_data.get('contact_email', ''),
-                'phone': supplier_data.get('contact_phone', ''),
-                'responsible_person': supplier_data.get('responsible_person', '')
-            },
-            'address': supplier_data.get('address', ''),
-            'status': supplier_data.get('status', 'ACTIVE'),
-            'created_at': supplier_data.get('created_at'),
-            'updated_at': supplier_data.get('updated_at')
-        }
+        formatted_supplier = format_supplier(supplier_data)
         
         return {
             'statusCode': 201,
             'headers': COMMON_HEADERS,
-            'body': json.dumps({
+            'body': dumps({
                 'supplier': formatted_supplier,
                 'message': 'Supplier created successfully'
-            }, cls=DecimalEncoder)
+            })
         }
     except Exception as e:
         print(f"Error creating supplier: {str(e)}")
         return {
             'statusCode': 500,
             'headers': COMMON_HEADERS,
-            'body': json.dumps({'message': f"Error creating supplier: {str(e)}"}, cls=DecimalEncoder)
+            'body': dumps({'message': f"Error creating supplier: {str(e)}"})
         }
 
-def update_supplier(event, supplier_id):
-    """공급업체 업데이트"""
-    try:
-        body = json.loads(event.get('body', '{}'))
+def parse_import_rows(event):
+    """일괄 등록 본문 파싱 (JSON 배열, NDJSON, CSV) -> [(행 번호, 행 dict 또는 None, 파싱 오류)]"""
+    body = read_body(event)
+    content_type = (get_header(event, 'Content-Type') or '').lower()
+    
+    if 'csv' in content_type:
+        reader = csv.DictReader(io.StringIO(body))
+        # CSV 행 번호는 헤더 다음 줄부터 1
+        return [(index, dict(row), None) for index, row in enumerate(reader, start=1)]
+    
+    if 'ndjson' in content_type or 'jsonl' in content_type:
+        rows = []
+        for index, line in enumerate(io.StringIO(body), start=1):
+            if not line.strip():
+                continue
+            try:
+                rows.append((index, json.loads(line), None))
+            except ValueError as e:
+                rows.append((index, None, f'Invalid JSON: {str(e)}'))
+        return rows
+    
+    data = json.loads(body or '[]')
+    if isinstance(data, dict):
+        data = data.get('suppliers', [])
+    if not isinstance(data, list):
+        raise ValueError('Body must be a JSON array of suppliers')
+    return [(index, row, None) for index, row in enumerate(data, start=1)]
 
-        table = dynamodb.Table(SUPPLIER_TABLE)
-        response = table.get_item(Key={'supplier_id': supplier_id})
+def validate_import_row(row):
+    """일괄 등록 행 검증, 오류 메시지 목록 반환"""
+    if not isinstance(row, dict):
+        return ['Row must be an object']
+    errors = []
+    for field in SUPPLIER_REQUIRED_FIELDS:
+        value = row.get(field)
+        if value is None or (isinstance(value, str) and not value.strip()):
+            errors.append(f'Missing required field: {field}')
+    for field in SUPPLIER_IMPORT_FIELDS:
+        if row.get(field) is not None and not isinstance(row[field], str):
+            errors.append(f'Field must be a string: {field}')
+    return errors
 
-        if 'Item' not in response:
+def import_suppliers(event):
+    """공급업체 일괄 등록 (사전 검증 후 25개 단위 BatchWriteItem 병렬 실행)"""
+    try:
+        try:
+            rows = parse_import_rows(event)
+        except ValueError as e:
             return {
-                'statusCode': 404,
+                'statusCode': 400,
                 'headers': COMMON_HEADERS,
-                'body': json.dumps({'message': 'Supplier not found'}, cls=DecimalEncoder)
+                'body': dumps({'message': str(e)})
             }
-
-        update_expression = "set updated_at = :time"
-        expression_values = {
-            ':time': int(datetime.now().timestamp())
+        
+        if len(rows) > MAX_IMPORT_ROWS:
+            return {
+                'statusCode': 413,
+                'headers': COMMON_HEADERS,
+                'body': dumps({'message': f'Too many rows: maximum {MAX_IMPORT_ROWS}'})
+            }
+        
+        # 전체 행 사전 검증
+        timestamp = int(datetime.now().timestamp())
+        results = []
+        records = []
+        for row_number, row, parse_error in rows:
+            errors = [parse_error] if parse_error else validate_import_row(row)
+            if errors:
+                results.append({'row': row_number, 'status': 'INVALID', 'errors': errors})
+                continue
+            record = build_supplier_record(row, timestamp)
+            records.append(record)
+            results.append({'row': row_number, 'status': 'CREATED', 'supplier_id': record['supplier_id']})
+        
+        # 공급업체 테이블 병렬 일괄 쓰기
+        client = dynamodb.meta.client
+        failed = batch_write_items(client, SUPPLIER_TABLE, records, max_workers=IMPORT_WRITE_WORKERS)
+        failed_reasons = {item['supplier_id']: reason for item, reason in failed}
+        for result in results:
+            if result.get('supplier_id') in failed_reasons:
+                result['status'] = 'FAILED'
+                result['error'] = failed_reasons[result.pop('supplier_id')]
+        
+        # 저장된 공급업체의 이름 검색 인덱스 일괄 쓰기
+        # (스냅샷에 없는 신규 공급업체는 조회 시 DynamoDB로 대체되므로 버전 갱신 불필요)
+        created = [record for record in records if record['supplier_id'] not in failed_reasons]
+        search_rows = [row for record in created for row in build_search_rows(record)]
+        search_failed = batch_write_items(client, SUPPLIER_SEARCH_TABLE, search_rows, max_workers=IMPORT_WRITE_WORKERS)
+        if search_failed:
+            print(f"Failed to index {len(search_failed)} supplier search rows; run rebuild_supplier_search_index")
+        
+        summary = {
+            'total': len(rows),
+            'created': len(created),
+            'invalid': sum(1 for result in results if result['status'] == 'INVALID'),
+            'failed': len(failed_reasons)
         }
-        expression_names = {}
-
-        update_fields = {
-            'supplier_name': 'sname',
-            'contact_name': 'cname',
-            'contact_phone': 'cphone',
-            'contact_email': 'cemail',
-            'responsible_person': 'resperson',
-            'address': 'addr',
-            'status': 'status'
+        
+        return {
+            'statusCode': 200,
+            'headers': COMMON_HEADERS,
+            'body': dumps({
+                'summary': summary,
+                'results': results,
+                'message': 'Supplier import completed'
+            })
         }
-
-        for field, short in update_fields.items():
-            if field in body:
-                # 예약어 처리
-                if field == 'status':
-                    update_expression += f", #status = :{short}"
-                    expression_names['#status'] = 'status'
-                else:
-                    update_expression += f", {field} = :{short}"
-                expression_values[f":{short}"] = body[field]
-
-        update_args = {
-            'Key': {'supplier_id': supplier_id},
-            'UpdateExpression': update_expression,
-            'ExpressionAttributeValues': expression_values,
-            'ReturnValues': "ALL_NEW"
+    except Exception as e:
+        print(f"Error importing suppliers: {str(e)}")
+        return {
+            'statusCode': 500,
+            'headers': COMMON_HEADERS,
+            'body': dumps({'message': f"Error importing suppliers: {str(e)}"})
         }
 
-        if expression_names:
-            update_args['ExpressionAttributeNames'] = expression_names
+def update_supplier(event, supplier_id):
+    """공급업체 업데이트 (조건부 update_item 1회)"""
+    try:
+        body = json.loads(event.get('body', '{}'))
 
-        table.update_item(**update_args)
+        try:
+            expected_version = get_expected_version(event, body)
+        except ValueError as e:
+            return {
+                'statusCode': 400,
+                'headers': COMMON_HEADERS,
+                'body': dumps({'message': str(e)})
+            }
+
+        changes = {field: body[field] for field in SUPPLIER_UPDATE_FIELDS if field in body}
+        # status=ALL 목록이 모든 공급업체를 포함하도록 알려진 상태만 허용
+        if 'status' in changes and changes['status'] not in SUPPLIER_STATUSES:
+            return {
+                'statusCode': 400,
+                'headers': COMMON_HEADERS,
+                'body': dumps({'message': f"status must be one of: {', '.join(SUPPLIER_STATUSES)}"})
+            }
+
+        table = dynamodb.Table(SUPPLIER_TABLE)
+        # 검색 인덱스에 반영되는 필드가 바뀔 때만 수정 전 레코드를 받아 인덱스 갱신
+        reindex = any(field in changes for field in SEARCH_INDEXED_FIELDS)
+        try:
+            existing_supplier, updated_supplier = apply_patch(
+                table, {'supplier_id': supplier_id}, changes, expected_version, return_old=reindex
+            )
+        except PatchError as e:
+            return patch_error_response(e)
 
-        response = table.get_item(Key={'supplier_id': supplier_id})
-        updated_supplier = response['Item']
+        if reindex:
+            sync_supplier_search_index(existing_supplier, updated_supplier)
+        record_snapshot_change(supplier_id)
 
         # 새로운 응답 형식으로 변환
-        formatted_supplier = {
-            'supplier_id': updated_supplier.get('supplier_id'),
-            'supplier_name': updated_supplier.get('supplier_name'),
-            'contact_info': {
-                'name': updated_supplier.get('contact_name', ''),
-                'email': updated_supplier.get('contact_email', ''),
-                'phone': updated_supplier.get('contact_phone', ''),
-                'responsible_person': updated_supplier.get('responsible_person', '')
-            },
-            'address': updated_supplier.get('address', ''),
-            'status': updated_supplier.get('status', 'ACTIVE'),
-            'created_at': updated_supplier.get('created_at'),
-            'updated_at': updated_supplier.get('updated_at')
-        }
+        formatted_supplier = format_supplier(updated_supplier)
 
         return {
             'statusCode': 200,
             'headers': COMMON_HEADERS,
-            'body': json.dumps({
+            'body': dumps({
                 'supplier': formatted_supplier,
                 'message': 'Supplier updated successfully'
-            }, cls=DecimalEncoder)
+            })
         }
 
     except Exception as e:
@@ -339,153 +1057,140 @@ def update_supplier(event, supplier_id):
         return {
             'statusCode': 500,
             'headers': COMMON_HEADERS,
-            'body': json.dumps({'message': f"Error updating supplier: {str(e)}"}, cls=DecimalEncoder)
+            'body': dumps({'message': f"Error updating supplier: {str(e)}"})
         }
 
-def delete_supplier(supplier_id):
-    """공급업체 삭제"""
+def delete_supplier(event, supplier_id):
+    """공급업체 삭제 (조건부 update_item 1회)"""
     try:
-        table = dynamodb.Table(SUPPLIER_TABLE)
-        
-        # 기존 공급업체 조회
-        response = table.get_item(Key={'supplier_id': supplier_id})
-        
-        if 'Item' not in response:
+        try:
+            expected_version = get_expected_version(event)
+        except ValueError as e:
             return {
-                'statusCode': 404,
+                'statusCode': 400,
                 'headers': COMMON_HEADERS,
-                'body': json.dumps({'message': 'Supplier not found'}, cls=DecimalEncoder)
+                'body': dumps({'message': str(e)})
             }
-            
+
+        table = dynamodb.Table(SUPPLIER_TABLE)
+        
         # 소프트 삭제 (상태만 변경)
-        table.update_item(
-            Key={'supplier_id': supplier_id},
-            UpdateExpression="set #status = :status, updated_at = :time",
-            ExpressionAttributeValues={
-                ':status': 'DELETED',
-                ':time': int(datetime.now().timestamp())
-            },
-            ExpressionAttributeNames={'#status': 'status'}
-        )
+        try:
+            existing_supplier, deleted_supplier = apply_patch(
+                table, {'supplier_id': supplier_id}, {'status': 'DELETED'}, expected_version, return_old=True
+            )
+        except PatchError as e:
+            return patch_error_response(e)
+        
+        sync_supplier_search_index(existing_supplier, deleted_supplier)
+        record_snapshot_change(supplier_id)
         
         return {
             'statusCode': 200,
             'headers': COMMON_HEADERS,
-            'body': json.dumps({'message': 'Supplier deleted successfully'}, cls=DecimalEncoder)
+            'body': dumps({'message': 'Supplier deleted successfully'})
         }
     except Exception as e:
         print(f"Error deleting supplier: {str(e)}")
         return {
             'statusCode': 500,
             'headers': COMMON_HEADERS,
-            'body': json.dumps({'message': f"Error deleting supplier: {str(e)}"}, cls=DecimalEncoder)
+            'body': dumps({'message': f"Error deleting supplier: {str(e)}"})
         }
 
-def get_supplier_inbound_history(supplier_id):
-    """공급업체 입고 이력 조회"""
+def get_supplier_history(event, supplier_id, event_type):
+    """공급업체 이력 조회 (supplier-event-index, 기간 조건, 최신순, 페이지네이션)"""
+    query_params = event.get('queryStringParameters', {}) or {}
+    
     try:
-        # 공급업체 존재 확인
-        supplier_table = dynamodb.Table(SUPPLIER_TABLE)
-        supplier_response = supplier_table.get_item(Key={'supplier_id': supplier_id})
-        
-        if 'Item' not in supplier_response:
-            return {
-                'statusCode': 404,
-                'headers': COMMON_HEADERS,
-                'body': json.dumps({'message': 'Supplier not found'}, cls=DecimalEncoder)
-            }
-            
-        # 이력 조회
-        history_table = dynamodb.Table(RECEIVING_HISTORY_TABLE)
-        
-        # 주문에서 supplier_id로 필터링 (GSI 필요)
-        # DynamoDB에서는 직접 조인이 불가능하므로, 별도 조회 후 애플리케이션에서 조합
-        query_params = {'supplier_id': supplier_id, 'event_type': 'RECEIVING_COMPLETED'}
-        
-        # GSI가 있는 경우:
-        response = history_table.query(
-            IndexName='order-time-index',  # 실제 인덱스 이름으로 변경
-            KeyConditionExpression='order_id = :oid',
-            FilterExpression='event_type = :type',
-            ExpressionAttributeValues={
-                ':oid': supplier_id,
-                ':type': 'RECEIVING_COMPLETED'
-            }
-        )
-        
-        history_items = response.get('Items', [])
-        
-        # 날짜 포맷팅 추가
-        for item in history_items:
-            if 'timestamp' in item:
-                item['timestamp_iso'] = datetime.fromtimestamp(item['timestamp']).isoformat()
-        
+        from_ts = parse_time_bound(query_params.get('from'))
+        to_ts = parse_time_bound(query_params.get('to'), end_of_day=True)
+        # 공급업체 / 이벤트 유형 / 기간이 바뀌면 이전 토큰은 거부
+        scope = query_scope('supplier-history', [supplier_id, event_type, from_ts, to_ts])
+        limit, cursor = read_page_params(query_params, scope, SUPPLIER_EVENT_INDEX)
+    except ValueError as e:
         return {
-            'statusCode': 200,
+            'statusCode': 400,
+            'headers': COMMON_HEADERS,
+            'body': dumps({'message': str(e)})
+        }
+    
+    # 공급업체 존재 확인 (스냅샷 우선)
+    if lookup_supplier(supplier_id) is None:
+        return {
+            'statusCode': 404,
             'headers': COMMON_HEADERS,
-            'body': json.dumps({
-                'history': history_items,
-                'count': len(history_items)
-            }, cls=DecimalEncoder)
+            'body': dumps({'message': 'Supplier not found'})
         }
+    
+    # 이력 조회 - 키 조건만으로 범위를 좁히므로 이력 양과 무관하게 페이지 비용 일정
+    history_table = dynamodb.Table(RECEIVING_HISTORY_TABLE)
+    query_args = build_history_key_condition(supplier_id, event_type, from_ts, to_ts)
+    query_args['ScanIndexForward'] = False
+    query_args.update(page_args(limit, cursor))
+    
+    response = history_table.query(**query_args)
+    history_items = response.get('Items', [])
+    
+    # 날짜 포맷팅 추가
+    for item in history_items:
+        if 'timestamp' in item:
+            item['timestamp_iso'] = datetime.fromtimestamp(int(item['timestamp'])).isoformat()
+    
+    next_token = encode_token(response.get('LastEvaluatedKey'), scope, SUPPLIER_EVENT_INDEX)
+    
+    return {
+        'statusCode': 200,
+        'headers': COMMON_HEADERS,
+        'body': dumps(page_body('history', history_items, next_token))
+    }
+
+def get_supplier_inbound_history(event, supplier_id):
+    """공급업체 입고 이력 조회"""
+    try:
+        return get_supplier_history(event, supplier_id, 'RECEIVING_COMPLETED')
     except Exception as e:
         print(f"Error getting supplier inbound history: {str(e)}")
         return {
             'statusCode': 500,
             'headers': COMMON_HEADERS,
-            'body': json.dumps({'message': f"Error getting supplier inbound history: {str(e)}"}, cls=DecimalEncoder)
+            'body': dumps({'message': f"Error getting supplier inbound history: {str(e)}"})
         }
 
-def get_supplier_outbound_history(supplier_id):
+def get_supplier_outbound_history(event, supplier_id):
     """공급업체 출고 이력 조회"""
     try:
-        # 공급업체 존재 확인
-        supplier_table = dynamodb.Table(SUPPLIER_TABLE)
-        supplier_response = supplier_table.get_item(Key={'supplier_id': supplier_id})
+        return get_supplier_history(event, supplier_id, 'DISPATCH_COMPLETED')
+    except Exception as e:
+        print(f"Error getting supplier outbound history: {str(e)}")
+        return {
+            'statusCode': 500,
+            'headers': COMMON_HEADERS,
+            'body': dumps({'message': f"Error getting supplier outbound history: {str(e)}"})
+        }
+
+def get_supplier_scorecard(supplier_id):
+    """공급업체 스코어카드 조회 (누적 카운터 레코드 get_item 1회)"""
+    try:
+        table = dynamodb.Table(SUPPLIER_SCORECARD_TABLE)
+        response = table.get_item(Key={'supplier_id': supplier_id, 'record_key': SCORECARD_RECORD_KEY})
         
-        if 'Item' not in supplier_response:
+        if 'Item' not in response and lookup_supplier(supplier_id) is None:
             return {
                 'statusCode': 404,
                 'headers': COMMON_HEADERS,
-                'body': json.dumps({'message': 'Supplier not found'}, cls=DecimalEncoder)
-            }
-            
-        # 이력 조회
-        history_table = dynamodb.Table(RECEIVING_HISTORY_TABLE)
-        
-        # 주문에서 supplier_id로 필터링 (GSI 필요)
-        query_params = {'supplier_id': supplier_id, 'event_type': 'DISPATCH_COMPLETED'}
-        
-        # GSI가 있는 경우:
-        response = history_table.query(
-            IndexName='order-time-index',  # 실제 인덱스 이름으로 변경
-            KeyConditionExpression='order_id = :oid',
-            FilterExpression='event_type = :type',
-            ExpressionAttributeValues={
-                ':oid': supplier_id,
-                ':type': 'DISPATCH_COMPLETED'
+                'body': dumps({'message': 'Supplier not found'})
             }
-        )
-        
-        history_items = response.get('Items', [])
-        
-        # 날짜 포맷팅 추가
-        for item in history_items:
-            if 'timestamp' in item:
-                item['timestamp_iso'] = datetime.fromtimestamp(item['timestamp']).isoformat()
         
         return {
             'statusCode': 200,
             'headers': COMMON_HEADERS,
-            'body': json.dumps({
-                'history': history_items,
-                'count': len(history_items)
-            }, cls=DecimalEncoder)
+            'body': dumps(build_scorecard(supplier_id, response.get('Item')))
         }
     except Exception as e:
-        print(f"Error getting supplier outbound history: {str(e)}")
+        print(f"Error getting supplier scorecard: {str(e)}")
         return {
             'statusCode': 500,
             'headers': COMMON_HEADERS,
-            'body': json.dumps({'message': f"Error getting supplier outbound history: {str(e)}"}, cls=DecimalEncoder)
+            'body': dumps({'message': f"Error getting supplier scorecard: {str(e)}"})
         }
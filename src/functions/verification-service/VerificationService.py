@@ -1,31 +1,33 @@
 import json
-import boto3
 import os
 import uuid
 from datetime import datetime
-from decimal import Decimal
+
+from wms_common.clients import lazy_client, lazy_resource
+from wms_common.http import api_handler
+from wms_common.pagination import encode_token, page_args, page_body, read_page_params
+from wms_common.projection import build_projection, parse_fields
+from wms_common.serialization import dumps
 
 # AWS 서비스 클라이언트
-dynamodb = boto3.resource('dynamodb')
-events = boto3.client('events')
+dynamodb = lazy_resource('dynamodb')
+events = lazy_client('events')
 
 # 환경 변수
 VERIFICATION_RESULT_TABLE = os.environ.get('VERIFICATION_RESULT_TABLE')
 DOCUMENT_METADATA_TABLE = os.environ.get('DOCUMENT_METADATA_TABLE')
 RECEIVING_ORDER_TABLE = os.environ.get('RECEIVING_ORDER_TABLE')
 
-# JSON 인코더 클래스 정의
-class DecimalEncoder(json.JSONEncoder):
-    def default(self, obj):
-        if isinstance(obj, Decimal):
-            return float(obj)
-        return super(DecimalEncoder, self).default(obj)
+# 목록 조회 fields= 허용 필드 (verification_id는 항상 포함)
+VERIFICATION_LIST_FIELDS = [
+    'verification_id', 'order_id', 'document_id', 'verification_type', 'result',
+    'verifier', 'verification_date', 'notes', 'discrepancies'
+]
 
+@api_handler
 def lambda_handler(event, context):
     """검증 처리 Lambda 핸들러"""
     try:
-        print(f"Received event: {json.dumps(event)}")
-        
         # API Gateway 프록시 통합
         if 'httpMethod' in event:
             http_method = event.get('httpMethod')
@@ -49,11 +51,11 @@ def lambda_handler(event, context):
                     'Access-Control-Allow-Methods': 'GET,POST,PUT,DELETE,OPTIONS',
                     'Access-Control-Allow-Headers': 'Content-Type,X-Amz-Date,Authorization,X-Api-Key,X-Amz-Security-Token'
                 },
-                'body': json.dumps({
+                'body': dumps({
                     'message': 'Endpoint not found',
                     'path': path,
                     'method': http_method
-                }, cls=DecimalEncoder)
+                })
             }
         
         # EventBridge 이벤트 처리
@@ -71,10 +73,10 @@ def lambda_handler(event, context):
                     'Access-Control-Allow-Methods': 'GET,POST,PUT,DELETE,OPTIONS',
                     'Access-Control-Allow-Headers': 'Content-Type,X-Amz-Date,Authorization,X-Api-Key,X-Amz-Security-Token'
                 },
-            'body': json.dumps({
+            'body': dumps({
                 'message': 'Verification service executed directly',
                 'event': event
-            }, cls=DecimalEncoder)
+            })
         }
             
     except Exception as e:
@@ -87,7 +89,7 @@ def lambda_handler(event, context):
                     'Access-Control-Allow-Methods': 'GET,POST,PUT,DELETE,OPTIONS',
                     'Access-Control-Allow-Headers': 'Content-Type,X-Amz-Date,Authorization,X-Api-Key,X-Amz-Security-Token'
                 },
-            'body': json.dumps({'message': f"Error: {str(e)}"}, cls=DecimalEncoder)
+            'body': dumps({'message': f"Error: {str(e)}"})
         }
 
 def get_verification_results(event):
@@ -96,23 +98,38 @@ def get_verification_results(event):
         query_params = event.get('queryStringParameters', {}) or {}
         order_id = query_params.get('order_id')
         
+        index_name = 'order_id-index' if order_id else None
+        scope = f'verification-results:{order_id}' if order_id else 'verification-results'
+        try:
+            fields = parse_fields(query_params, VERIFICATION_LIST_FIELDS, required=('verification_id',))
+            limit, cursor = read_page_params(query_params, scope, index_name)
+        except ValueError as e:
+            return {
+                'statusCode': 400,
+                'headers': {'Content-Type': 'application/json', 'Access-Control-Allow-Origin': '*'},
+                'body': dumps({'message': str(e)})
+            }
+        request_args = dict(build_projection(fields, VERIFICATION_LIST_FIELDS), **page_args(limit, cursor))
+        
         table = dynamodb.Table(VERIFICATION_RESULT_TABLE)
         
         if order_id:
             # 특정 주문의 검증 결과 조회
             # GSI 필요: order_id-index
             response = table.query(
-                IndexName='order_id-index',
+                IndexName=index_name,
                 KeyConditionExpression='order_id = :order_id',
                 ExpressionAttributeValues={
                     ':order_id': order_id
-                }
+                },
+                **request_args
             )
         else:
             # 전체 결과 스캔 (프로덕션에서는 권장하지 않음)
-            response = table.scan()
+            response = table.scan(**request_args)
             
         results = response.get('Items', [])
+        next_token = encode_token(response.get('LastEvaluatedKey'), scope, index_name)
         
         return {
             'statusCode': 200,
@@ -120,17 +137,14 @@ def get_verification_results(event):
                 'Content-Type': 'application/json',
                 'Access-Control-Allow-Origin': '*'
             },
-            'body': json.dumps({
-                'results': results,
-                'count': len(results)
-            }, cls=DecimalEncoder)
+            'body': dumps(page_body('results', results, next_token))
         }
     except Exception as e:
         print(f"Error getting verification results: {str(e)}")
         return {
             'statusCode': 500,
             'headers': {'Content-Type': 'application/json', 'Access-Control-Allow-Origin': '*'},
-            'body': json.dumps({'message': f"Error getting verification results: {str(e)}"}, cls=DecimalEncoder)
+            'body': dumps({'message': f"Error getting verification results: {str(e)}"})
         }
 
 def verify_documents(event, order_id):
@@ -143,7 +157,7 @@ def verify_documents(event, order_id):
             return {
                 'statusCode': 400,
                 'headers': {'Content-Type': 'application/json', 'Access-Control-Allow-Origin': '*'},
-                'body': json.dumps({'message': 'Missing verification_results field'}, cls=DecimalEncoder)
+                'body': dumps({'message': 'Missing verification_results field'})
             }
         
         verification_results = body.get('verification_results', [])
@@ -156,7 +170,7 @@ def verify_documents(event, order_id):
             return {
                 'statusCode': 404,
                 'headers': {'Content-Type': 'application/json', 'Access-Control-Allow-Origin': '*'},
-                'body': json.dumps({'message': 'Receiving order not found'}, cls=DecimalEncoder)
+                'body': dumps({'message': 'Receiving order not found'})
             }
             
         # 기존 주문 정보
@@ -167,7 +181,7 @@ def verify_documents(event, order_id):
             return {
                 'statusCode': 400,
                 'headers': {'Content-Type': 'application/json', 'Access-Control-Allow-Origin': '*'},
-                'body': json.dumps({'message': f'Cannot verify documents for order in {existing_order.get("status")} status'}, cls=DecimalEncoder)
+                'body': dumps({'message': f'Cannot verify documents for order in {existing_order.get("status")} status'})
             }
         
         # 문서 조회 및 검증 상태 업데이트
@@ -187,13 +201,15 @@ def verify_documents(event, order_id):
             if verification_result == 'DECLINED':
                 overall_result = 'DECLINED'
             
-            # 문서 메타데이터 업데이트
+            # 문서 메타데이터 업데이트 (version / updated_at 갱신으로 문서 ETag 변경)
             document_table.update_item(
                 Key={'document_id': document_id},
-                UpdateExpression="set verification_status = :status, verification_notes = :notes",
+                UpdateExpression="set verification_status = :status, verification_notes = :notes, updated_at = :time add version :one",
                 ExpressionAttributeValues={
                     ':status': verification_result,
-                    ':notes': notes
+                    ':notes': notes,
+                    ':time': timestamp,
+                    ':one': 1
                 }
             )
             
@@ -228,7 +244,10 @@ def verify_documents(event, order_id):
         # 이벤트 발행
         event_detail = {
             'order_id': order_id,
+            'supplier_id': existing_order.get('supplier_id'),
             'verification_status': new_verification_status,
+            'document_count': len(saved_results),
+            'declined_count': sum(1 for result in saved_results if result['result'] == 'DECLINED'),
             'timestamp': timestamp
         }
         
@@ -249,18 +268,18 @@ def verify_documents(event, order_id):
                 'Content-Type': 'application/json',
                 'Access-Control-Allow-Origin': '*'
             },
-            'body': json.dumps({
+            'body': dumps({
                 'verification_status': new_verification_status,
                 'results': saved_results,
                 'message': 'Document verification completed'
-            }, cls=DecimalEncoder)
+            })
         }
     except Exception as e:
         print(f"Error verifying documents: {str(e)}")
         return {
             'statusCode': 500,
             'headers': {'Content-Type': 'application/json', 'Access-Control-Allow-Origin': '*'},
-            'body': json.dumps({'message': f"Error verifying documents: {str(e)}"}, cls=DecimalEncoder)
+            'body': dumps({'message': f"Error verifying documents: {str(e)}"})
         }
 
 def handle_document_uploaded(detail):
@@ -314,16 +333,16 @@ def handle_document_uploaded(detail):
         
         return {
             'statusCode': 200,
-            'body': json.dumps({
+            'body': dumps({
                 'message': 'Document upload event processed',
                 'all_documents_uploaded': all_documents_uploaded
-            }, cls=DecimalEncoder)
+            })
         }
     except Exception as e:
         print(f"Error handling document uploaded event: {str(e)}")
         return {
             'statusCode': 500,
-            'body': json.dumps({'message': f"Error: {str(e)}"}, cls=DecimalEncoder)
+            'body': dumps({'message': f"Error: {str(e)}"})
         }
 
 def publish_event(event_detail, detail_type, source='wms.verification-service'):
@@ -334,7 +353,7 @@ def publish_event(event_detail, detail_type, source='wms.verification-service'):
                 {
                     'Source': source,
                     'DetailType': detail_type,
-                    'Detail': json.dumps(event_detail, cls=DecimalEncoder)
+                    'Detail': dumps(event_detail)
                 }
             ]
         )
@@ -0,0 +1,4 @@
+"""WMS Lambda 함수 공통 모듈
+
+각 서비스 배포 패키지의 루트에 wms_common/ 디렉터리를 함께 복사해서 사용합니다.
+"""
@@ -0,0 +1,133 @@
+"""BatchWriteItem / BatchGetItem 청크 병렬 처리
+
+boto3 리소스 객체는 스레드 간 공유가 안전하지 않으므로 저수준 클라이언트
+(dynamodb.meta.client)를 받아 직접 직렬화하고, 청크를 스레드 풀에서 병렬 실행합니다.
+미처리 항목(UnprocessedItems / UnprocessedKeys)은 지터를 준 지수 백오프로 재시도합니다.
+"""
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from boto3.dynamodb.types import TypeDeserializer, TypeSerializer
+from botocore.exceptions import ClientError
+
+MAX_BATCH_WRITE = 25    # BatchWriteItem 요청당 최대 항목 수
+MAX_BATCH_GET = 100     # BatchGetItem 요청당 최대 키 수
+DEFAULT_WORKERS = 8
+DEFAULT_MAX_ATTEMPTS = 8
+
+RETRYABLE_ERRORS = (
+    'ProvisionedThroughputExceededException',
+    'ThrottlingException',
+    'RequestLimitExceeded',
+    'InternalServerError'
+)
+
+_serializer = TypeSerializer()
+_deserializer = TypeDeserializer()
+
+
+def serialize_item(item):
+    """파이썬 dict -> DynamoDB AttributeValue dict"""
+    return {key: _serializer.serialize(value) for key, value in item.items()}
+
+
+def deserialize_item(item):
+    """DynamoDB AttributeValue dict -> 파이썬 dict"""
+    return {key: _deserializer.deserialize(value) for key, value in item.items()}
+
+
+def chunked(items, size):
+    """리스트를 size 크기 청크로 분할"""
+    return [items[start:start + size] for start in range(0, len(items), size)]
+
+
+def backoff_sleep(attempt, base=0.05, cap=2.0):
+    """full jitter 지수 백오프 대기"""
+    time.sleep(random.uniform(0, min(cap, base * (2 ** attempt))))
+
+
+def _write_chunk(client, table_name, chunk, max_attempts):
+    """청크 하나 쓰기, 최종 실패 항목 [(item, reason)] 반환"""
+    requests = [{'PutRequest': {'Item': serialize_item(item)}} for item in chunk]
+
+    for attempt in range(max_attempts):
+        try:
+            response = client.batch_write_item(RequestItems={table_name: requests})
+        except ClientError as e:
+            code = e.response.get('Error', {}).get('Code')
+            if code not in RETRYABLE_ERRORS:
+                return [(deserialize_item(request['PutRequest']['Item']), code or str(e)) for request in requests]
+            backoff_sleep(attempt)
+            continue
+
+        requests = response.get('UnprocessedItems', {}).get(table_name, [])
+        if not requests:
+            return []
+        backoff_sleep(attempt)
+
+    return [(deserialize_item(request['PutRequest']['Item']), 'Unprocessed after retries') for request in requests]
+
+
+def batch_write_items(client, table_name, items, max_workers=DEFAULT_WORKERS, max_attempts=DEFAULT_MAX_ATTEMPTS):
+    """항목들을 25개 청크로 나눠 병렬 BatchWriteItem, 실패 항목 [(item, reason)] 반환"""
+    chunks = chunked(list(items), MAX_BATCH_WRITE)
+    if not chunks:
+        return []
+    if len(chunks) == 1:
+        return _write_chunk(client, table_name, chunks[0], max_attempts)
+
+    failed = []
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(chunks))) as executor:
+        for chunk_failed in executor.map(lambda chunk: _write_chunk(client, table_name, chunk, max_attempts), chunks):
+            failed.extend(chunk_failed)
+    return failed
+
+
+def _get_chunk(client, table_name, keys, max_attempts, projection=None):
+    """청크 하나 조회, (조회된 항목 목록, 미처리 키 목록) 반환"""
+    request = {'Keys': [serialize_item(key) for key in keys]}
+    if projection:
+        request['ProjectionExpression'] = projection['expression']
+        request['ExpressionAttributeNames'] = projection['names']
+
+    found = []
+    for attempt in range(max_attempts):
+        try:
+            response = client.batch_get_item(RequestItems={table_name: request})
+        except ClientError as e:
+            if e.response.get('Error', {}).get('Code') not in RETRYABLE_ERRORS:
+                raise
+            backoff_sleep(attempt)
+            continue
+
+        found.extend(deserialize_item(item) for item in response.get('Responses', {}).get(table_name, []))
+        unprocessed = response.get('UnprocessedKeys', {}).get(table_name)
+        if not unprocessed or not unprocessed.get('Keys'):
+            return found, []
+        request = unprocessed
+        backoff_sleep(attempt)
+
+    return found, [deserialize_item(key) for key in request['Keys']]
+
+
+def batch_get_items(client, table_name, keys, max_workers=DEFAULT_WORKERS, max_attempts=DEFAULT_MAX_ATTEMPTS, projection=None):
+    """키들을 100개 청크로 나눠 병렬 BatchGetItem, (항목 목록, 최종 미처리 키 목록) 반환
+
+    projection: {'expression': '#a, #b', 'names': {'#a': 'a', '#b': 'b'}} (선택)
+    """
+    # 중복 키는 BatchGetItem에서 ValidationException이 되므로 제거
+    unique_keys = list({tuple(sorted(key.items())): key for key in keys}.values())
+    chunks = chunked(unique_keys, MAX_BATCH_GET)
+    if not chunks:
+        return [], []
+    if len(chunks) == 1:
+        return _get_chunk(client, table_name, chunks[0], max_attempts, projection)
+
+    found, missing = [], []
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(chunks))) as executor:
+        results = executor.map(lambda chunk: _get_chunk(client, table_name, chunk, max_attempts, projection), chunks)
+        for chunk_found, chunk_missing in results:
+            found.extend(chunk_found)
+            missing.extend(chunk_missing)
+    return found, missing
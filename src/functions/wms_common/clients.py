@@ -0,0 +1,113 @@
+"""지연 생성 AWS 클라이언트 레지스트리
+
+모듈 로드 시점에 boto3 클라이언트를 만들면 요청에 필요 없는 서비스 모델까지 읽어
+콜드 스타트가 길어집니다. lazy_client / lazy_resource는 처음 속성에 접근할 때
+클라이언트를 만들고 컨테이너 수명 동안 재사용합니다(스레드 안전).
+- 공통 botocore 설정: 적응형 재시도, 연결 풀 크기, TCP keep-alive
+- 워밍업 호출(is_warmup_event)은 등록된 클라이언트만 미리 만들고 바로 반환
+"""
+import os
+import threading
+
+AWS_MAX_POOL_CONNECTIONS = int(os.environ.get('AWS_MAX_POOL_CONNECTIONS', '32'))    # 병렬 배치 / 팬아웃 작업 수 이상
+AWS_MAX_ATTEMPTS = int(os.environ.get('AWS_MAX_ATTEMPTS', '5'))
+AWS_CONNECT_TIMEOUT = 2
+AWS_READ_TIMEOUT = 30
+
+WARMUP_SOURCE = 'serverless-plugin-warmup'
+
+_lock = threading.Lock()
+_session = None
+_instances = {}
+_registered = []
+
+
+def client_config():
+    """공통 botocore Config"""
+    from botocore.config import Config
+
+    options = {
+        'retries': {'mode': 'adaptive', 'max_attempts': AWS_MAX_ATTEMPTS},
+        'max_pool_connections': AWS_MAX_POOL_CONNECTIONS,
+        'connect_timeout': AWS_CONNECT_TIMEOUT,
+        'read_timeout': AWS_READ_TIMEOUT
+    }
+    try:
+        return Config(tcp_keepalive=True, **options)
+    except TypeError:
+        # tcp_keepalive를 지원하지 않는 botocore (1.27 이전)
+        return Config(**options)
+
+
+def _create(kind, service_name, region_name):
+    global _session
+    key = (kind, service_name, region_name)
+    instance = _instances.get(key)
+    if instance is not None:
+        return instance
+    with _lock:
+        # boto3 세션의 클라이언트 생성은 스레드 안전하지 않으므로 잠금 안에서 생성
+        instance = _instances.get(key)
+        if instance is None:
+            if _session is None:
+                import boto3
+                _session = boto3.session.Session()
+            factory = _session.resource if kind == 'resource' else _session.client
+            instance = factory(service_name, region_name=region_name, config=client_config())
+            _instances[key] = instance
+    return instance
+
+
+def get_client(service_name, region_name=None):
+    return _create('client', service_name, region_name)
+
+
+def get_resource(service_name, region_name=None):
+    return _create('resource', service_name, region_name)
+
+
+class LazyClient:
+    """처음 속성 접근 시 실제 클라이언트 / 리소스를 만들어 위임하는 프록시"""
+
+    def __init__(self, kind, service_name, region_name=None):
+        self._kind = kind
+        self._service_name = service_name
+        self._region_name = region_name
+
+    def _target(self):
+        return _create(self._kind, self._service_name, self._region_name)
+
+    def __getattr__(self, name):
+        return getattr(self._target(), name)
+
+    def __repr__(self):
+        return f'<LazyClient {self._kind}:{self._service_name}>'
+
+
+def lazy_client(service_name, region_name=None):
+    proxy = LazyClient('client', service_name, region_name)
+    _registered.append(proxy)
+    return proxy
+
+
+def lazy_resource(service_name, region_name=None):
+    proxy = LazyClient('resource', service_name, region_name)
+    _registered.append(proxy)
+    return proxy
+
+
+def is_warmup_event(event):
+    """워밍업 호출 여부 ({'warmup': true} 또는 serverless-plugin-warmup)"""
+    return isinstance(event, dict) and (event.get('warmup') is True or event.get('source') == WARMUP_SOURCE)
+
+
+def warm_clients():
+    """등록된 지연 클라이언트를 모두 생성 (이미 생성된 경우 비용 없음)"""
+    for proxy in _registered:
+        proxy._target()
+
+
+def warmup_response():
+    """워밍업 호출 응답 - 클라이언트만 미리 만들고 요청 처리는 건너뜀"""
+    warm_clients()
+    return {'statusCode': 200, 'body': '{"warmup":true}'}
@@ -0,0 +1,67 @@
+"""상세 조회 응답의 ETag / If-None-Match 처리
+
+ETag는 레코드의 version과 updated_at으로 만든 강한 검증자("<version>-<updated_at>")이며,
+If-Match로 되돌려 받으면 wms_common.patch.parse_version_tag로 version을 읽을 수 있습니다.
+"""
+from wms_common.http import get_header
+
+# 304 판단용 키 전용 조회 프로젝션
+VALIDATOR_PROJECTION = '#ver, #ts'
+VALIDATOR_NAMES = {'#ver': 'version', '#ts': 'updated_at'}
+
+
+def make_etag(record, timestamp_field='updated_at', suffix=None):
+    """레코드의 version / updated_at으로 ETag 생성 (suffix: 응답에 시간 의존 값이 있을 때 추가)"""
+    version = int(record.get('version', 0) or 0)
+    timestamp = record.get(timestamp_field)
+    if timestamp is None:
+        timestamp = 0
+    if suffix is not None:
+        return f'"{version}-{int(timestamp)}-{suffix}"'
+    return f'"{version}-{int(timestamp)}"'
+
+
+def requested_etags(event):
+    """If-None-Match 헤더의 ETag 목록 (약한 비교, W/ 접두어 무시)"""
+    header = get_header(event, 'If-None-Match')
+    if not header:
+        return set()
+    tags = set()
+    for tag in header.split(','):
+        tag = tag.strip()
+        if tag.startswith('W/'):
+            tag = tag[2:]
+        if tag:
+            tags.add(tag)
+    return tags
+
+
+def is_not_modified(event, etag):
+    """If-None-Match가 현재 ETag와 일치하면 True"""
+    tags = requested_etags(event)
+    return '*' in tags or etag in tags
+
+
+def with_etag(headers, etag):
+    """응답 헤더에 ETag 추가 (브라우저에서 읽을 수 있도록 노출 헤더 포함)"""
+    return {**headers, 'ETag': etag, 'Access-Control-Expose-Headers': 'ETag'}
+
+
+def not_modified_response(headers, etag):
+    """본문 직렬화 없이 304 응답 생성"""
+    return {
+        'statusCode': 304,
+        'headers': with_etag(headers, etag),
+        'body': ''
+    }
+
+
+def read_validator(table, key, timestamp_field='updated_at', suffix=None):
+    """ETag 계산에 필요한 속성만 조회, 레코드가 없으면 None"""
+    names = dict(VALIDATOR_NAMES)
+    names['#ts'] = timestamp_field
+    response = table.get_item(Key=key, ProjectionExpression=VALIDATOR_PROJECTION, ExpressionAttributeNames=names)
+    item = response.get('Item')
+    if item is None:
+        return None
+    return make_etag(item, timestamp_field, suffix)
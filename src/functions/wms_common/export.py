@@ -0,0 +1,172 @@
+"""대용량 목록 내보내기 (병렬 scan -> NDJSON / CSV -> S3 멀티파트 객체)
+
+조회 계획(wms_common.query_plan)의 스트림(scan 세그먼트 / 팬아웃 query)마다 작업 스레드가
+페이지를 읽어 바로 NDJSON / CSV 바이트로 인코딩하고, 크기가 제한된 큐를 통해 업로드 스레드로
+넘깁니다. 업로드 스레드는 EXPORT_PART_SIZE가 찰 때마다 멀티파트 파트를 올리므로
+메모리 사용량은 테이블 크기와 무관하게 (큐 길이 x 페이지 크기 + 파트 크기) 정도로 일정합니다.
+"""
+import csv
+import io
+import queue
+import threading
+
+from wms_common.batch import deserialize_item
+from wms_common.query_plan import plan_streams, serialize_request
+from wms_common.serialization import dumps
+
+EXPORT_PART_SIZE = 8 * 1024 * 1024     # S3 최소 파트 크기(5MB) 이상
+EXPORT_QUEUE_PAGES = 8                 # 업로드 대기 중인 페이지 최대 수 (메모리 상한)
+
+EXPORT_FORMATS = {
+    'ndjson': 'application/x-ndjson',
+    'csv': 'text/csv'
+}
+
+_DONE = object()
+
+
+class JobDeadlineError(RuntimeError):
+    """Lambda 제한 시간 안에 백그라운드 작업을 마칠 수 없음 (작업 상태를 FAILED로 기록)"""
+
+
+def encode_rows(rows, export_format, fields):
+    """행 목록을 NDJSON / CSV 바이트로 인코딩 (CSV 헤더는 별도로 기록)"""
+    if export_format == 'ndjson':
+        return ''.join(dumps(row) + '\n' for row in rows).encode('utf-8')
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=fields, extrasaction='ignore')
+    writer.writerows(rows)
+    return buffer.getvalue().encode('utf-8')
+
+
+def csv_header(fields):
+    buffer = io.StringIO()
+    csv.writer(buffer).writerow(fields)
+    return buffer.getvalue().encode('utf-8')
+
+
+class S3MultipartWriter:
+    """바이트 스트림을 EXPORT_PART_SIZE 단위 파트로 S3 멀티파트 업로드"""
+
+    def __init__(self, s3, bucket, key, content_type):
+        self.s3 = s3
+        self.bucket = bucket
+        self.key = key
+        self.upload_id = s3.create_multipart_upload(Bucket=bucket, Key=key, ContentType=content_type)['UploadId']
+        self.parts = []
+        self.buffer = bytearray()
+        self.size = 0
+
+    def write(self, data):
+        self.buffer.extend(data)
+        self.size += len(data)
+        if len(self.buffer) >= EXPORT_PART_SIZE:
+            self._flush()
+
+    def _flush(self):
+        part_number = len(self.parts) + 1
+        response = self.s3.upload_part(
+            Bucket=self.bucket, Key=self.key, UploadId=self.upload_id,
+            PartNumber=part_number, Body=bytes(self.buffer)
+        )
+        self.parts.append({'PartNumber': part_number, 'ETag': response['ETag']})
+        self.buffer = bytearray()
+
+    def close(self):
+        """남은 버퍼를 마지막 파트로 올리고 업로드 완료 (마지막 파트는 5MB 미만 허용)"""
+        if self.buffer or not self.parts:
+            self._flush()
+        self.s3.complete_multipart_upload(
+            Bucket=self.bucket, Key=self.key, UploadId=self.upload_id,
+            MultipartUpload={'Parts': self.parts}
+        )
+        return self.size
+
+    def abort(self):
+        try:
+            self.s3.abort_multipart_upload(Bucket=self.bucket, Key=self.key, UploadId=self.upload_id)
+        except Exception as e:
+            print(f"Error aborting multipart upload {self.key}: {str(e)}")
+
+
+def _put(output, value, stop):
+    """큐가 가득 차면 대기하되, 중단 신호가 오면 포기"""
+    while not stop.is_set():
+        try:
+            output.put(value, timeout=0.5)
+            return True
+        except queue.Full:
+            pass
+    return False
+
+
+def _read_stream(client, table_name, operation, request, row_formatter, export_format, fields, output, stop):
+    """스트림 하나를 페이지 단위로 읽어 인코딩한 청크를 큐에 전달"""
+    try:
+        params = serialize_request(table_name, request)
+        call = getattr(client, operation)
+        while not stop.is_set():
+            response = call(**params)
+            rows = [row_formatter(deserialize_item(item)) for item in response.get('Items', [])]
+            if rows and not _put(output, (len(rows), encode_rows(rows, export_format, fields)), stop):
+                return
+            last_key = response.get('LastEvaluatedKey')
+            if not last_key:
+                break
+            params['ExclusiveStartKey'] = last_key
+        _put(output, _DONE, stop)
+    except Exception as e:
+        _put(output, e, stop)
+
+
+def export_plan_to_s3(client, table_name, plan, s3, bucket, key, export_format, fields, row_formatter, deadline=None):
+    """조회 계획 결과 전체를 S3 객체 하나로 내보내고 {'rows', 'bytes'} 반환
+
+    deadline() 이 True를 반환하면 (Lambda 남은 시간 부족) 업로드를 취소하고 JobDeadlineError 발생
+    """
+    if export_format not in EXPORT_FORMATS:
+        raise ValueError(f"format must be one of: {', '.join(EXPORT_FORMATS)}")
+
+    streams = plan_streams(plan)
+    output = queue.Queue(maxsize=EXPORT_QUEUE_PAGES)
+    stop = threading.Event()
+    writer = S3MultipartWriter(s3, bucket, key, EXPORT_FORMATS[export_format])
+    workers = [
+        threading.Thread(
+            target=_read_stream,
+            args=(client, table_name, operation, request, row_formatter, export_format, fields, output, stop),
+            daemon=True
+        )
+        for operation, request in streams
+    ]
+
+    rows = 0
+    try:
+        if export_format == 'csv':
+            writer.write(csv_header(fields))
+        for worker in workers:
+            worker.start()
+
+        remaining = len(workers)
+        while remaining:
+            if deadline and deadline():
+                raise JobDeadlineError('Export did not finish before the Lambda timeout')
+            try:
+                chunk = output.get(timeout=0.5)
+            except queue.Empty:
+                continue
+            if chunk is _DONE:
+                remaining -= 1
+            elif isinstance(chunk, Exception):
+                raise chunk
+            else:
+                rows += chunk[0]
+                writer.write(chunk[1])
+        size = writer.close()
+    except Exception:
+        # 작업 스레드 중단 후 업로드 취소
+        stop.set()
+        writer.abort()
+        raise
+
+    return {'rows': rows, 'bytes': size}
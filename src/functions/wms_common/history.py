@@ -0,0 +1,46 @@
+"""입고/출고 이력 테이블 공통 키 규칙
+
+supplier-event-index GSI 정렬 키는 "<event_type>#<10자리 timestamp>" 형식이며,
+자리수를 맞춰 문자열 정렬이 시간순과 일치하도록 합니다.
+"""
+from datetime import datetime
+
+SUPPLIER_EVENT_INDEX = 'supplier-event-index'
+EVENT_TIME_ATTRIBUTE = 'event_time'
+
+
+def event_time_key(event_type, timestamp):
+    """GSI 정렬 키 생성 (예: RECEIVING_COMPLETED#1737331200)"""
+    return f"{event_type}#{int(timestamp):010d}"
+
+
+def parse_time_bound(value, end_of_day=False):
+    """from / to 파라미터(epoch 초, YYYY-MM-DD, ISO 8601)를 epoch 초로 변환"""
+    if value is None or value == '':
+        return None
+    value = str(value)
+    if value.isdigit():
+        return int(value)
+    try:
+        if 'T' in value:
+            return int(datetime.fromisoformat(value).timestamp())
+        suffix = 'T23:59:59' if end_of_day else 'T00:00:00'
+        return int(datetime.fromisoformat(f"{value}{suffix}").timestamp())
+    except ValueError:
+        raise ValueError(f'Invalid date: {value}')
+
+
+def build_history_key_condition(supplier_id, event_type, from_ts=None, to_ts=None):
+    """공급업체 + 이벤트 유형 + 시간 범위 KeyConditionExpression 인자 생성"""
+    lower = event_time_key(event_type, from_ts if from_ts is not None else 0)
+    upper = event_time_key(event_type, to_ts if to_ts is not None else 9999999999)
+    return {
+        'IndexName': SUPPLIER_EVENT_INDEX,
+        'KeyConditionExpression': 'supplier_id = :sid AND #et BETWEEN :lower AND :upper',
+        'ExpressionAttributeNames': {'#et': EVENT_TIME_ATTRIBUTE},
+        'ExpressionAttributeValues': {
+            ':sid': supplier_id,
+            ':lower': lower,
+            ':upper': upper
+        }
+    }
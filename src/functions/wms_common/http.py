@@ -0,0 +1,123 @@
+"""API Gateway 프록시 이벤트 공통 처리
+
+api_handler 데코레이터는 각 서비스 lambda_handler의 입출력 경계에서
+- base64로 전달된 텍스트 요청 본문을 문자열로 되돌리고
+  (REST API BinaryMediaTypes '*/*' 설정 시 모든 본문이 base64로 전달됨)
+- Accept-Encoding이 gzip을 허용하고 본문이 GZIP_MIN_BYTES 이상이면 gzip 압축 후
+  isBase64Encoded 응답으로 반환합니다. 압축 비율 / 시간은 로그로 남깁니다.
+- 워밍업 호출은 핸들러를 실행하지 않고 바로 반환합니다 (wms_common.clients 참고).
+- 요청마다 구조화 로그 한 줄을 남깁니다 (wms_common.log 참고).
+"""
+import base64
+import functools
+import gzip
+import json
+import os
+import time
+
+from wms_common.clients import is_warmup_event, warmup_response
+from wms_common.log import log_request
+
+# 이 크기 미만 응답은 압축하지 않음 (작은 응답은 압축 비용이 전송 절감보다 큼)
+GZIP_MIN_BYTES = int(os.environ.get('GZIP_MIN_BYTES', '1024'))
+GZIP_LEVEL = 5
+
+
+def get_header(event, name, default=None):
+    """요청 헤더 조회 (대소문자 구분 없음)"""
+    headers = event.get('headers') or {}
+    name = name.lower()
+    for key, value in headers.items():
+        if key.lower() == name:
+            return value
+    return default
+
+
+def read_body(event):
+    """요청 본문 문자열 반환 (isBase64Encoded 처리 포함)"""
+    body = event.get('body') or ''
+    if event.get('isBase64Encoded'):
+        body = base64.b64decode(body).decode('utf-8')
+    return body
+
+
+def accepts_gzip(event):
+    """Accept-Encoding이 gzip(또는 *)을 q > 0으로 허용하는지 확인"""
+    accepted = {}
+    for part in (get_header(event, 'Accept-Encoding') or '').split(','):
+        coding, _, params = part.strip().partition(';')
+        quality = 1.0
+        if params.strip().startswith('q='):
+            try:
+                quality = float(params.strip()[2:])
+            except ValueError:
+                quality = 0.0
+        if coding:
+            accepted[coding.strip().lower()] = quality
+    quality = accepted.get('gzip', accepted.get('*', 0.0))
+    return quality > 0
+
+
+def decode_request_body(event):
+    """base64로 전달된 텍스트(UTF-8) 본문을 문자열로 변환한 이벤트 반환 (바이너리는 그대로)"""
+    if not event.get('isBase64Encoded') or not event.get('body'):
+        return event
+    try:
+        body = base64.b64decode(event['body']).decode('utf-8')
+    except (ValueError, UnicodeDecodeError):
+        return event
+    return dict(event, body=body, isBase64Encoded=False)
+
+
+def compress_response(event, response, min_bytes=None):
+    """조건을 만족하면 gzip + base64 응답으로 변환 (아니면 원래 응답 반환)"""
+    if min_bytes is None:
+        min_bytes = GZIP_MIN_BYTES
+    if not isinstance(response, dict) or response.get('isBase64Encoded') or min_bytes < 0:
+        return response
+    body = response.get('body')
+    headers = response.get('headers') or {}
+    if not isinstance(body, str) or any(key.lower() == 'content-encoding' for key in headers):
+        return response
+
+    raw = body.encode('utf-8')
+    if len(raw) < min_bytes:
+        return response
+    # 크기가 기준 이상인 응답은 Accept-Encoding에 따라 달라지므로 캐시에 알림
+    headers = dict(headers, Vary='Accept-Encoding')
+    if not accepts_gzip(event):
+        return dict(response, headers=headers)
+
+    started = time.perf_counter()
+    compressed = gzip.compress(raw, compresslevel=GZIP_LEVEL)
+    compress_ms = round((time.perf_counter() - started) * 1000, 1)
+    if len(compressed) >= len(raw):
+        return dict(response, headers=headers)
+
+    print(json.dumps({
+        'metric': 'response_compression',
+        'path': event.get('path'),
+        'original_bytes': len(raw),
+        'compressed_bytes': len(compressed),
+        'ratio': round(len(raw) / len(compressed), 2),
+        'compress_ms': compress_ms
+    }))
+    return dict(
+        response,
+        headers=dict(headers, **{'Content-Encoding': 'gzip'}),
+        body=base64.b64encode(compressed).decode('ascii'),
+        isBase64Encoded=True
+    )
+
+
+def api_handler(handler):
+    """lambda_handler 데코레이터 - API Gateway 요청 본문 복원 / 응답 gzip 협상 (그 외 이벤트는 그대로 전달)"""
+    @functools.wraps(handler)
+    def wrapper(event, context):
+        if is_warmup_event(event):
+            return warmup_response()
+        if not isinstance(event, dict) or 'httpMethod' not in event:
+            return handler(event, context)
+        event = decode_request_body(event)
+        return compress_response(event, handler(event, context))
+    return log_request(wrapper)
@@ -0,0 +1,129 @@
+"""Idempotency-Key 헤더 처리 (TTL DynamoDB 테이블)
+
+멱등성 테이블은 idempotency_key(HASH) 하나로 구성되며 expires_at TTL로 자동 삭제됩니다.
+- 첫 요청: 조건부 Put으로 IN_PROGRESS 표시를 남기고 처리한 뒤 응답을 COMPLETED로 저장
+- 재시도: 같은 조건부 Put이 실패하면서 기존 레코드를 함께 돌려받으므로(ReturnValuesOnConditionCheckFailure)
+  한 번의 왕복으로 저장된 응답을 그대로 재생
+- 처리 중인 키는 409, 같은 키에 다른 본문이면 422로 응답
+- 5xx 응답은 저장하지 않고 표시를 지워 재시도가 다시 처리되도록 함
+"""
+import hashlib
+import json
+from datetime import datetime
+
+from botocore.exceptions import ClientError
+
+from wms_common.batch import deserialize_item
+from wms_common.http import get_header, read_body
+
+IDEMPOTENCY_HEADER = 'Idempotency-Key'
+IDEMPOTENCY_TTL_SECONDS = 24 * 3600
+IDEMPOTENCY_LOCK_SECONDS = 120      # Lambda 제한 시간보다 길게 - 이 시간이 지난 IN_PROGRESS는 재처리 허용
+MAX_KEY_LENGTH = 255
+MAX_STORED_BODY = 350 * 1024        # DynamoDB 항목 크기 제한(400KB) 여유분
+
+STATUS_IN_PROGRESS = 'IN_PROGRESS'
+STATUS_COMPLETED = 'COMPLETED'
+
+
+def request_fingerprint(event):
+    """같은 키로 다른 요청을 보냈는지 확인하기 위한 본문 해시"""
+    return hashlib.sha256(read_body(event).encode('utf-8')).hexdigest()
+
+
+def _error_response(headers, status_code, message):
+    return {
+        'statusCode': status_code,
+        'headers': headers,
+        'body': json.dumps({'message': message})
+    }
+
+
+def _replay(record, headers):
+    """저장된 응답 재생"""
+    response = record['response']
+    return {
+        'statusCode': int(response['statusCode']),
+        'headers': dict(headers, **{'Idempotency-Replayed': 'true'}),
+        'body': response['body']
+    }
+
+
+def _claim(table, record_key, fingerprint, now):
+    """IN_PROGRESS 표시 저장, 이미 있으면 기존 레코드 반환 (없으면 None)"""
+    try:
+        table.put_item(
+            Item={
+                'idempotency_key': record_key,
+                'status': STATUS_IN_PROGRESS,
+                'fingerprint': fingerprint,
+                'locked_until': now + IDEMPOTENCY_LOCK_SECONDS,
+                'expires_at': now + IDEMPOTENCY_TTL_SECONDS
+            },
+            # 처음 보는 키이거나, 처리 도중 중단되어 잠금이 만료된 키만 선점
+            ConditionExpression='attribute_not_exists(idempotency_key) OR (#status = :in_progress AND locked_until < :now)',
+            ExpressionAttributeNames={'#status': 'status'},
+            ExpressionAttributeValues={':in_progress': STATUS_IN_PROGRESS, ':now': now},
+            ReturnValuesOnConditionCheckFailure='ALL_OLD'
+        )
+        return None
+    except ClientError as e:
+        if e.response.get('Error', {}).get('Code') != 'ConditionalCheckFailedException':
+            raise
+        return deserialize_item(e.response.get('Item') or {})
+
+
+def _store(table, record_key, response, now):
+    """최종 응답 저장 (5xx이거나 너무 크면 표시 삭제)"""
+    body = response.get('body') or ''
+    if response.get('statusCode', 500) >= 500 or len(body.encode('utf-8')) > MAX_STORED_BODY:
+        table.delete_item(Key={'idempotency_key': record_key})
+        return
+    table.update_item(
+        Key={'idempotency_key': record_key},
+        UpdateExpression='SET #status = :completed, #response = :response, expires_at = :expires REMOVE locked_until',
+        ExpressionAttributeNames={'#status': 'status', '#response': 'response'},
+        ExpressionAttributeValues={
+            ':completed': STATUS_COMPLETED,
+            ':response': {'statusCode': response['statusCode'], 'body': body},
+            ':expires': now + IDEMPOTENCY_TTL_SECONDS
+        }
+    )
+
+
+def run_idempotent(event, table, scope, handler, headers):
+    """Idempotency-Key 헤더가 있으면 handler(event) 결과를 저장/재생, 없으면 그대로 실행
+
+    scope는 엔드포인트 구분자(예: 'POST /receiving-orders')로, 다른 엔드포인트의 같은 키와 섞이지 않게 합니다.
+    table이 None이면(테이블 미설정) 헤더를 무시합니다.
+    """
+    key = get_header(event, IDEMPOTENCY_HEADER)
+    if not key or table is None:
+        return handler(event)
+    if len(key) > MAX_KEY_LENGTH:
+        return _error_response(headers, 400, f'{IDEMPOTENCY_HEADER} must be at most {MAX_KEY_LENGTH} characters')
+
+    record_key = f'{scope}#{key}'
+    fingerprint = request_fingerprint(event)
+    now = int(datetime.now().timestamp())
+
+    existing = _claim(table, record_key, fingerprint, now)
+    if existing is not None:
+        if existing.get('fingerprint') != fingerprint:
+            return _error_response(headers, 422, f'{IDEMPOTENCY_HEADER} was already used with a different request body')
+        if existing.get('status') == STATUS_COMPLETED:
+            return _replay(existing, headers)
+        return _error_response(headers, 409, 'A request with this Idempotency-Key is still in progress')
+
+    try:
+        response = handler(event)
+    except Exception:
+        table.delete_item(Key={'idempotency_key': record_key})
+        raise
+
+    try:
+        _store(table, record_key, response, now)
+    except Exception as e:
+        # 응답 저장 실패는 요청 자체를 실패시키지 않음 (잠금 만료 후 재처리 가능)
+        print(f"Error storing idempotent response for {record_key}: {str(e)}")
+    return response
@@ -0,0 +1,152 @@
+"""구조화 로그 (요청당 JSON 한 줄 + 샘플링된 이벤트 덤프)
+
+핸들러마다 print(f"Received event: {json.dumps(event)}")로 이벤트 전체를 남기면
+문서 업로드 / 주문 생성 요청의 수 MB base64 본문을 매번 직렬화해 CloudWatch로 보내게 됩니다.
+- 요청마다 route / status / duration_ms만 JSON 한 줄로 기록 (log_request 데코레이터)
+- 이벤트 덤프는 DEBUG 레벨이며 LOG_EVENT_SAMPLE_RATE 비율로만 기록
+  (덤프할 때만 이벤트를 직렬화하므로 샘플링되지 않은 요청은 비용이 없음)
+- 덤프 시 file_content 등 큰 필드와 인증 헤더는 제거하고 긴 문자열 / 목록은 잘라서 기록
+"""
+import functools
+import json
+import os
+import random
+import time
+
+from wms_common.clients import is_warmup_event
+
+LOG_LEVELS = {'DEBUG': 10, 'INFO': 20, 'WARNING': 30, 'ERROR': 40}
+LOG_LEVEL = os.environ.get('LOG_LEVEL', 'INFO').upper()
+LOG_EVENT_SAMPLE_RATE = float(os.environ.get('LOG_EVENT_SAMPLE_RATE', '0.01'))
+LOG_MAX_FIELD_CHARS = int(os.environ.get('LOG_MAX_FIELD_CHARS', '256'))
+LOG_MAX_LIST_ITEMS = 20
+LOG_MAX_PARSE_BYTES = 64 * 1024    # 이보다 큰 요청 본문은 JSON으로 파싱하지 않고 잘라서 기록
+
+REDACTED_FIELDS = frozenset(
+    name.strip() for name in os.environ.get('LOG_REDACT_FIELDS', 'file_content').split(',') if name.strip()
+)
+SENSITIVE_HEADERS = frozenset(['authorization', 'x-api-key', 'x-amz-security-token', 'cookie'])
+
+_cold_start = True
+
+
+def is_enabled(level):
+    return LOG_LEVELS.get(level, 20) >= LOG_LEVELS.get(LOG_LEVEL, 20)
+
+
+def log(level, message, **fields):
+    """JSON 한 줄 로그 출력 (LOG_LEVEL 미만은 무시)"""
+    if not is_enabled(level):
+        return
+    record = {'level': level, 'message': message}
+    record.update(fields)
+    print(json.dumps(record, ensure_ascii=False, default=str))
+
+
+def truncate(value, limit=None):
+    """긴 문자열은 앞부분과 생략된 길이만 남김"""
+    limit = LOG_MAX_FIELD_CHARS if limit is None else limit
+    if len(value) <= limit:
+        return value
+    return f"{value[:limit]}...<+{len(value) - limit} chars>"
+
+
+def redact(value):
+    """로그용 사본 - 제거 대상 필드는 길이만, 긴 문자열 / 목록은 잘라서 반환"""
+    if isinstance(value, dict):
+        redacted = {}
+        for key, item in value.items():
+            if key in REDACTED_FIELDS and item is not None:
+                redacted[key] = f"<redacted {len(str(item))} chars>"
+            else:
+                redacted[key] = redact(item)
+        return redacted
+    if isinstance(value, list):
+        items = [redact(item) for item in value[:LOG_MAX_LIST_ITEMS]]
+        if len(value) > LOG_MAX_LIST_ITEMS:
+            items.append(f"<+{len(value) - LOG_MAX_LIST_ITEMS} items>")
+        return items
+    if isinstance(value, str):
+        return truncate(value)
+    return value
+
+
+def redact_event(event):
+    """이벤트 덤프용 사본 (요청 본문은 JSON이면 필드 단위로, 아니면 문자열로 잘라냄)"""
+    if not isinstance(event, dict):
+        return redact(event)
+    summary = redact({key: value for key, value in event.items() if key not in ('body', 'headers', 'multiValueHeaders')})
+    headers = event.get('headers')
+    if headers:
+        summary['headers'] = {
+            key: '<redacted>' if key.lower() in SENSITIVE_HEADERS else truncate(str(value))
+            for key, value in headers.items()
+        }
+    body = event.get('body')
+    if isinstance(body, str) and body:
+        summary['body'] = truncate(body)
+        if not event.get('isBase64Encoded') and len(body) <= LOG_MAX_PARSE_BYTES:
+            try:
+                summary['body'] = redact(json.loads(body))
+            except ValueError:
+                pass
+    elif body is not None:
+        summary['body'] = redact(body)
+    return summary
+
+
+def should_dump_event():
+    """DEBUG 레벨이면 항상, 아니면 LOG_EVENT_SAMPLE_RATE 비율로 이벤트 덤프"""
+    return is_enabled('DEBUG') or random.random() < LOG_EVENT_SAMPLE_RATE
+
+
+def request_route(event):
+    """로그용 요청 경로 (API 리소스 템플릿 / 이벤트 유형 / 스트림 / 직접 호출)"""
+    if not isinstance(event, dict):
+        return 'invoke'
+    if 'httpMethod' in event:
+        return f"{event['httpMethod']} {event.get('resource') or event.get('path')}"
+    if 'detail-type' in event:
+        return f"event {event.get('source')} {event['detail-type']}"
+    records = event.get('Records')
+    if records:
+        return f"records {records[0].get('eventSource')}"
+    return f"invoke {event.get('action', 'direct')}"
+
+
+def log_request(handler):
+    """lambda_handler 데코레이터 - 요청당 route / status / duration_ms 한 줄 + 샘플링된 이벤트 덤프"""
+    @functools.wraps(handler)
+    def wrapper(event, context):
+        global _cold_start
+        if is_warmup_event(event):
+            return handler(event, context)
+        cold_start, _cold_start = _cold_start, False
+        request_id = getattr(context, 'aws_request_id', None)
+        route = request_route(event)
+        if should_dump_event():
+            # 샘플링 여부와 관계없이 덤프는 DEBUG 레코드로 남겨 로그 필터에서 구분
+            print(json.dumps({'level': 'DEBUG', 'message': 'event', 'request_id': request_id, 'route': route,
+                              'event': redact_event(event)}, ensure_ascii=False, default=str))
+
+        started = time.perf_counter()
+        response = None
+        try:
+            response = handler(event, context)
+            return response
+        finally:
+            fields = {
+                'request_id': request_id,
+                'route': route,
+                'status': response.get('statusCode') if isinstance(response, dict) else None,
+                'duration_ms': round((time.perf_counter() - started) * 1000, 1),
+                'cold_start': cold_start
+            }
+            if isinstance(response, dict) and 'batchItemFailures' in response:
+                fields['batch_item_failures'] = len(response['batchItemFailures'])
+            if response is None:
+                # 핸들러에서 처리되지 않은 예외 (Lambda가 호출 오류로 기록)
+                log('ERROR', 'request', **fields)
+            else:
+                log('INFO', 'request', **fields)
+    return wrapper
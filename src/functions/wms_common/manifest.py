@@ -0,0 +1,94 @@
+"""NDJSON / CSV 매니페스트 점진적 파싱
+
+매니페스트 전체를 json.loads 하지 않고 줄 단위로 읽어 행(dict)을 하나씩 돌려주므로
+요청 본문(str)이든 S3 StreamingBody든 메모리 사용량이 배치 크기에 비례합니다.
+파싱할 수 없는 행은 예외 대신 오류 메시지와 함께 전달해 행별 결과 보고에 포함합니다.
+"""
+import csv
+import io
+import json
+from itertools import islice
+
+MANIFEST_FORMATS = {
+    'ndjson': ('application/x-ndjson', 'application/jsonl', 'application/json'),
+    'csv': ('text/csv',)
+}
+
+STREAM_CHUNK_SIZE = 64 * 1024
+
+
+def detect_manifest_format(requested=None, content_type=None):
+    """format 파라미터 또는 Content-Type으로 매니페스트 형식 결정 (알 수 없으면 ValueError)"""
+    if requested:
+        requested = requested.lower()
+        if requested not in MANIFEST_FORMATS:
+            raise ValueError(f"format must be one of: {', '.join(MANIFEST_FORMATS)}")
+        return requested
+    media_type = (content_type or '').split(';')[0].strip().lower()
+    for manifest_format, media_types in MANIFEST_FORMATS.items():
+        if media_type in media_types:
+            return manifest_format
+    raise ValueError(f"Unsupported manifest Content-Type: {content_type or '(none)'}")
+
+
+def _stream_lines(body, chunk_size=STREAM_CHUNK_SIZE):
+    """botocore StreamingBody를 청크 단위로 읽어 줄바꿈을 유지한 bytes 줄로 분할"""
+    pending = b''
+    for chunk in body.iter_chunks(chunk_size):
+        lines = (pending + chunk).split(b'\n')
+        pending = lines.pop()
+        for line in lines:
+            yield line + b'\n'
+    if pending:
+        yield pending
+
+
+def text_lines(source):
+    """str / bytes 줄 iterable / 파일 객체를 문자열 줄 iterator로 변환"""
+    if isinstance(source, str):
+        return io.StringIO(source)
+    if hasattr(source, 'iter_chunks'):
+        source = _stream_lines(source)
+    return (line.decode('utf-8') if isinstance(line, bytes) else line for line in source)
+
+
+def iter_manifest_rows(source, manifest_format):
+    """(행 번호, 행 dict 또는 None, 오류 메시지 또는 None) 를 차례로 생성
+
+    행 번호는 1부터 시작하며 CSV 헤더 줄은 세지 않습니다. 빈 줄은 건너뜁니다.
+    """
+    lines = text_lines(source)
+    if manifest_format == 'csv':
+        reader = csv.DictReader(line.lstrip('\ufeff') if index == 0 else line for index, line in enumerate(lines))
+        for row_number, row in enumerate(reader, start=1):
+            if None in row:
+                yield row_number, None, 'Row has more columns than the header'
+                continue
+            yield row_number, {key.strip(): (value or '').strip() for key, value in row.items() if key}, None
+        return
+
+    row_number = 0
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+        row_number += 1
+        try:
+            row = json.loads(line)
+        except ValueError as e:
+            yield row_number, None, f'Invalid JSON: {str(e)}'
+            continue
+        if not isinstance(row, dict):
+            yield row_number, None, 'Each line must be a JSON object'
+            continue
+        yield row_number, row, None
+
+
+def batched(iterable, size):
+    """iterable을 size 크기 리스트로 나눠 차례로 생성"""
+    iterator = iter(iterable)
+    while True:
+        batch = list(islice(iterator, size))
+        if not batch:
+            return
+        yield batch
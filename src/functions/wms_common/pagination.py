@@ -0,0 +1,110 @@
+"""목록 조회 공통 키셋 페이지네이션
+
+next_token은 조회 범위(scope), 인덱스 이름, 스트림 번호, LastEvaluatedKey(AttributeValue 형식)와
+동시에 읽는 scan 세그먼트별 위치를 담아 PAGINATION_TOKEN_SECRET으로 서명한 불투명 문자열입니다(wms_common.signing).
+서명 키가 설정되지 않으면 토큰 발급 / 검증 모두 SigningKeyError로 거부합니다.
+토큰은 ExclusiveStartKey로만 사용하므로 깊은 페이지도 첫 페이지와 비용이 같습니다.
+"""
+import hashlib
+import json
+
+from wms_common.batch import deserialize_item, serialize_item
+from wms_common.signing import InvalidTokenError, sign_token, signing_secret, verify_token
+
+PAGINATION_TOKEN_SECRET_ENV = 'PAGINATION_TOKEN_SECRET'
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+
+
+class PaginationError(ValueError):
+    """잘못된 limit / next_token (400)"""
+    status_code = 400
+
+
+def _is_attribute_value_key(key):
+    """저수준 클라이언트 형식({'S': ...}) 키인지 확인"""
+    return all(isinstance(value, dict) and len(value) == 1 for value in key.values())
+
+
+def parse_limit(query_params, default=DEFAULT_PAGE_SIZE, maximum=MAX_PAGE_SIZE):
+    """limit 쿼리 파라미터 검증 (1 ~ maximum)"""
+    value = (query_params or {}).get('limit')
+    if value is None or value == '':
+        return default
+    try:
+        limit = int(value)
+    except (TypeError, ValueError):
+        raise PaginationError('limit must be an integer')
+    if limit < 1 or limit > maximum:
+        raise PaginationError(f'limit must be between 1 and {maximum}')
+    return limit
+
+
+def encode_token(last_key, scope, index_name=None, stream=0, segments=None):
+    """LastEvaluatedKey를 서명된 next_token으로 변환 (마지막 페이지면 None)
+
+    stream은 여러 요청을 이어 읽는 조회(팬아웃 query)의 현재 요청 번호이며,
+    last_key 없이 stream만 있으면 해당 요청의 처음부터 읽습니다.
+    segments는 동시에 읽는 scan 세그먼트별 위치 목록입니다 (wms_common.query_plan.execute_scan_page).
+    """
+    if not last_key and not stream and not segments:
+        return None
+    last_key = last_key or {}
+    if not _is_attribute_value_key(last_key):
+        last_key = serialize_item(last_key)
+    data = {'s': scope, 'i': index_name or '', 'n': stream, 'k': last_key}
+    if segments:
+        data['g'] = segments
+    return sign_token(data, signing_secret(PAGINATION_TOKEN_SECRET_ENV))
+
+
+def decode_token(token, scope, index_name=None):
+    """next_token 검증 후 {'stream', 'key'(resource 형식), 'raw_key'(AttributeValue 형식), 'segments'} 반환"""
+    secret = signing_secret(PAGINATION_TOKEN_SECRET_ENV)
+    try:
+        data = verify_token(token, secret)
+    except InvalidTokenError:
+        raise PaginationError('Invalid next_token')
+
+    # 다른 목록 / 다른 필터 / 다른 인덱스에서 발급된 토큰 거부
+    if data.get('s') != scope or data.get('i') != (index_name or ''):
+        raise PaginationError('next_token does not match this query')
+
+    raw_key = data['k']
+    return {'stream': int(data.get('n', 0)), 'key': deserialize_item(raw_key), 'raw_key': raw_key,
+            'segments': data.get('g')}
+
+
+def read_page_params(query_params, scope, index_name=None, default_limit=DEFAULT_PAGE_SIZE):
+    """limit / next_token 파라미터를 (limit, cursor) 로 변환 (cursor는 첫 페이지면 None)"""
+    limit = parse_limit(query_params, default_limit)
+    token = (query_params or {}).get('next_token')
+    cursor = decode_token(token, scope, index_name) if token else None
+    return limit, cursor
+
+
+def page_args(limit, cursor=None, raw=False):
+    """query / scan에 넘길 Limit / ExclusiveStartKey 인자"""
+    args = {'Limit': limit}
+    if cursor and cursor['raw_key']:
+        args['ExclusiveStartKey'] = cursor['raw_key'] if raw else cursor['key']
+    return args
+
+
+def query_scope(name, request):
+    """필터가 바뀌면 이전 토큰을 쓸 수 없도록 요청 인자로 만든 scope 문자열"""
+    digest = hashlib.sha256(
+        json.dumps(request, sort_keys=True, default=str, separators=(',', ':')).encode('utf-8')
+    ).hexdigest()[:16]
+    return f'{name}:{digest}'
+
+
+def page_body(resource_key, items, next_token, **extra):
+    """공통 목록 응답 본문 ({<resource_key>: [...], count, next_token, ...})
+
+    기존 프론트엔드가 읽는 리소스 키(orders, suppliers 등)를 그대로 유지합니다.
+    """
+    body = {resource_key: items, 'count': len(items), 'next_token': next_token}
+    body.update(extra)
+    return body
@@ -0,0 +1,167 @@
+"""단일 조건부 update_item 기반 부분 수정(PATCH) 엔진
+
+get_item -> update_item -> get_item 세 번의 왕복 대신 조건부 update_item 한 번으로
+존재 여부 확인, 낙관적 잠금(version / If-Match), 수정 후 레코드 반환(ALL_NEW)을 처리합니다.
+"""
+import functools
+from datetime import datetime
+from decimal import Decimal
+
+from botocore.exceptions import ClientError
+
+from wms_common.batch import deserialize_item
+
+VERSION_ATTRIBUTE = 'version'
+TIMESTAMP_ATTRIBUTE = 'updated_at'
+
+
+class PatchError(Exception):
+    """PATCH 실패 (status_code로 HTTP 응답 코드 매핑)"""
+    status_code = 400
+
+
+class ItemNotFoundError(PatchError):
+    """수정 대상 레코드 없음"""
+    status_code = 404
+
+
+class VersionConflictError(PatchError):
+    """요청한 version과 현재 version 불일치"""
+    status_code = 409
+
+    def __init__(self, message, current_version=None):
+        super().__init__(message)
+        self.current_version = current_version
+
+
+def parse_version_tag(value):
+    """If-Match / version 값을 정수 version으로 변환 (W/"3-1700000000" -> 3)"""
+    if value is None or value == '':
+        return None
+    if isinstance(value, (int, Decimal)):
+        return int(value)
+    tag = str(value).strip()
+    if tag.startswith('W/'):
+        tag = tag[2:]
+    tag = tag.strip('"').split('-')[0]
+    try:
+        return int(tag)
+    except ValueError:
+        raise ValueError(f'Invalid version: {value}')
+
+
+def get_expected_version(event, body=None):
+    """요청의 If-Match 헤더 또는 body의 version에서 기대 version 추출"""
+    headers = event.get('headers') or {}
+    for name, value in headers.items():
+        if name.lower() == 'if-match' and value and value.strip() != '*':
+            return parse_version_tag(value)
+    if body and VERSION_ATTRIBUTE in body:
+        return parse_version_tag(body[VERSION_ATTRIBUTE])
+    return None
+
+
+@functools.lru_cache(maxsize=256)
+def compile_update(key_name, field_names, version_check):
+    """필드 조합별 UpdateExpression / ConditionExpression 생성 (캐시됨)
+
+    version_check: None(검사 안 함), 'absent'(version 속성 없음), 'equal'(version 일치)
+    """
+    names = {'#pk': key_name, '#ver': VERSION_ATTRIBUTE, '#ts': TIMESTAMP_ATTRIBUTE}
+    assignments = ['#ts = :ts']
+    for index, field in enumerate(field_names):
+        names[f'#f{index}'] = field
+        assignments.append(f'#f{index} = :v{index}')
+
+    update_expression = f"SET {', '.join(assignments)} ADD #ver :one"
+
+    condition_expression = 'attribute_exists(#pk)'
+    if version_check == 'absent':
+        condition_expression += ' AND attribute_not_exists(#ver)'
+    elif version_check == 'equal':
+        condition_expression += ' AND #ver = :expected'
+
+    return update_expression, condition_expression, names
+
+
+def to_dynamodb_value(value):
+    """JSON 요청 값의 float를 DynamoDB용 Decimal로 변환"""
+    if isinstance(value, float):
+        return Decimal(str(value))
+    return value
+
+
+def build_patch(key_name, changes, expected_version=None, timestamp=None):
+    """부분 수정 표현식 생성 -> (UpdateExpression, ConditionExpression, names, values)
+
+    apply_patch와 트랜잭션 Update 작업(wms_common.transactions.update_action)이 함께 사용합니다.
+    """
+    field_names = tuple(sorted(changes))
+    if expected_version is None:
+        version_check = None
+    elif expected_version == 0:
+        version_check = 'absent'
+    else:
+        version_check = 'equal'
+
+    update_expression, condition_expression, names = compile_update(key_name, field_names, version_check)
+
+    if timestamp is None:
+        timestamp = int(datetime.now().timestamp())
+    values = {':ts': timestamp, ':one': 1}
+    for index, field in enumerate(field_names):
+        values[f':v{index}'] = to_dynamodb_value(changes[field])
+    if version_check == 'equal':
+        values[':expected'] = expected_version
+    return update_expression, condition_expression, dict(names), values
+
+
+def patched_item(old_item, changes, timestamp):
+    """수정 전 레코드에 변경 사항 / updated_at / version을 반영한 수정 후 레코드"""
+    new_item = dict(old_item)
+    new_item.update({field: to_dynamodb_value(value) for field, value in changes.items()})
+    new_item[TIMESTAMP_ATTRIBUTE] = timestamp
+    new_item[VERSION_ATTRIBUTE] = int(old_item.get(VERSION_ATTRIBUTE, 0)) + 1
+    return new_item
+
+
+def apply_patch(table, key, changes, expected_version=None, timestamp=None, return_old=False):
+    """조건부 update_item 한 번으로 레코드 수정 후 (수정 전, 수정 후) 레코드 반환
+
+    - 레코드가 없으면 ItemNotFoundError
+    - expected_version이 주어졌고 현재 version과 다르면 VersionConflictError
+    - 기본은 ALL_NEW로 DynamoDB가 돌려준 수정 후 레코드를 그대로 사용하며 수정 전 레코드는 None입니다.
+      return_old=True(검색 인덱스 갱신처럼 이전 값이 필요한 경우)면 ALL_OLD로 수정 전 레코드를 받아
+      수정 후 레코드를 구성합니다.
+    실패 시에는 ReturnValuesOnConditionCheckFailure=ALL_OLD로 받은 현재 레코드로 404 / 409를 구분하므로
+    추가 조회가 없습니다.
+    """
+    key_name = next(iter(key))
+    update_expression, condition_expression, names, values = build_patch(key_name, changes, expected_version, timestamp)
+
+    try:
+        response = table.update_item(
+            Key=key,
+            UpdateExpression=update_expression,
+            ConditionExpression=condition_expression,
+            ExpressionAttributeNames=names,
+            ExpressionAttributeValues=values,
+            ReturnValues='ALL_OLD' if return_old else 'ALL_NEW',
+            ReturnValuesOnConditionCheckFailure='ALL_OLD'
+        )
+    except ClientError as e:
+        if e.response.get('Error', {}).get('Code') != 'ConditionalCheckFailedException':
+            raise
+        current = e.response.get('Item')
+        if not current:
+            raise ItemNotFoundError('Item not found')
+        current_version = int(deserialize_item(current).get(VERSION_ATTRIBUTE, 0))
+        raise VersionConflictError(
+            f'Version conflict: expected {expected_version}, current {current_version}',
+            current_version
+        )
+
+    if not return_old:
+        return None, response.get('Attributes', {})
+    old_item = response.get('Attributes', {})
+    return old_item, patched_item(old_item, changes, values[':ts'])
@@ -0,0 +1,81 @@
+"""목록 조회의 fields= 파라미터를 DynamoDB ProjectionExpression으로 변환
+
+허용 필드(allowed)는 응답 필드 이름의 목록이거나, 응답 필드가 원본 속성과 다를 때
+{응답 필드: (원본 속성, ...)} 형태의 dict입니다.
+"""
+
+# 예약어 충돌을 피하기 위한 속성 이름 별칭 접두어 (기존 #status 등과 겹치지 않도록 구분)
+PROJECTION_ALIAS_PREFIX = '#pf'
+
+
+class FieldSelectionError(ValueError):
+    """허용되지 않은 fields= 값 (400)"""
+    status_code = 400
+
+
+def parse_fields(query_params, allowed, required=()):
+    """fields= 파라미터를 응답 필드 목록으로 변환 (파라미터가 없으면 None = 전체 필드)"""
+    value = (query_params or {}).get('fields')
+    if value is None or not value.strip():
+        return None
+
+    fields = []
+    for field in value.split(','):
+        field = field.strip()
+        if field and field not in fields:
+            fields.append(field)
+
+    unknown = [field for field in fields if field not in allowed]
+    if unknown:
+        raise FieldSelectionError(
+            f"Unknown fields: {', '.join(unknown)} (allowed: {', '.join(allowed)})"
+        )
+
+    # 키 / 정렬에 필요한 필드는 항상 포함
+    for field in required:
+        if field not in fields:
+            fields.append(field)
+    return fields
+
+
+def source_attributes(fields, allowed, extra_attributes=()):
+    """응답 필드 목록에 필요한 원본 속성 목록 (중복 제거, 순서 유지)"""
+    attributes = []
+    for field in fields:
+        names = allowed[field] if isinstance(allowed, dict) else (field,)
+        for name in names:
+            if name not in attributes:
+                attributes.append(name)
+    for name in extra_attributes:
+        if name not in attributes:
+            attributes.append(name)
+    return attributes
+
+
+def build_projection(fields, allowed, extra_attributes=(), names=None):
+    """query / scan 인자로 넘길 ProjectionExpression / ExpressionAttributeNames 생성
+
+    fields가 None이면 빈 dict(전체 속성 조회)를 반환합니다. names에 기존 쿼리의
+    ExpressionAttributeNames를 넘기면 별칭을 합쳐서 돌려줍니다.
+    """
+    if fields is None:
+        return {'ExpressionAttributeNames': names} if names else {}
+
+    attribute_names = dict(names or {})
+    aliases = []
+    for index, attribute in enumerate(source_attributes(fields, allowed, extra_attributes)):
+        alias = f'{PROJECTION_ALIAS_PREFIX}{index}'
+        attribute_names[alias] = attribute
+        aliases.append(alias)
+
+    return {
+        'ProjectionExpression': ', '.join(aliases),
+        'ExpressionAttributeNames': attribute_names
+    }
+
+
+def select_fields(record, fields):
+    """응답 레코드에서 요청한 필드만 남김 (fields가 None이면 그대로 반환)"""
+    if fields is None:
+        return record
+    return {field: record[field] for field in fields if field in record}
@@ -0,0 +1,162 @@
+"""인덱스 선택 조회 계획(plan) 실행
+
+plan은 서비스가 필터로부터 만든 dict입니다.
+    {
+        'operation': 'query' | 'scan',
+        'index': GSI 이름 (scan / 기본 테이블은 None),
+        'key_condition': 사람이 읽는 키 조건 요약,
+        'filters': KeyCondition으로 처리하지 못한 필터 속성 목록,
+        'requests': [query / scan 인자, ...]   # query 팬아웃이면 여러 개
+    }
+batch.py와 마찬가지로 스레드 간 공유가 안전한 저수준 클라이언트로 요청을 직렬화합니다.
+페이지 조회(execute_plan_page)에서 query 팬아웃은 요청마다 하나의 스트림으로 보고 순서대로
+이어 읽고, scan은 Segment / TotalSegments로 나눈 세그먼트를 스레드 풀에서 동시에 읽습니다.
+"""
+from concurrent.futures import ThreadPoolExecutor
+
+from wms_common.batch import deserialize_item, serialize_item
+
+DEFAULT_SCAN_SEGMENTS = 4
+MAX_PAGE_ROUND_TRIPS = 10   # 필터가 많이 걸러낼 때 한 페이지에서 허용할 최대 요청 수
+
+
+def serialize_request(table_name, request):
+    """resource 형식 인자 -> 저수준 클라이언트 인자"""
+    params = dict(request, TableName=table_name)
+    if 'ExpressionAttributeValues' in params:
+        params['ExpressionAttributeValues'] = serialize_item(params['ExpressionAttributeValues'])
+    return params
+
+
+def _read_all(call, params):
+    """LastEvaluatedKey를 따라 모든 페이지 조회"""
+    items = []
+    while True:
+        response = call(**params)
+        items.extend(deserialize_item(item) for item in response.get('Items', []))
+        last_key = response.get('LastEvaluatedKey')
+        if not last_key:
+            return items
+        params = dict(params, ExclusiveStartKey=last_key)
+
+
+def query_all(client, table_name, request):
+    """query 하나의 전체 페이지 조회"""
+    return _read_all(client.query, serialize_request(table_name, request))
+
+
+def plan_streams(plan):
+    """페이지 조회용 스트림 목록 [(operation, request)] - query 팬아웃 / scan 세그먼트 순서"""
+    if plan['operation'] == 'scan':
+        request = plan['requests'][0] if plan['requests'] else {}
+        segments = max(plan.get('segments', DEFAULT_SCAN_SEGMENTS), 1)
+        if segments == 1:
+            return [('scan', request)]
+        return [('scan', dict(request, Segment=segment, TotalSegments=segments)) for segment in range(segments)]
+    return [('query', request) for request in plan['requests']]
+
+
+def _split_limit(remaining, count):
+    """남은 개수를 count개 요청의 Limit로 분배 (합계는 remaining을 넘지 않음)"""
+    share, extra = divmod(remaining, count)
+    return [share + (1 if index < extra else 0) for index in range(count)]
+
+
+def execute_scan_page(client, table_name, plan, limit, segment_keys=None):
+    """scan 세그먼트를 동시에 읽어 최대 limit개 반환
+
+    segment_keys는 세그먼트별 위치 목록입니다 (None: 처음부터, False: 끝까지 읽음,
+    dict: LastEvaluatedKey). (items, 다음 segment_keys) 를 반환하며 모두 끝났으면 None입니다.
+    """
+    request = plan['requests'][0] if plan['requests'] else {}
+    segments = max(plan.get('segments', DEFAULT_SCAN_SEGMENTS), 1)
+    states = list(segment_keys) if segment_keys else [None] * segments
+    if len(states) != segments:
+        raise ValueError('next_token does not match this query')
+
+    base_params = serialize_request(table_name, request)
+    if segments > 1:
+        base_params['TotalSegments'] = segments
+
+    def scan_segment(read):
+        segment, segment_limit = read
+        params = dict(base_params, Limit=segment_limit)
+        if segments > 1:
+            params['Segment'] = segment
+        if states[segment]:
+            params['ExclusiveStartKey'] = states[segment]
+        return client.scan(**params)
+
+    items = []
+    round_trips = 0
+    with ThreadPoolExecutor(max_workers=segments) as executor:
+        while len(items) < limit and round_trips < MAX_PAGE_ROUND_TRIPS:
+            active = [segment for segment, state in enumerate(states) if state is not False]
+            if not active:
+                break
+            limits = _split_limit(limit - len(items), len(active))
+            reads = [(segment, segment_limit) for segment, segment_limit in zip(active, limits) if segment_limit]
+            responses = list(executor.map(scan_segment, reads))
+            round_trips += 1
+
+            # 세그먼트 순서대로 이어 붙여 같은 커서면 같은 페이지가 되도록 함
+            for (segment, _), response in zip(reads, responses):
+                items.extend(deserialize_item(item) for item in response.get('Items', []))
+                states[segment] = response.get('LastEvaluatedKey') or False
+
+    if all(state is False for state in states):
+        return items, None
+    return items, states
+
+
+def execute_plan_page(client, table_name, plan, limit, stream=0, start_key=None, segment_keys=None):
+    """plan의 다음 페이지를 최대 limit개 반환
+
+    (items, cursor) 를 반환하며 더 읽을 항목이 없으면 cursor는 None입니다.
+    - query: 스트림(팬아웃 요청)을 차례로 읽고 cursor는 {'stream', 'key'}
+      (key가 None이면 해당 스트림 처음부터)
+    - scan: 세그먼트를 동시에 읽고 cursor는 {'stream': 0, 'key': None, 'segments': 세그먼트별 위치}
+    """
+    if plan['operation'] == 'scan':
+        items, states = execute_scan_page(client, table_name, plan, limit, segment_keys)
+        if states is None:
+            return items, None
+        return items, {'stream': 0, 'key': None, 'segments': states}
+
+    streams = plan_streams(plan)
+    items = []
+    key = start_key
+    round_trips = 0
+
+    while stream < len(streams) and len(items) < limit and round_trips < MAX_PAGE_ROUND_TRIPS:
+        operation, request = streams[stream]
+        params = serialize_request(table_name, request)
+        params['Limit'] = limit - len(items)
+        if key:
+            params['ExclusiveStartKey'] = key
+        response = getattr(client, operation)(**params)
+        round_trips += 1
+        items.extend(deserialize_item(item) for item in response.get('Items', []))
+
+        key = response.get('LastEvaluatedKey')
+        if not key:
+            stream += 1
+
+    if stream >= len(streams):
+        return items, None
+    return items, {'stream': stream, 'key': key}
+
+
+def describe_plan(plan):
+    """응답 meta에 넣을 조회 계획 요약"""
+    summary = {
+        'operation': plan['operation'],
+        'index': plan.get('index'),
+        'key_condition': plan.get('key_condition'),
+        'filters': plan.get('filters', [])
+    }
+    if plan['operation'] == 'scan':
+        summary['segments'] = plan.get('segments', DEFAULT_SCAN_SEGMENTS)
+    else:
+        summary['fan_out'] = len(plan['requests'])
+    return summary
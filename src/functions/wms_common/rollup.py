@@ -0,0 +1,122 @@
+"""입고 주문 일별 상태 집계 (원자적 ADD 카운터)
+
+집계 테이블은 metric(HASH) + date_status(RANGE) 구조입니다.
+- metric = 'receiving-orders', date_status = '<YYYY-MM-DD>#<status>' : 일자/상태별 주문 수
+- metric = 'EVENT#<stream event id>', date_status = 'EVENT'       : 처리한 스트림 레코드 표시 (TTL로 자동 삭제)
+
+주문 테이블 스트림의 INSERT / MODIFY / REMOVE 레코드마다 이전 키에서 1을 빼고 새 키에 1을 더합니다.
+스트림은 최소 한 번 전달이므로 scorecard.py와 같이 레코드 표시 Put과 카운터 ADD를
+하나의 트랜잭션으로 묶어 재전달된 레코드가 두 번 집계되지 않게 합니다.
+한 metric 파티션에 날짜순으로 모여 있으므로 기간 조회는 query 한 번(1MB 이내)으로 끝납니다.
+"""
+from datetime import datetime
+
+from wms_common.transactions import TransactionConflictError, put_action, transact_write, update_action
+
+ORDER_ROLLUP_METRIC = 'receiving-orders'
+ROLLUP_EVENT_MARKER_TTL = 7 * 24 * 3600
+MAX_ROLLUP_DAYS = 366
+
+
+def rollup_date(order):
+    """주문 집계 일자 (입고 예정일, 없으면 생성일 기준 YYYY-MM-DD)"""
+    timestamp = order.get('scheduled_date')
+    if timestamp is None:
+        timestamp = order.get('created_at')
+    if timestamp is None:
+        return None
+    return datetime.fromtimestamp(int(timestamp)).strftime('%Y-%m-%d')
+
+
+def rollup_key(order):
+    """'<YYYY-MM-DD>#<status>' 정렬 키 (일자 / 상태를 알 수 없으면 None)"""
+    date = rollup_date(order)
+    status = order.get('status')
+    if not date or not status:
+        return None
+    return f"{date}#{status}"
+
+
+def order_rollup_deltas(old_order, new_order):
+    """스트림 이전 / 새 이미지로 {date_status: 증감} 계산 (변화가 없으면 빈 dict)"""
+    deltas = {}
+    old_key = rollup_key(old_order or {})
+    new_key = rollup_key(new_order or {})
+    if old_key == new_key:
+        return deltas
+    if old_key:
+        deltas[old_key] = deltas.get(old_key, 0) - 1
+    if new_key:
+        deltas[new_key] = deltas.get(new_key, 0) + 1
+    return deltas
+
+
+def record_rollup_event(client, table_name, event_id, deltas, metric=ORDER_ROLLUP_METRIC, timestamp=None):
+    """스트림 레코드 1건의 증감 반영, 이미 처리한 레코드면 False 반환"""
+    deltas = {key: value for key, value in deltas.items() if value}
+    if not deltas:
+        return False
+    if timestamp is None:
+        timestamp = int(datetime.now().timestamp())
+
+    actions = []
+    for date_status, delta in sorted(deltas.items()):
+        date, status = date_status.split('#', 1)
+        actions.append(update_action(
+            table_name,
+            {'metric': metric, 'date_status': date_status},
+            'SET rollup_date = :date, #status = :status, updated_at = :ts ADD order_count :delta',
+            names={'#status': 'status'},
+            values={':date': date, ':status': status, ':ts': timestamp, ':delta': delta}
+        ))
+
+    if event_id:
+        actions.insert(0, put_action(
+            table_name,
+            {'metric': f'EVENT#{event_id}', 'date_status': 'EVENT', 'expires_at': timestamp + ROLLUP_EVENT_MARKER_TTL},
+            condition='attribute_not_exists(date_status)'
+        ))
+
+    try:
+        transact_write(client, actions)
+    except TransactionConflictError:
+        print(f"Rollup event {event_id} already recorded")
+        return False
+    return True
+
+
+def query_rollups(table, from_date, to_date, metric=ORDER_ROLLUP_METRIC):
+    """기간(YYYY-MM-DD, 양끝 포함) 집계 레코드 조회"""
+    params = {
+        'KeyConditionExpression': 'metric = :metric AND date_status BETWEEN :lower AND :upper',
+        # '#' 뒤 상태 이름은 모두 '~'보다 작으므로 to_date 당일 레코드까지 포함
+        'ExpressionAttributeValues': {':metric': metric, ':lower': f'{from_date}#', ':upper': f'{to_date}#~'}
+    }
+    items = []
+    while True:
+        response = table.query(**params)
+        items.extend(response.get('Items', []))
+        last_key = response.get('LastEvaluatedKey')
+        if not last_key:
+            return items
+        params['ExclusiveStartKey'] = last_key
+
+
+def build_rollup_summary(items, statuses=None):
+    """집계 레코드를 일자별 상태 카운트 + 기간 합계 응답으로 변환"""
+    days = {}
+    totals = {}
+    for item in items:
+        status = item.get('status')
+        if statuses and status not in statuses:
+            continue
+        count = int(item.get('order_count', 0))
+        day = days.setdefault(item['rollup_date'], {'date': item['rollup_date'], 'counts': {}, 'total': 0})
+        day['counts'][status] = count
+        day['total'] += count
+        totals[status] = totals.get(status, 0) + count
+    return {
+        'days': [days[date] for date in sorted(days)],
+        'totals': totals,
+        'total': sum(totals.values())
+    }
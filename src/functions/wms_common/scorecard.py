@@ -0,0 +1,105 @@
+"""공급업체 스코어카드 집계 (원자적 ADD 카운터)
+
+스코어카드 테이블은 supplier_id(HASH) + record_key(RANGE) 구조입니다.
+- record_key = 'SCORECARD'        : 누적 카운터 레코드
+- record_key = 'EVENT#<event id>' : 처리한 이벤트 표시 (TTL로 자동 삭제)
+
+EventBridge는 최소 한 번 전달이므로 이벤트 표시 Put과 카운터 ADD를 하나의
+TransactWriteItems(wms_common.transactions)로 묶어 같은 이벤트가 두 번 집계되지 않게 합니다.
+"""
+from datetime import datetime
+
+from wms_common.transactions import TransactionConflictError, put_action, transact_write, update_action
+
+SCORECARD_RECORD_KEY = 'SCORECARD'
+EVENT_MARKER_TTL = 7 * 24 * 3600
+
+# 누적 카운터 이름
+COUNTERS = (
+    'completed_orders',
+    'on_time_orders',
+    'rejected_orders',
+    'dock_to_stock_orders',
+    'dock_to_stock_seconds_total',
+    'documents_verified',
+    'documents_declined',
+    'lines_total',
+    'accurate_lines',
+    'expected_qty_total',
+    'received_qty_total'
+)
+
+
+def record_scorecard_event(client, table_name, supplier_id, event_id, counters, timestamp=None):
+    """이벤트 1건의 카운터 증가분 반영, 이미 처리한 이벤트면 False 반환"""
+    counters = {name: value for name, value in counters.items() if value}
+    if not supplier_id or not counters:
+        return False
+    unknown = set(counters) - set(COUNTERS)
+    if unknown:
+        raise ValueError(f"Unknown scorecard counters: {', '.join(sorted(unknown))}")
+
+    if timestamp is None:
+        timestamp = int(datetime.now().timestamp())
+
+    names = {'#ts': 'updated_at'}
+    values = {':ts': timestamp}
+    additions = []
+    for index, (name, value) in enumerate(sorted(counters.items())):
+        names[f'#c{index}'] = name
+        values[f':c{index}'] = value
+        additions.append(f'#c{index} :c{index}')
+
+    update = update_action(
+        table_name,
+        {'supplier_id': supplier_id, 'record_key': SCORECARD_RECORD_KEY},
+        f"SET #ts = :ts ADD {', '.join(additions)}",
+        names=names,
+        values=values
+    )
+
+    if not event_id:
+        transact_write(client, [update])
+        return True
+
+    marker = put_action(
+        table_name,
+        {'supplier_id': supplier_id, 'record_key': f'EVENT#{event_id}', 'expires_at': timestamp + EVENT_MARKER_TTL},
+        condition='attribute_not_exists(record_key)'
+    )
+
+    try:
+        transact_write(client, [marker, update])
+    except TransactionConflictError as e:
+        if e.reasons[0] != 'ConditionalCheckFailed':
+            raise
+        print(f"Scorecard event {event_id} already recorded for supplier {supplier_id}")
+        return False
+    return True
+
+
+def ratio(numerator, denominator):
+    """0으로 나누기 방지 비율 계산"""
+    if not denominator:
+        return None
+    return round(float(numerator) / float(denominator), 4)
+
+
+def build_scorecard(supplier_id, record):
+    """누적 카운터 레코드로 스코어카드 응답 생성"""
+    record = record or {}
+    counts = {name: int(record.get(name, 0)) for name in COUNTERS}
+
+    average_dock_to_stock = ratio(counts['dock_to_stock_seconds_total'], counts['dock_to_stock_orders'])
+
+    return {
+        'supplier_id': supplier_id,
+        'on_time_rate': ratio(counts['on_time_orders'], counts['completed_orders']),
+        'average_dock_to_stock_seconds': average_dock_to_stock,
+        'document_rejection_rate': ratio(counts['documents_declined'], counts['documents_verified']),
+        'receiving_accuracy': ratio(counts['accurate_lines'], counts['lines_total']),
+        'received_vs_expected_ratio': ratio(counts['received_qty_total'], counts['expected_qty_total']),
+        'rejection_rate': ratio(counts['rejected_orders'], counts['completed_orders'] + counts['rejected_orders']),
+        'counters': counts,
+        'updated_at': record.get('updated_at')
+    }
@@ -0,0 +1,91 @@
+"""응답 본문 JSON 직렬화 (DynamoDB Decimal 처리)
+
+서비스마다 정의하던 DecimalEncoder는 모든 Decimal을 float로 바꿔 정수가 1790000000.0으로,
+17자리를 넘는 수는 반올림된 값으로 나갔습니다. dumps()는 인코더가 객체를 한 번 순회하는 동안
+Decimal을 다음과 같이 바꿉니다.
+- 정수 값은 int, 소수는 float 변환이 값을 보존하는 경우에만 float (16자 이하 표기는 문자열 비교 없이 바로 변환)
+- float로 표현할 수 없는 정밀도는 Decimal 표기 그대로의 JSON 숫자 (값과 타입이 바뀌지 않도록)
+  인코더가 임의 숫자 표기를 내보낼 수 없어, 이런 값이 있는 응답만 자리표시 문자열로 다시 인코딩한 뒤 치환합니다.
+orjson이 설치되어 있으면 C 인코더를 사용하고(dumps를 쓰는 모든 서비스의 requirements.txt에 포함),
+없으면 표준 json(C 가속 인코더 + default 훅)을 사용합니다.
+Decimal을 미리 변환하는 별도 순회는 표준 json에서 오히려 느려 사용하지 않습니다.
+벤치마크: tests/benchmark_serialization.py
+"""
+import json
+import re
+import uuid
+from decimal import Decimal
+
+try:
+    import orjson
+except ImportError:  # 선택 의존성
+    orjson = None
+
+HAS_ORJSON = orjson is not None
+
+
+def decimal_value(value):
+    """Decimal -> int / float / str (float로 표현할 수 없으면 JSON 숫자 표기 문자열)"""
+    text = str(value)
+    if 'E+' in text:
+        # 양의 지수 표기(1E+2)는 항상 정수 값
+        return int(value)
+    if '.' not in text and 'E' not in text:
+        return int(text)
+    number = float(text)
+    # 16자 이하 표기는 유효 숫자가 15자리 이하라 float 변환이 값을 보존 (repr 비교 생략)
+    if len(text) <= 16 or repr(number) == text or Decimal(repr(number)) == value:
+        return int(number) if number.is_integer() and abs(number) < 2 ** 53 else number
+    return text
+
+
+class _ExactNumberRequired(Exception):
+    """float로 표현할 수 없는 Decimal 발견 (숫자 표기 치환 경로로 다시 인코딩)"""
+
+
+def _default(value):
+    # 인코더가 기본 타입이 아닐 때만 호출하므로 나머지는 C 코드로 처리됨
+    if isinstance(value, Decimal):
+        number = decimal_value(value)
+        if isinstance(number, str):
+            raise _ExactNumberRequired(number)
+        return number
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    raise TypeError(f'Object of type {type(value).__name__} is not JSON serializable')
+
+
+def _dumps_exact(value, **kwargs):
+    """정밀한 Decimal을 호출별 자리표시 문자열로 인코딩한 뒤 원래 숫자 표기로 치환"""
+    marker = uuid.uuid4().hex
+    exact_numbers = []
+
+    def default(obj):
+        if isinstance(obj, Decimal):
+            number = decimal_value(obj)
+            if isinstance(number, str):
+                exact_numbers.append(number)
+                return f'{marker}:{len(exact_numbers) - 1}'
+            return number
+        return _default(obj)
+
+    text = json.dumps(value, default=default, **kwargs)
+    # 자리표시 문자열 전체를 한 번에 치환 (값마다 문자열 전체를 다시 훑지 않도록)
+    return re.sub(f'"{marker}:(\\d+)"', lambda match: exact_numbers[int(match.group(1))], text)
+
+
+def dumps(value, **kwargs):
+    """응답 본문용 JSON 문자열 (json.dumps(..., cls=DecimalEncoder) 대체)
+
+    indent / sort_keys 등 옵션을 넘기면 표준 json으로 처리합니다.
+    """
+    if HAS_ORJSON and not kwargs:
+        try:
+            return orjson.dumps(value, default=_default).decode('utf-8')
+        except TypeError:
+            # 문자열이 아닌 dict 키 / 정밀한 Decimal 등 orjson이 처리하지 못하는 입력은 표준 json으로 처리
+            pass
+    try:
+        return json.dumps(value, default=_default, **kwargs)
+    except _ExactNumberRequired:
+        return _dumps_exact(value, **kwargs)
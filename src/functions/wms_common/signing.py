@@ -0,0 +1,64 @@
+"""서명된 불투명 토큰 ("<payload>.<signature>")
+
+payload는 JSON을 base64url로 인코딩한 값이고 signature는 HMAC-SHA256(앞 16바이트)입니다.
+페이지네이션 토큰, 업로드 세션 토큰처럼 클라이언트가 그대로 돌려보내야 하는 상태에 사용합니다.
+"""
+import base64
+import hashlib
+import hmac
+import json
+import os
+
+SIGNATURE_BYTES = 16
+
+
+class InvalidTokenError(ValueError):
+    """서명 / 형식이 올바르지 않은 토큰 (400)"""
+    status_code = 400
+
+
+class SigningKeyError(RuntimeError):
+    """서명 키 환경 변수 미설정 (500) - 기본 키로 대체하지 않고 토큰 발급 / 검증을 거부"""
+    status_code = 500
+
+
+def signing_secret(env_name):
+    """환경 변수에서 서명 키(bytes) 조회 (미설정 시 SigningKeyError)"""
+    value = os.environ.get(env_name)
+    if not value:
+        raise SigningKeyError(f'{env_name} is not configured')
+    return value.encode('utf-8')
+
+
+def _b64encode(raw):
+    return base64.urlsafe_b64encode(raw).decode('ascii').rstrip('=')
+
+
+def _b64decode(text):
+    return base64.urlsafe_b64decode((text + '=' * (-len(text) % 4)).encode('ascii'))
+
+
+def _sign(secret, payload):
+    return hmac.new(secret, payload, hashlib.sha256).digest()[:SIGNATURE_BYTES]
+
+
+def sign_token(data, secret):
+    """dict를 서명된 토큰 문자열로 변환 (secret은 bytes)"""
+    payload = json.dumps(data, separators=(',', ':'), sort_keys=True).encode('utf-8')
+    return f'{_b64encode(payload)}.{_b64encode(_sign(secret, payload))}'
+
+
+def verify_token(token, secret):
+    """토큰 서명 검증 후 dict 반환 (실패 시 InvalidTokenError)"""
+    try:
+        encoded_payload, encoded_signature = token.split('.', 1)
+        payload = _b64decode(encoded_payload)
+        signature = _b64decode(encoded_signature)
+    except Exception:
+        raise InvalidTokenError('Invalid token')
+    if not hmac.compare_digest(signature, _sign(secret, payload)):
+        raise InvalidTokenError('Invalid token')
+    data = json.loads(payload)
+    if not isinstance(data, dict):
+        raise InvalidTokenError('Invalid token')
+    return data
@@ -0,0 +1,91 @@
+"""TransactWriteItems 공통 처리
+
+여러 테이블의 Put / Update / ConditionCheck를 하나의 트랜잭션(한 번의 왕복)으로 커밋합니다.
+저수준 클라이언트(dynamodb.meta.client)를 받아 직접 직렬화합니다.
+"""
+from botocore.exceptions import ClientError
+
+from wms_common.batch import deserialize_item, serialize_item
+
+MAX_TRANSACT_ITEMS = 100    # TransactWriteItems 요청당 최대 작업 수
+
+
+class TransactionConflictError(Exception):
+    """조건 검사 실패로 트랜잭션 취소 (409)"""
+    status_code = 409
+
+    def __init__(self, reasons, items=None):
+        super().__init__(f"Transaction cancelled: {', '.join(reason or 'None' for reason in reasons)}")
+        self.reasons = reasons
+        # 작업별 기존 항목 (ReturnValuesOnConditionCheckFailure='ALL_OLD'로 요청한 작업만, 없으면 None)
+        self.items = items or [None] * len(reasons)
+
+
+def _with_expression(action, condition, names, values):
+    if condition:
+        action['ConditionExpression'] = condition
+    if names:
+        action['ExpressionAttributeNames'] = names
+    if values:
+        action['ExpressionAttributeValues'] = serialize_item(values)
+    return action
+
+
+def put_action(table_name, item, condition=None, names=None, values=None):
+    """Put 작업 (condition 예: 'attribute_not_exists(order_id)')"""
+    action = {'TableName': table_name, 'Item': serialize_item(item)}
+    return {'Put': _with_expression(action, condition, names, values)}
+
+
+def update_action(table_name, key, update_expression, condition=None, names=None, values=None, return_old_on_failure=False):
+    """Update 작업 (return_old_on_failure: 조건 실패 시 현재 항목을 TransactionConflictError.items로 반환)"""
+    action = {'TableName': table_name, 'Key': serialize_item(key), 'UpdateExpression': update_expression}
+    if return_old_on_failure:
+        action['ReturnValuesOnConditionCheckFailure'] = 'ALL_OLD'
+    return {'Update': _with_expression(action, condition, names, values)}
+
+
+def condition_check_action(table_name, key, condition, names=None, values=None, return_old_on_failure=False):
+    """ConditionCheck 작업 (다른 항목의 상태를 쓰기 조건으로 사용)"""
+    action = {'TableName': table_name, 'Key': serialize_item(key)}
+    if return_old_on_failure:
+        action['ReturnValuesOnConditionCheckFailure'] = 'ALL_OLD'
+    return {'ConditionCheck': _with_expression(action, condition, names, values)}
+
+
+def cancellation_reasons(error):
+    """TransactionCanceledException의 작업별 취소 사유 코드 목록"""
+    return [reason.get('Code') for reason in error.response.get('CancellationReasons', [])]
+
+
+def cancellation_items(error):
+    """작업별 조건 실패 당시 항목 목록 (반환되지 않은 작업은 None)"""
+    return [
+        deserialize_item(reason['Item']) if reason.get('Item') else None
+        for reason in error.response.get('CancellationReasons', [])
+    ]
+
+
+def transact_write(client, actions, client_token=None):
+    """작업 목록을 하나의 트랜잭션으로 커밋
+
+    조건 검사 실패로 취소되면 TransactionConflictError(작업별 사유 포함)를 발생시키고,
+    그 외 오류는 그대로 전달합니다. client_token은 10분 동안 같은 요청의 중복 커밋을 막습니다.
+    """
+    if not actions:
+        return
+    if len(actions) > MAX_TRANSACT_ITEMS:
+        raise ValueError(f'A transaction can contain at most {MAX_TRANSACT_ITEMS} actions')
+
+    params = {'TransactItems': actions}
+    if client_token:
+        params['ClientRequestToken'] = client_token
+    try:
+        client.transact_write_items(**params)
+    except ClientError as e:
+        if e.response.get('Error', {}).get('Code') != 'TransactionCanceledException':
+            raise
+        reasons = cancellation_reasons(e)
+        if 'ConditionalCheckFailed' in reasons:
+            raise TransactionConflictError(reasons, cancellation_items(e))
+        raise
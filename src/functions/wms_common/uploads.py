@@ -0,0 +1,174 @@
+"""S3 직접 업로드 세션 (presigned PUT / 멀티파트)
+
+파일 내용이 Lambda를 거치지 않도록 클라이언트가 presigned URL로 S3에 직접 올리고,
+완료 후 세션 토큰으로 마무리(finalize)합니다. 세션 상태는 서버에 저장하지 않고
+UPLOAD_SESSION_SECRET으로 서명한 토큰(wms_common.signing)에 담습니다.
+서명 키가 설정되지 않으면 세션 발급 / 검증 모두 SigningKeyError로 거부합니다.
+
+- size_bytes < MULTIPART_THRESHOLD : presigned PUT URL 하나
+- 그 이상                          : CreateMultipartUpload + 파트별 presigned UploadPart URL
+  (클라이언트는 각 파트 응답의 ETag를 모아 finalize에 전달)
+"""
+import math
+import re
+import time
+import uuid
+
+from botocore.exceptions import ClientError
+
+from wms_common.signing import InvalidTokenError, sign_token, signing_secret, verify_token
+
+UPLOAD_SESSION_SECRET_ENV = 'UPLOAD_SESSION_SECRET'
+
+UPLOAD_URL_EXPIRES = 3600                   # presigned URL / 세션 유효 시간(초)
+MULTIPART_THRESHOLD = 16 * 1024 * 1024      # 이 크기 이상은 멀티파트 (불안정한 Wi-Fi에서 파트 단위 재시도)
+MULTIPART_PART_SIZE = 8 * 1024 * 1024       # S3 최소 파트 크기 5MB 이상
+MAX_UPLOAD_BYTES = 1024 * 1024 * 1024
+MAX_PARTS = 10000
+FILE_EXTENSION_PATTERN = re.compile(r'[A-Za-z0-9]{1,10}')   # S3 키에 쓰는 확장자
+
+VALID_DOCUMENT_TYPES = ['INVOICE', 'BILL_OF_ENTRY', 'AIRWAY_BILL']
+
+
+class UploadSessionError(ValueError):
+    """잘못된 / 만료된 업로드 세션 또는 업로드되지 않은 객체 (400)"""
+    status_code = 400
+
+
+def build_s3_key(order_id, document_type, document_id, file_name):
+    """문서 S3 키 (주문 생성 전 세션은 pending/ 아래에 저장)
+
+    확장자는 영문자 / 숫자 1~10자만 사용하고 그 외(경로 문자 등)는 버립니다.
+    """
+    file_extension = file_name.split('.')[-1] if '.' in file_name else ''
+    if not FILE_EXTENSION_PATTERN.fullmatch(file_extension):
+        file_extension = ''
+    return f"{order_id or 'pending'}/{document_type.lower()}/{document_id}.{file_extension}"
+
+
+def create_upload_session(s3, bucket, order_id, document_type, file_name, content_type, size_bytes, user_id):
+    """업로드 세션 생성 후 {document_id, session_token, expires_at, upload} 반환"""
+    if document_type not in VALID_DOCUMENT_TYPES:
+        raise UploadSessionError(f'Invalid document type. Must be one of: {", ".join(VALID_DOCUMENT_TYPES)}')
+    if not isinstance(size_bytes, int) or size_bytes < 1 or size_bytes > MAX_UPLOAD_BYTES:
+        raise UploadSessionError(f'size_bytes must be between 1 and {MAX_UPLOAD_BYTES}')
+
+    document_id = str(uuid.uuid4())
+    s3_key = build_s3_key(order_id, document_type, document_id, file_name)
+    expires_at = int(time.time()) + UPLOAD_URL_EXPIRES
+
+    session = {
+        'document_id': document_id,
+        'order_id': order_id,
+        'document_type': document_type,
+        'file_name': file_name,
+        'content_type': content_type,
+        'size_bytes': size_bytes,
+        's3_key': s3_key,
+        'uploader': user_id,
+        'expires_at': expires_at
+    }
+
+    if size_bytes < MULTIPART_THRESHOLD:
+        upload = {
+            'method': 'PUT',
+            'url': s3.generate_presigned_url(
+                'put_object',
+                Params={'Bucket': bucket, 'Key': s3_key, 'ContentType': content_type},
+                ExpiresIn=UPLOAD_URL_EXPIRES
+            ),
+            'headers': {'Content-Type': content_type}
+        }
+    else:
+        part_size = max(MULTIPART_PART_SIZE, math.ceil(size_bytes / MAX_PARTS))
+        part_count = math.ceil(size_bytes / part_size)
+        upload_id = s3.create_multipart_upload(Bucket=bucket, Key=s3_key, ContentType=content_type)['UploadId']
+        session['upload_id'] = upload_id
+        upload = {
+            'method': 'MULTIPART',
+            'part_size': part_size,
+            'parts': [
+                {
+                    'part_number': part_number,
+                    'url': s3.generate_presigned_url(
+                        'upload_part',
+                        Params={'Bucket': bucket, 'Key': s3_key, 'UploadId': upload_id, 'PartNumber': part_number},
+                        ExpiresIn=UPLOAD_URL_EXPIRES
+                    )
+                }
+                for part_number in range(1, part_count + 1)
+            ]
+        }
+
+    return {
+        'document_id': document_id,
+        'session_token': sign_token(session, signing_secret(UPLOAD_SESSION_SECRET_ENV)),
+        'expires_at': expires_at,
+        'upload': upload
+    }
+
+
+def read_upload_session(token):
+    """세션 토큰 검증 후 세션 dict 반환 (만료 / 위조 시 UploadSessionError)"""
+    secret = signing_secret(UPLOAD_SESSION_SECRET_ENV)
+    try:
+        session = verify_token(token or '', secret)
+    except InvalidTokenError:
+        raise UploadSessionError('Invalid upload session')
+    # 세션 키는 항상 세션 정보로 다시 계산한 값이어야 함 (다른 주문 / 임의 객체 지정 방지)
+    try:
+        expected_key = build_s3_key(session.get('order_id'), session['document_type'], session['document_id'], session['file_name'])
+    except (KeyError, AttributeError):
+        raise UploadSessionError('Invalid upload session')
+    if session.get('s3_key') != expected_key:
+        raise UploadSessionError('Invalid upload session')
+    # 업로드 완료 후 finalize까지 여유를 두어 만료 판단
+    if session.get('expires_at', 0) + UPLOAD_URL_EXPIRES < int(time.time()):
+        raise UploadSessionError('Upload session expired')
+    return session
+
+
+def complete_upload(s3, bucket, session, parts=None):
+    """멀티파트 완료 처리 후 업로드된 객체 확인, 실제 크기 반환"""
+    if session.get('upload_id'):
+        if not parts:
+            raise UploadSessionError('parts are required to complete a multipart upload')
+        try:
+            s3.complete_multipart_upload(
+                Bucket=bucket,
+                Key=session['s3_key'],
+                UploadId=session['upload_id'],
+                MultipartUpload={'Parts': [
+                    {'PartNumber': int(part['part_number']), 'ETag': part['etag']}
+                    for part in sorted(parts, key=lambda part: int(part['part_number']))
+                ]}
+            )
+        except ClientError as e:
+            # 이미 완료된 업로드(finalize 재시도)는 객체 확인으로 넘어감
+            if e.response.get('Error', {}).get('Code') != 'NoSuchUpload':
+                raise UploadSessionError(f"Could not complete multipart upload: {e.response.get('Error', {}).get('Message', str(e))}")
+
+    try:
+        head = s3.head_object(Bucket=bucket, Key=session['s3_key'])
+    except ClientError as e:
+        if e.response.get('Error', {}).get('Code') in ('404', 'NoSuchKey', 'NotFound'):
+            raise UploadSessionError('The document has not been uploaded yet')
+        raise
+    return head.get('ContentLength', 0)
+
+
+def build_document_metadata(session, order_id, size_bytes, timestamp):
+    """세션 정보로 document_metadata 레코드 생성"""
+    return {
+        'document_id': session['document_id'],
+        'order_id': order_id,
+        'document_type': session['document_type'],
+        's3_key': session['s3_key'],
+        'file_name': session['file_name'],
+        'content_type': session['content_type'],
+        'size_bytes': size_bytes,
+        'upload_date': timestamp,
+        'uploader': session.get('uploader', 'system'),
+        'verification_status': 'PENDING',
+        'verification_notes': ''
+    }
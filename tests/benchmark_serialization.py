@@ -0,0 +1,96 @@
+"""응답 직렬화 벤치마크 (10,000건 주문 목록 1회 응답 비용)
+
+기존 서비스별 DecimalEncoder와 wms_common.serialization.dumps(표준 json / orjson)를 비교합니다.
+AWS 없이 로컬에서 실행합니다.
+
+    python tests/benchmark_serialization.py [--items 10000] [--repeat 7]
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+from decimal import Decimal
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src', 'functions'))
+
+from wms_common import serialization  # noqa: E402
+
+
+class DecimalEncoder(json.JSONEncoder):
+    """서비스에서 사용하던 기존 인코더"""
+    def default(self, obj):
+        if isinstance(obj, Decimal):
+            return float(obj)
+        return super(DecimalEncoder, self).default(obj)
+
+
+def build_orders(count):
+    """DynamoDB에서 읽은 형태(숫자는 모두 Decimal)의 주문 목록"""
+    base = 1790000000
+    return [
+        {
+            'order_id': f'00000000-0000-4000-8000-{index:012d}',
+            'po_number': f'PO-{base + index}',
+            'supplier_id': f'SUP-{index % 250:04d}',
+            'supplier_name': f'공급업체 {index % 250}',
+            'sku_name': f'SKU 상품 {index % 1000}',
+            'sku_number': f'SKU-{index % 1000:05d}',
+            'barcode': f'880{index:010d}',
+            'status': ('SCHEDULED', 'IN_PROGRESS', 'COMPLETED', 'REJECTED')[index % 4],
+            'scheduled_date': Decimal(base + index * 60),
+            'created_at': Decimal(base + index),
+            'updated_at': Decimal(base + index),
+            'verification_status': 'PENDING',
+            'dimensions': {
+                'length': Decimal('12.5'),
+                'width': Decimal('30'),
+                'height': Decimal('7.25'),
+                'weight': Decimal(str(round(0.1 * (index % 97), 1)))
+            }
+        }
+        for index in range(count)
+    ]
+
+
+def measure(label, encode, body, repeat):
+    timings = []
+    size = 0
+    for _ in range(repeat):
+        started = time.perf_counter()
+        size = len(encode(body))
+        timings.append((time.perf_counter() - started) * 1000)
+    print(f"{label:<34} median {statistics.median(timings):8.1f} ms   min {min(timings):8.1f} ms   {size / 1024:8.0f} KiB")
+    return statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--items', type=int, default=10000)
+    parser.add_argument('--repeat', type=int, default=7)
+    args = parser.parse_args()
+
+    body = {'orders': build_orders(args.items), 'count': args.items, 'next_token': None}
+    print(f"{args.items} orders, {args.repeat} runs (orjson {'available' if serialization.HAS_ORJSON else 'not installed'})")
+
+    baseline = measure('json.dumps(cls=DecimalEncoder)', lambda value: json.dumps(value, cls=DecimalEncoder), body, args.repeat)
+    # orjson 유무와 관계없이 표준 json 경로도 측정
+    has_orjson = serialization.HAS_ORJSON
+    serialization.HAS_ORJSON = False
+    results = {'dumps (json)': measure('dumps (json)', serialization.dumps, body, args.repeat)}
+    serialization.HAS_ORJSON = has_orjson
+    if has_orjson:
+        results['dumps (orjson)'] = measure('dumps (orjson)', serialization.dumps, body, args.repeat)
+
+    for label, median in results.items():
+        print(f"{label}: {baseline / median:.1f}x faster than DecimalEncoder")
+
+    # 정밀도 확인 - 기존 인코더는 정수를 float(1790000000.0)로, 긴 소수는 반올림해서 출력
+    sample = {'created_at': Decimal('1790000000'), 'qty': Decimal('12345678901234567890'), 'rate': Decimal('0.1')}
+    print('DecimalEncoder :', json.dumps(sample, cls=DecimalEncoder))
+    print('dumps          :', serialization.dumps(sample))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,177 @@
+"""핸들러별 콜드 스타트 예산 검사 (모듈 import 시간 / 첫 호출 지연)
+
+핸들러마다 새 Python 프로세스에서 모듈을 import 하고 첫 요청을 처리하는 시간을 측정합니다.
+boto3 / botocore는 호출 기록만 남기는 스텁으로 대체하므로 AWS 자격 증명 없이 실행되며,
+측정값은 서비스 코드(+ wms_common) 자체의 비용입니다. 실제 boto3 import 비용은 포함되지 않습니다.
+- import 중 AWS 클라이언트를 만들면 실패 (wms_common.clients 지연 생성 확인)
+- 중앙값이 예산을 넘으면 종료 코드 1
+
+    python tests/cold_start_budget.py [--runs 5] [--import-budget-ms 150] [--invoke-budget-ms 50]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+FUNCTIONS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src', 'functions')
+
+HANDLERS = [
+    ('document-service', 'DocumentService'),
+    ('eventbridge-integration', 'EventBridgeIntegrationService'),
+    ('receiving-item-service', 'ReceivingItemService'),
+    ('receiving-order-service', 'ReceivingOrderService'),
+    ('supplier-service', 'SupplierService'),
+    ('verification-service', 'VerificationService')
+]
+
+# 등록되지 않은 경로 - 라우팅과 응답 생성까지만 실행하고 AWS 호출은 하지 않음
+PROBE_API_EVENT = {'httpMethod': 'GET', 'path': '/__cold-start-probe', 'headers': {}, 'queryStringParameters': None, 'pathParameters': None, 'body': None}
+PROBE_DIRECT_EVENT = {'action': '__cold-start-probe'}
+
+STUBS = {
+    'boto3/__init__.py': '''
+from boto3 import session
+
+CREATED = []
+
+
+def client(service_name, *args, **kwargs):
+    return session.Session().client(service_name, *args, **kwargs)
+
+
+def resource(service_name, *args, **kwargs):
+    return session.Session().resource(service_name, *args, **kwargs)
+''',
+    'boto3/session.py': '''
+class _Stub:
+    def __init__(self, name):
+        self._name = name
+
+    def __getattr__(self, name):
+        return _Stub(f'{self._name}.{name}')
+
+    def __call__(self, *args, **kwargs):
+        return _Stub(f'{self._name}()')
+
+
+class Session:
+    def client(self, service_name, *args, **kwargs):
+        import boto3
+        boto3.CREATED.append(service_name)
+        return _Stub(service_name)
+
+    resource = client
+''',
+    'boto3/dynamodb/__init__.py': '',
+    'boto3/dynamodb/conditions.py': '''
+class _Condition:
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: _Condition()
+
+
+Attr = Key = And = Or = Not = _Condition
+''',
+    'boto3/dynamodb/types.py': '''
+class TypeSerializer:
+    def serialize(self, value):
+        return {'S': str(value)}
+
+
+class TypeDeserializer:
+    def deserialize(self, value):
+        return next(iter(value.values()))
+''',
+    'botocore/__init__.py': '',
+    'botocore/config.py': '''
+class Config:
+    def __init__(self, **kwargs):
+        self.options = kwargs
+''',
+    'botocore/exceptions.py': '''
+class BotoCoreError(Exception):
+    pass
+
+
+class ClientError(Exception):
+    def __init__(self, error_response=None, operation_name=None):
+        super().__init__(operation_name)
+        self.response = error_response or {}
+'''
+}
+
+PROBE = '''
+import importlib, json, sys, time
+stub_dir, service_dir, module_name, event = sys.argv[1], sys.argv[2], sys.argv[3], json.loads(sys.argv[4])
+sys.path[:0] = [stub_dir, service_dir]
+import boto3
+started = time.perf_counter()
+module = importlib.import_module(module_name)
+import_ms = (time.perf_counter() - started) * 1000
+clients_at_import = list(boto3.CREATED)
+started = time.perf_counter()
+response = module.lambda_handler(event, None)
+invoke_ms = (time.perf_counter() - started) * 1000
+print(json.dumps({'import_ms': import_ms, 'invoke_ms': invoke_ms, 'clients_at_import': clients_at_import,
+                  'status': response.get('statusCode') if isinstance(response, dict) else None}))
+'''
+
+
+def write_stubs(directory):
+    for path, source in STUBS.items():
+        target = os.path.join(directory, path)
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        with open(target, 'w', encoding='utf-8') as f:
+            f.write(source.lstrip())
+
+
+def probe(stub_dir, service, module_name):
+    event = PROBE_DIRECT_EVENT if service == 'eventbridge-integration' else PROBE_API_EVENT
+    env = dict(os.environ, PYTHONPATH=FUNCTIONS_DIR, PYTHONDONTWRITEBYTECODE='1', AWS_DEFAULT_REGION='us-east-2')
+    result = subprocess.run(
+        [sys.executable, '-c', PROBE, stub_dir, os.path.join(FUNCTIONS_DIR, service), module_name, json.dumps(event)],
+        capture_output=True, text=True, env=env, cwd=FUNCTIONS_DIR
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f'{module_name} probe failed:\n{result.stderr}')
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--import-budget-ms', type=float, default=150)
+    parser.add_argument('--invoke-budget-ms', type=float, default=50)
+    args = parser.parse_args()
+
+    failures = []
+    with tempfile.TemporaryDirectory() as stub_dir:
+        write_stubs(stub_dir)
+        print(f"{'handler':<32} {'import ms':>10} {'1st invoke ms':>14}  status")
+        for service, module_name in HANDLERS:
+            runs = [probe(stub_dir, service, module_name) for _ in range(args.runs)]
+            import_ms = statistics.median(run['import_ms'] for run in runs)
+            invoke_ms = statistics.median(run['invoke_ms'] for run in runs)
+            print(f"{module_name:<32} {import_ms:10.1f} {invoke_ms:14.1f}  {runs[0]['status']}")
+
+            if runs[0]['clients_at_import']:
+                failures.append(f"{module_name}: AWS clients created at import: {', '.join(runs[0]['clients_at_import'])}")
+            if import_ms > args.import_budget_ms:
+                failures.append(f"{module_name}: import {import_ms:.1f} ms > budget {args.import_budget_ms:.0f} ms")
+            if invoke_ms > args.invoke_budget_ms:
+                failures.append(f"{module_name}: first invocation {invoke_ms:.1f} ms > budget {args.invoke_budget_ms:.0f} ms")
+
+    for failure in failures:
+        print(f"FAIL {failure}")
+    if failures:
+        sys.exit(1)
+    print('All handlers within cold-start budget')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,163 @@
+"""단위 테스트 공통 설정
+
+tests/ 의 다른 스크립트(document.py 등)는 배포된 API를 호출하는 수동 점검용이며,
+test_*.py 는 AWS 없이 tests/fake_aws.py 대역으로 서비스 핸들러를 실행합니다.
+
+    python -m pytest -q tests
+"""
+import importlib
+import os
+import sys
+
+import pytest
+
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+FUNCTIONS_DIR = os.path.join(TESTS_DIR, '..', 'src', 'functions')
+
+SERVICE_DIRS = {
+    'DocumentService': 'document-service',
+    'EventBridgeIntegrationService': 'eventbridge-integration',
+    'ReceivingItemService': 'receiving-item-service',
+    'ReceivingOrderService': 'receiving-order-service',
+    'SupplierService': 'supplier-service',
+    'VerificationService': 'verification-service'
+}
+
+# 서비스 모듈이 import 시점에 읽는 환경 변수
+TEST_ENVIRONMENT = {
+    'UPLOAD_SESSION_SECRET': 'test-upload-session-secret',
+    'PAGINATION_TOKEN_SECRET': 'test-pagination-secret',
+    'DOCUMENT_METADATA_TABLE': 'document-metadata',
+    'DOCUMENT_BUCKET': 'documents',
+    'IDEMPOTENCY_TABLE': 'idempotency-keys',
+    'RECEIVING_ORDER_TABLE': 'receiving-orders',
+    'RECEIVING_ITEM_TABLE': 'receiving-items',
+    'RECEIVING_HISTORY_TABLE': 'receiving-history',
+    'SUPPLIER_TABLE': 'suppliers',
+    'SUPPLIER_SEARCH_TABLE': 'supplier-search',
+    'SUPPLIER_SCORECARD_TABLE': 'supplier-scorecards',
+    'RECEIVING_ROLLUP_TABLE': 'receiving-rollups',
+    'VERIFICATION_RESULT_TABLE': 'verification-results',
+    'LOG_EVENT_SAMPLE_RATE': '0'
+}
+for name, value in TEST_ENVIRONMENT.items():
+    os.environ.setdefault(name, value)
+
+sys.path.insert(0, TESTS_DIR)
+sys.path.insert(0, FUNCTIONS_DIR)
+
+from fake_aws import FakeDynamoDB, FakeEvents, FakeLambda, FakeS3, install_boto_stubs  # noqa: E402
+
+install_boto_stubs()
+
+
+def load_service(module_name):
+    """서비스 모듈 import (서비스 디렉터리를 경로에 추가)"""
+    service_dir = os.path.join(FUNCTIONS_DIR, SERVICE_DIRS[module_name])
+    if service_dir not in sys.path:
+        sys.path.insert(0, service_dir)
+    return importlib.import_module(module_name)
+
+
+def create_tables(database, names):
+    """스토리지 스택(wms-storage-stack.yaml)과 같은 키 / GSI 구성으로 테이블 생성"""
+    schemas = {
+        'document_metadata': ('document_id', None, {'order_id-index': ('order_id', 'document_type'),
+                                                    'type-date-index': ('document_type', 'upload_date')}),
+        'orders': ('order_id', None, {'supplier-index': ('supplier_id', 'created_at'),
+                                      'status-date-index': ('status', 'scheduled_date'),
+                                      'date-status-index': ('scheduled_date', 'status')}),
+        'items': ('item_id', None, {'order_id-index': ('order_id', 'created_at')}),
+        'history': ('history_id', None, {'order-time-index': ('order_id', 'timestamp'),
+                                         'supplier-event-index': ('supplier_id', 'event_time')}),
+        'suppliers': ('supplier_id', None, {'status-name-index': ('status', 'supplier_name')}),
+        'supplier_search': ('token', 'sort_key', {}),
+        'scorecards': ('supplier_id', 'record_key', {}),
+        'rollups': ('metric', 'date_status', {}),
+        'idempotency': ('idempotency_key', None, {}),
+        'verification_results': ('verification_id', None, {'order_id-index': ('order_id', 'verification_date')})
+    }
+    for kind, table_name in names.items():
+        if table_name:
+            hash_key, range_key, indexes = schemas[kind]
+            database.create_table(table_name, hash_key, range_key, indexes)
+    return database
+
+
+@pytest.fixture
+def aws():
+    """서비스 하나에 끼워 넣을 AWS 대역 묶음"""
+    class Fakes:
+        dynamodb = FakeDynamoDB()
+        s3 = FakeS3()
+        events = FakeEvents()
+        lambda_client = FakeLambda()
+    return Fakes
+
+
+def install_fakes(monkeypatch, module, fakes):
+    for name in ('dynamodb', 's3', 'events', 'lambda_client'):
+        if hasattr(module, name):
+            monkeypatch.setattr(module, name, getattr(fakes, name))
+    return module
+
+
+@pytest.fixture
+def order_service(monkeypatch, aws):
+    module = load_service('ReceivingOrderService')
+    create_tables(aws.dynamodb, {
+        'orders': module.RECEIVING_ORDER_TABLE,
+        'items': module.RECEIVING_ITEM_TABLE,
+        'history': module.RECEIVING_HISTORY_TABLE,
+        'document_metadata': module.DOCUMENT_METADATA_TABLE,
+        'idempotency': module.IDEMPOTENCY_TABLE,
+        'rollups': module.RECEIVING_ROLLUP_TABLE,
+        'verification_results': module.VERIFICATION_RESULT_TABLE
+    })
+    return install_fakes(monkeypatch, module, aws)
+
+
+@pytest.fixture
+def document_service(monkeypatch, aws):
+    module = load_service('DocumentService')
+    create_tables(aws.dynamodb, {
+        'document_metadata': module.DOCUMENT_METADATA_TABLE,
+        'idempotency': module.IDEMPOTENCY_TABLE
+    })
+    return install_fakes(monkeypatch, module, aws)
+
+
+@pytest.fixture
+def supplier_service(monkeypatch, aws):
+    module = load_service('SupplierService')
+    create_tables(aws.dynamodb, {
+        'suppliers': module.SUPPLIER_TABLE,
+        'history': module.RECEIVING_HISTORY_TABLE,
+        'supplier_search': module.SUPPLIER_SEARCH_TABLE,
+        'scorecards': module.SUPPLIER_SCORECARD_TABLE
+    })
+    return install_fakes(monkeypatch, module, aws)
+
+
+@pytest.fixture
+def eventbridge_service(monkeypatch, aws):
+    module = load_service('EventBridgeIntegrationService')
+    create_tables(aws.dynamodb, {
+        'orders': module.RECEIVING_ORDER_TABLE,
+        'items': module.RECEIVING_ITEM_TABLE,
+        'history': module.RECEIVING_HISTORY_TABLE,
+        'scorecards': module.SUPPLIER_SCORECARD_TABLE,
+        'rollups': module.RECEIVING_ROLLUP_TABLE
+    })
+    return install_fakes(monkeypatch, module, aws)
+
+
+
+@pytest.fixture
+def item_service(monkeypatch, aws):
+    module = load_service('ReceivingItemService')
+    create_tables(aws.dynamodb, {
+        'items': module.RECEIVING_ITEM_TABLE,
+        'orders': module.RECEIVING_ORDER_TABLE
+    })
+    return install_fakes(monkeypatch, module, aws)
@@ -0,0 +1,917 @@
+"""단위 테스트용 인메모리 AWS 대역 (DynamoDB / S3 / Lambda / EventBridge)
+
+서비스 모듈은 wms_common.clients의 지연 클라이언트를 모듈 변수(dynamodb, s3, events, lambda_client)로
+가지고 있으므로 테스트에서 이 대역으로 바꿔 끼웁니다. boto3가 설치되지 않은 환경에서는
+install_boto_stubs()가 import에 필요한 최소 모듈(boto3.dynamodb.types, botocore.exceptions 등)을 등록합니다.
+
+DynamoDB 대역은 서비스가 사용하는 표현식 문법(조건 / 키 조건 / 필터 / 업데이트 / 프로젝션)을 해석해
+조건부 쓰기, 트랜잭션 취소 사유, GSI 조회를 실제와 같은 형태로 돌려줍니다.
+"""
+import copy
+import io
+import re
+import sys
+import threading
+import types
+from decimal import Decimal
+
+
+# ------ boto3 / botocore import 대역 ------
+
+class StubClientError(Exception):
+    """botocore.exceptions.ClientError 대역 (response / operation_name 동일)"""
+
+    def __init__(self, error_response, operation_name):
+        error = error_response.get('Error', {})
+        super().__init__(f"An error occurred ({error.get('Code')}) when calling the {operation_name} operation: {error.get('Message', '')}")
+        self.response = error_response
+        self.operation_name = operation_name
+
+
+class StubTypeSerializer:
+    def serialize(self, value):
+        if value is None:
+            return {'NULL': True}
+        if isinstance(value, bool):
+            return {'BOOL': value}
+        if isinstance(value, str):
+            return {'S': value}
+        if isinstance(value, float):
+            raise TypeError('Float types are not supported. Use Decimal types instead.')
+        if isinstance(value, (int, Decimal)):
+            return {'N': str(value)}
+        if isinstance(value, (bytes, bytearray)):
+            return {'B': bytes(value)}
+        if isinstance(value, (set, frozenset)):
+            if all(isinstance(item, str) for item in value):
+                return {'SS': sorted(value)}
+            return {'NS': sorted(str(item) for item in value)}
+        if isinstance(value, (list, tuple)):
+            return {'L': [self.serialize(item) for item in value]}
+        if isinstance(value, dict):
+            return {'M': {key: self.serialize(item) for key, item in value.items()}}
+        raise TypeError(f'Unsupported type "{type(value)}" for value "{value}"')
+
+
+class StubTypeDeserializer:
+    def deserialize(self, value):
+        (kind, data), = value.items()
+        if kind == 'NULL':
+            return None
+        if kind in ('S', 'BOOL', 'B'):
+            return data
+        if kind == 'N':
+            return Decimal(data)
+        if kind == 'SS':
+            return set(data)
+        if kind == 'NS':
+            return set(Decimal(item) for item in data)
+        if kind == 'L':
+            return [self.deserialize(item) for item in data]
+        if kind == 'M':
+            return {key: self.deserialize(item) for key, item in data.items()}
+        raise TypeError(f'Unsupported AttributeValue {kind}')
+
+
+def install_boto_stubs():
+    """boto3가 없으면 서비스 모듈 import에 필요한 최소 모듈 등록"""
+    try:
+        import boto3  # noqa: F401
+        import botocore  # noqa: F401
+        return False
+    except ImportError:
+        pass
+
+    def module(name, **attributes):
+        created = types.ModuleType(name)
+        created.__dict__.update(attributes)
+        sys.modules[name] = created
+        return created
+
+    class Config:
+        def __init__(self, **options):
+            self.options = options
+
+    class _Condition:
+        def __init__(self, *args, **kwargs):
+            pass
+
+    def _no_client(*args, **kwargs):
+        raise RuntimeError('Tests must replace AWS clients with tests/fake_aws.py fakes')
+
+    class Session:
+        client = resource = staticmethod(_no_client)
+
+    botocore = module('botocore')
+    botocore.exceptions = module('botocore.exceptions', ClientError=StubClientError, BotoCoreError=Exception)
+    botocore.config = module('botocore.config', Config=Config)
+    boto3 = module('boto3', client=_no_client, resource=_no_client)
+    boto3.session = module('boto3.session', Session=Session)
+    boto3.dynamodb = module('boto3.dynamodb')
+    boto3.dynamodb.types = module('boto3.dynamodb.types', TypeSerializer=StubTypeSerializer, TypeDeserializer=StubTypeDeserializer)
+    boto3.dynamodb.conditions = module('boto3.dynamodb.conditions', Attr=_Condition, Key=_Condition, And=_Condition)
+    return True
+
+
+_error_classes = {}
+
+
+def error_class(code):
+    """오류 코드별 ClientError 하위 클래스 (client.exceptions.<Code> 대응)"""
+    if code not in _error_classes:
+        from botocore.exceptions import ClientError
+        _error_classes[code] = type(code, (ClientError,), {})
+    return _error_classes[code]
+
+
+def client_error(code, message='', operation='Operation', **extra):
+    """서비스 코드가 잡는 botocore ClientError 생성"""
+    response = {'Error': {'Code': code, 'Message': message}}
+    response.update(extra)
+    return error_class(code)(response, operation)
+
+
+# ------ 표현식 해석 ------
+
+_TOKEN = re.compile(r'\s*(?:(<>|<=|>=|=|<|>|\(|\)|,|\+|-|\[\d+\]|\.)|(#[A-Za-z0-9_]+)|(:[A-Za-z0-9_]+)|([A-Za-z_][A-Za-z0-9_]*))')
+_MISSING = object()
+
+
+def _tokenize(expression):
+    tokens = []
+    position = 0
+    expression = expression.strip()
+    while position < len(expression):
+        match = _TOKEN.match(expression, position)
+        if not match or match.end() == position:
+            raise ValueError(f'Cannot parse expression near: {expression[position:]!r}')
+        tokens.append(match.group(0).strip())
+        position = match.end()
+    return tokens
+
+
+def _normalize(value):
+    """쓰기 값 정규화 (숫자는 Decimal, 컨테이너는 복사)"""
+    if isinstance(value, bool) or value is None or isinstance(value, str):
+        return value
+    if isinstance(value, (int, float)):
+        return Decimal(str(value))
+    if isinstance(value, dict):
+        return {key: _normalize(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_normalize(item) for item in value]
+    if isinstance(value, (set, frozenset)):
+        return set(_normalize(item) for item in value)
+    return value
+
+
+class _Parser:
+    def __init__(self, expression, names, values):
+        self.tokens = _tokenize(expression)
+        self.position = 0
+        self.names = names or {}
+        self.values = values or {}
+
+    def peek(self, offset=0):
+        index = self.position + offset
+        return self.tokens[index] if index < len(self.tokens) else None
+
+    def take(self, expected=None):
+        token = self.peek()
+        if expected is not None and (token or '').upper() != expected.upper():
+            raise ValueError(f'Expected {expected}, got {token}')
+        self.position += 1
+        return token
+
+    def at_keyword(self, *keywords):
+        token = self.peek()
+        return token is not None and token.upper() in keywords
+
+    # 경로: name(.name | [n])*
+    def path(self):
+        token = self.take()
+        parts = [self.names[token] if token.startswith('#') else token]
+        while self.peek() is not None and (self.peek() == '.' or self.peek().startswith('[')):
+            token = self.take()
+            if token == '.':
+                token = self.take()
+                parts.append(self.names[token] if token.startswith('#') else token)
+            else:
+                parts.append(int(token[1:-1]))
+        return tuple(parts)
+
+    # ------ 조건 ------
+    def condition(self):
+        node = self.conjunction()
+        while self.at_keyword('OR'):
+            self.take()
+            node = ('or', node, self.conjunction())
+        return node
+
+    def conjunction(self):
+        node = self.negation()
+        while self.at_keyword('AND'):
+            self.take()
+            node = ('and', node, self.negation())
+        return node
+
+    def negation(self):
+        if self.at_keyword('NOT'):
+            self.take()
+            return ('not', self.negation())
+        return self.predicate()
+
+    def predicate(self):
+        token = self.peek()
+        if token == '(':
+            self.take('(')
+            node = self.condition()
+            self.take(')')
+            return node
+        lowered = (token or '').lower()
+        if lowered in ('attribute_exists', 'attribute_not_exists', 'begins_with', 'contains', 'attribute_type') and self.peek(1) == '(':
+            self.take()
+            self.take('(')
+            arguments = [self.operand()]
+            while self.peek() == ',':
+                self.take(',')
+                arguments.append(self.operand())
+            self.take(')')
+            return ('function', lowered, arguments)
+
+        left = self.operand()
+        if self.at_keyword('BETWEEN'):
+            self.take()
+            lower = self.operand()
+            self.take('AND')
+            return ('between', left, lower, self.operand())
+        if self.at_keyword('IN'):
+            self.take()
+            self.take('(')
+            options = [self.operand()]
+            while self.peek() == ',':
+                self.take(',')
+                options.append(self.operand())
+            self.take(')')
+            return ('in', left, options)
+        comparator = self.take()
+        if comparator not in ('=', '<>', '<', '<=', '>', '>='):
+            raise ValueError(f'Unexpected comparator {comparator}')
+        return ('compare', comparator, left, self.operand())
+
+    def operand(self):
+        token = self.peek()
+        if token.startswith(':'):
+            self.take()
+            return ('value', self.values[token])
+        if token.lower() == 'size' and self.peek(1) == '(':
+            self.take()
+            self.take('(')
+            argument = self.operand()
+            self.take(')')
+            return ('size', argument)
+        return ('path', self.path())
+
+    # ------ 업데이트 ------
+    def update(self):
+        clauses = []
+        while self.peek() is not None:
+            clause = self.take().upper()
+            actions = []
+            while True:
+                if clause == 'SET':
+                    target = self.path()
+                    self.take('=')
+                    actions.append((target, self.set_value()))
+                elif clause == 'REMOVE':
+                    actions.append((self.path(), None))
+                elif clause in ('ADD', 'DELETE'):
+                    target = self.path()
+                    actions.append((target, self.operand()))
+                else:
+                    raise ValueError(f'Unknown update clause {clause}')
+                if self.peek() != ',':
+                    break
+                self.take(',')
+            clauses.append((clause, actions))
+        return clauses
+
+    def set_value(self):
+        node = self.set_operand()
+        if self.peek() in ('+', '-'):
+            operator = self.take()
+            node = ('arithmetic', operator, node, self.set_operand())
+        return node
+
+    def set_operand(self):
+        token = (self.peek() or '').lower()
+        if token in ('if_not_exists', 'list_append') and self.peek(1) == '(':
+            self.take()
+            self.take('(')
+            first = self.set_value()
+            self.take(',')
+            second = self.set_value()
+            self.take(')')
+            return (token, first, second)
+        return self.operand()
+
+
+def _get_path(item, path):
+    current = item
+    for part in path:
+        if isinstance(part, int):
+            if not isinstance(current, list) or part >= len(current):
+                return _MISSING
+            current = current[part]
+        else:
+            if not isinstance(current, dict) or part not in current:
+                return _MISSING
+            current = current[part]
+    return current
+
+
+def _set_path(item, path, value):
+    current = item
+    for part in path[:-1]:
+        current = current[part]
+    if isinstance(path[-1], int) and path[-1] >= len(current):
+        current.append(value)
+    else:
+        current[path[-1]] = value
+
+
+def _remove_path(item, path):
+    parent = _get_path(item, path[:-1]) if len(path) > 1 else item
+    if parent is _MISSING:
+        return
+    if isinstance(parent, dict):
+        parent.pop(path[-1], None)
+    elif isinstance(parent, list) and path[-1] < len(parent):
+        parent.pop(path[-1])
+
+
+def _resolve(item, node):
+    kind = node[0]
+    if kind == 'value':
+        return _normalize(node[1])
+    if kind == 'path':
+        return _get_path(item, node[1])
+    if kind == 'size':
+        value = _resolve(item, node[1])
+        return _MISSING if value is _MISSING else Decimal(len(value))
+    if kind == 'if_not_exists':
+        value = _resolve(item, node[1])
+        return _resolve(item, node[2]) if value is _MISSING else value
+    if kind == 'list_append':
+        return list(_resolve(item, node[1])) + list(_resolve(item, node[2]))
+    if kind == 'arithmetic':
+        left, right = _resolve(item, node[2]), _resolve(item, node[3])
+        return left + right if node[1] == '+' else left - right
+    raise ValueError(f'Unknown operand {kind}')
+
+
+def _compare(operator, left, right):
+    if left is _MISSING or right is _MISSING:
+        return operator == '<>' and not (left is _MISSING and right is _MISSING)
+    if operator == '=':
+        return left == right
+    if operator == '<>':
+        return left != right
+    if type(left) is not type(right) and not (isinstance(left, Decimal) and isinstance(right, Decimal)):
+        return False
+    return {'<': left < right, '<=': left <= right, '>': left > right, '>=': left >= right}[operator]
+
+
+def _evaluate(item, node):
+    kind = node[0]
+    if kind == 'or':
+        return _evaluate(item, node[1]) or _evaluate(item, node[2])
+    if kind == 'and':
+        return _evaluate(item, node[1]) and _evaluate(item, node[2])
+    if kind == 'not':
+        return not _evaluate(item, node[1])
+    if kind == 'compare':
+        return _compare(node[1], _resolve(item, node[2]), _resolve(item, node[3]))
+    if kind == 'between':
+        value = _resolve(item, node[1])
+        return _compare('>=', value, _resolve(item, node[2])) and _compare('<=', value, _resolve(item, node[3]))
+    if kind == 'in':
+        value = _resolve(item, node[1])
+        return value is not _MISSING and any(value == _resolve(item, option) for option in node[2])
+    if kind == 'function':
+        name, arguments = node[1], node[2]
+        value = _resolve(item, arguments[0])
+        if name == 'attribute_exists':
+            return value is not _MISSING
+        if name == 'attribute_not_exists':
+            return value is _MISSING
+        if value is _MISSING:
+            return False
+        other = _resolve(item, arguments[1])
+        if name == 'begins_with':
+            return isinstance(value, str) and isinstance(other, str) and value.startswith(other)
+        if name == 'contains':
+            return other in value
+    raise ValueError(f'Unsupported condition {node}')
+
+
+def matches(item, expression, names=None, values=None):
+    """조건식 평가 (항목이 없으면 빈 dict로 평가)"""
+    if not expression:
+        return True
+    parser = _Parser(expression, names, values)
+    node = parser.condition()
+    if parser.peek() is not None:
+        raise ValueError(f'Unparsed tokens in {expression!r}: {parser.tokens[parser.position:]}')
+    return _evaluate(item or {}, node)
+
+
+def apply_update(item, expression, names=None, values=None):
+    """업데이트 식을 item에 적용 (item 변경)"""
+    for clause, actions in _Parser(expression, names, values).update():
+        for target, operand in actions:
+            if clause == 'SET':
+                _set_path(item, target, _resolve(item, operand))
+            elif clause == 'REMOVE':
+                _remove_path(item, target)
+            elif clause == 'ADD':
+                current = _get_path(item, target)
+                value = _resolve(item, operand)
+                if isinstance(value, set):
+                    _set_path(item, target, (set() if current is _MISSING else current) | value)
+                else:
+                    _set_path(item, target, (Decimal(0) if current is _MISSING else current) + value)
+            elif clause == 'DELETE':
+                current = _get_path(item, target)
+                if current is not _MISSING:
+                    remaining = current - _resolve(item, operand)
+                    if remaining:
+                        _set_path(item, target, remaining)
+                    else:
+                        _remove_path(item, target)
+    return item
+
+
+def project(item, expression, names=None):
+    """ProjectionExpression 적용 (최상위 속성만)"""
+    if not expression:
+        return item
+    names = names or {}
+    selected = {}
+    for part in expression.split(','):
+        name = part.strip().split('.')[0].split('[')[0]
+        name = names.get(name, name)
+        if name in item:
+            selected[name] = item[name]
+    return selected
+
+
+# ------ DynamoDB ------
+
+def _sort_value(value):
+    return (0, value) if isinstance(value, Decimal) else (1, str(value))
+
+
+class FakeTable:
+    """테이블 하나의 저장소 + 리소스(Table) API"""
+
+    def __init__(self, database, name, hash_key, range_key=None, indexes=None):
+        self.database = database
+        self.name = name
+        self.table_name = name
+        self.hash_key = hash_key
+        self.range_key = range_key
+        # {index_name: (hash_key, range_key 또는 None)}
+        self.indexes = indexes or {}
+        self.items = {}
+
+    # 저장소
+    def key_of(self, item, index_name=None):
+        hash_key, range_key = self.indexes[index_name] if index_name else (self.hash_key, self.range_key)
+        return (item.get(hash_key), item.get(range_key) if range_key else None)
+
+    def _primary_key(self, key):
+        missing = [name for name in (self.hash_key, self.range_key) if name and name not in key]
+        if missing:
+            raise client_error('ValidationException', f'Missing key attributes {missing} for {self.name}')
+        return self.key_of(key)
+
+    def current(self, key):
+        return self.items.get(self._primary_key(key))
+
+    def _check(self, existing, condition, names, values, return_old, operation):
+        if condition and not matches(existing, condition, names, values):
+            extra = {}
+            if return_old == 'ALL_OLD' and existing is not None:
+                from wms_common.batch import serialize_item
+                extra['Item'] = serialize_item(existing)
+            raise client_error('ConditionalCheckFailedException', 'The conditional request failed', operation, **extra)
+
+    # 리소스 API
+    def put_item(self, Item, ConditionExpression=None, ExpressionAttributeNames=None, ExpressionAttributeValues=None,
+                 ReturnValuesOnConditionCheckFailure=None, ReturnValues=None):
+        with self.database.lock:
+            self.database.record('PutItem', self.name)
+            item = _normalize(copy.deepcopy(Item))
+            existing = self.current(item)
+            self._check(existing, ConditionExpression, ExpressionAttributeNames, ExpressionAttributeValues,
+                        ReturnValuesOnConditionCheckFailure, 'PutItem')
+            self.items[self.key_of(item)] = item
+            return {'Attributes': copy.deepcopy(existing)} if ReturnValues == 'ALL_OLD' and existing else {}
+
+    def get_item(self, Key, ProjectionExpression=None, ExpressionAttributeNames=None, ConsistentRead=False):
+        with self.database.lock:
+            self.database.record('GetItem', self.name)
+            existing = self.current(_normalize(Key))
+            if existing is None:
+                return {}
+            return {'Item': project(copy.deepcopy(existing), ProjectionExpression, ExpressionAttributeNames)}
+
+    def update_item(self, Key, UpdateExpression, ConditionExpression=None, ExpressionAttributeNames=None,
+                    ExpressionAttributeValues=None, ReturnValues=None, ReturnValuesOnConditionCheckFailure=None):
+        with self.database.lock:
+            self.database.record('UpdateItem', self.name)
+            key = _normalize(Key)
+            existing = self.current(key)
+            self._check(existing, ConditionExpression, ExpressionAttributeNames, ExpressionAttributeValues,
+                        ReturnValuesOnConditionCheckFailure, 'UpdateItem')
+            item = copy.deepcopy(existing) if existing is not None else dict(key)
+            apply_update(item, UpdateExpression, ExpressionAttributeNames, ExpressionAttributeValues)
+            self.items[self.key_of(item)] = item
+            if ReturnValues in ('ALL_NEW', 'UPDATED_NEW'):
+                return {'Attributes': copy.deepcopy(item)}
+            if ReturnValues in ('ALL_OLD', 'UPDATED_OLD') and existing is not None:
+                return {'Attributes': copy.deepcopy(existing)}
+            return {}
+
+    def delete_item(self, Key, ConditionExpression=None, ExpressionAttributeNames=None, ExpressionAttributeValues=None,
+                    ReturnValues=None):
+        with self.database.lock:
+            self.database.record('DeleteItem', self.name)
+            key = _normalize(Key)
+            existing = self.current(key)
+            self._check(existing, ConditionExpression, ExpressionAttributeNames, ExpressionAttributeValues, None, 'DeleteItem')
+            self.items.pop(self._primary_key(key), None)
+            return {'Attributes': copy.deepcopy(existing)} if ReturnValues == 'ALL_OLD' and existing else {}
+
+    def _page(self, candidates, index_name, forward, limit, start_key, filter_expression, names, values, projection, select):
+        hash_key, range_key = self.indexes[index_name] if index_name else (self.hash_key, self.range_key)
+        candidates = sorted(
+            candidates,
+            key=lambda item: (_sort_value(item.get(hash_key)), _sort_value(item.get(range_key)) if range_key else (0, 0),
+                              _sort_value(item.get(self.hash_key)), _sort_value(item.get(self.range_key)) if self.range_key else (0, 0)),
+            reverse=not forward
+        )
+        if start_key:
+            start_key = _normalize(start_key)
+            position = next((index for index, item in enumerate(candidates)
+                             if all(item.get(name) == value for name, value in start_key.items())), None)
+            candidates = candidates[position + 1:] if position is not None else candidates
+        evaluated = candidates[:limit] if limit else candidates
+        last_key = None
+        if limit and len(candidates) > limit:
+            last = evaluated[-1]
+            key_names = {self.hash_key, self.range_key, hash_key, range_key} - {None}
+            last_key = {name: last[name] for name in key_names if name in last}
+        results = [copy.deepcopy(item) for item in evaluated if matches(item, filter_expression, names, values)]
+        response = {'Count': len(results), 'ScannedCount': len(evaluated)}
+        if select != 'COUNT':
+            response['Items'] = [project(item, projection, names) for item in results]
+        if last_key:
+            response['LastEvaluatedKey'] = copy.deepcopy(last_key)
+        return response
+
+    def query(self, KeyConditionExpression, IndexName=None, FilterExpression=None, ExpressionAttributeNames=None,
+              ExpressionAttributeValues=None, ScanIndexForward=True, Limit=None, ExclusiveStartKey=None,
+              ProjectionExpression=None, Select=None, ConsistentRead=False):
+        if not isinstance(KeyConditionExpression, str):
+            raise TypeError('Fake DynamoDB only supports string KeyConditionExpression')
+        with self.database.lock:
+            self.database.record('Query', self.name)
+            hash_key, range_key = self.indexes[IndexName] if IndexName else (self.hash_key, self.range_key)
+            candidates = [
+                item for item in self.items.values()
+                # GSI는 키 속성이 있는 항목만 포함 (sparse index)
+                if hash_key in item and (range_key is None or range_key in item)
+                and matches(item, KeyConditionExpression, ExpressionAttributeNames, ExpressionAttributeValues)
+            ]
+            return self._page(candidates, IndexName, ScanIndexForward, Limit, ExclusiveStartKey, FilterExpression,
+                              ExpressionAttributeNames, ExpressionAttributeValues, ProjectionExpression, Select)
+
+    def scan(self, IndexName=None, FilterExpression=None, ExpressionAttributeNames=None, ExpressionAttributeValues=None,
+             Limit=None, ExclusiveStartKey=None, ProjectionExpression=None, Segment=None, TotalSegments=None,
+             Select=None, ConsistentRead=False):
+        with self.database.lock:
+            self.database.record('Scan', self.name)
+            candidates = list(self.items.values())
+            if TotalSegments:
+                candidates = [item for index, item in enumerate(
+                    sorted(candidates, key=lambda item: _sort_value(item.get(self.hash_key)))) if index % TotalSegments == Segment]
+            return self._page(candidates, IndexName, True, Limit, ExclusiveStartKey, FilterExpression,
+                              ExpressionAttributeNames, ExpressionAttributeValues, ProjectionExpression, Select)
+
+    def batch_writer(self, overwrite_by_pkeys=None):
+        return _BatchWriter(self)
+
+
+class _BatchWriter:
+    def __init__(self, table):
+        self.table = table
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def put_item(self, Item):
+        self.table.put_item(Item=Item)
+
+    def delete_item(self, Key):
+        self.table.delete_item(Key=Key)
+
+
+class FakeDynamoClient:
+    """저수준 클라이언트 API (AttributeValue 직렬화 형식)"""
+
+    def __init__(self, database):
+        self.database = database
+        self.exceptions = types.SimpleNamespace(
+            ConditionalCheckFailedException=error_class('ConditionalCheckFailedException'),
+            TransactionCanceledException=error_class('TransactionCanceledException')
+        )
+
+    @staticmethod
+    def _plain(values):
+        from wms_common.batch import deserialize_item
+        return deserialize_item(values) if values else values
+
+    @staticmethod
+    def _wire(item):
+        from wms_common.batch import serialize_item
+        return serialize_item(item)
+
+    def _wire_response(self, response):
+        response = dict(response)
+        if 'Item' in response:
+            response['Item'] = self._wire(response['Item'])
+        if 'Items' in response:
+            response['Items'] = [self._wire(item) for item in response['Items']]
+        if 'Attributes' in response:
+            response['Attributes'] = self._wire(response['Attributes'])
+        if 'LastEvaluatedKey' in response:
+            response['LastEvaluatedKey'] = self._wire(response['LastEvaluatedKey'])
+        return response
+
+    def _call(self, TableName, method, **params):
+        for name in ('Item', 'Key', 'ExpressionAttributeValues', 'ExclusiveStartKey'):
+            if params.get(name) is not None:
+                params[name] = self._plain(params[name])
+        return self._wire_response(getattr(self.database.Table(TableName), method)(**params))
+
+    def put_item(self, TableName, **params):
+        return self._call(TableName, 'put_item', **params)
+
+    def get_item(self, TableName, **params):
+        return self._call(TableName, 'get_item', **params)
+
+    def update_item(self, TableName, **params):
+        return self._call(TableName, 'update_item', **params)
+
+    def delete_item(self, TableName, **params):
+        return self._call(TableName, 'delete_item', **params)
+
+    def query(self, TableName, **params):
+        return self._call(TableName, 'query', **params)
+
+    def scan(self, TableName, **params):
+        return self._call(TableName, 'scan', **params)
+
+    def batch_write_item(self, RequestItems):
+        self.database.record('BatchWriteItem', ','.join(RequestItems))
+        for table_name, requests in RequestItems.items():
+            table = self.database.Table(table_name)
+            for request in requests:
+                if 'PutRequest' in request:
+                    table.put_item(Item=self._plain(request['PutRequest']['Item']))
+                else:
+                    table.delete_item(Key=self._plain(request['DeleteRequest']['Key']))
+        return {'UnprocessedItems': {}}
+
+    def batch_get_item(self, RequestItems):
+        self.database.record('BatchGetItem', ','.join(RequestItems))
+        responses = {}
+        for table_name, request in RequestItems.items():
+            table = self.database.Table(table_name)
+            found = []
+            for key in request['Keys']:
+                item = table.get_item(Key=self._plain(key), ProjectionExpression=request.get('ProjectionExpression'),
+                                      ExpressionAttributeNames=request.get('ExpressionAttributeNames')).get('Item')
+                if item is not None:
+                    found.append(self._wire(item))
+            responses[table_name] = found
+        return {'Responses': responses, 'UnprocessedKeys': {}}
+
+    def transact_write_items(self, TransactItems, ClientRequestToken=None):
+        """모든 조건을 먼저 검사하고, 하나라도 실패하면 작업별 사유와 함께 전체 취소"""
+        with self.database.lock:
+            self.database.record('TransactWriteItems', len(TransactItems))
+            reasons = []
+            failed = False
+            for action in TransactItems:
+                (kind, params), = action.items()
+                table = self.database.Table(params['TableName'])
+                key = self._plain(params.get('Key') or params.get('Item'))
+                existing = table.current(key)
+                condition = params.get('ConditionExpression')
+                values = self._plain(params.get('ExpressionAttributeValues'))
+                if condition and not matches(existing, condition, params.get('ExpressionAttributeNames'), values):
+                    failed = True
+                    reason = {'Code': 'ConditionalCheckFailed', 'Message': 'The conditional request failed'}
+                    if params.get('ReturnValuesOnConditionCheckFailure') == 'ALL_OLD' and existing is not None:
+                        reason['Item'] = self._wire(existing)
+                    reasons.append(reason)
+                else:
+                    reasons.append({'Code': 'None'})
+            if failed:
+                raise client_error('TransactionCanceledException', 'Transaction cancelled', 'TransactWriteItems',
+                                   CancellationReasons=reasons)
+
+            for action in TransactItems:
+                (kind, params), = action.items()
+                table = self.database.Table(params['TableName'])
+                names = params.get('ExpressionAttributeNames')
+                values = self._plain(params.get('ExpressionAttributeValues'))
+                if kind == 'Put':
+                    item = self._plain(params['Item'])
+                    table.items[table.key_of(item)] = _normalize(item)
+                elif kind == 'Update':
+                    key = self._plain(params['Key'])
+                    existing = table.current(key)
+                    item = copy.deepcopy(existing) if existing is not None else _normalize(dict(key))
+                    apply_update(item, params['UpdateExpression'], names, values)
+                    table.items[table.key_of(item)] = item
+                elif kind == 'Delete':
+                    table.items.pop(table.key_of(self._plain(params['Key'])), None)
+            return {}
+
+
+class FakeDynamoDB:
+    """dynamodb 리소스 대역 (Table() / meta.client)"""
+
+    def __init__(self):
+        self.lock = threading.RLock()
+        self.tables = {}
+        self.calls = []
+        self.meta = types.SimpleNamespace(client=FakeDynamoClient(self))
+
+    def create_table(self, name, hash_key, range_key=None, indexes=None):
+        self.tables[name] = FakeTable(self, name, hash_key, range_key, indexes)
+        return self.tables[name]
+
+    def Table(self, name):
+        if name not in self.tables:
+            raise client_error('ResourceNotFoundException', f'Requested resource not found: Table: {name} not found')
+        return self.tables[name]
+
+    def record(self, operation, target):
+        self.calls.append((operation, target))
+
+    def count(self, operation):
+        return sum(1 for call in self.calls if call[0] == operation)
+
+
+# ------ S3 ------
+
+class FakeBody:
+    def __init__(self, data):
+        self._stream = io.BytesIO(data)
+
+    def read(self, size=-1):
+        return self._stream.read(size)
+
+    def iter_chunks(self, chunk_size=1024):
+        while True:
+            chunk = self._stream.read(chunk_size)
+            if not chunk:
+                return
+            yield chunk
+
+    def close(self):
+        pass
+
+
+class FakeS3:
+    def __init__(self):
+        self.objects = {}
+        self.uploads = {}
+        self.exceptions = types.SimpleNamespace(NoSuchKey=error_class('NoSuchKey'))
+
+    def put_object(self, Bucket, Key, Body=b'', **params):
+        if isinstance(Body, str):
+            Body = Body.encode('utf-8')
+        elif hasattr(Body, 'read'):
+            Body = Body.read()
+        self.objects[(Bucket, Key)] = {'Body': bytes(Body), 'ContentType': params.get('ContentType')}
+        return {'ETag': '"etag"'}
+
+    def get_object(self, Bucket, Key, **params):
+        if (Bucket, Key) not in self.objects:
+            raise client_error('NoSuchKey', 'The specified key does not exist.', 'GetObject')
+        stored = self.objects[(Bucket, Key)]
+        return {'Body': FakeBody(stored['Body']), 'ContentLength': len(stored['Body']), 'ContentType': stored['ContentType']}
+
+    def head_object(self, Bucket, Key):
+        if (Bucket, Key) not in self.objects:
+            raise client_error('404', 'Not Found', 'HeadObject')
+        return {'ContentLength': len(self.objects[(Bucket, Key)]['Body'])}
+
+    def delete_object(self, Bucket, Key):
+        self.objects.pop((Bucket, Key), None)
+        return {}
+
+    def delete_objects(self, Bucket, Delete):
+        for entry in Delete.get('Objects', []):
+            self.objects.pop((Bucket, entry['Key']), None)
+        return {}
+
+    def generate_presigned_url(self, operation, Params=None, ExpiresIn=3600, HttpMethod=None):
+        return f"https://{Params['Bucket']}.s3.example/{Params['Key']}?op={operation}&expires={ExpiresIn}"
+
+    def create_multipart_upload(self, Bucket, Key, **params):
+        upload_id = f'upload-{len(self.uploads) + 1}'
+        self.uploads[upload_id] = {'Bucket': Bucket, 'Key': Key, 'parts': {}}
+        return {'UploadId': upload_id}
+
+    def upload_part(self, Bucket, Key, UploadId, PartNumber, Body):
+        data = Body.encode('utf-8') if isinstance(Body, str) else bytes(Body)
+        self.uploads[UploadId]['parts'][PartNumber] = data
+        return {'ETag': f'"part-{PartNumber}"'}
+
+    def complete_multipart_upload(self, Bucket, Key, UploadId, MultipartUpload):
+        upload = self.uploads.pop(UploadId, None)
+        if upload is None:
+            raise client_error('NoSuchUpload', 'The specified upload does not exist.', 'CompleteMultipartUpload')
+        data = b''.join(upload['parts'].get(part['PartNumber'], b'') for part in MultipartUpload['Parts'])
+        self.objects[(Bucket, Key)] = {'Body': data, 'ContentType': None}
+        return {}
+
+    def abort_multipart_upload(self, Bucket, Key, UploadId):
+        self.uploads.pop(UploadId, None)
+        return {}
+
+    def read_json(self, bucket, key):
+        import json
+        return json.loads(self.objects[(bucket, key)]['Body'])
+
+
+# ------ Lambda / EventBridge ------
+
+class FakeLambda:
+    def __init__(self):
+        self.invocations = []
+
+    def invoke(self, FunctionName, InvocationType='RequestResponse', Payload=b''):
+        import json
+        self.invocations.append({'FunctionName': FunctionName, 'InvocationType': InvocationType,
+                                 'Payload': json.loads(Payload) if Payload else None})
+        return {'StatusCode': 202 if InvocationType == 'Event' else 200}
+
+
+class FakeEvents:
+    def __init__(self):
+        self.entries = []
+
+    def put_events(self, Entries):
+        self.entries.extend(Entries)
+        return {'FailedEntryCount': 0, 'Entries': [{'EventId': f'event-{len(self.entries) - index}'} for index in range(len(Entries))]}
+
+    def detail_types(self):
+        return [entry['DetailType'] for entry in self.entries]
+
+
+class FakeContext:
+    """Lambda context 대역"""
+
+    def __init__(self, remaining_ms=300000, function_name='wms-test-function'):
+        self.function_name = function_name
+        self.aws_request_id = 'test-request'
+        self._remaining_ms = remaining_ms
+
+    def get_remaining_time_in_millis(self):
+        return self._remaining_ms
+
+
+def api_event(method, path, body=None, headers=None, query=None, path_params=None, resource=None):
+    """API Gateway 프록시 이벤트"""
+    import json
+    return {
+        'httpMethod': method,
+        'path': path,
+        'resource': resource or path,
+        'headers': headers or {},
+        'queryStringParameters': query,
+        'pathParameters': path_params,
+        'body': body if body is None or isinstance(body, str) else json.dumps(body),
+        'isBase64Encoded': False
+    }
@@ -126,8 +126,10 @@ def create_history_records(supplier_id, supplier_data):
         history_data = {
             'history_id': history_id,
             'order_id': supplier_id,  # 공급업체 ID를 주문 ID로 사용
+            'supplier_id': supplier_id,
             'timestamp': timestamp,
             'event_type': 'RECEIVING_COMPLETED',
+            'event_time': f"RECEIVING_COMPLETED#{timestamp:010d}",
             'product_name': supplier_data.get('skuName', 'Unknown Product'),
             'quantity': inbound.get('qty', 0)
         }
@@ -146,8 +148,10 @@ def create_history_records(supplier_id, supplier_data):
         history_data = {
             'history_id': history_id,
             'order_id': supplier_id,  # 공급업체 ID를 주문 ID로 사용
+            'supplier_id': supplier_id,
             'timestamp': timestamp,
             'event_type': 'DISPATCH_COMPLETED',
+            'event_time': f"DISPATCH_COMPLETED#{timestamp:010d}",
             'product_name': supplier_data.get('skuName', 'Unknown Product'),
             'quantity': outbound.get('qty', 0)
         }
@@ -199,28 +203,28 @@ def get_supplier_by_id(supplier_id):
     return response.get('Item', {})
 
 def get_inbound_history_by_supplier(supplier_id):
-    """공급업체 입고 이력 조회 (GSI 필요)"""
+    """공급업체 입고 이력 조회"""
     response = history_table.query(
-        IndexName='order-time-index',  # 실제 인덱스 이름으로 변경 필요
-        KeyConditionExpression='order_id = :oid',
-        FilterExpression='event_type = :etype',
+        IndexName='supplier-event-index',
+        KeyConditionExpression='supplier_id = :sid AND begins_with(event_time, :etype)',
         ExpressionAttributeValues={
-            ':oid': supplier_id,
-            ':etype': 'RECEIVING_COMPLETED'
-        }
+            ':sid': supplier_id,
+            ':etype': 'RECEIVING_COMPLETED#'
+        },
+        ScanIndexForward=False
     )
     return response.get('Items', [])
 
 def get_outbound_history_by_supplier(supplier_id):
-    """공급업체 출고 이력 조회 (GSI 필요)"""
+    """공급업체 출고 이력 조회"""
     response = history_table.query(
-        IndexName='order-time-index',  # 실제 인덱스 이름으로 변경 필요
-        KeyConditionExpression='order_id = :oid',
-        FilterExpression='event_type = :etype',
+        IndexName='supplier-event-index',
+        KeyConditionExpression='supplier_id = :sid AND begins_with(event_time, :etype)',
         ExpressionAttributeValues={
-            ':oid': supplier_id,
-            ':etype': 'DISPATCH_COMPLETED'
-        }
+            ':sid': supplier_id,
+            ':etype': 'DISPATCH_COMPLETED#'
+        },
+        ScanIndexForward=False
     )
     return response.get('Items', [])
 
@@ -0,0 +1,167 @@
+"""백그라운드 작업 (주문 내보내기 / 일괄 등록) 상태 기록"""
+import json
+from decimal import Decimal
+
+from fake_aws import FakeContext, api_event
+
+
+def seed_orders(order_service, aws, count=3):
+    table = aws.dynamodb.Table(order_service.RECEIVING_ORDER_TABLE)
+    for index in range(count):
+        table.put_item(Item={'order_id': f'order-{index}', 'status': 'SCHEDULED', 'supplier_id': 'SUP-1',
+                             'created_at': Decimal(1790000000 + index), 'scheduled_date': Decimal(1790003600)})
+
+
+def start_export(order_service, aws, context, body=None):
+    body = dict({'format': 'ndjson'}, **(body or {}))
+    response = order_service.lambda_handler(api_event('POST', '/receiving-orders/export', body), context)
+    assert response['statusCode'] == 202
+    return aws.lambda_client.invocations[-1]['Payload']
+
+
+def export_status(order_service, export_id):
+    response = order_service.lambda_handler(api_event(
+        'GET', f'/receiving-orders/export/{export_id}', path_params={'export_id': export_id},
+        resource='/receiving-orders/export/{export_id}'), None)
+    assert response['statusCode'] == 200
+    return json.loads(response['body'])
+
+
+def failure_record(payload, condition='RetriesExhausted', error=None):
+    """비동기 호출 on-failure 대상이 받는 레코드"""
+    record = {
+        'version': '1.0',
+        'requestContext': {'requestId': 'request-1', 'condition': condition, 'approximateInvokeCount': 1},
+        'requestPayload': payload,
+        'responseContext': {'statusCode': 200, 'executedVersion': '$LATEST', 'functionError': 'Unhandled'}
+    }
+    if error:
+        record['responsePayload'] = {'errorMessage': error, 'errorType': 'Sandbox.Timedout'}
+    return record
+
+
+def test_export_runs_on_job_function(order_service, aws, monkeypatch):
+    monkeypatch.setattr(order_service, 'JOB_FUNCTION_NAME', 'wms-receiving-order-jobs-test')
+    seed_orders(order_service, aws)
+
+    payload = start_export(order_service, aws, FakeContext())
+    assert aws.lambda_client.invocations[-1]['FunctionName'] == 'wms-receiving-order-jobs-test'
+    assert aws.lambda_client.invocations[-1]['InvocationType'] == 'Event'
+
+    order_service.lambda_handler(payload, FakeContext())
+
+    status = export_status(order_service, payload['export_id'])
+    assert status['status'] == 'COMPLETED'
+    assert status['rows'] == 3
+    assert status['download_url']
+
+
+def test_finished_export_keeps_the_requested_manifest(order_service, aws):
+    seed_orders(order_service, aws)
+    payload = start_export(order_service, aws, FakeContext(), {'user_id': 'user-7'})
+    requested = export_status(order_service, payload['export_id'])
+
+    order_service.lambda_handler(payload, FakeContext())
+
+    status = export_status(order_service, payload['export_id'])
+    assert status['status'] == 'COMPLETED'
+    assert (status['requested_by'], status['created_at']) == ('user-7', requested['created_at'])
+    assert status['started_at'] >= status['created_at']
+
+
+def test_export_near_timeout_is_marked_failed(order_service, aws):
+    seed_orders(order_service, aws)
+    payload = start_export(order_service, aws, FakeContext())
+
+    order_service.lambda_handler(payload, FakeContext(remaining_ms=order_service.JOB_DEADLINE_MARGIN_MS - 1))
+
+    status = export_status(order_service, payload['export_id'])
+    assert status['status'] == 'FAILED'
+    assert 'timeout' in status['error']
+    assert aws.s3.uploads == {}
+
+
+def test_killed_export_is_marked_failed_by_failure_destination(order_service, aws):
+    payload = start_export(order_service, aws, FakeContext())
+    assert export_status(order_service, payload['export_id'])['status'] == 'RUNNING'
+
+    order_service.lambda_handler(failure_record(payload, error='Task timed out after 900.00 seconds'), None)
+
+    status = export_status(order_service, payload['export_id'])
+    assert status['status'] == 'FAILED'
+    assert status['error'] == 'Task timed out after 900.00 seconds'
+
+
+def test_failure_record_does_not_overwrite_finished_export(order_service, aws):
+    seed_orders(order_service, aws)
+    payload = start_export(order_service, aws, FakeContext())
+    order_service.lambda_handler(payload, FakeContext())
+
+    order_service.lambda_handler(failure_record(payload, condition='EventAgeExceeded'), None)
+
+    assert export_status(order_service, payload['export_id'])['status'] == 'COMPLETED'
+
+
+def manifest(rows):
+    return ''.join(json.dumps({
+        'scheduled_date': '2026-10-20', 'supplier_name': 'Acme', 'supplier_number': 'SUP-1',
+        'sku_name': f'SKU {index}', 'sku_number': f'SKU-{index}', 'shipment_number': 'SHIP-1',
+        'po_number': f'PO-{index // 10}', 'expected_qty': 2
+    }) + '\n' for index in range(rows))
+
+
+def start_bulk_job(order_service, aws, monkeypatch, rows):
+    monkeypatch.setattr(order_service, 'BULK_SYNC_MAX_BYTES', 10)
+    response = order_service.lambda_handler(api_event(
+        'POST', '/receiving-orders/bulk', manifest(rows), headers={'Content-Type': 'application/x-ndjson'}), FakeContext())
+    assert response['statusCode'] == 202
+    return aws.lambda_client.invocations[-1]['Payload']
+
+
+def bulk_status(order_service, job_id):
+    response = order_service.lambda_handler(api_event(
+        'GET', f'/receiving-orders/bulk/{job_id}', path_params={'job_id': job_id},
+        resource='/receiving-orders/bulk/{job_id}'), None)
+    assert response['statusCode'] == 200
+    return json.loads(response['body'])
+
+
+def report_rows(order_service, aws, status):
+    body = aws.s3.objects[(order_service.EXPORT_BUCKET, status['report_key'])]['Body']
+    return [json.loads(line) for line in body.decode('utf-8').splitlines()]
+
+
+def test_bulk_job_completes(order_service, aws, monkeypatch):
+    payload = start_bulk_job(order_service, aws, monkeypatch, 150)
+
+    order_service.lambda_handler(payload, FakeContext())
+
+    status = bulk_status(order_service, payload['job_id'])
+    assert status['status'] == 'COMPLETED'
+    assert (status['rows'], status['created'], status['failed']) == (150, 150, 0)
+    assert len(report_rows(order_service, aws, status)) == 150
+
+
+def test_bulk_job_near_timeout_is_marked_failed_with_partial_report(order_service, aws, monkeypatch):
+    payload = start_bulk_job(order_service, aws, monkeypatch, 150)
+
+    order_service.lambda_handler(payload, FakeContext(remaining_ms=order_service.JOB_DEADLINE_MARGIN_MS - 1))
+
+    status = bulk_status(order_service, payload['job_id'])
+    assert status['status'] == 'FAILED'
+    assert 'timeout' in status['error']
+    # 첫 배치(BULK_BATCH_ROWS)만 처리 - 리포트로 등록된 행 확인 가능
+    assert status['created'] == order_service.BULK_BATCH_ROWS
+    assert len(report_rows(order_service, aws, status)) == order_service.BULK_BATCH_ROWS
+    assert status['report_url']
+    assert len(aws.dynamodb.Table(order_service.RECEIVING_ITEM_TABLE).items) == order_service.BULK_BATCH_ROWS
+
+
+def test_killed_bulk_job_is_marked_failed_by_failure_destination(order_service, aws, monkeypatch):
+    payload = start_bulk_job(order_service, aws, monkeypatch, 150)
+
+    order_service.lambda_handler(failure_record(payload, error='Runtime exited with error: signal: killed'), None)
+
+    status = bulk_status(order_service, payload['job_id'])
+    assert status['status'] == 'FAILED'
+    assert status['error'] == 'Runtime exited with error: signal: killed'
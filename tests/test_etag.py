@@ -0,0 +1,83 @@
+"""상세 조회 ETag / If-None-Match (wms_common.etag, 품목 / 문서 상세 핸들러)"""
+import json
+from datetime import datetime
+from decimal import Decimal
+
+from fake_aws import api_event
+from wms_common.etag import is_not_modified, make_etag
+from test_item_updates import seed, update
+
+
+def get_item(item_service, etag=None):
+    headers = {'If-None-Match': etag} if etag else None
+    event = api_event('GET', '/receiving-items/item-1', headers=headers, path_params={'item_id': 'item-1'},
+                      resource='/receiving-items/{item_id}')
+    return item_service.lambda_handler(event, None)
+
+
+def get_document(document_service, etag=None):
+    headers = {'If-None-Match': etag} if etag else None
+    event = api_event('GET', '/documents/doc-1', headers=headers, path_params={'document_id': 'doc-1'},
+                      resource='/documents/{document_id}')
+    return document_service.lambda_handler(event, None)
+
+
+def test_make_etag_uses_version_updated_at_and_suffix():
+    record = {'version': Decimal(3), 'updated_at': Decimal(1790000000)}
+
+    assert make_etag(record) == '"3-1790000000"'
+    assert make_etag(record, suffix=7) == '"3-1790000000-7"'
+    assert make_etag({}) == '"0-0"'
+
+
+def test_if_none_match_ignores_weak_prefix_and_accepts_lists():
+    event = api_event('GET', '/receiving-items/item-1', headers={'if-none-match': '"1-1", W/"3-1790000000"'})
+
+    assert is_not_modified(event, '"3-1790000000"')
+    assert not is_not_modified(event, '"4-1790000001"')
+    assert is_not_modified(api_event('GET', '/x', headers={'If-None-Match': '*'}), '"9-9"')
+
+
+def test_item_detail_returns_304_until_the_item_changes(item_service, aws):
+    seed(item_service, aws, version=1)
+    first = get_item(item_service)
+    etag = first['headers']['ETag']
+    assert first['statusCode'] == 200
+
+    not_modified = get_item(item_service, etag)
+    assert (not_modified['statusCode'], not_modified['body'], not_modified['headers']['ETag']) == (304, '', etag)
+
+    assert update(item_service, {'received_qty': 4})[0] == 200
+    changed = get_item(item_service, etag)
+    assert changed['statusCode'] == 200
+    assert changed['headers']['ETag'] != etag
+    assert json.loads(changed['body'])['received_qty'] == 4
+
+
+def test_document_etag_changes_with_the_download_url_window(document_service, aws, monkeypatch):
+    aws.dynamodb.Table(document_service.DOCUMENT_METADATA_TABLE).put_item(Item={
+        'document_id': 'doc-1', 'order_id': 'order-1', 'document_type': 'INVOICE',
+        's3_key': 'order-1/invoice/doc-1.pdf', 'version': 1, 'updated_at': 1790000000
+    })
+    window = document_service.DOWNLOAD_URL_WINDOW
+    now = [1790000000]
+
+    class FixedDatetime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return datetime.fromtimestamp(now[0], tz)
+
+    monkeypatch.setattr(document_service, 'datetime', FixedDatetime)
+
+    first = get_document(document_service)
+    etag = first['headers']['ETag']
+    assert first['statusCode'] == 200
+    assert etag == f'"1-1790000000-{1790000000 // window}"'
+    assert get_document(document_service, etag)['statusCode'] == 304
+
+    # 다운로드 URL 갱신 주기가 지나면 같은 레코드라도 새 URL과 새 ETag로 200
+    now[0] += window
+    renewed = get_document(document_service, etag)
+    assert renewed['statusCode'] == 200
+    assert renewed['headers']['ETag'] != etag
+    assert json.loads(renewed['body'])['download_url']
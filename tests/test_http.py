@@ -0,0 +1,72 @@
+"""응답 gzip 협상 / 요청 본문 복원 (wms_common.http)"""
+import base64
+import gzip
+import json
+
+from fake_aws import api_event
+from wms_common.http import accepts_gzip, compress_response, decode_request_body
+
+
+def large_response(size=4096):
+    return {'statusCode': 200, 'headers': {'Content-Type': 'application/json'},
+            'body': json.dumps({'orders': ['x' * 16] * (size // 16)})}
+
+
+def gzip_event(accept_encoding='gzip, deflate'):
+    return api_event('GET', '/receiving-orders', headers={'Accept-Encoding': accept_encoding})
+
+
+def test_large_response_is_gzipped_when_accepted():
+    response = large_response()
+
+    compressed = compress_response(gzip_event(), response)
+
+    assert compressed['isBase64Encoded'] is True
+    assert compressed['headers']['Content-Encoding'] == 'gzip'
+    assert compressed['headers']['Vary'] == 'Accept-Encoding'
+    assert gzip.decompress(base64.b64decode(compressed['body'])).decode('utf-8') == response['body']
+
+
+def test_response_below_threshold_is_unchanged():
+    response = {'statusCode': 200, 'headers': {}, 'body': '{"ok":true}'}
+
+    assert compress_response(gzip_event(), response, min_bytes=1024) is response
+
+
+def test_gzip_refused_with_q_zero():
+    assert accepts_gzip(gzip_event('gzip;q=0, deflate')) is False
+    assert accepts_gzip(gzip_event('*;q=0')) is False
+    assert accepts_gzip(gzip_event('br, *;q=0.5')) is True
+    assert accepts_gzip(api_event('GET', '/receiving-orders')) is False
+
+    response = compress_response(gzip_event('gzip;q=0'), large_response())
+
+    assert 'Content-Encoding' not in response['headers']
+    assert response['headers']['Vary'] == 'Accept-Encoding'
+    assert not response.get('isBase64Encoded')
+
+
+def test_existing_content_encoding_is_not_compressed_again():
+    response = large_response()
+    response['headers']['content-encoding'] = 'identity'
+
+    assert compress_response(gzip_event(), response) is response
+
+
+def test_base64_text_body_is_decoded():
+    body = json.dumps({'supplier_name': '공급업체'})
+    event = dict(api_event('POST', '/suppliers'), body=base64.b64encode(body.encode('utf-8')).decode('ascii'),
+                 isBase64Encoded=True)
+
+    decoded = decode_request_body(event)
+
+    assert decoded['body'] == body
+    assert decoded['isBase64Encoded'] is False
+    assert event['isBase64Encoded'] is True
+
+
+def test_base64_binary_body_is_left_encoded():
+    event = dict(api_event('POST', '/documents'), body=base64.b64encode(b'\xff\xd8\xff\xe0').decode('ascii'),
+                 isBase64Encoded=True)
+
+    assert decode_request_body(event) is event
@@ -0,0 +1,94 @@
+"""Idempotency-Key 처리 (wms_common.idempotency.run_idempotent - POST /receiving-orders)"""
+import base64
+import json
+from datetime import datetime
+
+from fake_aws import api_event
+
+ORDER_BODY = {
+    'request_details': {
+        'scheduled_date': '2026-10-20', 'supplier_name': 'Acme', 'supplier_number': 'SUP-1',
+        'sku_name': 'Widget', 'sku_number': 'SKU-1'
+    },
+    'shipment_information': {'shipment_number': 'SHIP-1'},
+    'documents': [
+        {'document_type': doc_type, 'file_name': f'{doc_type.lower()}.pdf', 'content_type': 'application/pdf',
+         'file_content': base64.b64encode(b'%PDF-1.4 test').decode('ascii')}
+        for doc_type in ('INVOICE', 'BILL_OF_ENTRY', 'AIRWAY_BILL')
+    ],
+    'user_id': 'tester'
+}
+
+
+def create_order(order_service, body=None, key='key-1'):
+    headers = {'Idempotency-Key': key} if key else {}
+    return order_service.lambda_handler(api_event('POST', '/receiving-orders', body or ORDER_BODY, headers=headers), None)
+
+
+def order_count(order_service, aws):
+    return len(aws.dynamodb.Table(order_service.RECEIVING_ORDER_TABLE).items)
+
+
+def test_retry_with_same_key_replays_stored_response(order_service, aws):
+    first = create_order(order_service)
+    second = create_order(order_service)
+
+    assert first['statusCode'] == second['statusCode'] == 201
+    assert second['body'] == first['body']
+    assert second['headers']['Idempotency-Replayed'] == 'true'
+    assert 'Idempotency-Replayed' not in first['headers']
+    assert order_count(order_service, aws) == 1
+
+
+def test_same_key_with_different_body_is_rejected(order_service, aws):
+    create_order(order_service)
+    other = dict(ORDER_BODY, user_id='someone-else')
+
+    response = create_order(order_service, other)
+
+    assert response['statusCode'] == 422
+    assert order_count(order_service, aws) == 1
+
+
+def test_same_key_while_first_request_is_running_is_conflict(order_service, aws, monkeypatch):
+    create_receiving_order = order_service.create_receiving_order
+    concurrent = []
+
+    def slow_create(event):
+        # 첫 요청 처리 도중 같은 키로 재시도 도착
+        concurrent.append(create_order(order_service))
+        return create_receiving_order(event)
+
+    monkeypatch.setattr(order_service, 'create_receiving_order', slow_create)
+    first = create_order(order_service)
+
+    assert first['statusCode'] == 201
+    assert concurrent[0]['statusCode'] == 409
+    assert order_count(order_service, aws) == 1
+
+
+def test_expired_lock_is_reclaimed(order_service, aws):
+    create_order(order_service, key='key-2')
+    table = aws.dynamodb.Table(order_service.IDEMPOTENCY_TABLE)
+    record = table.get_item(Key={'idempotency_key': 'POST /receiving-orders#key-2'})['Item']
+    # 처리 도중 중단된 요청 (잠금 만료)
+    table.put_item(Item=dict(record, status='IN_PROGRESS', locked_until=int(datetime.now().timestamp()) - 1))
+    aws.dynamodb.Table(order_service.RECEIVING_ORDER_TABLE).items.clear()
+
+    response = create_order(order_service, key='key-2')
+
+    assert response['statusCode'] == 201
+    assert 'Idempotency-Replayed' not in response['headers']
+    assert order_count(order_service, aws) == 1
+
+
+def test_server_errors_are_not_stored(order_service, aws, monkeypatch):
+    with monkeypatch.context() as patch:
+        patch.setattr(order_service, 'create_receiving_order', lambda event: {
+            'statusCode': 500, 'headers': {}, 'body': json.dumps({'message': 'boom'})})
+        assert create_order(order_service)['statusCode'] == 500
+
+    response = create_order(order_service)
+
+    assert response['statusCode'] == 201
+    assert 'Idempotency-Replayed' not in response['headers']
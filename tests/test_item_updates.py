@@ -0,0 +1,110 @@
+"""품목 수정 (ReceivingItemService.update_item - 주문 상태 ConditionCheck + 품목 Update 트랜잭션)"""
+import json
+from decimal import Decimal
+
+from fake_aws import api_event
+
+
+def seed(item_service, aws, status='IN_PROCESS', version=None):
+    aws.dynamodb.Table(item_service.RECEIVING_ORDER_TABLE).put_item(Item={'order_id': 'order-1', 'status': status})
+    item = {'item_id': 'item-1', 'order_id': 'order-1', 'product_name': 'Widget', 'expected_qty': Decimal(5)}
+    if version is not None:
+        item['version'] = Decimal(version)
+    aws.dynamodb.Table(item_service.RECEIVING_ITEM_TABLE).put_item(Item=item)
+
+
+def update(item_service, body, headers=None, item_id='item-1'):
+    event = api_event('PUT', f'/receiving-items/{item_id}', body=body, headers=headers,
+                      path_params={'item_id': item_id}, resource='/receiving-items/{item_id}')
+    response = item_service.lambda_handler(event, None)
+    return response['statusCode'], json.loads(response['body'])
+
+
+def stored_item(item_service, aws):
+    return aws.dynamodb.Table(item_service.RECEIVING_ITEM_TABLE).get_item(Key={'item_id': 'item-1'})['Item']
+
+
+def test_update_commits_order_check_and_item_update_together(item_service, aws):
+    seed(item_service, aws)
+
+    status, body = update(item_service, {'received_qty': 4, 'notes': 'dented box'})
+
+    assert status == 200
+    assert body['item']['received_qty'] == 4
+    assert body['item']['version'] == 1
+    stored = stored_item(item_service, aws)
+    assert (stored['received_qty'], stored['notes'], stored['version']) == (4, 'dented box', 1)
+    assert aws.dynamodb.count('TransactWriteItems') == 1
+
+
+def test_completed_order_rejects_update(item_service, aws):
+    seed(item_service, aws, status='COMPLETED')
+
+    status, body = update(item_service, {'received_qty': 4})
+
+    assert status == 400
+    assert body['message'] == 'Cannot update item for order in COMPLETED status'
+    assert 'received_qty' not in stored_item(item_service, aws)
+
+
+def test_order_completed_between_read_and_write_is_caught(item_service, aws, monkeypatch):
+    seed(item_service, aws)
+    items = aws.dynamodb.Table(item_service.RECEIVING_ITEM_TABLE)
+    get_item = items.get_item
+
+    def read_then_complete_order(**params):
+        # 품목을 읽은 직후 다른 요청이 주문을 완료 처리
+        response = get_item(**params)
+        aws.dynamodb.Table(item_service.RECEIVING_ORDER_TABLE).put_item(Item={'order_id': 'order-1', 'status': 'COMPLETED'})
+        return response
+
+    monkeypatch.setattr(items, 'get_item', read_then_complete_order)
+    status, _ = update(item_service, {'received_qty': 4})
+
+    assert status == 400
+    assert 'received_qty' not in stored_item(item_service, aws)
+
+
+def test_missing_item_and_missing_order(item_service, aws):
+    assert update(item_service, {'received_qty': 1}, item_id='missing')[0] == 404
+
+    aws.dynamodb.Table(item_service.RECEIVING_ITEM_TABLE).put_item(Item={'item_id': 'item-1', 'order_id': 'gone'})
+    status, body = update(item_service, {'received_qty': 1})
+    assert (status, body['message']) == (404, 'Associated order not found')
+
+
+def test_stale_if_match_returns_conflict(item_service, aws):
+    seed(item_service, aws, version=3)
+
+    status, body = update(item_service, {'received_qty': 4}, headers={'If-Match': 'W/"2-1790000000"'})
+    assert (status, body['current_version']) == (409, 3)
+
+    status, body = update(item_service, {'received_qty': 4}, headers={'If-Match': 'W/"3-1790000000"'})
+    assert (status, body['item']['version']) == (200, 4)
+
+
+def test_concurrent_item_change_without_if_match_is_retried(item_service, aws, monkeypatch):
+    seed(item_service, aws, version=1)
+    items = aws.dynamodb.Table(item_service.RECEIVING_ITEM_TABLE)
+    get_item = items.get_item
+    reads = []
+
+    def read_then_modify(**params):
+        response = get_item(**params)
+        if not reads:
+            # 읽기 직후 다른 요청이 품목을 수정
+            items.update_item(Key={'item_id': 'item-1'}, UpdateExpression='SET notes = :n ADD version :one',
+                              ExpressionAttributeValues={':n': 'other', ':one': 1})
+        reads.append(params)
+        return response
+
+    monkeypatch.setattr(items, 'get_item', read_then_modify)
+    status, body = update(item_service, {'received_qty': 4})
+
+    assert status == 200
+    # 재시도는 트랜잭션 실패 응답의 현재 품목을 사용 (다시 읽지 않음)
+    assert len(reads) == 1
+    assert aws.dynamodb.count('TransactWriteItems') == 2
+    assert (body['item']['notes'], body['item']['version']) == ('other', 3)
+    stored = stored_item(item_service, aws)
+    assert (stored['received_qty'], stored['notes'], stored['version']) == (4, 'other', 3)
@@ -0,0 +1,107 @@
+"""구조화 로그 / 이벤트 덤프 (wms_common.log)"""
+import json
+
+import pytest
+
+from fake_aws import FakeContext, api_event
+from wms_common import log
+
+
+def json_lines(capsys):
+    return [json.loads(line) for line in capsys.readouterr().out.splitlines() if line.strip()]
+
+
+def ok_handler(event, context):
+    return {'statusCode': 201, 'body': '{}'}
+
+
+@pytest.fixture
+def info_level(monkeypatch):
+    monkeypatch.setattr(log, 'LOG_LEVEL', 'INFO')
+
+
+def test_file_content_is_redacted_to_its_length():
+    body = {'order': {'documents': [{'file_name': 'a.pdf', 'file_content': 'A' * 5000}]}, 'file_content': None}
+
+    redacted = log.redact(body)
+
+    assert redacted['order']['documents'][0] == {'file_name': 'a.pdf', 'file_content': '<redacted 5000 chars>'}
+    assert redacted['file_content'] is None
+
+
+def test_long_strings_and_lists_are_truncated(monkeypatch):
+    monkeypatch.setattr(log, 'LOG_MAX_FIELD_CHARS', 10)
+
+    assert log.truncate('x' * 25) == 'xxxxxxxxxx...<+15 chars>'
+    assert log.truncate('short') == 'short'
+    redacted = log.redact({'items': list(range(log.LOG_MAX_LIST_ITEMS + 5))})
+    assert redacted['items'][-1] == '<+5 items>'
+    assert len(redacted['items']) == log.LOG_MAX_LIST_ITEMS + 1
+
+
+def test_event_body_and_headers_are_redacted(monkeypatch):
+    monkeypatch.setattr(log, 'LOG_MAX_FIELD_CHARS', 32)
+    event = api_event('POST', '/receiving-orders', body={'file_content': 'A' * 100, 'notes': 'n' * 40},
+                      headers={'Authorization': 'Bearer secret', 'Content-Type': 'application/json'})
+
+    summary = log.redact_event(event)
+
+    assert summary['headers'] == {'Authorization': '<redacted>', 'Content-Type': 'application/json'}
+    assert summary['body']['file_content'] == '<redacted 100 chars>'
+    assert summary['body']['notes'] == 'n' * 32 + '...<+8 chars>'
+
+    # 큰 본문은 JSON으로 파싱하지 않고 문자열로만 잘라서 기록
+    monkeypatch.setattr(log, 'LOG_MAX_PARSE_BYTES', 16)
+    assert log.redact_event(event)['body'].endswith('chars>')
+
+
+def test_zero_sample_rate_never_dumps_the_event(monkeypatch, info_level, capsys):
+    monkeypatch.setattr(log, 'LOG_EVENT_SAMPLE_RATE', 0.0)
+    handler = log.log_request(ok_handler)
+
+    for _ in range(20):
+        handler(api_event('GET', '/suppliers'), FakeContext())
+
+    records = json_lines(capsys)
+    assert len(records) == 20
+    assert all(record['message'] == 'request' for record in records)
+    assert not log.should_dump_event()
+
+    monkeypatch.setattr(log, 'LOG_LEVEL', 'DEBUG')
+    assert log.should_dump_event()
+
+
+def test_one_json_line_per_request(monkeypatch, info_level, capsys):
+    monkeypatch.setattr(log, 'LOG_EVENT_SAMPLE_RATE', 0.0)
+    handler = log.log_request(ok_handler)
+
+    handler(api_event('POST', '/documents/doc-1', resource='/documents/{document_id}'), FakeContext())
+
+    record, = json_lines(capsys)
+    assert record['level'] == 'INFO'
+    assert (record['route'], record['status']) == ('POST /documents/{document_id}', 201)
+    assert set(record) == {'level', 'message', 'request_id', 'route', 'status', 'duration_ms', 'cold_start'}
+
+
+def test_unhandled_error_is_logged_once_at_error_level(monkeypatch, info_level, capsys):
+    monkeypatch.setattr(log, 'LOG_EVENT_SAMPLE_RATE', 0.0)
+
+    def failing_handler(event, context):
+        raise RuntimeError('boom')
+
+    with pytest.raises(RuntimeError):
+        log.log_request(failing_handler)({'action': 'rebuild'}, None)
+
+    record, = json_lines(capsys)
+    assert (record['level'], record['route'], record['status']) == ('ERROR', 'invoke rebuild', None)
+
+
+def test_sampled_dump_is_a_separate_debug_line(monkeypatch, info_level, capsys):
+    monkeypatch.setattr(log, 'LOG_EVENT_SAMPLE_RATE', 1.0)
+
+    log.log_request(ok_handler)(api_event('POST', '/documents', body={'file_content': 'A' * 10}), FakeContext())
+
+    dump, request = json_lines(capsys)
+    assert (dump['level'], dump['message']) == ('DEBUG', 'event')
+    assert dump['event']['body']['file_content'] == '<redacted 10 chars>'
+    assert request['message'] == 'request'
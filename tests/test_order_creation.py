@@ -0,0 +1,48 @@
+"""입고 주문 생성 (ReceivingOrderService.create_receiving_order - 단일 TransactWriteItems)"""
+import base64
+
+from fake_aws import api_event, client_error
+
+ORDER_BODY = {
+    'request_details': {
+        'scheduled_date': '2026-10-20', 'supplier_name': 'Acme', 'supplier_number': 'SUP-1',
+        'sku_name': 'Widget', 'sku_number': 'SKU-1'
+    },
+    'shipment_information': {'shipment_number': 'SHIP-1'},
+    'documents': [
+        {'document_type': doc_type, 'file_name': f'{doc_type.lower()}.pdf', 'content_type': 'application/pdf',
+         'file_content': base64.b64encode(b'%PDF-1.4 test').decode('ascii')}
+        for doc_type in ('INVOICE', 'BILL_OF_ENTRY', 'AIRWAY_BILL')
+    ],
+    'user_id': 'tester'
+}
+
+
+def create_order(order_service):
+    return order_service.lambda_handler(api_event('POST', '/receiving-orders', ORDER_BODY), None)
+
+
+def table_sizes(order_service, aws):
+    names = ('RECEIVING_ORDER_TABLE', 'RECEIVING_ITEM_TABLE', 'RECEIVING_HISTORY_TABLE', 'DOCUMENT_METADATA_TABLE')
+    return [len(aws.dynamodb.Table(getattr(order_service, name)).items) for name in names]
+
+
+def test_order_records_commit_in_one_transaction(order_service, aws):
+    response = create_order(order_service)
+
+    assert response['statusCode'] == 201
+    assert aws.dynamodb.count('TransactWriteItems') == 1
+    assert table_sizes(order_service, aws) == [1, 1, 1, 3]
+
+
+def test_failed_transaction_writes_nothing_and_removes_uploads(order_service, aws, monkeypatch):
+    def cancelled(**params):
+        raise client_error('TransactionCanceledException', 'Transaction cancelled', 'TransactWriteItems',
+                           CancellationReasons=[{'Code': 'None'}, {'Code': 'ThrottlingError'}])
+
+    monkeypatch.setattr(aws.dynamodb.meta.client, 'transact_write_items', cancelled)
+    response = create_order(order_service)
+
+    assert response['statusCode'] == 500
+    assert table_sizes(order_service, aws) == [0, 0, 0, 0]
+    assert aws.s3.objects == {}
@@ -0,0 +1,44 @@
+"""주문 상세 조회 (GET /receiving-orders/{order_id}/full - 동시 조회 후 부분 응답)"""
+import json
+
+from fake_aws import api_event, client_error
+
+from test_order_creation import create_order
+
+
+def get_full(order_service, order_id):
+    return order_service.lambda_handler(api_event(
+        'GET', f'/receiving-orders/{order_id}/full', path_params={'order_id': order_id},
+        resource='/receiving-orders/{order_id}/full'), None)
+
+
+def test_full_detail_combines_every_section(order_service, aws):
+    order_id = json.loads(create_order(order_service)['body'])['order']['order_id']
+
+    response = get_full(order_service, order_id)
+
+    assert response['statusCode'] == 200
+    body = json.loads(response['body'])
+    assert body['order']['order_id'] == order_id
+    assert (len(body['items']), len(body['documents']), len(body['history'])) == (1, 3, 1)
+    assert all(document['download_url'] for document in body['documents'])
+    assert 'errors' not in body['meta']
+
+
+def test_full_detail_reports_failed_section_and_missing_order(order_service, aws, monkeypatch):
+    order_id = json.loads(create_order(order_service)['body'])['order']['order_id']
+    client = aws.dynamodb.meta.client
+    query = client.query
+
+    def history_unavailable(TableName, **params):
+        if TableName == order_service.RECEIVING_HISTORY_TABLE:
+            raise client_error('ProvisionedThroughputExceededException', 'throttled', 'Query')
+        return query(TableName, **params)
+
+    monkeypatch.setattr(client, 'query', history_unavailable)
+    body = json.loads(get_full(order_service, order_id)['body'])
+
+    assert body['history'] == []
+    assert 'throttled' in body['meta']['errors']['history']
+    assert len(body['items']) == 1
+    assert get_full(order_service, 'missing')['statusCode'] == 404
@@ -0,0 +1,75 @@
+"""입고 주문 목록 조회 계획 (ReceivingOrderService.plan_order_query / get_receiving_orders)"""
+import json
+from datetime import datetime
+from decimal import Decimal
+
+from fake_aws import api_event
+
+
+def scheduled(day):
+    return Decimal(int(datetime(2026, 10, day, 9).timestamp()))
+
+
+def list_orders(order_service, **query):
+    response = order_service.lambda_handler(api_event('GET', '/receiving-orders', query=query), None)
+    assert response['statusCode'] == 200
+    return json.loads(response['body'])
+
+
+def test_date_only_fan_out_covers_every_written_status(order_service, aws):
+    table = aws.dynamodb.Table(order_service.RECEIVING_ORDER_TABLE)
+    for status in order_service.ORDER_STATUSES:
+        table.put_item(Item={'order_id': f'order-{status}', 'status': status, 'scheduled_date': scheduled(10)})
+    table.put_item(Item={'order_id': 'order-later', 'status': 'SCHEDULED', 'scheduled_date': scheduled(20)})
+
+    body = list_orders(order_service, from_date='2026-10-01', to_date='2026-10-15', limit='50')
+
+    assert body['meta']['plan']['fan_out'] == len(order_service.ORDER_STATUSES)
+    assert sorted(order['status'] for order in body['orders']) == sorted(order_service.ORDER_STATUSES)
+
+
+def test_fan_out_includes_transition_and_default_statuses(order_service):
+    statuses = set(order_service.ORDER_STATUSES)
+    assert order_service.DEFAULT_ORDER_STATUS in statuses
+    for target, sources in order_service.ORDER_TRANSITIONS.items():
+        assert target in statuses
+        assert set(sources) <= statuses
+
+
+def test_list_does_not_print_query_plan(order_service, aws, capsys):
+    list_orders(order_service, status='SCHEDULED')
+    assert 'query plan' not in capsys.readouterr().out
+
+
+def test_scan_pages_read_segments_concurrently(order_service, aws, monkeypatch):
+    table = aws.dynamodb.Table(order_service.RECEIVING_ORDER_TABLE)
+    order_ids = {f'order-{index:02d}' for index in range(23)}
+    for order_id in order_ids:
+        table.put_item(Item={'order_id': order_id, 'status': 'SCHEDULED', 'scheduled_date': scheduled(10)})
+
+    client = aws.dynamodb.meta.client
+    scan = client.scan
+    requests = []
+
+    def record_scan(**params):
+        requests.append(params)
+        return scan(**params)
+
+    monkeypatch.setattr(client, 'scan', record_scan)
+
+    seen = []
+    query = {'limit': '5'}
+    while True:
+        requests.clear()
+        body = list_orders(order_service, **query)
+        assert body['meta']['plan']['operation'] == 'scan'
+        assert len(body['orders']) <= 5
+        # 한 페이지에서 여러 세그먼트를 함께 읽고 요청 Limit 합계는 limit을 넘지 않음
+        assert len({params['Segment'] for params in requests}) > 1
+        assert sum(params['Limit'] for params in requests[:order_service.ORDER_SCAN_SEGMENTS]) <= 5
+        seen.extend(order['order_id'] for order in body['orders'])
+        if not body['next_token']:
+            break
+        query['next_token'] = body['next_token']
+
+    assert sorted(seen) == sorted(order_ids)
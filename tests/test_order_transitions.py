@@ -0,0 +1,113 @@
+"""주문 상태 전이 (ReceivingOrderService.transition_order_status) 및 공급업체 입고 이력 조회"""
+import json
+from decimal import Decimal
+
+from fake_aws import api_event
+
+
+def seed_order(order_service, aws, order_id='order-1', status='IN_PROGRESS', supplier_id='SUP-1'):
+    order = {'order_id': order_id, 'status': status, 'created_at': Decimal(1790000000), 'scheduled_date': Decimal(1790003600)}
+    if supplier_id:
+        order['supplier_id'] = supplier_id
+    aws.dynamodb.Table(order_service.RECEIVING_ORDER_TABLE).put_item(Item=order)
+    return order
+
+
+def order(order_service, aws, order_id='order-1'):
+    return aws.dynamodb.Table(order_service.RECEIVING_ORDER_TABLE).get_item(Key={'order_id': order_id})['Item']
+
+
+def history_rows(order_service, aws):
+    return list(aws.dynamodb.Table(order_service.RECEIVING_HISTORY_TABLE).items.values())
+
+
+def receive(order_service, order_id, body=None):
+    return order_service.lambda_handler(api_event(
+        'POST', f'/receiving-orders/{order_id}/receive', body or {'user_id': 'tester'},
+        path_params={'order_id': order_id}, resource='/receiving-orders/{order_id}/receive'), None)
+
+
+def change_status(order_service, order_id, status):
+    return order_service.lambda_handler(api_event(
+        'PUT', f'/receiving-orders/{order_id}/status', {'status': status, 'user_id': 'tester'},
+        path_params={'order_id': order_id}, resource='/receiving-orders/{order_id}/status'), None)
+
+
+def test_receive_completes_order_and_records_supplier_on_history(order_service, aws):
+    seed_order(order_service, aws)
+
+    response = receive(order_service, 'order-1')
+
+    assert response['statusCode'] == 200
+    assert json.loads(response['body'])['previous_status'] == 'IN_PROGRESS'
+    assert order(order_service, aws)['status'] == 'COMPLETED'
+    [row] = history_rows(order_service, aws)
+    assert row['event_type'] == 'RECEIVING_COMPLETED'
+    assert row['supplier_id'] == 'SUP-1'
+    assert row['event_time'].startswith('RECEIVING_COMPLETED#')
+
+
+def test_wrong_supplier_hint_is_corrected_from_current_item(order_service, aws):
+    seed_order(order_service, aws)
+
+    response = receive(order_service, 'order-1', {'user_id': 'tester', 'supplier_id': 'SUP-OTHER'})
+
+    assert response['statusCode'] == 200
+    assert history_rows(order_service, aws)[0]['supplier_id'] == 'SUP-1'
+
+
+def test_order_without_supplier_writes_history_without_supplier(order_service, aws):
+    seed_order(order_service, aws, supplier_id=None)
+
+    assert receive(order_service, 'order-1')['statusCode'] == 200
+    assert 'supplier_id' not in history_rows(order_service, aws)[0]
+
+
+def test_transition_from_second_allowed_status(order_service, aws):
+    seed_order(order_service, aws, status='IN_PROGRESS')
+
+    response = change_status(order_service, 'order-1', 'REJECTED')
+
+    assert response['statusCode'] == 200
+    assert json.loads(response['body'])['previous_status'] == 'IN_PROGRESS'
+    assert order(order_service, aws)['status'] == 'REJECTED'
+
+
+def test_disallowed_transition_is_rejected_without_writes(order_service, aws):
+    seed_order(order_service, aws, status='SCHEDULED')
+
+    response = change_status(order_service, 'order-1', 'COMPLETED')
+
+    assert response['statusCode'] == 409
+    assert json.loads(response['body'])['current_status'] == 'SCHEDULED'
+    assert order(order_service, aws)['status'] == 'SCHEDULED'
+    assert history_rows(order_service, aws) == []
+
+
+def test_completed_order_cannot_be_received_again(order_service, aws):
+    seed_order(order_service, aws, status='COMPLETED')
+    assert receive(order_service, 'order-1')['statusCode'] == 409
+
+
+def test_unknown_order_returns_404(order_service, aws):
+    assert receive(order_service, 'missing')['statusCode'] == 404
+
+
+def test_completed_order_appears_in_supplier_inbound_history(order_service, supplier_service, aws, monkeypatch):
+    # 두 서비스가 같은 이력 테이블을 사용
+    monkeypatch.setattr(supplier_service, 'RECEIVING_HISTORY_TABLE', order_service.RECEIVING_HISTORY_TABLE)
+    aws.dynamodb.Table(supplier_service.SUPPLIER_TABLE).put_item(
+        Item={'supplier_id': 'SUP-1', 'supplier_name': 'Acme', 'status': 'ACTIVE'})
+    seed_order(order_service, aws)
+    seed_order(order_service, aws, order_id='order-2', supplier_id='SUP-2')
+    assert receive(order_service, 'order-1')['statusCode'] == 200
+    assert receive(order_service, 'order-2')['statusCode'] == 200
+
+    response = supplier_service.lambda_handler(api_event(
+        'GET', '/suppliers/SUP-1/inbound-history', path_params={'supplier_id': 'SUP-1'},
+        resource='/suppliers/{supplier_id}/inbound-history'), None)
+
+    assert response['statusCode'] == 200
+    body = json.loads(response['body'])
+    assert [row['order_id'] for row in body['history']] == ['order-1']
+    assert body['history'][0]['new_status'] == 'COMPLETED'
@@ -0,0 +1,43 @@
+"""next_token 서명 / 범위 검증 (wms_common.pagination)"""
+import json
+
+import pytest
+
+from fake_aws import api_event
+from wms_common import pagination
+from wms_common.signing import SigningKeyError, sign_token
+
+
+def test_token_round_trip():
+    token = pagination.encode_token({'supplier_id': 'S1', 'status': 'ACTIVE'}, 'suppliers:abc', 'status-name-index')
+    cursor = pagination.decode_token(token, 'suppliers:abc', 'status-name-index')
+    assert cursor['key'] == {'supplier_id': 'S1', 'status': 'ACTIVE'}
+
+
+def test_token_from_another_query_is_rejected():
+    token = pagination.encode_token({'supplier_id': 'S1'}, 'suppliers:abc', 'status-name-index')
+    with pytest.raises(pagination.PaginationError):
+        pagination.decode_token(token, 'suppliers:def', 'status-name-index')
+
+
+def test_token_signed_with_old_default_secret_is_rejected():
+    forged = sign_token({'s': 'suppliers:abc', 'i': '', 'n': 0, 'k': {'supplier_id': {'S': 'S9'}}},
+                        b'wms-dev-pagination-secret')
+    with pytest.raises(pagination.PaginationError):
+        pagination.decode_token(forged, 'suppliers:abc')
+
+
+def test_missing_secret_fails_closed(monkeypatch):
+    token = pagination.encode_token({'supplier_id': 'S1'}, 'suppliers:abc')
+    monkeypatch.delenv('PAGINATION_TOKEN_SECRET')
+    with pytest.raises(SigningKeyError):
+        pagination.encode_token({'supplier_id': 'S1'}, 'suppliers:abc')
+    with pytest.raises(SigningKeyError):
+        pagination.decode_token(token, 'suppliers:abc')
+
+
+def test_list_endpoint_rejects_forged_cursor(supplier_service):
+    forged = sign_token({'s': 'x', 'i': '', 'n': 0, 'k': {}}, b'wms-dev-pagination-secret')
+    response = supplier_service.lambda_handler(api_event('GET', '/suppliers', query={'next_token': forged}), None)
+    assert response['statusCode'] == 400
+    assert json.loads(response['body'])['message'] == 'Invalid next_token'
@@ -0,0 +1,40 @@
+"""조건부 update_item 부분 수정 (wms_common.patch.apply_patch)"""
+import pytest
+
+from wms_common.patch import apply_patch, ItemNotFoundError, VersionConflictError
+
+
+@pytest.fixture
+def suppliers(supplier_service, aws):
+    table = aws.dynamodb.Table(supplier_service.SUPPLIER_TABLE)
+    table.put_item(Item={'supplier_id': 'sup-1', 'supplier_name': 'Acme', 'status': 'ACTIVE', 'version': 2})
+    return table
+
+
+def test_updated_item_comes_from_the_write(suppliers, aws):
+    old_item, new_item = apply_patch(suppliers, {'supplier_id': 'sup-1'}, {'status': 'INACTIVE'}, 2, timestamp=100)
+
+    assert old_item is None
+    assert (new_item['status'], new_item['supplier_name'], new_item['version'], new_item['updated_at']) == \
+        ('INACTIVE', 'Acme', 3, 100)
+    assert aws.dynamodb.count('UpdateItem') == 1
+    assert aws.dynamodb.count('GetItem') == 0
+
+
+def test_return_old_rebuilds_the_updated_item(suppliers):
+    old_item, new_item = apply_patch(suppliers, {'supplier_id': 'sup-1'}, {'supplier_name': 'Acme Co'},
+                                     timestamp=100, return_old=True)
+
+    assert old_item['supplier_name'] == 'Acme'
+    assert new_item == suppliers.get_item(Key={'supplier_id': 'sup-1'})['Item']
+
+
+def test_condition_failures_are_mapped_without_another_read(suppliers, aws):
+    with pytest.raises(VersionConflictError) as conflict:
+        apply_patch(suppliers, {'supplier_id': 'sup-1'}, {'status': 'INACTIVE'}, 1)
+    assert conflict.value.current_version == 2
+
+    with pytest.raises(ItemNotFoundError):
+        apply_patch(suppliers, {'supplier_id': 'missing'}, {'status': 'INACTIVE'})
+
+    assert aws.dynamodb.count('GetItem') == 0
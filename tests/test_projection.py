@@ -0,0 +1,60 @@
+"""fields= 파라미터 검증 / ProjectionExpression 생성 (wms_common.projection)"""
+import json
+
+import pytest
+
+from fake_aws import api_event
+from wms_common.projection import FieldSelectionError, build_projection, parse_fields, select_fields
+
+ALLOWED = {'order_id': ('order_id',), 'status': ('status',), 'sku_id': ('sku_number',), 'name': ('name',)}
+
+
+def test_missing_or_blank_fields_select_everything():
+    assert parse_fields({}, ALLOWED) is None
+    assert parse_fields({'fields': ' '}, ALLOWED) is None
+    assert build_projection(None, ALLOWED) == {}
+    assert build_projection(None, ALLOWED, names={'#st': 'status'}) == {'ExpressionAttributeNames': {'#st': 'status'}}
+
+
+def test_unknown_fields_are_rejected():
+    with pytest.raises(FieldSelectionError) as error:
+        parse_fields({'fields': 'status,password,secret'}, ALLOWED)
+
+    assert str(error.value).startswith('Unknown fields: password, secret')
+    assert error.value.status_code == 400
+
+
+def test_required_fields_are_added_once():
+    assert parse_fields({'fields': 'status, status,order_id'}, ALLOWED, required=('order_id',)) == ['status', 'order_id']
+    assert parse_fields({'fields': 'status'}, ALLOWED, required=('order_id',)) == ['status', 'order_id']
+
+
+def test_reserved_words_are_aliased_and_names_are_merged():
+    projection = build_projection(['status', 'name', 'sku_id'], ALLOWED, extra_attributes=('status', 'scheduled_date'),
+                                  names={'#status': 'status'})
+
+    # 예약어(status, name)를 포함한 모든 속성을 별칭으로 조회
+    assert projection['ProjectionExpression'] == '#pf0, #pf1, #pf2, #pf3'
+    assert projection['ExpressionAttributeNames'] == {
+        '#status': 'status', '#pf0': 'status', '#pf1': 'name', '#pf2': 'sku_number', '#pf3': 'scheduled_date'
+    }
+
+
+def test_select_fields_keeps_requested_keys_only():
+    record = {'order_id': 'o-1', 'status': 'SCHEDULED', 'sku_id': 'SKU-1'}
+
+    assert select_fields(record, ['status', 'order_id', 'name']) == {'status': 'SCHEDULED', 'order_id': 'o-1'}
+    assert select_fields(record, None) is record
+
+
+def test_order_list_applies_field_selection(order_service, aws):
+    aws.dynamodb.Table(order_service.RECEIVING_ORDER_TABLE).put_item(
+        Item={'order_id': 'order-1', 'status': 'SCHEDULED', 'supplier_name': 'Acme', 'sku_number': 'SKU-1'})
+
+    response = order_service.lambda_handler(api_event('GET', '/receiving-orders', query={'fields': 'status,sku_id'}), None)
+    assert response['statusCode'] == 200
+    assert json.loads(response['body'])['orders'] == [{'status': 'SCHEDULED', 'sku_id': 'SKU-1', 'order_id': 'order-1'}]
+
+    response = order_service.lambda_handler(api_event('GET', '/receiving-orders', query={'fields': 'status,cost'}), None)
+    assert response['statusCode'] == 400
+    assert json.loads(response['body'])['message'].startswith('Unknown fields: cost')
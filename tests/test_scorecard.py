@@ -0,0 +1,137 @@
+"""공급업체 스코어카드 집계 (EventBridgeIntegrationService / wms_common.scorecard)"""
+import json
+from decimal import Decimal
+
+import pytest
+
+from fake_aws import FakeContext, client_error
+from wms_common.batch import serialize_item
+
+
+def seed_order(eventbridge_service, aws, order_id='order-1', supplier_id='SUP-1'):
+    aws.dynamodb.Table(eventbridge_service.RECEIVING_ORDER_TABLE).put_item(Item={
+        'order_id': order_id, 'supplier_id': supplier_id, 'status': 'COMPLETED',
+        'scheduled_date': Decimal(1790000000), 'received_at': Decimal(1790003600)
+    })
+
+
+def bridge_event(detail_type, detail, event_id='eb-1', source='wms.receiving-service'):
+    return {'id': event_id, 'source': source, 'detail-type': detail_type, 'detail': detail}
+
+
+def counters(eventbridge_service, aws, supplier_id='SUP-1'):
+    item = aws.dynamodb.Table(eventbridge_service.SUPPLIER_SCORECARD_TABLE).get_item(
+        Key={'supplier_id': supplier_id, 'record_key': 'SCORECARD'}).get('Item', {})
+    return {name: int(value) for name, value in item.items() if name not in ('supplier_id', 'record_key', 'updated_at')}
+
+
+def test_redelivered_event_is_counted_once(eventbridge_service, aws):
+    seed_order(eventbridge_service, aws)
+    event = bridge_event('ReceivingCompleted', {'order_id': 'order-1', 'supplier_id': 'SUP-1'})
+
+    eventbridge_service.lambda_handler(event, FakeContext())
+    eventbridge_service.lambda_handler(event, FakeContext())
+
+    assert counters(eventbridge_service, aws)['completed_orders'] == 1
+
+
+def test_scorecard_failure_fails_the_invocation_for_retry(eventbridge_service, aws, monkeypatch):
+    seed_order(eventbridge_service, aws)
+    event = bridge_event('ReceivingCompleted', {'order_id': 'order-1', 'supplier_id': 'SUP-1'})
+    client = aws.dynamodb.meta.client
+    transact_write_items = client.transact_write_items
+
+    def throttled(**params):
+        raise client_error('ProvisionedThroughputExceededException', 'throttled', 'TransactWriteItems')
+
+    monkeypatch.setattr(client, 'transact_write_items', throttled)
+    with pytest.raises(Exception, match='throttled'):
+        eventbridge_service.lambda_handler(event, FakeContext())
+    assert counters(eventbridge_service, aws) == {}
+
+    # EventBridge 재시도 - 같은 이벤트 ID로 한 번만 집계
+    monkeypatch.setattr(client, 'transact_write_items', transact_write_items)
+    eventbridge_service.lambda_handler(event, FakeContext())
+    eventbridge_service.lambda_handler(event, FakeContext())
+    assert counters(eventbridge_service, aws)['completed_orders'] == 1
+
+
+def image_record(eventbridge_service, event_id, sequence, old_image, new_image):
+    return {
+        'eventID': event_id,
+        'eventName': 'MODIFY',
+        'eventSource': 'aws:dynamodb',
+        'eventSourceARN': f'arn:aws:dynamodb:us-east-2:123456789012:table/{eventbridge_service.RECEIVING_ORDER_TABLE}/stream/2026',
+        'dynamodb': {
+            'SequenceNumber': sequence,
+            'OldImage': serialize_item(old_image),
+            'NewImage': serialize_item(new_image)
+        }
+    }
+
+
+def stream_record(eventbridge_service, event_id, sequence, old_status, new_status):
+    image = {'order_id': 'order-1', 'supplier_id': 'SUP-1', 'scheduled_date': Decimal(1790000000),
+             'received_at': Decimal(1790003600), 'updated_at': Decimal(1790003600)}
+    return image_record(eventbridge_service, event_id, sequence, {**image, 'status': old_status}, {**image, 'status': new_status})
+
+
+def deliver_published(eventbridge_service, aws):
+    """발행된 이벤트를 EventBridge가 전달한 것처럼 처리 (매번 새 EventBridge ID)"""
+    for index, entry in enumerate(aws.events.entries):
+        eventbridge_service.lambda_handler(bridge_event(
+            entry['DetailType'], json.loads(entry['Detail']), event_id=f'eb-{index}', source=entry['Source']), FakeContext())
+
+
+def test_declined_verification_counts_one_rejection(eventbridge_service, aws):
+    seed_order(eventbridge_service, aws)
+    orders = aws.dynamodb.Table(eventbridge_service.RECEIVING_ORDER_TABLE)
+    orders.put_item(Item=dict(orders.get_item(Key={'order_id': 'order-1'})['Item'], status='IN_PROGRESS'))
+    before = orders.get_item(Key={'order_id': 'order-1'})['Item']
+    verification = bridge_event('DocumentVerificationCompleted', {
+        'order_id': 'order-1', 'supplier_id': 'SUP-1', 'verification_status': 'DECLINED'
+    }, event_id='eb-verify', source='wms.verification-service')
+
+    # 검증 이벤트가 재시도되어도 거부 이벤트는 직접 발행하지 않음
+    eventbridge_service.lambda_handler(verification, FakeContext())
+    eventbridge_service.lambda_handler(verification, FakeContext())
+    assert aws.events.entries == []
+    after = orders.get_item(Key={'order_id': 'order-1'})['Item']
+    assert after['status'] == 'REJECTED'
+
+    # 상태 변경으로 생긴 스트림 레코드 (두 번째 수정은 상태가 같아 발행 없음)
+    eventbridge_service.lambda_handler({'Records': [
+        image_record(eventbridge_service, 'stream-rejected', '300', before, after),
+        image_record(eventbridge_service, 'stream-repeat', '301', after, after)
+    ]}, FakeContext())
+    rejections = [json.loads(entry['Detail']) for entry in aws.events.entries if entry['DetailType'] == 'ReceivingRejected']
+    assert [(detail['event_id'], detail['reason']) for detail in rejections] == [
+        ('stream-rejected', 'Document verification declined')]
+    deliver_published(eventbridge_service, aws)
+
+    result = counters(eventbridge_service, aws)
+    assert result['rejected_orders'] == 1
+    assert (result['documents_verified'], result['documents_declined']) == (1, 1)
+
+
+def test_redelivered_stream_record_is_counted_once(eventbridge_service, aws):
+    seed_order(eventbridge_service, aws)
+    record = stream_record(eventbridge_service, 'stream-1', '100', 'IN_PROGRESS', 'COMPLETED')
+
+    eventbridge_service.lambda_handler({'Records': [record]}, FakeContext())
+    eventbridge_service.lambda_handler({'Records': [record]}, FakeContext())
+
+    published = [json.loads(entry['Detail']) for entry in aws.events.entries]
+    assert [detail['event_id'] for detail in published] == ['stream-1', 'stream-1']
+    deliver_published(eventbridge_service, aws)
+    assert counters(eventbridge_service, aws)['completed_orders'] == 1
+
+
+def test_failed_publish_reports_stream_record_for_redelivery(eventbridge_service, aws, monkeypatch):
+    record = stream_record(eventbridge_service, 'stream-2', '200', 'IN_PROGRESS', 'REJECTED')
+    monkeypatch.setattr(aws.events, 'put_events', lambda Entries: {
+        'FailedEntryCount': 1, 'Entries': [{'ErrorCode': 'InternalFailure', 'ErrorMessage': 'try again'}]})
+
+    response = eventbridge_service.lambda_handler({'Records': [record]}, FakeContext())
+
+    assert response['batchItemFailures'] == [{'itemIdentifier': '200'}]
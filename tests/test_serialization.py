@@ -0,0 +1,56 @@
+"""응답 본문 JSON 직렬화 (wms_common.serialization.dumps)"""
+import json
+from decimal import Decimal
+
+from wms_common.serialization import dumps
+
+
+def test_integers_and_representable_decimals_become_json_numbers():
+    body = json.loads(dumps({'scheduled_date': Decimal(1790000000), 'weight': Decimal('12.5'), 'count': Decimal('1E+2')}))
+
+    assert body == {'scheduled_date': 1790000000, 'weight': 12.5, 'count': 100}
+    assert isinstance(body['scheduled_date'], int)
+
+
+def test_high_precision_decimals_are_exact_json_numbers():
+    precise = Decimal('12345.678901234567890123')
+    text = dumps({'volume': precise, 'dims': [Decimal('0.1000000000000000055511151231257827'), precise]})
+
+    assert '12345.678901234567890123' in text and '"12345.678901234567890123"' not in text
+    body = json.loads(text, parse_float=Decimal)
+    assert body['volume'] == precise
+    assert body['dims'] == [Decimal('0.1000000000000000055511151231257827'), precise]
+
+
+def test_marker_text_in_strings_is_left_alone():
+    precise = Decimal('1.00000000000000000001')
+    body = json.loads(dumps({'notes': ':0', 'qty': precise}, sort_keys=True), parse_float=Decimal)
+
+    assert body == {'notes': ':0', 'qty': precise}
+
+
+def test_exact_numbers_without_orjson(monkeypatch):
+    from wms_common import serialization
+    monkeypatch.setattr(serialization, 'HAS_ORJSON', False)
+    precise = Decimal('98765.432109876543210987')
+
+    assert dumps({'qty': precise, 'count': Decimal(3)}) == '{"qty": 98765.432109876543210987, "count": 3}'
+
+
+def test_many_exact_numbers_keep_their_positions(monkeypatch):
+    from wms_common import serialization
+    monkeypatch.setattr(serialization, 'HAS_ORJSON', False)
+    values = [Decimal(f'{index}.00000000000000000001') for index in range(150)]
+
+    assert json.loads(dumps({'values': values}), parse_float=Decimal)['values'] == values
+
+
+def test_short_decimals_take_the_float_path():
+    body = json.loads(dumps([Decimal('12.0'), Decimal('-0.000123'), Decimal('123456789.012345'), Decimal('-7')]))
+
+    assert body == [12, -0.000123, 123456789.012345, -7]
+    assert isinstance(body[0], int)
+
+
+def test_sets_are_encoded_as_lists():
+    assert json.loads(dumps({'tags': {'fragile'}})) == {'tags': ['fragile']}
@@ -0,0 +1,86 @@
+"""공급업체 일괄 조회 (SupplierService.batch_get_supplier_details - 100개 단위 BatchGetItem)"""
+import json
+
+import pytest
+
+from fake_aws import api_event
+from wms_common import batch
+
+
+@pytest.fixture(autouse=True)
+def dynamodb_only(supplier_service, monkeypatch):
+    """스냅샷 없이 BatchGetItem 경로만 사용"""
+    monkeypatch.setattr(supplier_service, 'SUPPLIER_SNAPSHOT_BUCKET', None)
+    monkeypatch.setattr(batch, 'backoff_sleep', lambda attempt: None)
+
+
+def seed(supplier_service, aws, count):
+    table = aws.dynamodb.Table(supplier_service.SUPPLIER_TABLE)
+    for index in range(count):
+        table.put_item(Item={'supplier_id': f'S{index:04d}', 'supplier_name': f'Supplier {index}', 'status': 'ACTIVE'})
+
+
+def batch_get(supplier_service, supplier_ids):
+    response = supplier_service.lambda_handler(api_event('POST', '/suppliers/batch-get', {'supplier_ids': supplier_ids}), None)
+    return response['statusCode'], json.loads(response['body'])
+
+
+def test_keys_are_chunked_at_100(supplier_service, aws, monkeypatch):
+    seed(supplier_service, aws, 250)
+    client = aws.dynamodb.meta.client
+    get = client.batch_get_item
+    chunk_sizes = []
+
+    def record_chunk(RequestItems):
+        chunk_sizes.append(len(RequestItems[supplier_service.SUPPLIER_TABLE]['Keys']))
+        return get(RequestItems=RequestItems)
+
+    monkeypatch.setattr(client, 'batch_get_item', record_chunk)
+    status, body = batch_get(supplier_service, [f'S{index:04d}' for index in range(250)])
+
+    assert status == 200
+    assert sorted(chunk_sizes) == [50, 100, 100]
+    assert body['count'] == 250
+
+
+def test_results_follow_request_order_without_duplicates(supplier_service, aws):
+    seed(supplier_service, aws, 5)
+
+    status, body = batch_get(supplier_service, ['S0003', 'S0000', 'missing', 'S0003', 'S0004'])
+
+    assert status == 200
+    assert [supplier['supplier_id'] for supplier in body['suppliers']] == ['S0003', 'S0000', 'S0004']
+    assert (body['not_found'], body['unprocessed']) == (['missing'], [])
+
+
+def test_unprocessed_keys_are_not_reported_as_not_found(supplier_service, aws, monkeypatch):
+    seed(supplier_service, aws, 3)
+    client = aws.dynamodb.meta.client
+    get = client.batch_get_item
+
+    def throttle_s0001(RequestItems):
+        # S0001은 재시도해도 계속 미처리로 반환
+        (table_name, request), = RequestItems.items()
+        keys = [key for key in request['Keys'] if key['supplier_id'] != {'S': 'S0001'}]
+        response = get(RequestItems={table_name: dict(request, Keys=keys)})
+        if len(keys) < len(request['Keys']):
+            response['UnprocessedKeys'] = {table_name: {'Keys': [{'supplier_id': {'S': 'S0001'}}]}}
+        return response
+
+    monkeypatch.setattr(client, 'batch_get_item', throttle_s0001)
+    status, body = batch_get(supplier_service, ['S0000', 'S0001', 'S0002', 'gone'])
+
+    assert status == 200
+    assert [supplier['supplier_id'] for supplier in body['suppliers']] == ['S0000', 'S0002']
+    assert body['unprocessed'] == ['S0001']
+    assert body['not_found'] == ['gone']
+
+
+def test_invalid_and_oversized_requests(supplier_service, monkeypatch):
+    assert batch_get(supplier_service, 'S0000')[0] == 400
+    assert batch_get(supplier_service, ['S0000', ''])[0] == 400
+
+    monkeypatch.setattr(supplier_service, 'MAX_BATCH_GET_IDS', 2)
+    assert batch_get(supplier_service, ['a', 'b', 'c'])[0] == 413
+    # 중복 제거 후 개수로 판단
+    assert batch_get(supplier_service, ['a', 'b', 'a'])[0] == 200
@@ -0,0 +1,127 @@
+"""공급업체 일괄 등록 (SupplierService.import_suppliers - JSON 배열 / NDJSON / CSV, 25개 단위 BatchWriteItem)"""
+import json
+
+import pytest
+
+from fake_aws import api_event, client_error
+from wms_common import batch
+
+
+@pytest.fixture(autouse=True)
+def no_backoff(monkeypatch):
+    monkeypatch.setattr(batch, 'backoff_sleep', lambda attempt: None)
+
+
+def supplier_row(index, **fields):
+    row = {'supplier_name': f'Supplier {index}', 'contact_email': f's{index}@example.com', 'contact_phone': '010-0000-0000'}
+    row.update(fields)
+    return row
+
+
+def import_rows(supplier_service, body, content_type='application/json'):
+    event = api_event('POST', '/suppliers/batch', body=body, headers={'Content-Type': content_type})
+    response = supplier_service.lambda_handler(event, None)
+    return response['statusCode'], json.loads(response['body'])
+
+
+def stored_names(supplier_service, aws):
+    table = aws.dynamodb.Table(supplier_service.SUPPLIER_TABLE)
+    return sorted(item['supplier_name'] for item in table.scan()['Items'])
+
+
+def test_json_array_and_wrapped_object(supplier_service, aws):
+    status, body = import_rows(supplier_service, [supplier_row(1), supplier_row(2)])
+    assert (status, body['summary']) == (200, {'total': 2, 'created': 2, 'invalid': 0, 'failed': 0})
+
+    status, body = import_rows(supplier_service, {'suppliers': [supplier_row(3)]})
+    assert (status, body['summary']['created']) == (200, 1)
+    assert stored_names(supplier_service, aws) == ['Supplier 1', 'Supplier 2', 'Supplier 3']
+
+    status, body = import_rows(supplier_service, '"not a list"')
+    assert (status, body['message']) == (400, 'Body must be a JSON array of suppliers')
+
+
+def test_ndjson_reports_bad_lines_by_line_number(supplier_service, aws):
+    lines = [json.dumps(supplier_row(1)), '', '{"supplier_name": ', json.dumps(supplier_row(2))]
+
+    status, body = import_rows(supplier_service, '\n'.join(lines), 'application/x-ndjson')
+
+    assert status == 200
+    assert body['summary'] == {'total': 3, 'created': 2, 'invalid': 1, 'failed': 0}
+    invalid = [result for result in body['results'] if result['status'] == 'INVALID']
+    assert invalid[0]['row'] == 3
+    assert invalid[0]['errors'][0].startswith('Invalid JSON')
+
+
+def test_csv_rows_are_validated_per_row(supplier_service, aws):
+    csv_body = '\n'.join([
+        'supplier_name,contact_email,contact_phone,address',
+        'Acme,acme@example.com,010-1111-2222,Seoul',
+        ',missing@example.com,010-3333-4444,Busan',
+        'Globex,globex@example.com,010-5555-6666,'
+    ])
+
+    status, body = import_rows(supplier_service, csv_body, 'text/csv')
+
+    assert status == 200
+    assert [result['status'] for result in body['results']] == ['CREATED', 'INVALID', 'CREATED']
+    assert body['results'][1] == {'row': 2, 'status': 'INVALID', 'errors': ['Missing required field: supplier_name']}
+    assert stored_names(supplier_service, aws) == ['Acme', 'Globex']
+
+
+def test_non_string_fields_are_invalid(supplier_service, aws):
+    status, body = import_rows(supplier_service, [supplier_row(1, contact_phone=1012345678), 'oops'])
+
+    assert status == 200
+    assert body['results'][0]['errors'] == ['Field must be a string: contact_phone']
+    assert body['results'][1]['errors'] == ['Row must be an object']
+    assert stored_names(supplier_service, aws) == []
+
+
+def test_unprocessed_items_are_retried(supplier_service, aws, monkeypatch):
+    client = aws.dynamodb.meta.client
+    write = client.batch_write_item
+    calls = []
+
+    def throttle_half(RequestItems):
+        # 첫 요청마다 절반만 처리하고 나머지는 UnprocessedItems로 반환
+        calls.append(RequestItems)
+        (table_name, requests), = RequestItems.items()
+        if len(calls) > 1 or table_name != supplier_service.SUPPLIER_TABLE:
+            return write(RequestItems=RequestItems)
+        half = len(requests) // 2
+        write(RequestItems={table_name: requests[:half]})
+        return {'UnprocessedItems': {table_name: requests[half:]}}
+
+    monkeypatch.setattr(client, 'batch_write_item', throttle_half)
+    status, body = import_rows(supplier_service, [supplier_row(index) for index in range(10)])
+
+    assert (status, body['summary']['created'], body['summary']['failed']) == (200, 10, 0)
+    assert len(stored_names(supplier_service, aws)) == 10
+    # 재시도 요청에는 미처리 항목만 포함
+    assert len(calls[1][supplier_service.SUPPLIER_TABLE]) == 5
+
+
+def test_failed_chunk_is_reported_per_row(supplier_service, aws, monkeypatch):
+    client = aws.dynamodb.meta.client
+    write = client.batch_write_item
+    chunks = []
+
+    def reject_second_chunk(RequestItems):
+        (table_name, _), = RequestItems.items()
+        if table_name == supplier_service.SUPPLIER_TABLE:
+            chunks.append(RequestItems)
+            if len(chunks) == 2:
+                raise client_error('ValidationException', 'Item size has exceeded the maximum allowed size', 'BatchWriteItem')
+        return write(RequestItems=RequestItems)
+
+    monkeypatch.setattr(supplier_service, 'IMPORT_WRITE_WORKERS', 1)
+    monkeypatch.setattr(client, 'batch_write_item', reject_second_chunk)
+    status, body = import_rows(supplier_service, [supplier_row(index) for index in range(30)])
+
+    assert status == 200
+    assert body['summary'] == {'total': 30, 'created': 25, 'invalid': 0, 'failed': 5}
+    failed = [result for result in body['results'] if result['status'] == 'FAILED']
+    assert [result['row'] for result in failed] == [26, 27, 28, 29, 30]
+    assert all(result['error'] == 'ValidationException' and 'supplier_id' not in result for result in failed)
+    assert len(stored_names(supplier_service, aws)) == 25
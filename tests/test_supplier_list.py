@@ -0,0 +1,68 @@
+"""공급업체 목록 조회 (SupplierService.get_suppliers - 상태 인덱스 / 이름 검색 페이지네이션)"""
+import json
+
+from fake_aws import api_event
+from test_supplier_search import seed_suppliers
+
+
+def list_suppliers(supplier_service, **query):
+    response = supplier_service.lambda_handler(api_event('GET', '/suppliers', query=query), None)
+    return response['statusCode'], json.loads(response['body'])
+
+
+def read_all_pages(supplier_service, **query):
+    ids = []
+    while True:
+        status, body = list_suppliers(supplier_service, **query)
+        assert status == 200
+        ids.extend(supplier['supplier_id'] for supplier in body['suppliers'])
+        if not body['next_token']:
+            return ids
+        query['next_token'] = body['next_token']
+
+
+def seed_statuses(supplier_service, aws):
+    table = aws.dynamodb.Table(supplier_service.SUPPLIER_TABLE)
+    for index, status in enumerate(['ACTIVE', 'INACTIVE', 'DELETED', 'ACTIVE', 'INACTIVE']):
+        table.put_item(Item={'supplier_id': f'S{index}', 'supplier_name': f'Supplier {index}', 'status': status})
+
+
+def test_default_lists_active_suppliers(supplier_service, aws):
+    seed_statuses(supplier_service, aws)
+
+    assert sorted(read_all_pages(supplier_service, limit='1')) == ['S0', 'S3']
+
+
+def test_all_statuses_are_paged_across_the_index(supplier_service, aws):
+    seed_statuses(supplier_service, aws)
+
+    ids = read_all_pages(supplier_service, status='all', limit='2')
+
+    assert sorted(ids) == ['S0', 'S1', 'S2', 'S3', 'S4']
+
+
+def test_unknown_status_is_rejected(supplier_service, aws):
+    status, body = list_suppliers(supplier_service, status='PENDING')
+    assert status == 400
+    assert body['message'].startswith('status must be one of')
+
+
+def test_name_search_pages_in_rank_order(supplier_service, aws):
+    seed_suppliers(supplier_service, aws, ['Acme', 'Acme Tools', 'Acme Parts', 'Best Acme'])
+
+    first_status, first = list_suppliers(supplier_service, supplier_name='acme', limit='2')
+    ids = read_all_pages(supplier_service, supplier_name='acme', limit='2')
+
+    assert first_status == 200
+    assert first['count'] == 2 and first['next_token']
+    # 정확히 일치 -> 이름 접두어 일치 -> 단어 접두어 일치 순서가 페이지를 넘어 유지됨
+    assert ids == ['S0000', 'S0002', 'S0001', 'S0003']
+
+
+def test_search_token_is_bound_to_the_query(supplier_service, aws):
+    seed_suppliers(supplier_service, aws, ['Acme', 'Acme Tools'])
+    _, body = list_suppliers(supplier_service, supplier_name='acme', limit='1')
+
+    status, _ = list_suppliers(supplier_service, supplier_name='best', next_token=body['next_token'])
+
+    assert status == 400
@@ -0,0 +1,79 @@
+"""공급업체 이름 검색 (SupplierService.search_suppliers_by_name)"""
+import json
+
+from fake_aws import api_event
+
+
+def seed_suppliers(supplier_service, aws, names):
+    suppliers = aws.dynamodb.Table(supplier_service.SUPPLIER_TABLE)
+    search = aws.dynamodb.Table(supplier_service.SUPPLIER_SEARCH_TABLE)
+    for index, name in enumerate(names):
+        supplier = {'supplier_id': f'S{index:04d}', 'supplier_name': name, 'status': 'ACTIVE'}
+        suppliers.put_item(Item=supplier)
+        for row in supplier_service.build_search_rows(supplier):
+            search.put_item(Item=row)
+
+
+def search(supplier_service, name, limit=None):
+    query = {'supplier_name': name}
+    if limit:
+        query['limit'] = str(limit)
+    response = supplier_service.lambda_handler(api_event('GET', '/suppliers', query=query), None)
+    assert response['statusCode'] == 200
+    return [supplier['supplier_name'] for supplier in json.loads(response['body'])['suppliers']]
+
+
+def test_name_prefix_match_beyond_first_candidate_page(supplier_service, aws):
+    # 'industries' 파티션 앞쪽 300행 뒤에 있는 이름도 sort_key 접두어 조건으로 바로 찾음
+    seed_suppliers(supplier_service, aws, [f'Industries {index:03d}' for index in range(300)] + ['Industries Zulu'])
+
+    assert search(supplier_service, 'industries zu') == ['Industries Zulu']
+
+
+def test_word_prefix_match_reads_within_cap(supplier_service, aws):
+    seed_suppliers(supplier_service, aws, [f'Industries {index:03d}' for index in range(300)] + ['Industries Zulu'])
+
+    assert search(supplier_service, 'zulu industries') == ['Industries Zulu']
+
+
+def test_word_prefix_match_is_bounded_for_short_queries(supplier_service, aws, monkeypatch):
+    monkeypatch.setattr(supplier_service, 'SEARCH_PAGE_SIZE', 20)
+    monkeypatch.setattr(supplier_service, 'SEARCH_WORD_MATCH_MAX_ROWS', 50)
+    seed_suppliers(supplier_service, aws, [f'Zeta Industries {index:03d}' for index in range(300)])
+    queries_before = aws.dynamodb.count('Query')
+
+    # 'i' 파티션 300행 중 상한(50행, 20행씩 3페이지)만 읽고 그 안에서 순위를 매김
+    results = search(supplier_service, 'i', limit=5)
+
+    assert results == [f'Zeta Industries {index:03d}' for index in range(5)]
+    assert aws.dynamodb.count('Query') - queries_before == 2 + 3
+
+
+def test_search_index_sync_failure_is_logged(supplier_service, aws, monkeypatch, capsys):
+    search_table = aws.dynamodb.Table(supplier_service.SUPPLIER_SEARCH_TABLE)
+
+    def unavailable():
+        raise RuntimeError('throttled')
+
+    monkeypatch.setattr(search_table, 'batch_writer', unavailable)
+    response = supplier_service.lambda_handler(api_event('POST', '/suppliers', {
+        'supplier_name': 'Acme', 'contact_email': 'acme@example.com', 'contact_phone': '010-0000-0000'
+    }), None)
+
+    assert response['statusCode'] == 201
+    errors = [json.loads(line) for line in capsys.readouterr().out.splitlines() if '"ERROR"' in line]
+    assert [(record['message'], record['error']) for record in errors] == [('supplier search index sync failed', 'throttled')]
+
+
+def test_results_are_ranked_exact_then_name_prefix_then_word_prefix(supplier_service, aws):
+    seed_suppliers(supplier_service, aws, ['Global Acme', 'Acme Corp', 'Acme', 'Acme Anvils', 'Acmeco'])
+
+    assert search(supplier_service, 'ACME') == ['Acme', 'Acme Anvils', 'Acme Corp', 'Acmeco', 'Global Acme']
+    assert search(supplier_service, 'acme', limit=2) == ['Acme', 'Acme Anvils']
+
+
+def test_every_query_word_must_match(supplier_service, aws):
+    seed_suppliers(supplier_service, aws, ['Acme Corp', 'Acme Tools', 'Tools Direct'])
+
+    assert search(supplier_service, 'tools acme') == ['Acme Tools']
+    assert search(supplier_service, 'acme widgets') == []
@@ -0,0 +1,125 @@
+"""공급업체 스냅샷 버전 / 변경 이력 (SupplierService)"""
+import json
+
+import pytest
+
+from fake_aws import api_event
+
+
+@pytest.fixture
+def snapshot(supplier_service, monkeypatch):
+    """모듈 전역 스냅샷 캐시를 테스트마다 초기화하고 매 조회마다 버전 확인"""
+    state = {'version': None, 'suppliers': {}, 'checked_at': 0}
+    monkeypatch.setattr(supplier_service, '_supplier_snapshot', state)
+    monkeypatch.setattr(supplier_service, 'SUPPLIER_SNAPSHOT_MAX_AGE', -1)
+    return state
+
+
+def meta(supplier_service, aws):
+    return aws.dynamodb.Table(supplier_service.SUPPLIER_SEARCH_TABLE).get_item(Key=supplier_service.SNAPSHOT_META_KEY)['Item']
+
+
+def create_supplier(supplier_service, name):
+    response = supplier_service.lambda_handler(api_event('POST', '/suppliers', {
+        'supplier_name': name, 'contact_email': f'{name.lower()}@example.com', 'contact_phone': '010-0000-0000'
+    }), None)
+    assert response['statusCode'] == 201
+    return json.loads(response['body'])['supplier']['supplier_id']
+
+
+def test_bump_appends_to_change_log(supplier_service, aws, snapshot):
+    first = create_supplier(supplier_service, 'Acme')
+    second = create_supplier(supplier_service, 'Beta')
+
+    item = meta(supplier_service, aws)
+    assert (item['version'], item['base_version'], item['changes']) == (2, 0, [first, second])
+
+
+def test_full_change_log_is_reset_instead_of_growing(supplier_service, aws, snapshot, monkeypatch):
+    monkeypatch.setattr(supplier_service, 'SUPPLIER_SNAPSHOT_MAX_CHANGES', 3)
+    for index in range(5):
+        supplier_service.bump_supplier_snapshot_version(f'S{index}')
+
+    item = meta(supplier_service, aws)
+    assert item['version'] == 5
+    assert item['base_version'] == 4
+    assert item['changes'] == ['S4']
+
+
+def test_rebuild_compacts_change_log(supplier_service, aws, snapshot):
+    create_supplier(supplier_service, 'Acme')
+    create_supplier(supplier_service, 'Beta')
+
+    response = supplier_service.lambda_handler({'action': 'rebuild_supplier_snapshot'}, None)
+
+    assert response['statusCode'] == 200
+    item = meta(supplier_service, aws)
+    # 재생성도 버전 하나를 사용 -> base_version이 웜 컨테이너 버전보다 커져 전체 다시 로드
+    assert (item['version'], item['base_version'], item['changes']) == (3, 3, [])
+
+
+def test_compaction_keeps_changes_made_after_the_snapshot(supplier_service, aws, snapshot):
+    for supplier_id in ('S1', 'S2', 'S3'):
+        supplier_service.bump_supplier_snapshot_version(supplier_id)
+
+    # 버전 2에서 만든 스냅샷 - 이후 변경(S3)은 유지
+    supplier_service.compact_snapshot_changes(aws.dynamodb.Table(supplier_service.SUPPLIER_SEARCH_TABLE), 2)
+
+    item = meta(supplier_service, aws)
+    assert (item['version'], item['base_version'], item['changes']) == (3, 2, ['S3'])
+
+
+def test_reader_applies_changes_and_falls_back_after_reset(supplier_service, aws, snapshot, monkeypatch):
+    supplier_id = create_supplier(supplier_service, 'Acme')
+    supplier_service.rebuild_supplier_snapshot()
+    assert supplier_service.get_snapshot_supplier(supplier_id)['supplier_name'] == 'Acme'
+
+    # 변경 이력 초기화 후에는 오래된 스냅샷을 쓰지 않고 DynamoDB 조회로 대체
+    monkeypatch.setattr(supplier_service, 'SUPPLIER_SNAPSHOT_MAX_CHANGES', 0)
+    supplier_service.bump_supplier_snapshot_version(supplier_id)
+    assert supplier_service.get_snapshot_supplier(supplier_id) is None
+    assert supplier_service.lookup_supplier(supplier_id)['supplier_name'] == 'Acme'
+
+    supplier_service.rebuild_supplier_snapshot()
+    assert supplier_service.get_snapshot_supplier(supplier_id)['supplier_name'] == 'Acme'
+
+
+def update_supplier(supplier_service, supplier_id, name):
+    response = supplier_service.lambda_handler(api_event(
+        'PUT', f'/suppliers/{supplier_id}', {'supplier_name': name},
+        path_params={'supplier_id': supplier_id}, resource='/suppliers/{supplier_id}'), None)
+    assert response['statusCode'] == 200
+
+
+def test_bump_failure_after_commit_keeps_the_success_response(supplier_service, aws, snapshot, monkeypatch, capsys):
+    supplier_id = create_supplier(supplier_service, 'Acme')
+    supplier_service.rebuild_supplier_snapshot()
+    assert supplier_service.get_snapshot_supplier(supplier_id)['supplier_name'] == 'Acme'
+
+    search_table = aws.dynamodb.Table(supplier_service.SUPPLIER_SEARCH_TABLE)
+    update_item = search_table.update_item
+
+    def failing_update(**params):
+        if params['Key'] == supplier_service.SNAPSHOT_META_KEY:
+            raise RuntimeError('throttled')
+        return update_item(**params)
+
+    monkeypatch.setattr(search_table, 'update_item', failing_update)
+
+    # 공급업체는 이미 저장됨 - 500으로 응답하면 재시도가 중복 생성 / 수정을 만듦
+    created_id = create_supplier(supplier_service, 'Beta')
+    update_supplier(supplier_service, supplier_id, 'Acme Renamed')
+
+    assert len(aws.dynamodb.Table(supplier_service.SUPPLIER_TABLE).items) == 2
+    errors = [json.loads(line) for line in capsys.readouterr().out.splitlines()
+              if line.startswith('{') and '"ERROR"' in line]
+    assert [(record['message'], record['supplier_id']) for record in errors] == [
+        ('supplier snapshot change not recorded', created_id),
+        ('supplier snapshot change not recorded', supplier_id)]
+    assert supplier_service.get_snapshot_supplier(supplier_id)['supplier_name'] == 'Acme'
+
+    # 예약된 재생성 후 웜 컨테이너가 전체 다시 로드해 놓친 변경 반영
+    monkeypatch.setattr(search_table, 'update_item', update_item)
+    supplier_service.rebuild_supplier_snapshot()
+    assert supplier_service.get_snapshot_supplier(supplier_id)['supplier_name'] == 'Acme Renamed'
+    assert supplier_service.get_snapshot_supplier(created_id)['supplier_name'] == 'Beta'
@@ -0,0 +1,99 @@
+"""업로드 세션 토큰 검증 (wms_common.uploads / DocumentService finalize)"""
+import json
+
+import pytest
+
+from fake_aws import api_event
+from wms_common import uploads
+from wms_common.signing import SigningKeyError, sign_token
+
+
+def create_session(s3, order_id='order-1', file_name='invoice.pdf'):
+    return uploads.create_upload_session(s3, 'documents', order_id, 'INVOICE', file_name, 'application/pdf', 1024, 'tester')
+
+
+def test_session_round_trip(aws):
+    created = create_session(aws.s3)
+    session = uploads.read_upload_session(created['session_token'])
+    assert session['document_id'] == created['document_id']
+    assert session['s3_key'] == f"order-1/invoice/{created['document_id']}.pdf"
+
+
+@pytest.mark.parametrize('file_name, extension', [
+    ('scan.PDF', 'PDF'),
+    ('archive.tar.gz', 'gz'),
+    ('invoice.pdf/../../other-order/x', ''),
+    ('photo.jpeg?versionId=1', ''),
+    ('notes.averyverylongext', ''),
+    ('README', ''),
+])
+def test_s3_key_extension_is_restricted(file_name, extension):
+    assert uploads.build_s3_key('order-1', 'INVOICE', 'doc-1', file_name) == f'order-1/invoice/doc-1.{extension}'
+
+
+def test_tampered_token_is_rejected(aws):
+    created = create_session(aws.s3)
+    payload, signature = created['session_token'].split('.')
+    with pytest.raises(uploads.UploadSessionError):
+        uploads.read_upload_session(payload[:-2] + 'xx.' + signature)
+
+
+def test_foreign_s3_key_is_rejected_even_when_signed(aws):
+    # 서명이 맞아도 세션 정보로 계산한 키와 다르면 거부 (다른 주문 / 임의 객체 지정 방지)
+    session = uploads.read_upload_session(create_session(aws.s3)['session_token'])
+    session['s3_key'] = 'other-order/invoice/secret.pdf'
+    token = sign_token(session, b'test-upload-session-secret')
+    with pytest.raises(uploads.UploadSessionError):
+        uploads.read_upload_session(token)
+
+
+def test_token_signed_with_old_default_secret_is_rejected(aws):
+    session = uploads.read_upload_session(create_session(aws.s3)['session_token'])
+    token = sign_token(session, b'wms-dev-upload-session-secret')
+    with pytest.raises(uploads.UploadSessionError):
+        uploads.read_upload_session(token)
+
+
+def test_missing_secret_fails_closed(aws, monkeypatch):
+    token = create_session(aws.s3)['session_token']
+    monkeypatch.delenv('UPLOAD_SESSION_SECRET')
+    with pytest.raises(SigningKeyError):
+        uploads.read_upload_session(token)
+    with pytest.raises(SigningKeyError):
+        create_session(aws.s3)
+
+
+def test_finalize_stores_metadata_for_uploaded_object(document_service, aws):
+    created = create_session(aws.s3)
+    session = uploads.read_upload_session(created['session_token'])
+    aws.s3.put_object(Bucket='documents', Key=session['s3_key'], Body=b'x' * 1024)
+
+    response = document_service.finalize_document_upload(
+        api_event('POST', '/documents/upload-sessions/finalize', {'session_token': created['session_token']}))
+
+    assert response['statusCode'] == 201
+    stored = aws.dynamodb.Table('document-metadata').get_item(Key={'document_id': created['document_id']})['Item']
+    assert stored['s3_key'] == session['s3_key']
+    assert stored['size_bytes'] == 1024
+
+
+def test_finalize_rejects_forged_session(document_service, aws):
+    aws.s3.put_object(Bucket='documents', Key='order-2/invoice/private.pdf', Body=b'secret')
+    forged = sign_token({
+        'document_id': 'doc-1', 'order_id': 'order-1', 'document_type': 'INVOICE', 'file_name': 'a.pdf',
+        'content_type': 'application/pdf', 'size_bytes': 6, 's3_key': 'order-2/invoice/private.pdf',
+        'expires_at': 9999999999
+    }, b'wms-dev-upload-session-secret')
+
+    response = document_service.finalize_document_upload(
+        api_event('POST', '/documents/upload-sessions/finalize', {'session_token': forged}))
+
+    assert response['statusCode'] == 400
+    assert json.loads(response['body'])['message'] == 'Invalid upload session'
+    assert aws.dynamodb.Table('document-metadata').items == {}
+
+
+def test_order_creation_rejects_session_of_another_order(order_service, aws):
+    created = create_session(aws.s3, order_id='order-9')
+    with pytest.raises(order_service.DocumentContentError):
+        order_service.prepare_document('order-1', {'upload_session': created['session_token']}, 'tester', 0)